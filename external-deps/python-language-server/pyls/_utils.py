@@ -1,12 +1,15 @@
 # Copyright 2017 Palantir Technologies, Inc.
 import functools
 import inspect
+import io
+import json
 import logging
 import os
 import sys
 import threading
 
 import jedi
+from pyls_jsonrpc.exceptions import JsonRpcRequestCancelled
 
 PY2 = sys.version_info.major == 2
 JEDI_VERSION = jedi.__version__
@@ -18,6 +21,16 @@
 
 log = logging.getLogger(__name__)
 
+# os.replace is not available in Python 2, where os.rename replaces files
+# on POSIX systems
+_replace = getattr(os, 'replace', os.rename)
+
+# Cancellation event of the request being handled by each thread
+_request_state = threading.local()
+
+# Jedi is not thread-safe, so it must only be used while holding this lock
+JEDI_LOCK = threading.RLock()
+
 
 def debounce(interval_s, keyed_by=None):
     """Debounce calls to this function until interval_s seconds have passed."""
@@ -47,6 +60,31 @@ def run():
     return wrapper
 
 
+class cancellable(object):
+    """Context manager to run a request that can be cancelled with `event`.
+
+    While it's active, `check_cancelled` raises an exception in the current
+    thread once `event` is set.
+    """
+
+    def __init__(self, event):
+        self.event = event
+
+    def __enter__(self):
+        _request_state.cancel_event = self.event
+        return self
+
+    def __exit__(self, *exc_info):
+        _request_state.cancel_event = None
+
+
+def check_cancelled():
+    """Abort the current request if the client cancelled it."""
+    event = getattr(_request_state, 'cancel_event', None)
+    if event is not None and event.is_set():
+        raise JsonRpcRequestCancelled()
+
+
 def find_parents(root, path, names):
     """Find files matching the given names relative to the given path.
 
@@ -154,6 +192,41 @@ def format_docstring(contents):
     return contents
 
 
+def cache_dir(name):
+    """Return the directory where the data in `name` is saved between sessions."""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'pyls', name)
+
+
+def load_json(path):
+    """Load the data saved with `save_json`, or return None if it can't be read."""
+    try:
+        with io.open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def save_json(path, data):
+    """Save `data` to `path` as JSON, returning whether that succeeded."""
+    # Write to a temporary file first to not leave a truncated file if
+    # this is interrupted.
+    tmp_path = path + '.tmp'
+    try:
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with io.open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data))
+        _replace(tmp_path, path)
+    except (IOError, OSError):
+        log.debug('Failed to save %s', path, exc_info=True)
+        return False
+    return True
+
+
 def clip_column(column, lines, line_number):
     """
     Normalise the position as per the LSP that accepts character positions > line length
@@ -0,0 +1,190 @@
+# Copyright 2017 Palantir Technologies, Inc.
+"""Jedi environments whose information is saved between sessions.
+
+Creating a jedi environment for an interpreter and getting its sys.path
+means starting that interpreter in a subprocess, which is done again
+every time the server starts. Instead, the interpreter information and
+sys.path are saved to disk, together with the modification times of the
+interpreter and its site-packages, and are reused while those don't
+change, e.g. because packages were installed or removed.
+
+Environments are also warmed up in the background by loading the modules
+that are usually imported, so that the first request after the server
+starts doesn't need to wait for jedi to load them.
+"""
+from collections import namedtuple
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+
+import jedi
+from jedi.api.environment import Environment, InterpreterEnvironment
+from jedi.inference.compiled.subprocess import CompiledSubprocess
+from jedi._compatibility import highest_pickle_protocol
+
+from . import _utils
+
+log = logging.getLogger(__name__)
+
+# Increase when the format of the saved information changes
+CACHE_VERSION = 1
+SITE_DIRS = ('site-packages', 'dist-packages')
+
+VersionInfo = namedtuple('VersionInfo', 'major minor micro')
+
+_lock = threading.Lock()
+
+
+class _SerializedSubprocess(CompiledSubprocess):
+    """Subprocess of an environment that can be used from several threads.
+
+    Jedi sends requests to the subprocess and reads their replies through
+    the same pipes, so they can't be sent by two threads at the same time.
+    """
+
+    def __init__(self, executable, env_vars=None):
+        super(_SerializedSubprocess, self).__init__(executable, env_vars=env_vars)
+        self._lock = threading.RLock()
+
+    def _send(self, inference_state_id, function, args=(), kwargs={}):  # pylint: disable=dangerous-default-value
+        with self._lock:
+            return super(_SerializedSubprocess, self)._send(inference_state_id, function, args, kwargs)
+
+
+class CachedEnvironment(Environment):
+    """Jedi environment created from the information of a previous session.
+
+    Its subprocess, which jedi uses to inspect compiled modules, is only
+    started when it's needed.
+    """
+
+    def __init__(self, executable, path, version_info, sys_path, env_vars=None):
+        # pylint: disable=super-init-not-called
+        # The constructor of Environment is not called because it starts
+        # the subprocess to get the information that is already known.
+        self._start_executable = executable
+        self._env_vars = env_vars
+        self._sys_path = sys_path
+        self._lock = threading.Lock()
+        self.executable = executable
+        self.path = path
+        self.version_info = VersionInfo(*version_info)
+
+    def _get_subprocess(self):
+        with self._lock:
+            if self._subprocess is None or self._subprocess.is_crashed:
+                self._subprocess = _SerializedSubprocess(self._start_executable,
+                                                         env_vars=self._env_vars)
+                self._subprocess._pickle_protocol = highest_pickle_protocol(  # pylint: disable=protected-access
+                    [sys.version_info, self.version_info])
+            return self._subprocess
+
+    def get_sys_path(self):
+        return list(self._sys_path)
+
+
+def _cache_key(environment_path, env_vars):
+    if environment_path is None:
+        # Jedi chooses the default environment from these
+        environment = ['default', os.environ.get('VIRTUAL_ENV'), os.environ.get('CONDA_PREFIX'),
+                       sys.executable]
+    else:
+        environment = [environment_path]
+    # The rest of the variables don't change the sys.path of an interpreter
+    python_vars = sorted([key, value] for key, value in (env_vars or {}).items()
+                         if key.startswith('PYTHON'))
+    return environment + python_vars
+
+
+def _mtimes(executable, sys_path):
+    """Get the modification times of the files that change when the
+    interpreter is updated or packages are installed or removed."""
+    paths = [executable]
+    for path in sys_path:
+        if os.path.basename(path) in SITE_DIRS and os.path.isdir(path):
+            paths.append(path)
+            # Packages installed in development mode are added to sys.path
+            # by .pth files, which can change without changing their folder.
+            paths.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.endswith('.pth'))
+
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.path.getmtime(path)
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def _create_environment(environment_path, env_vars):
+    if environment_path is None:
+        return jedi.api.environment.get_cached_default_environment()
+    return jedi.api.environment.create_environment(path=environment_path, safe=False, env_vars=env_vars)
+
+
+def get_environment(environment_path=None, env_vars=None, cache_dir=None):
+    """Get the jedi environment for `environment_path`, or the default one.
+
+    The information saved for it is used if the interpreter and its
+    site-packages didn't change since it was saved.
+    """
+    key = _cache_key(environment_path, env_vars)
+    key_hash = hashlib.sha1(json.dumps(key).encode('utf-8')).hexdigest()
+    store_path = os.path.join(cache_dir or _utils.cache_dir('environments'), key_hash + '.json')
+
+    with _lock:
+        data = _utils.load_json(store_path)
+        if (data and data.get('version') == CACHE_VERSION and data.get('key') == key and
+                _mtimes(data['executable'], data['sys_path']) == data['mtimes']):
+            log.debug('Using saved information of environment %s', data['executable'])
+            return CachedEnvironment(data['executable'], data['path'], data['version_info'],
+                                     data['sys_path'], env_vars=env_vars)
+
+        environment = _create_environment(environment_path, env_vars)
+        # The environment of the server itself doesn't need a subprocess
+        if isinstance(environment, InterpreterEnvironment):
+            return environment
+
+        sys_path = environment.get_sys_path()
+        data = {
+            'version': CACHE_VERSION,
+            'key': key,
+            'executable': environment.executable,
+            'path': environment.path,
+            'version_info': list(environment.version_info),
+            'sys_path': sys_path,
+            'mtimes': _mtimes(environment.executable, sys_path),
+        }
+        _utils.save_json(store_path, data)
+        return CachedEnvironment(environment.executable, environment.path, environment.version_info,
+                                 sys_path, env_vars=env_vars)
+
+
+def preload_modules(environment, project, modules):
+    """Make jedi load `modules` and the builtins of `environment`.
+
+    Compiled modules stay loaded in the environment subprocess, and the
+    syntax trees of the rest are kept by parso, so requests that use them
+    later on don't need to load them again.
+    """
+    source = ''.join('import {}\n'.format(module) for module in modules)
+    script = jedi.Script(source, environment=environment, project=project)
+    # Modules are loaded one at a time to not make requests wait for all
+    # of them.
+    for line, module in enumerate(modules, start=1):
+        try:
+            with _utils.JEDI_LOCK:
+                script.infer(line, len('import ') + len(module))
+        except Exception:  # pylint: disable=broad-except
+            # Catch any exception since jedi can fail with any of them
+            # for modules it can't inspect.
+            log.debug('Failed to preload %s', module, exc_info=True)
+    try:
+        with _utils.JEDI_LOCK:
+            script.complete(len(modules) + 1, 0)
+    except Exception:  # pylint: disable=broad-except
+        log.debug('Failed to preload builtins', exc_info=True)
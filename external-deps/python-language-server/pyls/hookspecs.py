@@ -27,6 +27,11 @@ def pyls_completions(config, workspace, document, position):
     pass
 
 
+@hookspec(firstresult=True)
+def pyls_completion_item_resolve(config, workspace, document, completion_item):
+    pass
+
+
 @hookspec
 def pyls_definitions(config, workspace, document, position):
     pass
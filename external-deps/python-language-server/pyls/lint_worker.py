@@ -0,0 +1,254 @@
+# Copyright 2017 Palantir Technologies, Inc.
+"""Persistent worker process for linters that are slow to start.
+
+Running pylint or flake8 in a new process for every lint means paying
+for the interpreter startup and for importing them each time, which
+often takes longer than checking the file itself. Instead, they are
+loaded once in a worker process that receives the sources to check
+through a pipe. Each linter has its own worker, so fast linters don't
+wait for slow ones like pylint.
+
+Results are also cached by the content of the document and the
+arguments passed to the linter, so unchanged files and reverted edits
+don't need to be checked again.
+"""
+import collections
+import hashlib
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+
+log = logging.getLogger(__name__)
+
+CACHE_SIZE = 256
+
+
+class LintCache(object):
+    """LRU cache of linter outputs keyed by document contents and arguments."""
+
+    def __init__(self, size=CACHE_SIZE):
+        self._size = size
+        self._lock = threading.Lock()
+        self._outputs = collections.OrderedDict()
+
+    @staticmethod
+    def key(linter, args, path, source):
+        source_hash = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        return (linter, tuple(args), path, source_hash)
+
+    def get(self, key):
+        with self._lock:
+            output = self._outputs.pop(key, None)
+            if output is not None:
+                self._outputs[key] = output
+            return output
+
+    def set(self, key, output):
+        with self._lock:
+            self._outputs.pop(key, None)
+            self._outputs[key] = output
+            while len(self._outputs) > self._size:
+                self._outputs.popitem(last=False)
+
+    def clear(self, keep_path=None):
+        """Remove cached outputs, except the ones for `keep_path`."""
+        with self._lock:
+            for key in list(self._outputs):
+                if key[2] != keep_path:
+                    del self._outputs[key]
+
+
+class LintWorker(object):
+    """Client of a worker process that runs linters in-process.
+
+    Requests are handled one at a time, so a worker should only be used
+    for one linter.
+    """
+
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+
+    def run(self, linter, args, source=''):
+        """Run `linter` with `args`, passing `source` as its stdin.
+
+        Returns the output of the linter, or None if the worker failed, in
+        which case the linter should be run in a new process.
+        """
+        request = json.dumps({'linter': linter, 'args': args, 'source': source})
+        with self._lock:
+            try:
+                if self._process is None or self._process.poll() is not None:
+                    self._start()
+                self._process.stdin.write(request + '\n')
+                self._process.stdin.flush()
+                response = self._process.stdout.readline()
+                if not response:
+                    raise IOError('Lint worker exited')
+                response = json.loads(response)
+            except (IOError, OSError, ValueError):
+                log.exception('Failed to run %s in the lint worker', linter)
+                self._stop()
+                return None
+
+        if response.get('error'):
+            log.error('Error while running %s: %s', linter, response['error'])
+            return None
+        if response.get('stderr'):
+            log.error("Error while running %s '%s'", linter, response['stderr'])
+        return response['stdout']
+
+    def stop(self):
+        with self._lock:
+            self._stop()
+
+    def _start(self):
+        log.debug('Starting lint worker')
+        self._process = subprocess.Popen(
+            [sys.executable, '-m', 'pyls.lint_worker'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            universal_newlines=True
+        )
+
+    def _stop(self):
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait()
+            except OSError:
+                pass
+        self._process = None
+
+
+_CACHE = LintCache()
+_WORKERS = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def _get_worker(linter):
+    with _WORKERS_LOCK:
+        if linter not in _WORKERS:
+            _WORKERS[linter] = LintWorker()
+        return _WORKERS[linter]
+
+
+def run(linter, args, source=''):
+    """Run `linter` in its worker process and return its output or None."""
+    return _get_worker(linter).run(linter, args, source)
+
+
+def cached_run(linter, args, document, run_linter):
+    """Get the output of `run_linter()` for `document`, computing it only
+    if its contents or the linter arguments changed.
+    """
+    key = LintCache.key(linter, args, document.path, document.source)
+    output = _CACHE.get(key)
+    if output is None:
+        output = run_linter()
+        if output is not None:
+            _CACHE.set(key, output)
+    return output
+
+
+def clear_cache(keep_path=None):
+    """Remove cached outputs, e.g. because linter configuration changed."""
+    _CACHE.clear(keep_path=keep_path)
+
+
+def stop():
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+    for worker in workers:
+        worker.stop()
+
+
+# ---- Worker process
+# Modification times of the files parsed by astroid
+_MTIMES = {}
+
+
+def _update_astroid_cache(clear_changed):
+    """Save the modification times of the modules in the astroid cache.
+
+    If `clear_changed` is True, modules that changed on disk since they were
+    parsed are removed from it. The rest are kept to not parse them again,
+    which is what makes running pylint in the same process worthwhile.
+    """
+    from astroid import MANAGER
+    for name, module in list(MANAGER.astroid_cache.items()):
+        path = getattr(module, 'file', None)
+        if not path or not os.path.isfile(path):
+            continue
+        mtime = os.path.getmtime(path)
+        if clear_changed and _MTIMES.get(path, mtime) != mtime:
+            del MANAGER.astroid_cache[name]
+        _MTIMES[path] = mtime
+
+
+def _run_pylint(args):
+    from pylint.lint import Run
+    _update_astroid_cache(clear_changed=True)
+    try:
+        Run(args)
+    except SystemExit:
+        pass
+    finally:
+        _update_astroid_cache(clear_changed=False)
+
+
+def _run_flake8(args):
+    from flake8 import utils
+    from flake8.main import application
+
+    # flake8 caches what it reads from stdin
+    if hasattr(utils.stdin_get_value, 'cache_clear'):
+        utils.stdin_get_value.cache_clear()
+    app = application.Application()
+    try:
+        app.run(args)
+    except SystemExit:
+        pass
+
+
+_LINTERS = {
+    'flake8': _run_flake8,
+    'pylint': _run_pylint,
+}
+
+
+def _handle_request(request):
+    stdin, stdout, stderr = sys.stdin, sys.stdout, sys.stderr
+    source = request['source'].encode('utf-8')
+    sys.stdin = io.TextIOWrapper(io.BytesIO(source), encoding='utf-8')
+    sys.stdout = io.StringIO()
+    sys.stderr = io.StringIO()
+    try:
+        _LINTERS[request['linter']](request['args'])
+        return {'stdout': sys.stdout.getvalue(), 'stderr': sys.stderr.getvalue()}
+    except Exception as e:  # pylint: disable=broad-except
+        return {'error': '{}: {}'.format(type(e).__name__, e)}
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+
+
+def main():
+    """Answer requests received from stdin until it's closed."""
+    # Responses are written to a copy of the original stdout, which is
+    # then redirected to stderr, so nothing printed by linters or the
+    # modules they import can get mixed with them.
+    sys.stdout.flush()
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    requests = sys.stdin
+    for line in iter(requests.readline, ''):
+        response = _handle_request(json.loads(line))
+        responses.write(json.dumps(response) + '\n')
+        responses.flush()
+
+
+if __name__ == '__main__':
+    main()
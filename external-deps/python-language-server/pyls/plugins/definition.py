@@ -7,6 +7,11 @@
 
 @hookimpl
 def pyls_definitions(config, document, position):
+    return document.memoize_result(
+        'definitions', position, lambda: _definitions(config, document, position))
+
+
+def _definitions(config, document, position):
     settings = config.plugin_settings('jedi_definition')
     code_position = _utils.position_to_jedi_linecolumn(document, position)
     definitions = document.jedi_script().goto(
@@ -4,7 +4,7 @@
 import os.path
 import re
 from subprocess import Popen, PIPE
-from pyls import hookimpl, lsp
+from pyls import hookimpl, lint_worker, lsp
 
 log = logging.getLogger(__name__)
 FIX_IGNORES_RE = re.compile(r'([^a-zA-Z0-9_,]*;.*(\W+||$))')
@@ -41,21 +41,31 @@ def pyls_lint(workspace, document):
         log.debug("using flake8 with config: %s", opts['config'])
 
     # Call the flake8 utility then parse diagnostics from stdout
-    flake8_executable = settings.get('executable', 'flake8')
+    flake8_executable = settings.get('executable')
 
     args = build_args(opts)
-    output = run_flake8(flake8_executable, args, document)
+    output = lint_worker.cached_run(
+        'flake8', [flake8_executable] + args, document,
+        lambda: run_flake8(flake8_executable, args, document))
     return parse_stdout(document, output)
 
 
 def run_flake8(flake8_executable, args, document):
     """Run flake8 with the provided arguments, logs errors
     from stderr if any.
+
+    If no executable is given, flake8 is run in the persistent lint worker.
     """
     # a quick temporary fix to deal with Atom
     args = [(i if not i.startswith('--ignore=') else FIX_IGNORES_RE.sub('', i))
             for i in args if i is not None]
 
+    if flake8_executable is None:
+        output = lint_worker.run('flake8', args, document.source)
+        if output is not None:
+            return output
+        flake8_executable = 'flake8'
+
     # if executable looks like a path resolve it
     if not os.path.isfile(flake8_executable) and os.sep in flake8_executable:
         flake8_executable = os.path.abspath(
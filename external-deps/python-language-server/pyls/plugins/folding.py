@@ -1,23 +1,70 @@
 # pylint: disable=len-as-condition
 # Copyright 2019 Palantir Technologies, Inc.
 
+import logging
 import re
+import threading
 
 import parso
 import parso.python.tree as tree_nodes
+from parso.utils import split_lines
 
 from pyls import hookimpl
 
+log = logging.getLogger(__name__)
+
 SKIP_NODES = (tree_nodes.Module, tree_nodes.IfStmt, tree_nodes.TryStmt)
 IDENTATION_REGEX = re.compile(r'(\s+).+')
 
+# Loaded on first use by _load_grammar
+_GRAMMAR = None
+
+
+class FoldingState(object):
+    """Parse tree and folding ranges of the last version of a document.
+
+    They are kept between requests so that after an edit only the part of
+    the document that changed needs to be parsed again and walked to find
+    its folding ranges.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.lines = None
+        self.module = None
+        self.ranges = []
+        # Line of the first syntax error found when walking the tree
+        self.error_line = None
+
+
+def _load_grammar():
+    """Return the parso grammar, or None if it's not available.
+
+    parso may not have a grammar for the running interpreter yet, in which
+    case documents are parsed again in full with parso.parse.
+    """
+    global _GRAMMAR  # pylint: disable=global-statement
+    if _GRAMMAR is None:
+        try:
+            _GRAMMAR = parso.load_grammar()
+        except Exception:  # pylint: disable=broad-except
+            log.warning('Failed to load the parso grammar', exc_info=True)
+            _GRAMMAR = False
+    return _GRAMMAR or None
+
 
 @hookimpl
 def pyls_folding_range(document):
+    return document.memoize_result('folding_range', None,
+                                   lambda: __folding_range(document))
+
+
+def __folding_range(document):
     program = document.source + '\n'
     lines = program.splitlines()
-    tree = parso.parse(program)
-    ranges = __compute_folding_ranges(tree, lines)
+    state = document.shared_data.setdefault('FOLDING_STATE', FoldingState())
+    with state.lock:
+        ranges = __update_folding_ranges(state, program, lines)
 
     results = []
     for (start_line, end_line) in ranges:
@@ -32,6 +79,78 @@ def pyls_folding_range(document):
     return results
 
 
+def __update_folding_ranges(state, program, lines):
+    new_lines = split_lines(program, keepends=True)
+    grammar = _load_grammar()
+    if grammar is None:
+        module = parso.parse(program)
+        reused_nodes = 0
+    elif state.module is None:
+        module = grammar.parse(program)
+        reused_nodes = 0
+    else:
+        first_changed = __first_changed_line(state.lines, new_lines)
+        if first_changed is None:
+            return state.ranges
+        # This needs to be computed before parsing the changes because the
+        # diff parser modifies the old tree.
+        reused_nodes = __count_unchanged_nodes(state, first_changed)
+        # The diff parser is used directly instead of through parse's
+        # diff_cache, which keeps trees in a cache by path that is shared
+        # with jedi, so that trees jedi is using are not modified.
+        # pylint: disable=protected-access
+        try:
+            module = grammar._diff_parser(
+                grammar._pgen_grammar, grammar._tokenizer, state.module
+            ).update(old_lines=state.lines, new_lines=new_lines)
+        except Exception:  # pylint: disable=broad-except
+            log.exception('Failed to parse the changes of the document')
+            module = grammar.parse(program)
+            reused_nodes = 0
+
+    # Folding ranges of the top level nodes before the first one that
+    # changed are still valid
+    reused_ranges = []
+    if reused_nodes > 0:
+        limit, _ = module.children[reused_nodes].start_pos
+        reused_ranges = [r for r in state.ranges if r[0] < limit]
+
+    new_ranges, error_line = __compute_folding_ranges(
+        module.children[reused_nodes:], lines)
+
+    state.lines = new_lines
+    state.module = module
+    state.ranges = reused_ranges + new_ranges
+    state.error_line = error_line
+    return state.ranges
+
+
+def __first_changed_line(old_lines, new_lines):
+    """Return the first line (starting at 1) that differs, if any."""
+    for i, (old_line, new_line) in enumerate(zip(old_lines, new_lines)):
+        if old_line != new_line:
+            return i + 1
+    if len(old_lines) != len(new_lines):
+        return min(len(old_lines), len(new_lines)) + 1
+    return None
+
+
+def __count_unchanged_nodes(state, first_changed):
+    """Count the top level nodes whose folding ranges can be reused."""
+    children = state.module.children
+    count = 0
+    while count < len(children) and children[count].end_pos[0] < first_changed:
+        count += 1
+    # The ranges of a node can depend on where the next one starts
+    count = max(count - 1, 0)
+    # Ranges after a syntax error are computed from the indentation of
+    # the rest of the document
+    if state.error_line is not None:
+        while count > 0 and children[count - 1].end_pos[0] >= state.error_line:
+            count -= 1
+    return count
+
+
 def __merge_folding_ranges(left, right):
     for start in list(left.keys()):
         right_start = right.pop(start, None)
@@ -169,9 +288,12 @@ def __compute_start_end_lines(node, stack):
     return start_line, end_line, stack
 
 
-def __compute_folding_ranges(tree, lines):
+def __compute_folding_ranges(nodes, lines):
+    """Return the folding ranges of `nodes` and the line of the first
+    syntax error found in them, if any."""
     folding_ranges = {}
-    stack = [tree]
+    error_line = None
+    stack = list(nodes)
 
     while len(stack) > 0:
         node = stack.pop(0)
@@ -181,6 +303,7 @@ def __compute_folding_ranges(tree, lines):
         elif isinstance(node, tree_nodes.PythonErrorNode):
             # Fallback to identation-based (best-effort) folding
             start_line, _ = node.start_pos
+            error_line = start_line
             start_line -= 1
             padding = [''] * start_line
             text = '\n'.join(padding + lines[start_line:]) + '\n'
@@ -200,4 +323,4 @@ def __compute_folding_ranges(tree, lines):
             stack = node.children + stack
 
     folding_ranges = sorted(folding_ranges.items())
-    return folding_ranges
+    return folding_ranges, error_line
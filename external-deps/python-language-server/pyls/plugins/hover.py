@@ -9,6 +9,10 @@
 
 @hookimpl
 def pyls_hover(document, position):
+    return document.memoize_result('hover', position, lambda: _hover(document, position))
+
+
+def _hover(document, position):
     code_position = _utils.position_to_jedi_linecolumn(document, position)
     definitions = document.jedi_script().infer(**code_position)
     word = document.word_at_position(position)
@@ -25,6 +29,8 @@ def pyls_hover(document, position):
     if not definition:
         return {'contents': ''}
 
+    _utils.check_cancelled()
+
     # raw docstring returns only doc, without signature
     doc = _utils.format_docstring(definition.docstring(raw=True))
 
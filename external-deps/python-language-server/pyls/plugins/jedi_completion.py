@@ -71,20 +71,48 @@ def pyls_completions(config, document, position):
     include_params = snippet_support and should_include_params and use_snippets(document, position)
     include_class_objects = snippet_support and should_include_class_objects and use_snippets(document, position)
 
-    ready_completions = [
-        _format_completion(c, include_params)
-        for c in completions
-    ]
+    # Getting docstrings is the slowest part of formatting completions, so
+    # leave it for completionItem/resolve if the client supports it.
+    resolve_support = completion_capabilities.get('completionItem', {}).get('resolveSupport', {})
+    resolve_lazily = 'documentation' in resolve_support.get('properties', [])
+
+    # Stop formatting completions if the request was cancelled.
+    ready_completions = []
+    for c in completions:
+        _utils.check_cancelled()
+        ready_completions.append((_format_completion(c, include_params, resolve=not resolve_lazily), c))
 
     if include_class_objects:
         for c in completions:
+            _utils.check_cancelled()
             if c.type == 'class':
-                completion_dict = _format_completion(c, False)
+                completion_dict = _format_completion(c, False, resolve=not resolve_lazily)
                 completion_dict['kind'] = lsp.CompletionItemKind.TypeParameter
                 completion_dict['label'] += ' object'
-                ready_completions.append(completion_dict)
+                ready_completions.append((completion_dict, c))
+
+    if resolve_lazily:
+        document.shared_data['LAST_JEDI_COMPLETIONS'] = {
+            completion_dict['label']: c for completion_dict, c in ready_completions
+        }
+        for completion_dict, _c in ready_completions:
+            completion_dict['data'] = {'doc_uri': document.uri}
+
+    return [completion_dict for completion_dict, _c in ready_completions] or None
+
+
+@hookimpl
+def pyls_completion_item_resolve(completion_item, document):
+    """Add the documentation of a completion returned by pyls_completions."""
+    if document is None:
+        return None
 
-    return ready_completions or None
+    completion = document.shared_data.get('LAST_JEDI_COMPLETIONS', {}).get(completion_item['label'])
+    if completion is None:
+        return None
+
+    completion_item['documentation'] = _utils.format_docstring(completion.docstring())
+    return completion_item
 
 
 def is_exception_class(name):
@@ -137,16 +165,18 @@ def use_snippets(document, position):
             not (expr_type in _ERRORS and 'import' in code))
 
 
-def _format_completion(d, include_params=True):
+def _format_completion(d, include_params=True, resolve=True):
     completion = {
         'label': _label(d),
         'kind': _TYPE_MAP.get(d.type),
         'detail': _detail(d),
-        'documentation': _utils.format_docstring(d.docstring()),
         'sortText': _sort_text(d),
         'insertText': d.name
     }
 
+    if resolve:
+        completion['documentation'] = _utils.format_docstring(d.docstring())
+
     if d.type == 'path':
         path = osp.normpath(d.name)
         path = path.replace('\\', '\\\\')
@@ -1,5 +1,7 @@
 # Copyright 2017 Palantir Technologies, Inc.
 import logging
+import threading
+
 from pyls import hookimpl
 
 log = logging.getLogger(__name__)
@@ -25,8 +27,17 @@ def pyls_settings():
 
 
 @hookimpl
-def pyls_initialize(config):
-    for mod_name in config.plugin_settings('preload').get('modules', []):
+def pyls_initialize(config, workspace):
+    # Importing modules and loading them in jedi can take several seconds,
+    # so it's done in the background to not delay the server start.
+    modules = config.plugin_settings('preload').get('modules', [])
+    thread = threading.Thread(target=_preload, args=(modules, workspace), name='PreloadImports')
+    thread.daemon = True
+    thread.start()
+
+
+def _preload(modules, workspace):
+    for mod_name in modules:
         try:
             __import__(mod_name)
             log.debug("Preloaded module %s", mod_name)
@@ -35,3 +46,4 @@ def pyls_initialize(config):
             # For example, old versions of NumPy can cause a ValueError.
             # See spyder-ide/spyder#13985
             pass
+    workspace.preload_environment(modules)
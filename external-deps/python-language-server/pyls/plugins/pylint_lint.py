@@ -2,12 +2,13 @@
 """Linter plugin for pylint."""
 import collections
 import logging
+import shlex
 import sys
 import re
 from subprocess import Popen, PIPE
 
 from pylint.epylint import py_run
-from pyls import hookimpl, lsp
+from pyls import hookimpl, lint_worker, lsp
 
 try:
     import ujson as json
@@ -58,23 +59,8 @@ def lint(cls, document, is_saved, flags=''):
             # save.
             return cls.last_diags[document.path]
 
-        # py_run will call shlex.split on its arguments, and shlex.split does
-        # not handle Windows paths (it will try to perform escaping). Turn
-        # backslashes into forward slashes first to avoid this issue.
-        path = document.path
-        if sys.platform.startswith('win'):
-            path = path.replace('\\', '/')
-
-        pylint_call = '{} -f json {}'.format(path, flags)
-        log.debug("Calling pylint with '%s'", pylint_call)
-        json_out, err = py_run(pylint_call, return_std=True)
-
-        # Get strings
-        json_out = json_out.getvalue()
-        err = err.getvalue()
-
-        if err != '':
-            log.error("Error calling pylint: '%s'", err)
+        json_out = lint_worker.cached_run(
+            'pylint', [flags], document, lambda: cls._run_pylint(document, flags))
 
         # pylint prints nothing rather than [] when there are no diagnostics.
         # json.loads will not parse an empty string, so just return.
@@ -143,6 +129,32 @@ def lint(cls, document, is_saved, flags=''):
         cls.last_diags[document.path] = diagnostics
         return diagnostics
 
+    @staticmethod
+    def _run_pylint(document, flags):
+        """Run pylint on the saved document and return its JSON output."""
+        json_out = lint_worker.run('pylint', [document.path, '-f', 'json'] + shlex.split(flags))
+        if json_out is not None:
+            return json_out
+
+        # py_run will call shlex.split on its arguments, and shlex.split does
+        # not handle Windows paths (it will try to perform escaping). Turn
+        # backslashes into forward slashes first to avoid this issue.
+        path = document.path
+        if sys.platform.startswith('win'):
+            path = path.replace('\\', '/')
+
+        pylint_call = '{} -f json {}'.format(path, flags)
+        log.debug("Calling pylint with '%s'", pylint_call)
+        json_out, err = py_run(pylint_call, return_std=True)
+
+        # Get strings
+        json_out = json_out.getvalue()
+        err = err.getvalue()
+
+        if err != '':
+            log.error("Error calling pylint: '%s'", err)
+        return json_out
+
 
 def _build_pylint_flags(settings):
     """Build arguments for calling pylint."""
@@ -211,7 +223,9 @@ def pylint_lint_stdin(pylint_executable, document, flags):
     :return: linting diagnostics
     :rtype: list
     """
-    pylint_result = _run_pylint_stdio(pylint_executable, document, flags)
+    pylint_result = lint_worker.cached_run(
+        'pylint', [pylint_executable] + flags, document,
+        lambda: _run_pylint_stdio(pylint_executable, document, flags))
     return _parse_pylint_stdio_result(document, pylint_result)
 
 
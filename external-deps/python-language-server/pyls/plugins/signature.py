@@ -14,12 +14,19 @@
 
 @hookimpl
 def pyls_signature_help(document, position):
+    return document.memoize_result(
+        'signature_help', position, lambda: _signature_help(document, position))
+
+
+def _signature_help(document, position):
     code_position = _utils.position_to_jedi_linecolumn(document, position)
     signatures = document.jedi_script().get_signatures(**code_position)
 
     if not signatures:
         return {'signatures': []}
 
+    _utils.check_cancelled()
+
     s = signatures[0]
 
     # Docstring contains one or more lines of signature, followed by empty line, followed by docstring
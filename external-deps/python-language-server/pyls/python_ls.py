@@ -1,15 +1,19 @@
 # Copyright 2017 Palantir Technologies, Inc.
+from concurrent import futures
 from functools import partial
+import itertools
 import logging
 import os
 import socketserver
 import threading
+import time
 
 from pyls_jsonrpc.dispatchers import MethodDispatcher
-from pyls_jsonrpc.endpoint import Endpoint
+from pyls_jsonrpc.endpoint import Endpoint, JSONRPC_VERSION
+from pyls_jsonrpc.exceptions import JsonRpcException, JsonRpcRequestCancelled
 from pyls_jsonrpc.streams import JsonRpcStreamReader, JsonRpcStreamWriter
 
-from . import lsp, _utils, uris
+from . import lint_worker, lsp, _utils, uris
 from .config import config
 from .workspace import Workspace
 
@@ -19,6 +23,7 @@
 LINT_DEBOUNCE_S = 0.5  # 500 ms
 PARENT_PROCESS_WATCH_INTERVAL = 10  # 10 s
 MAX_WORKERS = 64
+MAX_LINT_WORKERS = 4
 PYTHON_FILE_EXTENSIONS = ('.py', '.pyi')
 CONFIG_FILEs = ('pycodestyle.cfg', 'setup.cfg', 'tox.ini', '.flake8')
 
@@ -90,6 +95,65 @@ def start_io_lang_server(rfile, wfile, check_parent_process, handler_class):
     server.start()
 
 
+class ContentModified(JsonRpcException):
+    """The document changed while a request about it was being handled."""
+    CODE = -32801
+    MESSAGE = 'Content Modified'
+
+
+class _CancellableEndpoint(Endpoint):
+    """Endpoint that lets request handlers know when they are cancelled.
+
+    pyls_jsonrpc can only cancel requests that didn't start yet. This
+    endpoint also sets an event for running requests, so they can stop
+    their work as soon as possible (see `_utils.check_cancelled`).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_CancellableEndpoint, self).__init__(*args, **kwargs)
+        self._cancel_events = {}
+        self._current_request = None
+
+    def cancellation_event(self):
+        """Get an event set when the request being handled is cancelled."""
+        event = threading.Event()
+        self._cancel_events[self._current_request] = event
+        return event
+
+    def _handle_request(self, msg_id, method, params):
+        self._current_request = msg_id
+        try:
+            super(_CancellableEndpoint, self)._handle_request(
+                msg_id, method, params)
+        finally:
+            self._current_request = None
+
+    def _handle_cancel_notification(self, msg_id):
+        event = self._cancel_events.pop(msg_id, None)
+        if event is not None:
+            event.set()
+        super(_CancellableEndpoint, self)._handle_cancel_notification(msg_id)
+
+    def _request_callback(self, request_id):
+        callback = super(_CancellableEndpoint, self)._request_callback(
+            request_id)
+
+        def wrapper(future):
+            self._cancel_events.pop(request_id, None)
+            if future.cancelled():
+                # The default callback fails for cancelled futures in
+                # recent Python versions, so reply here.
+                self._client_request_futures.pop(request_id, None)
+                self._consumer({
+                    'jsonrpc': JSONRPC_VERSION,
+                    'id': request_id,
+                    'error': JsonRpcRequestCancelled().to_dict()
+                })
+                return
+            callback(future)
+        return wrapper
+
+
 class PythonLanguageServer(MethodDispatcher):
     """ Implementation of the Microsoft VSCode Language Server Protocol
     https://github.com/Microsoft/language-server-protocol/blob/master/versions/protocol-1-x.md
@@ -108,7 +172,18 @@ def __init__(self, rx, tx, check_parent_process=False):
         self._jsonrpc_stream_reader = JsonRpcStreamReader(rx)
         self._jsonrpc_stream_writer = JsonRpcStreamWriter(tx)
         self._check_parent_process = check_parent_process
-        self._endpoint = Endpoint(self, self._jsonrpc_stream_writer.write, max_workers=MAX_WORKERS)
+        self._endpoint = _CancellableEndpoint(self, self._jsonrpc_stream_writer.write, max_workers=MAX_WORKERS)
+        # Requests that use Jedi run here, one at a time, because it is not
+        # thread-safe. They can also be cancelled.
+        self._cancellable_executor = futures.ThreadPoolExecutor(max_workers=1)
+        # Linters run concurrently and their diagnostics are published as
+        # soon as each of them finishes, merged with the last ones of the
+        # others.
+        self._lint_executor = futures.ThreadPoolExecutor(max_workers=MAX_LINT_WORKERS)
+        self._lint_lock = threading.Lock()
+        self._lint_runs = {}
+        self._lint_run_ids = itertools.count(1)
+        self._lint_results = {}
         self._dispatchers = []
         self._shutdown = False
 
@@ -135,12 +210,53 @@ def __getitem__(self, item):
 
         raise KeyError()
 
+    def _cancellable(self, func, *args, **kwargs):
+        """Run the current request in a thread where it can be cancelled.
+
+        Requests superseded by newer ones are cancelled by clients while
+        users type, so they don't delay the ones that are still needed.
+        """
+        event = self._endpoint.cancellation_event()
+
+        def run():
+            with _utils.cancellable(event), _utils.JEDI_LOCK:
+                _utils.check_cancelled()
+                return func(*args, **kwargs)
+        return self._cancellable_executor.submit(run)
+
+    def _document_request(self, func, doc_uri, *args):
+        """Run a request about a document like the cancellable ones.
+
+        The request is dropped if the document changes before its results
+        are ready, because the positions in them could be wrong.
+        """
+        version = self._document_version(doc_uri)
+
+        def run():
+            if self._document_version(doc_uri) != version:
+                raise ContentModified()
+            result = func(doc_uri, *args)
+            if self._document_version(doc_uri) != version:
+                raise ContentModified()
+            return result
+        return self._cancellable(run)
+
+    def _document_version(self, doc_uri):
+        workspace = self._match_uri_to_workspace(doc_uri)
+        document = workspace.get_maybe_document(doc_uri)
+        return None if document is None else document.version
+
     def m_shutdown(self, **_kwargs):
         self._shutdown = True
         return None
 
     def m_exit(self, **_kwargs):
         self._endpoint.shutdown()
+        self._cancellable_executor.shutdown()
+        self._lint_executor.shutdown(wait=False)
+        lint_worker.stop()
+        for workspace in self.workspaces.values():
+            workspace.stop_symbol_index()
         self._jsonrpc_stream_reader.close()
         self._jsonrpc_stream_writer.close()
 
@@ -162,7 +278,7 @@ def capabilities(self):
                 'resolveProvider': False,  # We may need to make this configurable
             },
             'completionProvider': {
-                'resolveProvider': False,  # We know everything ahead of time
+                'resolveProvider': True,  # Documentation can be computed lazily
                 'triggerCharacters': ['.']
             },
             'documentFormattingProvider': True,
@@ -177,6 +293,7 @@ def capabilities(self):
             'referencesProvider': True,
             'renameProvider': True,
             'foldingRangeProvider': True,
+            'workspaceSymbolProvider': True,
             'signatureHelpProvider': {
                 'triggerCharacters': ['(', ',', '=']
             },
@@ -243,12 +360,24 @@ def completions(self, doc_uri, position):
             'items': flatten(completions)
         }
 
+    def completion_item_resolve(self, completion_item):
+        doc_uri = completion_item.get('data', {}).get('doc_uri')
+        resolved_item = self._hook('pyls_completion_item_resolve', doc_uri, completion_item=completion_item)
+        return resolved_item or completion_item
+
     def definitions(self, doc_uri, position):
         return flatten(self._hook('pyls_definitions', doc_uri, position=position))
 
     def document_symbols(self, doc_uri):
         return flatten(self._hook('pyls_document_symbols', doc_uri))
 
+    def workspace_symbols(self, query):
+        symbols = []
+        for workspace in self.workspaces.values():
+            if workspace.is_local():
+                symbols.extend(workspace.symbol_index.search(query))
+        return symbols
+
     def execute_command(self, command, arguments):
         return self._hook('pyls_execute_command', command=command, arguments=arguments)
 
@@ -269,10 +398,47 @@ def lint(self, doc_uri, is_saved):
         # Since we're debounced, the document may no longer be open
         workspace = self._match_uri_to_workspace(doc_uri)
         if doc_uri in workspace.documents:
-            workspace.publish_diagnostics(
-                doc_uri,
-                flatten(self._hook('pyls_lint', doc_uri, is_saved=is_saved))
-            )
+            self.run_linters(workspace, doc_uri, is_saved)
+
+    def run_linters(self, workspace, doc_uri, is_saved):
+        """Run the pyls_lint hook implementations concurrently."""
+        hook_handlers = self.config.plugin_manager.subset_hook_caller('pyls_lint', self.config.disabled_plugins)
+        linters = hook_handlers.get_hookimpls()
+        kwargs = {
+            'config': self.config,
+            'workspace': workspace,
+            'document': workspace.get_document(doc_uri),
+            'is_saved': is_saved,
+        }
+
+        with self._lint_lock:
+            run = next(self._lint_run_ids)
+            self._lint_runs[doc_uri] = run
+            # Diagnostics of the previous run are kept until each linter
+            # finishes, to not make them flicker while users type.
+            names = [linter.plugin_name for linter in linters]
+            previous = self._lint_results.get(doc_uri, {})
+            self._lint_results[doc_uri] = {name: previous.get(name, []) for name in names}
+
+        return [self._lint_executor.submit(self._run_linter, linter, kwargs, workspace, doc_uri, run)
+                for linter in linters]
+
+    def _run_linter(self, linter, kwargs, workspace, doc_uri, run):
+        start = time.time()
+        try:
+            diagnostics = linter.function(**{arg: kwargs[arg] for arg in linter.argnames}) or []
+        except Exception:  # pylint: disable=broad-except
+            log.exception('Failed to run linter %s on %s', linter.plugin_name, doc_uri)
+            return
+        log.debug('Linter %s ran on %s in %.1f ms', linter.plugin_name, doc_uri, (time.time() - start) * 1000)
+
+        with self._lint_lock:
+            # Drop diagnostics of runs superseded by newer ones
+            if self._lint_runs.get(doc_uri) != run or doc_uri not in workspace.documents:
+                return
+            results = self._lint_results[doc_uri]
+            results[linter.plugin_name] = diagnostics
+            workspace.publish_diagnostics(doc_uri, flatten(results.values()))
 
     def references(self, doc_uri, position, exclude_declaration):
         return flatten(self._hook(
@@ -292,6 +458,9 @@ def folding(self, doc_uri):
     def m_text_document__did_close(self, textDocument=None, **_kwargs):
         workspace = self._match_uri_to_workspace(textDocument['uri'])
         workspace.rm_document(textDocument['uri'])
+        with self._lint_lock:
+            self._lint_runs.pop(textDocument['uri'], None)
+            self._lint_results.pop(textDocument['uri'], None)
 
     def m_text_document__did_open(self, textDocument=None, **_kwargs):
         workspace = self._match_uri_to_workspace(textDocument['uri'])
@@ -310,6 +479,9 @@ def m_text_document__did_change(self, contentChanges=None, textDocument=None, **
         self.lint(textDocument['uri'], is_saved=False)
 
     def m_text_document__did_save(self, textDocument=None, **_kwargs):
+        # Saving a module can change the results of linting the ones that
+        # import it.
+        lint_worker.clear_cache(keep_path=uris.to_fs_path(textDocument['uri']))
         self.lint(textDocument['uri'], is_saved=True)
 
     def m_text_document__code_action(self, textDocument=None, range=None, context=None, **_kwargs):
@@ -319,29 +491,32 @@ def m_text_document__code_lens(self, textDocument=None, **_kwargs):
         return self.code_lens(textDocument['uri'])
 
     def m_text_document__completion(self, textDocument=None, position=None, **_kwargs):
-        return self.completions(textDocument['uri'], position)
+        return self._document_request(self.completions, textDocument['uri'], position)
+
+    def m_completion_item__resolve(self, **completionItem):
+        return self._cancellable(self.completion_item_resolve, completionItem)
 
     def m_text_document__definition(self, textDocument=None, position=None, **_kwargs):
-        return self.definitions(textDocument['uri'], position)
+        return self._document_request(self.definitions, textDocument['uri'], position)
 
     def m_text_document__document_highlight(self, textDocument=None, position=None, **_kwargs):
-        return self.highlight(textDocument['uri'], position)
+        return self._document_request(self.highlight, textDocument['uri'], position)
 
     def m_text_document__hover(self, textDocument=None, position=None, **_kwargs):
-        return self.hover(textDocument['uri'], position)
+        return self._document_request(self.hover, textDocument['uri'], position)
 
     def m_text_document__document_symbol(self, textDocument=None, **_kwargs):
-        return self.document_symbols(textDocument['uri'])
+        return self._document_request(self.document_symbols, textDocument['uri'])
 
     def m_text_document__formatting(self, textDocument=None, _options=None, **_kwargs):
         # For now we're ignoring formatting options.
         return self.format_document(textDocument['uri'])
 
     def m_text_document__rename(self, textDocument=None, position=None, newName=None, **_kwargs):
-        return self.rename(textDocument['uri'], position, newName)
+        return self._document_request(self.rename, textDocument['uri'], position, newName)
 
     def m_text_document__folding_range(self, textDocument=None, **_kwargs):
-        return self.folding(textDocument['uri'])
+        return self._document_request(self.folding, textDocument['uri'])
 
     def m_text_document__range_formatting(self, textDocument=None, range=None, _options=None, **_kwargs):
         # Again, we'll ignore formatting options for now.
@@ -349,10 +524,10 @@ def m_text_document__range_formatting(self, textDocument=None, range=None, _opti
 
     def m_text_document__references(self, textDocument=None, position=None, context=None, **_kwargs):
         exclude_declaration = not context['includeDeclaration']
-        return self.references(textDocument['uri'], position, exclude_declaration)
+        return self._document_request(self.references, textDocument['uri'], position, exclude_declaration)
 
     def m_text_document__signature_help(self, textDocument=None, position=None, **_kwargs):
-        return self.signature_help(textDocument['uri'], position)
+        return self._document_request(self.signature_help, textDocument['uri'], position)
 
     def m_workspace__did_change_configuration(self, settings=None):
         self.config.update((settings or {}).get('pyls', {}))
@@ -371,7 +546,9 @@ def m_workspace__did_change_workspace_folders(self, event=None, **_kwargs):  # p
         for removed_info in removed:
             if 'uri' in removed_info:
                 removed_uri = removed_info['uri']
-                self.workspaces.pop(removed_uri, None)
+                workspace = self.workspaces.pop(removed_uri, None)
+                if workspace is not None:
+                    workspace.stop_symbol_index()
 
         for added_info in added:
             if 'uri' in added_info:
@@ -380,8 +557,12 @@ def m_workspace__did_change_workspace_folders(self, event=None, **_kwargs):  # p
                     added_uri, self.config._init_opts,
                     self.config._process_id, self.config._capabilities)
                 workspace_config.update(self.config._settings)
-                self.workspaces[added_uri] = Workspace(
-                    added_uri, self._endpoint, workspace_config)
+                workspace = Workspace(added_uri, self._endpoint, workspace_config)
+                self.workspaces[added_uri] = workspace
+                # Workspace folders are projects, so their symbols are
+                # indexed in advance to search them quickly
+                if workspace.is_local():
+                    workspace.symbol_index.start()
 
         root_workspace_removed = any(removed_info['uri'] == self.root_uri for removed_info in removed)
         workspace_added = len(added) > 0 and 'uri' in added[0]
@@ -420,6 +601,14 @@ def m_workspace__did_change_watched_files(self, changes=None, **_kwargs):
             elif d['uri'].endswith(CONFIG_FILEs):
                 config_changed = True
 
+        if config_changed or changed_py_files:
+            lint_worker.clear_cache()
+
+        for uri in changed_py_files:
+            workspace = self._match_uri_to_workspace(uri)
+            if workspace.is_local():
+                workspace.symbol_index.update_files([uris.to_fs_path(uri)])
+
         if config_changed:
             self.config.settings.cache_clear()
         elif not changed_py_files:
@@ -433,6 +622,9 @@ def m_workspace__did_change_watched_files(self, changes=None, **_kwargs):
                 if doc_uri not in changed_py_files:
                     self.lint(doc_uri, is_saved=False)
 
+    def m_workspace__symbol(self, query=None, **_kwargs):
+        return self._cancellable(self.workspace_symbols, query or '')
+
     def m_workspace__execute_command(self, command=None, arguments=None):
         return self.execute_command(command, arguments)
 
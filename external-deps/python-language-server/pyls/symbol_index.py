@@ -0,0 +1,511 @@
+# Copyright 2017 Palantir Technologies, Inc.
+"""Project-wide index of the symbols defined in Python files.
+
+Symbols are extracted from syntax trees, without any inference, so that
+large projects can be indexed in the background quickly. The index is saved
+to disk together with the modification time, size and hash of each
+file, so that only files that changed since the last session need to
+be parsed again. Changes made afterwards are saved periodically, not
+after each of them.
+"""
+import ast
+import bisect
+import hashlib
+import heapq
+import io
+import logging
+import os
+import re
+import threading
+import time
+
+import parso
+
+from . import _utils, lsp, uris
+
+log = logging.getLogger(__name__)
+
+# Increase when the format of the saved index changes
+INDEX_VERSION = 1
+MAX_FILES = 20000
+MAX_RESULTS = 500
+# Number of files indexed between updates of the data used to search
+SEARCH_UPDATE_FILES = 1000
+# Minimum time between saves of the index after it's built
+SAVE_INTERVAL_S = 30
+# Maximum time to wait for the index to be saved when it's stopped
+STOP_TIMEOUT_S = 5
+PYTHON_FILE_EXTENSIONS = ('.py', '.pyi')
+SKIP_DIRS = ('__pycache__', 'node_modules', 'site-packages')
+
+# Loaded the first time a file with syntax errors is indexed
+_GRAMMAR = None
+
+
+def _skip_dir(dirpath, name):
+    if name.startswith('.') or name in SKIP_DIRS:
+        return True
+    # Virtual and conda environments
+    path = os.path.join(dirpath, name)
+    return (os.path.isfile(os.path.join(path, 'pyvenv.cfg')) or
+            os.path.isdir(os.path.join(path, 'conda-meta')))
+
+
+def _symbol_kind(name, in_class, is_function=False):
+    if is_function:
+        return lsp.SymbolKind.Method if in_class else lsp.SymbolKind.Function
+    if in_class:
+        return lsp.SymbolKind.Field
+    if name.isupper():
+        return lsp.SymbolKind.Constant
+    return lsp.SymbolKind.Variable
+
+
+class _AstSymbols(object):
+    """Extract symbols from the tree built by the ast module.
+
+    This is much faster than using parso, but only works for files without
+    syntax errors.
+    """
+
+    _FUNCTION_NODES = tuple(
+        getattr(ast, name) for name in ('FunctionDef', 'AsyncFunctionDef') if hasattr(ast, name))
+
+    def __init__(self, source):
+        if isinstance(source, bytes):
+            text = source.decode('utf-8', 'replace')
+        else:
+            text = source
+        self._lines = text.splitlines()
+        self._tree = ast.parse(source)
+        self.symbols = []
+        self._walk(self._tree.body)
+
+    def _column(self, line, offset):
+        """Convert a column in UTF-8 bytes, as given by ast, to characters."""
+        if line >= len(self._lines):
+            return offset
+        text = self._lines[line]
+        try:
+            text.encode('ascii')
+            return offset
+        except UnicodeError:
+            return len(text.encode('utf-8')[:offset].decode('utf-8', 'ignore'))
+
+    def _add(self, name, kind, container, node):
+        start_line = node.lineno - 1
+        end_line = getattr(node, 'end_lineno', node.lineno) - 1
+        start_column = self._column(start_line, node.col_offset)
+        end_offset = getattr(node, 'end_col_offset', None)
+        if end_offset is None:
+            end_column = start_column + len(name)
+        else:
+            end_column = self._column(end_line, end_offset)
+        self.symbols.append([name, kind, container,
+                             start_line, start_column, end_line, end_column])
+
+    def _add_targets(self, target, container, in_class):
+        if isinstance(target, ast.Name):
+            self._add(target.id, _symbol_kind(target.id, in_class), container, target)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self._add_targets(element, container, in_class)
+        elif isinstance(target, getattr(ast, 'Starred', ())):
+            self._add_targets(target.value, container, in_class)
+
+    def _walk(self, body, container=None, in_class=False):
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                self._add(node.name, lsp.SymbolKind.Class, container, node)
+                self._walk(node.body, container=node.name, in_class=True)
+            elif isinstance(node, self._FUNCTION_NODES):
+                kind = _symbol_kind(node.name, in_class, is_function=True)
+                self._add(node.name, kind, container, node)
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    self._add_targets(target, container, in_class)
+            elif isinstance(node, getattr(ast, 'AnnAssign', ())):
+                self._add_targets(node.target, container, in_class)
+            else:
+                # Definitions done conditionally, e.g. depending on the
+                # Python version or on whether an import succeeds
+                for field in ('body', 'orelse', 'finalbody'):
+                    if isinstance(node, (ast.If, ast.With, _TRY_NODES)):
+                        self._walk(getattr(node, field, []), container, in_class)
+                for handler in getattr(node, 'handlers', []):
+                    self._walk(handler.body, container, in_class)
+
+
+_TRY_NODES = tuple(
+    getattr(ast, name) for name in ('Try', 'TryExcept', 'TryFinally') if hasattr(ast, name))
+
+
+def _load_grammar():
+    """Return the parso grammar, or None if it's not available.
+
+    parso may not have a grammar for the running interpreter yet, in which
+    case files with syntax errors are not indexed.
+    """
+    global _GRAMMAR  # pylint: disable=global-statement
+    if _GRAMMAR is None:
+        try:
+            _GRAMMAR = parso.load_grammar()
+        except Exception:  # pylint: disable=broad-except
+            log.warning('Failed to load the parso grammar', exc_info=True)
+            _GRAMMAR = False
+    return _GRAMMAR or None
+
+
+def _parso_symbol(node, kind, container):
+    name = node.name
+    (start_line, start_column) = node.start_pos
+    (end_line, end_column) = node.end_pos
+    return [name.value, kind, container,
+            start_line - 1, start_column, end_line - 1, end_column]
+
+
+def _parso_walk(node, symbols, container=None, in_class=False):
+    """Add the definitions found in a parso `node` to `symbols`."""
+    for child in node.children:
+        kind = child.type
+        if kind == 'decorated':
+            child = child.children[-1]
+            kind = child.type
+        if kind == 'async_stmt':
+            child = child.children[-1]
+            kind = child.type
+
+        if kind == 'classdef':
+            symbols.append(_parso_symbol(child, lsp.SymbolKind.Class, container))
+            _parso_walk(child.children[-1], symbols, container=child.name.value,
+                        in_class=True)
+        elif kind == 'funcdef':
+            symbol_kind = _symbol_kind(child.name.value, in_class, is_function=True)
+            symbols.append(_parso_symbol(child, symbol_kind, container))
+        elif kind == 'simple_stmt':
+            for stmt in child.children:
+                if stmt.type != 'expr_stmt':
+                    continue
+                for name in stmt.get_defined_names():
+                    if name.type != 'name':
+                        continue
+                    (line, column) = name.start_pos
+                    symbols.append([name.value, _symbol_kind(name.value, in_class), container,
+                                    line - 1, column, line - 1, column + len(name.value)])
+        elif kind in ('if_stmt', 'try_stmt', 'with_stmt', 'suite'):
+            _parso_walk(child, symbols, container=container, in_class=in_class)
+
+
+def extract_symbols(source):
+    """Return the symbols defined in `source`.
+
+    Only classes, functions and the variables defined in modules and
+    classes are included, not the ones local to functions. Each symbol is
+    a list with its name, kind, container name and the start and end
+    lines and columns of its definition.
+    """
+    try:
+        return _AstSymbols(source).symbols
+    except (SyntaxError, ValueError):
+        # parso is able to recover from syntax errors
+        grammar = _load_grammar()
+        if grammar is None:
+            return []
+        symbols = []
+        _parso_walk(grammar.parse(source), symbols)
+        return symbols
+
+
+class SymbolIndex(object):
+    """Index of the symbols defined in the Python files under a folder.
+
+    Files are indexed in a background thread, which then waits for the
+    files reported as changed with `update_files`. Searches can be done
+    while the index is being built, returning the symbols found so far.
+    """
+
+    def __init__(self, root_path, cache_dir=None):
+        self._root_path = root_path
+        root_hash = hashlib.sha1(root_path.encode('utf-8')).hexdigest()
+        self._store_path = os.path.join(cache_dir or _utils.cache_dir('symbols'), root_hash + '.json')
+
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        # path -> {'mtime', 'size', 'hash', 'symbols'}
+        self._files = {}
+        self._pending = set()
+        self._stopped = False
+        self._thread = None
+        self._indexed = threading.Event()
+
+        # Data used to search symbols. It's computed again in the
+        # background after files are indexed.
+        self._search_data = None
+        self._search_data_stale = False
+
+    @property
+    def root_path(self):
+        return self._root_path
+
+    def start(self):
+        """Start indexing files in the background, if not done yet."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='SymbolIndex')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self, timeout=STOP_TIMEOUT_S):
+        """Stop indexing files and wait until the index is saved."""
+        with self._lock:
+            self._stopped = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def wait_indexed(self, timeout=None):
+        """Wait until all the files found at start have been indexed."""
+        return self._indexed.wait(timeout)
+
+    def update_files(self, paths):
+        """Index `paths` again because they were created, changed or removed."""
+        paths = [path for path in paths if path.endswith(PYTHON_FILE_EXTENSIONS)]
+        if not paths:
+            return
+        with self._lock:
+            self._pending.update(paths)
+            self._condition.notify_all()
+
+    def search(self, query, limit=MAX_RESULTS):  # pylint: disable=too-many-locals
+        """Return the symbols whose names fuzzy match `query`.
+
+        Symbols are returned as LSP SymbolInformation, best matches first:
+        exact matches, then names starting with `query`, containing it and
+        containing its characters in order. Shorter names go first within
+        each of these groups.
+        """
+        self.start()
+        with self._lock:
+            if self._search_data is None:
+                self._search_data = self._build_search_data(self._files)
+            sorted_names, joined_names, symbols_by_name = self._search_data
+
+        query = query.lower()
+        names = []
+        found = set()
+
+        def add_names(candidates):
+            candidates = [name for name in candidates if name not in found]
+            for name in heapq.nsmallest(limit, candidates, key=lambda name: (len(name), name)):
+                names.append(name)
+                found.add(name)
+
+        def enough():
+            return sum(len(symbols_by_name[name]) for name in names) >= limit
+
+        if query in symbols_by_name:
+            add_names([query])
+
+        if not query:
+            add_names(sorted_names[:limit])
+        else:
+            start = bisect.bisect_left(sorted_names, query)
+            end = start
+            while end < len(sorted_names) and sorted_names[end].startswith(query):
+                end += 1
+            add_names(sorted_names[start:end])
+
+        # Names are searched all at once with regular expressions on a
+        # string that has one per line, which is much faster than testing
+        # them one by one.
+        if query and not enough():
+            add_names(self._matching_names(re.escape(query), joined_names))
+        if len(query) > 1 and not enough():
+            # Each character is followed by any others except the next
+            # one, so that no backtracking is needed
+            pattern = re.escape(query[0]) + ''.join(
+                '[^\n{0}]*{0}'.format(re.escape(char)) for char in query[1:])
+            add_names(self._matching_names(pattern, joined_names))
+
+        results = []
+        for name in names:
+            for path, symbol in symbols_by_name[name]:
+                results.append(self._symbol_information(path, symbol))
+                if len(results) >= limit:
+                    return results
+        return results
+
+    @staticmethod
+    def _matching_names(pattern, joined_names):
+        """Return the names in `joined_names` where `pattern` is found."""
+        names = set()
+        for match in re.finditer(pattern, joined_names):
+            start = joined_names.rfind('\n', 0, match.start()) + 1
+            end = joined_names.find('\n', match.start())
+            names.add(joined_names[start:end if end >= 0 else len(joined_names)])
+        return names
+
+    @staticmethod
+    def _symbol_information(path, symbol):
+        name, kind, container, start_line, start_column, end_line, end_column = symbol
+        return {
+            'name': name,
+            'kind': kind,
+            'containerName': container,
+            'location': {
+                'uri': uris.from_fs_path(path),
+                'range': {
+                    'start': {'line': start_line, 'character': start_column},
+                    'end': {'line': end_line, 'character': end_column},
+                },
+            },
+        }
+
+    @staticmethod
+    def _build_search_data(files):
+        symbols_by_name = {}
+        for path, entry in files.items():
+            for symbol in entry['symbols']:
+                symbols_by_name.setdefault(symbol[0].lower(), []).append((path, symbol))
+        sorted_names = sorted(symbols_by_name)
+        return sorted_names, '\n'.join(sorted_names), symbols_by_name
+
+    def _update_search_data(self):
+        """Compute the data used to search symbols again, if needed."""
+        with self._lock:
+            if not self._search_data_stale:
+                return
+            self._search_data_stale = False
+            files = dict(self._files)
+        search_data = self._build_search_data(files)
+        with self._lock:
+            self._search_data = search_data
+
+    def _set_entry(self, path, entry):
+        with self._lock:
+            if entry is None:
+                if self._files.pop(path, None) is None:
+                    return
+            else:
+                self._files[path] = entry
+            self._search_data_stale = True
+
+    # ---- Background thread
+    def _run(self):
+        try:
+            self._index_all()
+        except Exception:  # pylint: disable=broad-except
+            log.exception('Failed to index symbols in %s', self._root_path)
+        finally:
+            self._indexed.set()
+
+        # Time at which the changes not saved yet must be saved
+        save_time = None
+        while True:
+            with self._lock:
+                while not self._pending and not self._stopped:
+                    if save_time is None:
+                        self._condition.wait()
+                    elif time.time() < save_time:
+                        self._condition.wait(save_time - time.time())
+                    else:
+                        break
+                stopped = self._stopped
+                paths = self._pending
+                self._pending = set()
+
+            if stopped:
+                if save_time is not None:
+                    self._save()
+                return
+
+            if paths:
+                for path in paths:
+                    self._index_file(path, self._files.get(path))
+                self._update_search_data()
+                if save_time is None:
+                    save_time = time.time() + SAVE_INTERVAL_S
+            if save_time is not None and time.time() >= save_time:
+                self._save()
+                save_time = None
+
+    def _index_all(self):
+        stored = self._load()
+        # Show the symbols of the last session until they are checked
+        with self._lock:
+            self._files = dict(stored)
+            self._search_data_stale = True
+        self._update_search_data()
+
+        paths = set()
+        for dirpath, dirnames, filenames in os.walk(self._root_path):
+            dirnames[:] = [name for name in dirnames if not _skip_dir(dirpath, name)]
+            for filename in filenames:
+                if filename.endswith(PYTHON_FILE_EXTENSIONS):
+                    paths.add(os.path.join(dirpath, filename))
+            if len(paths) >= MAX_FILES:
+                log.warning('Only the first %s files in %s are indexed', MAX_FILES, self._root_path)
+                break
+
+        for i, path in enumerate(paths):
+            if self._stopped:
+                return
+            self._index_file(path, stored.get(path))
+            if i % SEARCH_UPDATE_FILES == SEARCH_UPDATE_FILES - 1:
+                self._update_search_data()
+        for path in set(stored) - paths:
+            self._set_entry(path, None)
+        self._update_search_data()
+        self._save()
+
+    def _index_file(self, path, entry):
+        """Update the symbols of `path` if it changed since `entry` was saved."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._set_entry(path, None)
+            return
+
+        if entry is not None and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+            return
+
+        try:
+            with io.open(path, 'rb') as f:
+                content = f.read()
+        except (IOError, OSError):
+            self._set_entry(path, None)
+            return
+
+        content_hash = hashlib.sha1(content).hexdigest()
+        if entry is not None and entry['hash'] == content_hash:
+            symbols = entry['symbols']
+        else:
+            try:
+                symbols = extract_symbols(content)
+            except Exception:  # pylint: disable=broad-except
+                log.debug('Failed to extract symbols from %s', path, exc_info=True)
+                symbols = []
+
+        self._set_entry(path, {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'hash': content_hash,
+            'symbols': symbols,
+        })
+
+    def _load(self):
+        data = _utils.load_json(self._store_path) or {}
+        if data.get('version') != INDEX_VERSION or data.get('root_path') != self._root_path:
+            return {}
+        return data.get('files', {})
+
+    def _save(self):
+        with self._lock:
+            data = {
+                'version': INDEX_VERSION,
+                'root_path': self._root_path,
+                'files': dict(self._files),
+            }
+        _utils.save_json(self._store_path, data)
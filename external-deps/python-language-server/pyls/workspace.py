@@ -4,11 +4,12 @@
 import os
 import re
 import functools
-from threading import RLock
+from threading import RLock, Thread, current_thread
 
 import jedi
 
-from . import lsp, uris, _utils
+from . import environment_cache, lsp, uris, _utils
+from .symbol_index import SymbolIndex
 
 log = logging.getLogger(__name__)
 
@@ -42,6 +43,12 @@ def __init__(self, root_uri, endpoint, config=None):
 
         # Cache jedi environments
         self._environments = {}
+        self._environments_lock = RLock()
+        # Modules loaded when the jedi environment is warmed up, if done
+        self._preload_modules = None
+
+        # Index of the symbols in the workspace files, created when needed
+        self._symbol_index = None
 
         # Whilst incubating, keep rope private
         self.__rope = None
@@ -72,6 +79,49 @@ def root_path(self):
     def root_uri(self):
         return self._root_uri
 
+    @property
+    def symbol_index(self):
+        if self._symbol_index is None:
+            self._symbol_index = SymbolIndex(self._root_path)
+        return self._symbol_index
+
+    def stop_symbol_index(self):
+        if self._symbol_index is not None:
+            self._symbol_index.stop()
+
+    def get_environment(self, environment_path=None, env_vars=None):
+        """Get the jedi environment for `environment_path`, or the default one."""
+        with self._environments_lock:
+            if environment_path not in self._environments:
+                self._environments[environment_path] = environment_cache.get_environment(
+                    environment_path, env_vars=env_vars)
+            return self._environments[environment_path]
+
+    def preload_environment(self, modules):
+        """Warm up the configured jedi environment in a background thread.
+
+        It's done again with the same `modules` if the environment changes.
+        """
+        self._preload_modules = modules
+        thread = Thread(target=self._preload_environment, args=(modules,), name='PreloadEnvironment')
+        thread.daemon = True
+        thread.start()
+
+    def _preload_environment(self, modules):
+        jedi_settings = self._config.plugin_settings('jedi') if self._config else {}
+        env_vars = jedi_settings.get('env_vars')
+        env_vars = dict(env_vars) if env_vars is not None else os.environ.copy()
+        env_vars.pop('PYTHONPATH', None)
+        try:
+            environment = self.get_environment(jedi_settings.get('environment'), env_vars=env_vars)
+        except Exception:  # pylint: disable=broad-except
+            log.exception('Failed to create jedi environment')
+            return
+        sys_path = environment.get_sys_path() + (jedi_settings.get('extra_paths') or [])
+        project = jedi.Project(path=self._root_path, sys_path=sys_path)
+        environment_cache.preload_modules(environment, project, modules)
+        log.debug('Preloaded jedi environment %s', environment)
+
     def is_local(self):
         return (self._root_uri_scheme == '' or self._root_uri_scheme == 'file') and os.path.exists(self._root_path)
 
@@ -96,7 +146,11 @@ def update_document(self, doc_uri, change, version=None):
         self._docs[doc_uri].version = version
 
     def update_config(self, settings):
+        old_environment = self._config.plugin_settings('jedi').get('environment')
         self._config.update((settings or {}).get('pyls', {}))
+        new_environment = self._config.plugin_settings('jedi').get('environment')
+        if self._preload_modules is not None and new_environment != old_environment:
+            self.preload_environment(self._preload_modules)
         for doc_uri in self.documents:
             self.get_document(doc_uri).update_config(settings)
 
@@ -139,11 +193,27 @@ def __init__(self, uri, workspace, source=None, version=None, local=True, extra_
         self._config = workspace._config
         self._workspace = workspace
         self._local = local
+        # The document contents are kept as a list of lines, so that edits
+        # only touch the lines they change. The full source is built when
+        # it's requested and cached until the next edit.
         self._source = source
+        self._lines = None
+        # Offsets at which lines start. Only the ones before the first
+        # line changed by an edit are kept.
+        self._line_offsets = [0]
         self._extra_sys_path = extra_sys_path or []
         self._rope_project_builder = rope_project_builder
         self._lock = RLock()
 
+        # Jedi scripts and request results computed for the current
+        # version of the document. They are cleared when it changes.
+        self._revision = 0
+        self._jedi_scripts = {}
+        self._results = {}
+
+        # Data that plugins need to keep between requests
+        self.shared_data = {}
+
     def __str__(self):
         return str(self.uri)
 
@@ -154,28 +224,49 @@ def _rope_resource(self, rope_config):
     @property
     @lock
     def lines(self):
-        return self.source.splitlines(True)
+        """List of lines of the document. It must not be modified."""
+        if self._lines is None:
+            if self._source is None:
+                # Documents that are not open are always read from disk
+                return self._read_source().splitlines(True)
+            self._lines = self._source.splitlines(True)
+        return self._lines
 
     @property
     @lock
     def source(self):
         if self._source is None:
-            with io.open(self.path, 'r', encoding='utf-8') as f:
-                return f.read()
+            if self._lines is None:
+                return self._read_source()
+            self._source = ''.join(self._lines)
         return self._source
 
+    def _read_source(self):
+        with io.open(self.path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    @lock
     def update_config(self, settings):
         self._config.update((settings or {}).get('pyls', {}))
+        self._clear_caches()
+
+    def _clear_caches(self):
+        self._revision += 1
+        self._jedi_scripts.clear()
+        self._results.clear()
 
     @lock
     def apply_change(self, change):
         """Apply a change to the document."""
+        self._clear_caches()
         text = change['text']
         change_range = change.get('range')
 
         if not change_range:
             # The whole file has changed
             self._source = text
+            self._lines = None
+            self._line_offsets = [0]
             return
 
         start_line = change_range['start']['line']
@@ -183,44 +274,71 @@ def apply_change(self, change):
         end_line = change_range['end']['line']
         end_col = change_range['end']['character']
 
-        # Check for an edit occuring at the very end of the file
-        if start_line == len(self.lines):
-            self._source = self.source + text
-            return
-
-        new = io.StringIO()
-
-        # Iterate over the existing document until we hit the edit range,
-        # at which point we write the new text, then loop until we hit
-        # the end of the range and continue writing.
-        for i, line in enumerate(self.lines):
-            if i < start_line:
-                new.write(line)
-                continue
-
-            if i > end_line:
-                new.write(line)
-                continue
-
-            if i == start_line:
-                new.write(line[:start_col])
-                new.write(text)
-
-            if i == end_line:
-                new.write(line[end_col:])
+        lines = self.lines
+        num_lines = len(lines)
 
-        self._source = new.getvalue()
+        if start_line >= num_lines:
+            # Edit occurring at the very end of the file
+            if num_lines and not lines[-1].endswith(('\r', '\n')):
+                # The last line has no newline, so the edit is appended
+                # to it instead of starting a new one.
+                start_line = end_line = num_lines - 1
+                start_col = end_col = len(lines[-1])
+            else:
+                start_line = end_line = num_lines
+                start_col = end_col = 0
+        elif end_line >= num_lines:
+            end_line = num_lines - 1
+            end_col = len(lines[end_line])
+
+        # Lines to split again after applying the edit. Neighbouring lines
+        # are included when the edit could join a '\r' with a '\n'.
+        first = start_line
+        if first > 0 and lines[first - 1].endswith('\r'):
+            first -= 1
+        last = end_line + 1
+        if last < num_lines and lines[last].startswith('\n'):
+            last += 1
+
+        start_text = lines[start_line] if start_line < num_lines else ''
+        end_text = lines[end_line] if end_line < num_lines else ''
+        new_text = ''.join((''.join(lines[first:start_line]),
+                            start_text[:start_col],
+                            text,
+                            end_text[end_col:],
+                            ''.join(lines[end_line + 1:last])))
+
+        # A new list is created because linters can be reading the old one
+        # in other threads.
+        self._lines = lines[:first] + new_text.splitlines(True) + lines[last:]
+        self._source = None
+        del self._line_offsets[first + 1:]
 
+    @lock
     def offset_at_position(self, position):
         """Return the byte-offset pointed at by the given position."""
-        return position['character'] + len(''.join(self.lines[:position['line']]))
+        return position['character'] + self._line_offset(position['line'])
+
+    def _line_offset(self, line):
+        """Return the offset at which `line` starts."""
+        lines = self.lines
+        line = min(line, len(lines))
+        if self._lines is None:
+            return sum(len(text) for text in lines[:line])
 
+        offsets = self._line_offsets
+        while len(offsets) <= line:
+            offsets.append(offsets[-1] + len(lines[len(offsets) - 1]))
+        return offsets[line]
+
+    @lock
     def word_at_position(self, position):
         """Get the word under the cursor returning the start and end positions."""
-        if position['line'] >= len(self.lines):
+        lines = self.lines
+        if position['line'] >= len(lines):
             return ''
 
-        line = self.lines[position['line']]
+        line = lines[position['line']]
         i = position['character']
         # Split word in two
         start = line[:i]
@@ -239,6 +357,33 @@ def jedi_names(self, use_document_path, all_scopes=False, definitions=True, refe
         return script.get_names(all_scopes=all_scopes, definitions=definitions,
                                 references=references)
 
+    def memoize_result(self, name, position, compute):
+        """
+        Return the result of calling `compute` for request `name` at `position`.
+
+        `position` is None for requests about the whole document.
+
+        Results are reused until the document changes, so that requests sent
+        repeatedly for the same position don't need to be computed again.
+        """
+        with self._lock:
+            cacheable = self._source is not None or self._lines is not None
+            revision = self._revision
+            key = (name,)
+            if position is not None:
+                key += (position['line'], position['character'])
+            if cacheable and key in self._results:
+                return self._results[key]
+
+        # Don't hold the lock while computing the result to not block
+        # other threads that need to access the document.
+        result = compute()
+
+        with self._lock:
+            if cacheable and revision == self._revision:
+                self._results[key] = result
+        return result
+
     @lock
     def jedi_script(self, position=None, use_document_path=False):
         extra_paths = []
@@ -251,13 +396,26 @@ def jedi_script(self, position=None, use_document_path=False):
             extra_paths = jedi_settings.get('extra_paths') or []
             env_vars = jedi_settings.get('env_vars')
 
+        # Scripts of documents that are not open are not cached because
+        # they could change on disk.
+        cacheable = position is None and (self._source is not None or self._lines is not None)
+        # Jedi is not thread-safe, so scripts are not shared between the
+        # threads that handle requests.
+        key = (current_thread(), use_document_path, environment_path, tuple(extra_paths),
+               tuple(sorted(env_vars.items())) if env_vars is not None else None)
+        if cacheable and key in self._jedi_scripts:
+            return self._jedi_scripts[key]
+
+        if env_vars is not None:
+            env_vars = dict(env_vars)
+
         # Drop PYTHONPATH from env_vars before creating the environment because that makes
         # Jedi throw an error.
         if env_vars is None:
             env_vars = os.environ.copy()
         env_vars.pop('PYTHONPATH', None)
 
-        environment = self.get_enviroment(environment_path, env_vars=env_vars) if environment_path else None
+        environment = self.get_enviroment(environment_path, env_vars=env_vars)
         sys_path = self.sys_path(environment_path, env_vars=env_vars) + extra_paths
         project_path = self._workspace.root_path
 
@@ -276,22 +434,14 @@ def jedi_script(self, position=None, use_document_path=False):
             # Deprecated by Jedi to use in Script() constructor
             kwargs += _utils.position_to_jedi_linecolumn(self, position)
 
-        return jedi.Script(**kwargs)
+        script = jedi.Script(**kwargs)
+        if cacheable:
+            self._jedi_scripts[key] = script
+        return script
 
     def get_enviroment(self, environment_path=None, env_vars=None):
         # TODO(gatesn): #339 - make better use of jedi environments, they seem pretty powerful
-        if environment_path is None:
-            environment = jedi.api.environment.get_cached_default_environment()
-        else:
-            if environment_path in self._workspace._environments:
-                environment = self._workspace._environments[environment_path]
-            else:
-                environment = jedi.api.environment.create_environment(path=environment_path,
-                                                                      safe=False,
-                                                                      env_vars=env_vars)
-                self._workspace._environments[environment_path] = environment
-
-        return environment
+        return self._workspace.get_environment(environment_path, env_vars=env_vars)
 
     def sys_path(self, environment_path=None, env_vars=None):
         # Copy our extra sys path
@@ -7,6 +7,7 @@
 from pyls import uris, lsp
 from pyls.workspace import Document
 from pyls.plugins.jedi_completion import pyls_completions as pyls_jedi_completions
+from pyls.plugins.jedi_completion import pyls_completion_item_resolve as pyls_jedi_completion_item_resolve
 from pyls.plugins.rope_completion import pyls_completions as pyls_rope_completions
 
 
@@ -41,6 +42,25 @@ def everyone(self, a, b, c=None, d=2):
 """
 
 
+def test_jedi_completion_item_resolve(config, workspace):
+    # Over 'i' in os.path.isabs(...)
+    com_position = {'line': 1, 'character': 15}
+    doc = Document(DOC_URI, workspace, DOC)
+    config.capabilities['textDocument'] = {
+        'completion': {'completionItem': {'resolveSupport': {'properties': ['documentation']}}}}
+
+    items = pyls_jedi_completions(config, doc, com_position)
+    isabs = [item for item in items if item['label'] == 'isabs(path)'][0]
+    assert 'documentation' not in isabs
+    assert isabs['data'] == {'doc_uri': DOC_URI}
+
+    resolved = pyls_jedi_completion_item_resolve(isabs, doc)
+    assert 'Test whether a path is absolute' in resolved['documentation']
+
+    # Items not returned by the last completion request are not resolved
+    assert pyls_jedi_completion_item_resolve({'label': 'unknown'}, doc) is None
+
+
 def test_rope_import_completion(config, workspace):
     com_position = {'line': 0, 'character': 7}
     doc = Document(DOC_URI, workspace, DOC)
@@ -59,18 +59,31 @@ def test_flake8_lint(workspace):
 
 
 def test_flake8_config_param(workspace):
-    with patch('pyls.plugins.flake8_lint.Popen') as popen_mock:
-        mock_instance = popen_mock.return_value
-        mock_instance.communicate.return_value = [bytes(), bytes()]
+    with patch('pyls.plugins.flake8_lint.lint_worker.run') as run_mock:
+        run_mock.return_value = ''
         flake8_conf = '/tmp/some.cfg'
         workspace._config.update({'plugins': {'flake8': {'config': flake8_conf}}})
         _name, doc = temp_document(DOC, workspace)
         flake8_lint.pyls_lint(workspace, doc)
-        call_args = popen_mock.call_args.args[0]
-        assert 'flake8' in call_args
+        linter, call_args = run_mock.call_args.args[:2]
+        assert linter == 'flake8'
         assert '--config={}'.format(flake8_conf) in call_args
 
 
+def test_flake8_cached_results(workspace):
+    with patch('pyls.plugins.flake8_lint.lint_worker.run') as run_mock:
+        run_mock.return_value = 'stdin:1:1: F401 module imported but unused'
+        _name, doc = temp_document(DOC, workspace)
+        diags = flake8_lint.pyls_lint(workspace, doc)
+        assert flake8_lint.pyls_lint(workspace, doc) == diags
+        assert run_mock.call_count == 1
+
+        # The linter runs again when the document changes
+        doc.apply_change({'text': DOC + '\n'})
+        flake8_lint.pyls_lint(workspace, doc)
+        assert run_mock.call_count == 2
+
+
 def test_flake8_executable_param(workspace):
     with patch('pyls.plugins.flake8_lint.Popen') as popen_mock:
         mock_instance = popen_mock.return_value
@@ -1,9 +1,17 @@
 # Copyright 2019 Palantir Technologies, Inc.
 
+import os
 from textwrap import dedent
 
+from mock import patch
+try:
+    from importlib import reload as reload_module
+except ImportError:  # Python 2
+    reload_module = reload  # noqa: F821 pylint: disable=undefined-variable
+
 from pyls import uris
 from pyls.workspace import Document
+from pyls.plugins import folding
 from pyls.plugins.folding import pyls_folding_range
 
 
@@ -166,3 +174,58 @@ def test_folding_syntax_error(workspace):
                 {'startLine': 26, 'endLine': 28},
                 {'startLine': 27, 'endLine': 28}]
     assert ranges == expected
+
+
+def test_folding_incremental(workspace):
+    doc_uri = uris.from_fs_path(os.path.join(os.path.dirname(__file__), 'folding.py'))
+    workspace.put_document(doc_uri, DOC)
+    doc = workspace.get_document(doc_uri)
+    pyls_folding_range(doc)
+
+    # Edits before, inside and after syntax errors, and additions and
+    # removals of whole blocks
+    edits = [
+        ((44, 0), (44, 0), 'x = 1\n'),
+        ((13, 4), (13, 4), 'if a:\n        pass\n    '),
+        ((22, 0), (22, 0), 'class B(:\n'),
+        ((30, 4), (31, 0), ''),
+        ((22, 0), (23, 0), ''),
+        ((60, 0), (60, 0), 'def f(\n'),
+        ((2, 0), (6, 0), ''),
+    ]
+    for start, end, text in edits:
+        workspace.update_document(doc_uri, {
+            'range': {
+                'start': {'line': start[0], 'character': start[1]},
+                'end': {'line': end[0], 'character': end[1]},
+            },
+            'text': text,
+        })
+        ranges = pyls_folding_range(doc)
+        assert ranges == pyls_folding_range(Document(doc_uri, workspace, doc.source))
+        assert pyls_folding_range(doc) is ranges
+
+
+def test_folding_without_grammar(workspace):
+    expected = pyls_folding_range(Document(DOC_URI, workspace, DOC))
+
+    # parso may not have a grammar for the running interpreter
+    with patch.object(folding.parso, 'load_grammar', side_effect=NotImplementedError):
+        reload_module(folding)
+        assert folding._load_grammar() is None
+    try:
+        # Documents are parsed again in full with parso.parse instead
+        workspace.put_document(DOC_URI, DOC)
+        doc = workspace.get_document(DOC_URI)
+        assert folding.pyls_folding_range(doc) == expected
+        workspace.update_document(DOC_URI, {
+            'range': {
+                'start': {'line': 0, 'character': 0},
+                'end': {'line': 0, 'character': 0},
+            },
+            'text': 'x = 1\n',
+        })
+        ranges = folding.pyls_folding_range(doc)
+    finally:
+        folding._GRAMMAR = None
+    assert ranges == pyls_folding_range(Document(DOC_URI, workspace, doc.source))
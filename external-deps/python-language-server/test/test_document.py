@@ -97,3 +97,98 @@ def test_document_end_of_file_edit(workspace):
         "print 'b'\n",
         "o",
     ]
+
+
+def test_document_end_of_file_edit_without_newline(workspace):
+    doc = Document('file:///uri', workspace, u"print 'a'")
+    doc.apply_change({'text': u'\n', 'range': {
+        'start': {'line': 1, 'character': 0},
+        'end': {'line': 1, 'character': 0}
+    }})
+    assert doc.lines == ["print 'a'\n"]
+    doc.apply_change({'text': u'o', 'range': {
+        'start': {'line': 1, 'character': 0},
+        'end': {'line': 1, 'character': 0}
+    }})
+    assert doc.lines == ["print 'a'\n", "o"]
+    assert doc.source == u"print 'a'\no"
+    assert doc.offset_at_position({'line': 1, 'character': 0}) == 10
+
+
+def test_document_line_endings_edit(workspace):
+    doc = Document('file:///uri', workspace, u'a\r\nb\rc\n')
+    # Removing the 'b' joins the '\r' at the end of 'a' with the next one
+    doc.apply_change({'text': u'', 'range': {
+        'start': {'line': 1, 'character': 0},
+        'end': {'line': 1, 'character': 1}
+    }})
+    assert doc.lines == [u'a\r\n', u'\r', u'c\n']
+    doc.apply_change({'text': u'\n', 'range': {
+        'start': {'line': 1, 'character': 0},
+        'end': {'line': 1, 'character': 1}
+    }})
+    assert doc.lines == [u'a\r\n', u'\n', u'c\n']
+    assert doc.source == u'a\r\n\nc\n'
+
+
+def test_document_incremental_edits(workspace):
+    source = u'import os\n\ndef main():\n    """Main."""\n    print(os.getcwd())\n'
+    doc = Document('file:///uri', workspace, source)
+    edits = [
+        ((4, 10, 4, 13), u'path.join'),
+        ((2, 4, 2, 8), u'run'),
+        ((1, 0, 1, 0), u'import sys\n'),
+        ((4, 15, 6, 0), u'\n    pass\n'),
+        ((0, 0, 0, 0), u'# Comment\r\n'),
+    ]
+    for (start_line, start_col, end_line, end_col), text in edits:
+        # Compute the expected result from the full source
+        lines = doc.source.splitlines(True)
+        start = sum(len(line) for line in lines[:start_line]) + start_col
+        end = sum(len(line) for line in lines[:end_line]) + end_col
+        expected = doc.source[:start] + text + doc.source[end:]
+
+        # Prefix offsets are computed before the edit to test they are
+        # updated by it
+        assert doc.offset_at_position({'line': end_line, 'character': end_col}) == end
+
+        doc.apply_change({'text': text, 'range': {
+            'start': {'line': start_line, 'character': start_col},
+            'end': {'line': end_line, 'character': end_col}
+        }})
+        assert doc.source == expected
+        assert doc.lines == expected.splitlines(True)
+        for line in range(len(doc.lines) + 1):
+            offset = sum(len(text) for text in doc.lines[:line])
+            assert doc.offset_at_position({'line': line, 'character': 0}) == offset
+
+
+def test_jedi_script_cache(workspace):
+    doc = Document(DOC_URI, workspace, DOC)
+    script = doc.jedi_script()
+    assert doc.jedi_script() is script
+    assert doc.jedi_script(use_document_path=True) is not script
+
+    doc.apply_change({'text': u'import os\n'})
+    new_script = doc.jedi_script()
+    assert new_script is not script
+    assert new_script._code == u'import os\n'
+
+
+def test_memoize_result(workspace):
+    doc = Document(DOC_URI, workspace, DOC)
+    position = {'line': 0, 'character': 8}
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert doc.memoize_result('hover', position, compute) == 1
+    assert doc.memoize_result('hover', position, compute) == 1
+    assert doc.memoize_result('hover', {'line': 0, 'character': 9}, compute) == 2
+    assert doc.memoize_result('signature_help', position, compute) == 3
+
+    # Results are computed again after the document changes
+    doc.apply_change({'text': DOC})
+    assert doc.memoize_result('hover', position, compute) == 4
@@ -0,0 +1,49 @@
+# Copyright 2017 Palantir Technologies, Inc.
+import glob
+import json
+import os
+import sys
+
+import jedi
+from mock import patch
+
+from pyls import environment_cache
+from pyls.environment_cache import CachedEnvironment, get_environment, preload_modules
+
+
+def test_environment_cache(tmpdir):
+    cache_dir = str(tmpdir)
+    environment = get_environment(sys.executable, cache_dir=cache_dir)
+    assert isinstance(environment, CachedEnvironment)
+    assert environment.version_info[:3] == sys.version_info[:3]
+    jedi_environment = jedi.api.environment.create_environment(sys.executable, safe=False)
+    assert environment.get_sys_path() == jedi_environment.get_sys_path()
+
+    # The saved information is used in the next session
+    with patch.object(environment_cache, '_create_environment') as create:
+        environment = get_environment(sys.executable, cache_dir=cache_dir)
+    assert not create.called
+    assert environment.get_sys_path() == jedi_environment.get_sys_path()
+
+    # The subprocess is started when jedi needs it
+    script = jedi.Script('import os\nos.pa', environment=environment)
+    assert 'path' in [c.name for c in script.complete(2, 5)]
+
+    # The information is not used after packages are installed
+    store_path, = glob.glob(os.path.join(cache_dir, '*.json'))
+    with open(store_path) as f:
+        data = json.load(f)
+    data['mtimes'][data['executable']] -= 1
+    with open(store_path, 'w') as f:
+        json.dump(data, f)
+    with patch.object(environment_cache, '_create_environment',
+                      wraps=environment_cache._create_environment) as create:
+        get_environment(sys.executable, cache_dir=cache_dir)
+    assert create.called
+
+
+def test_preload_modules(tmpdir):
+    environment = get_environment(sys.executable, cache_dir=str(tmpdir))
+    project = jedi.Project(str(tmpdir), sys_path=environment.get_sys_path())
+    # Modules that can't be found are ignored
+    preload_modules(environment, project, ['math', 'os', 'not_a_module'])
@@ -1,14 +1,16 @@
 # Copyright 2017 Palantir Technologies, Inc.
+from concurrent import futures
 import os
 import time
 import multiprocessing
 import sys
-from threading import Thread
+from threading import Event, Thread
 
-from pyls_jsonrpc.exceptions import JsonRpcMethodNotFound
+from pyls_jsonrpc.exceptions import JsonRpcMethodNotFound, JsonRpcRequestCancelled
 import pytest
 
-from pyls.python_ls import start_io_lang_server, PythonLanguageServer
+from pyls import _utils, hookimpl, uris
+from pyls.python_ls import start_io_lang_server, ContentModified, PythonLanguageServer, _CancellableEndpoint
 
 CALL_TIMEOUT = 10
 PY2 = sys.version_info[0] == 2
@@ -113,3 +115,118 @@ def test_not_exit_without_check_parent_process_flag(client_server):  # pylint: d
 def test_missing_message(client_server):  # pylint: disable=redefined-outer-name
     with pytest.raises(JsonRpcMethodNotFound):
         client_server._endpoint.request('unknown_method').result(timeout=CALL_TIMEOUT)
+
+
+def test_cancel_running_request():
+    messages = []
+    started = Event()
+
+    def slow_handler(_params):
+        event = endpoint.cancellation_event()
+
+        def run():
+            with _utils.cancellable(event):
+                started.set()
+                while True:
+                    _utils.check_cancelled()
+                    time.sleep(0.01)
+        return run
+
+    endpoint = _CancellableEndpoint({'slow': slow_handler}, messages.append)
+    endpoint.consume({'jsonrpc': '2.0', 'id': 1, 'method': 'slow', 'params': {}})
+    assert started.wait(CALL_TIMEOUT)
+
+    endpoint.consume({'jsonrpc': '2.0', 'method': '$/cancelRequest', 'params': {'id': 1}})
+    start = time.time()
+    while not messages and time.time() - start < CALL_TIMEOUT:
+        time.sleep(0.01)
+
+    assert messages[0]['id'] == 1
+    assert messages[0]['error']['code'] == JsonRpcRequestCancelled.CODE
+    assert not endpoint._cancel_events
+    endpoint.shutdown()
+
+
+def test_cancel_pending_request():
+    messages = []
+    executor = futures.ThreadPoolExecutor(max_workers=1)
+    blocker = Event()
+
+    def blocking_handler(_params):
+        return executor.submit(blocker.wait)
+
+    endpoint = _CancellableEndpoint({'block': blocking_handler}, messages.append)
+    endpoint.consume({'jsonrpc': '2.0', 'id': 1, 'method': 'block', 'params': {}})
+    endpoint.consume({'jsonrpc': '2.0', 'id': 2, 'method': 'block', 'params': {}})
+
+    # The second request didn't start, so it's cancelled right away
+    endpoint.consume({'jsonrpc': '2.0', 'method': '$/cancelRequest', 'params': {'id': 2}})
+    assert messages == [{
+        'jsonrpc': '2.0',
+        'id': 2,
+        'error': JsonRpcRequestCancelled().to_dict()
+    }]
+
+    blocker.set()
+    executor.shutdown()
+    assert messages[1] == {'jsonrpc': '2.0', 'id': 1, 'result': True}
+    endpoint.shutdown()
+
+
+def test_linters_publish_diagnostics_independently(pyls, tmpdir):
+    release_slow = Event()
+    published = []
+
+    class FastLinter(object):
+        @hookimpl
+        def pyls_lint(self, document):  # pylint: disable=unused-argument
+            return [{'source': 'fast'}]
+
+    class SlowLinter(object):
+        @hookimpl
+        def pyls_lint(self, is_saved):  # pylint: disable=unused-argument
+            release_slow.wait(CALL_TIMEOUT)
+            return [{'source': 'slow'}]
+
+    pyls.config.plugin_manager.register(FastLinter(), name='fast_linter')
+    pyls.config.plugin_manager.register(SlowLinter(), name='slow_linter')
+
+    doc_uri = uris.from_fs_path(str(tmpdir.join('lint.py')))
+    pyls.workspace.put_document(doc_uri, 'import os\n')
+    pyls.workspace.publish_diagnostics = lambda uri, diagnostics: published.append(
+        {d['source'] for d in diagnostics})
+
+    lint_futures = pyls.run_linters(pyls.workspace, doc_uri, True)
+
+    # Diagnostics of the fast linter don't wait for the slow one
+    start = time.time()
+    while not any('fast' in sources for sources in published):
+        assert time.time() - start < CALL_TIMEOUT
+        time.sleep(0.01)
+    assert all('slow' not in sources for sources in published)
+
+    release_slow.set()
+    futures.wait(lint_futures, timeout=CALL_TIMEOUT)
+    assert {'fast', 'slow'} <= published[-1]
+
+
+def test_stale_document_requests_are_dropped(pyls, tmpdir):
+    doc_uri = uris.from_fs_path(str(tmpdir.join('stale.py')))
+    pyls.workspace.put_document(doc_uri, 'def foo():\n    pass\n', version=1)
+    text_document = {'uri': doc_uri}
+    position = {'line': 0, 'character': 5}
+
+    # Requests run in the same worker, after the ones queued before them
+    blocker = Event()
+    pyls._cancellable(blocker.wait)
+    up_to_date = pyls.m_text_document__document_highlight(textDocument=text_document, position=position)
+    blocker.set()
+    assert up_to_date.result(timeout=CALL_TIMEOUT)
+
+    blocker.clear()
+    pyls._cancellable(blocker.wait)
+    stale = pyls.m_text_document__document_highlight(textDocument=text_document, position=position)
+    pyls.workspace.update_document(doc_uri, {'text': 'def bar():\n    pass\n'}, version=2)
+    blocker.set()
+    with pytest.raises(ContentModified):
+        stale.result(timeout=CALL_TIMEOUT)
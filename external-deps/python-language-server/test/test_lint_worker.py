@@ -0,0 +1,86 @@
+# Copyright 2017 Palantir Technologies, Inc.
+import subprocess
+import sys
+
+from pyls import lint_worker
+
+DOC = """import sys
+
+def main():
+\ta = 1
+"""
+
+
+def test_lint_cache():
+    cache = lint_worker.LintCache(size=2)
+    key_a = cache.key('flake8', ['-'], '/a.py', 'a = 1\n')
+    key_b = cache.key('flake8', ['-'], '/b.py', 'b = 1\n')
+    key_c = cache.key('flake8', ['-'], '/c.py', 'c = 1\n')
+    assert key_a == cache.key('flake8', ['-'], '/a.py', 'a = 1\n')
+    assert key_a != cache.key('flake8', ['-', '--select=F'], '/a.py', 'a = 1\n')
+
+    cache.set(key_a, 'a')
+    cache.set(key_b, 'b')
+    assert cache.get(key_a) == 'a'
+
+    # The least recently used output is dropped
+    cache.set(key_c, 'c')
+    assert cache.get(key_b) is None
+    assert cache.get(key_a) == 'a'
+
+    cache.clear(keep_path='/c.py')
+    assert cache.get(key_a) is None
+    assert cache.get(key_c) == 'c'
+
+
+def test_lint_worker():
+    worker = lint_worker.LintWorker()
+    try:
+        output = worker.run('flake8', ['-'], DOC)
+        assert "F401 'sys' imported but unused" in output
+        assert "F841 local variable 'a' is assigned to but never used" in output
+
+        # The same process is used to lint other sources
+        process = worker._process
+        assert 'F401' not in worker.run('flake8', ['-'], 'import sys\nsys.exit()\n')
+        assert worker._process is process
+
+        # The worker is restarted if it dies
+        process.kill()
+        process.wait()
+        assert 'F401' in worker.run('flake8', ['-'], DOC)
+    finally:
+        worker.stop()
+
+
+def test_lint_workers_per_linter():
+    try:
+        # Linters don't wait for each other in the same worker
+        assert lint_worker._get_worker('flake8') is lint_worker._get_worker('flake8')
+        assert lint_worker._get_worker('flake8') is not lint_worker._get_worker('pylint')
+    finally:
+        lint_worker.stop()
+
+
+class NoisyLintWorker(lint_worker.LintWorker):
+    """Worker with a linter that writes directly to its stdout."""
+
+    def _start(self):
+        code = ("import os, sys; from pyls import lint_worker; "
+                "lint_worker._LINTERS['noisy'] = lambda args: os.write(sys.__stdout__.fileno(), b'noise\\n'); "
+                "lint_worker.main()")
+        self._process = subprocess.Popen(
+            [sys.executable, '-c', code],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True
+        )
+
+
+def test_lint_worker_output():
+    worker = NoisyLintWorker()
+    try:
+        # The output doesn't get mixed with the responses of the worker
+        assert worker.run('noisy', []) == ''
+        assert worker.run('noisy', []) == ''
+    finally:
+        worker.stop()
@@ -0,0 +1,122 @@
+# Copyright 2017 Palantir Technologies, Inc.
+import os
+import time
+
+from mock import patch
+
+from pyls import lsp, uris, symbol_index
+from pyls.symbol_index import SymbolIndex, extract_symbols
+
+CALL_TIMEOUT = 10
+DOC = """import sys
+
+MAX_SIZE = 10
+
+if sys.version_info[0] > 2:
+    def compat_open():
+        pass
+
+class TestClass(object):
+    kind = 'test'
+
+    @property
+    def test_method(self):
+        local_var = 1
+        return local_var
+
+async def test_coroutine():
+    pass
+"""
+
+
+def test_extract_symbols():
+    symbols = {s[0]: s for s in extract_symbols(DOC)}
+    assert set(symbols) == {'MAX_SIZE', 'compat_open', 'TestClass', 'kind',
+                            'test_method', 'test_coroutine'}
+    assert symbols['MAX_SIZE'][1:] == [lsp.SymbolKind.Constant, None, 2, 0, 2, 8]
+    assert symbols['compat_open'][1] == lsp.SymbolKind.Function
+    assert symbols['TestClass'][1:4] == [lsp.SymbolKind.Class, None, 8]
+    assert symbols['kind'][1:3] == [lsp.SymbolKind.Field, 'TestClass']
+    assert symbols['test_method'][1:4] == [lsp.SymbolKind.Method, 'TestClass', 12]
+    assert symbols['test_coroutine'][1] == lsp.SymbolKind.Function
+
+    # Symbols are found even if there are syntax errors
+    symbols = {s[0]: s for s in extract_symbols(DOC + 'def broken(:\n')}
+    assert symbols['TestClass'][1:4] == [lsp.SymbolKind.Class, None, 8]
+    assert symbols['test_method'][1:4] == [lsp.SymbolKind.Method, 'TestClass', 12]
+
+    # Unless parso has no grammar for the running Python version
+    with patch.object(symbol_index, '_GRAMMAR', None), \
+            patch.object(symbol_index.parso, 'load_grammar', side_effect=NotImplementedError):
+        assert extract_symbols(DOC + 'def broken(:\n') == []
+        assert extract_symbols(DOC)
+
+
+def _wait_for(condition):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < CALL_TIMEOUT
+        time.sleep(0.01)
+
+
+def test_symbol_index(tmpdir):
+    project = tmpdir.mkdir('project')
+    cache_dir = str(tmpdir.join('cache'))
+    module = project.mkdir('package').join('module.py')
+    module.write(DOC)
+    project.mkdir('.hidden').join('hidden.py').write('def hidden_function(): pass\n')
+
+    index = SymbolIndex(str(project), cache_dir=cache_dir)
+    index.start()
+    assert index.wait_indexed(CALL_TIMEOUT)
+
+    # Exact matches first, then prefixes, substrings and subsequences
+    names = [s['name'] for s in index.search('test')]
+    assert names == ['TestClass', 'test_method', 'test_coroutine']
+    names = [s['name'] for s in index.search('te')]
+    assert names[:3] == ['TestClass', 'test_method', 'test_coroutine']
+    assert [s['name'] for s in index.search('tcls')] == ['TestClass']
+    assert [s['name'] for s in index.search('max_size')] == ['MAX_SIZE']
+    assert not index.search('hidden')
+
+    symbol = index.search('TestClass')[0]
+    assert symbol['kind'] == lsp.SymbolKind.Class
+    assert symbol['location']['uri'] == uris.from_fs_path(str(module))
+    assert symbol['location']['range']['start'] == {'line': 8, 'character': 0}
+
+    # Changed files are indexed again, and saved when the index is stopped
+    # instead of after each change
+    with patch.object(index, '_save', wraps=index._save) as save:
+        module.write('def renamed_function():\n    pass\n')
+        new_module = project.join('new_module.py')
+        new_module.write('class NewClass:\n    pass\n')
+        index.update_files([str(module), str(new_module)])
+        _wait_for(lambda: index.search('renamed'))
+        assert not index.search('TestClass')
+        assert index.search('NewClass')
+
+        new_module.remove()
+        index.update_files([str(new_module)])
+        _wait_for(lambda: not index.search('NewClass'))
+        assert not save.called
+        index.stop(CALL_TIMEOUT)
+        assert save.call_count == 1
+
+    # The index is saved, so files that didn't change are not parsed again
+    index = SymbolIndex(str(project), cache_dir=cache_dir)
+    with patch.object(symbol_index, 'extract_symbols') as extract:
+        index.start()
+        assert index.wait_indexed(CALL_TIMEOUT)
+    assert not extract.called
+    assert [s['name'] for s in index.search('renamed')] == ['renamed_function']
+    index.stop()
+
+
+def test_workspace_symbols(pyls, tmpdir):
+    tmpdir.join('module.py').write(DOC)
+    with patch.dict(os.environ, {'XDG_CACHE_HOME': str(tmpdir.join('cache'))}):
+        pyls.workspace.symbol_index.start()
+        assert pyls.workspace.symbol_index.wait_indexed(CALL_TIMEOUT)
+    symbols = pyls.workspace_symbols('TestClass')
+    assert symbols[0]['name'] == 'TestClass'
+    assert symbols[0]['location']['uri'] == uris.from_fs_path(str(tmpdir.join('module.py')))
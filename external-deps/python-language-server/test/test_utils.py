@@ -1,8 +1,11 @@
 # Copyright 2017 Palantir Technologies, Inc.
+import threading
 import time
 
 import mock
 from flaky import flaky
+from pyls_jsonrpc.exceptions import JsonRpcRequestCancelled
+import pytest
 
 from pyls import _utils
 
@@ -92,3 +95,18 @@ def test_clip_column():
     assert _utils.clip_column(2, ['123\n', '123'], 0) == 2
     assert _utils.clip_column(3, ['123\n', '123'], 0) == 3
     assert _utils.clip_column(4, ['123\n', '123'], 1) == 3
+
+
+def test_check_cancelled():
+    event = threading.Event()
+
+    # Nothing happens outside a cancellable request
+    _utils.check_cancelled()
+
+    with _utils.cancellable(event):
+        _utils.check_cancelled()
+        event.set()
+        with pytest.raises(JsonRpcRequestCancelled):
+            _utils.check_cancelled()
+
+    _utils.check_cancelled()
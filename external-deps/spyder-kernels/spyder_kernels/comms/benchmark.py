@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Benchmark of the calls made through comms.
+
+The two sides of a comm exchange messages through a pair of zmq sockets
+with a jupyter_client Session, as Spyder and its kernels do, and the calls
+are handled by the other side in its own thread. The latency and
+throughput of small calls, and of calls that return big arrays and
+DataFrames, are measured for each pickle protocol and compression, and the
+time is split in the steps given by `CommBase.get_call_stats`.
+
+Run it with
+
+    python -m spyder_kernels.comms.benchmark --help
+
+to see the available options.
+"""
+
+from __future__ import print_function
+
+import argparse
+import pickle
+import threading
+import timeit
+import uuid
+
+from jupyter_client.session import Session
+import zmq
+
+from spyder_kernels.comms.commbase import (
+    CommBase, COMPRESSIONS, DEFAULT_PICKLE_PROTOCOL)
+from spyder_kernels.py3compat import TimeoutError
+
+
+# Cases measured by default
+CASES = ['small', 'array', 'dataframe']
+
+# Max time (in secs) to wait for a message before checking again if the
+# benchmark was stopped
+MAX_WAIT_TIME = 0.5
+
+# Steps of the calls shown in the results
+STEPS = ['serialize', 'send', 'handler', 'reply', 'deserialize', 'callback']
+
+
+def get_protocols():
+    """Return the pickle protocols that can be measured."""
+    return sorted(set(
+        protocol for protocol in (DEFAULT_PICKLE_PROTOCOL, 4, 5,
+                                  pickle.HIGHEST_PROTOCOL)
+        if protocol <= pickle.HIGHEST_PROTOCOL))
+
+
+class LoopbackComm(object):
+    """Comm that sends its messages through a zmq socket."""
+
+    def __init__(self, comm_id, socket, session):
+        self.comm_id = comm_id
+        self.socket = socket
+        self.session = session
+        self._msg_callback = None
+        self._close_callback = None
+
+    def on_msg(self, callback):
+        """Register a callback for the messages received."""
+        self._msg_callback = callback
+
+    def on_close(self, callback):
+        """Register a callback for when the comm is closed."""
+        self._close_callback = callback
+
+    def send(self, data, buffers=None):
+        """Send a message to the other side."""
+        self.session.send(
+            self.socket, 'comm_msg',
+            content={'comm_id': self.comm_id, 'data': data},
+            buffers=buffers)
+
+    def close(self):
+        """Close the socket of the comm."""
+        self.socket.close(linger=0)
+
+    def receive(self, timeout=None):
+        """
+        Handle the next message, if it's received before timeout.
+
+        Return whether a message was handled.
+        """
+        if timeout is not None:
+            timeout = int(timeout * 1000)
+        if not self.socket.poll(timeout):
+            return False
+        _, msg = self.session.recv(self.socket, mode=0)
+        self._msg_callback(msg)
+        return True
+
+
+class BenchmarkComm(CommBase):
+    """Side of a comm whose messages are sent through a zmq socket."""
+
+    def __init__(self, comm):
+        super(BenchmarkComm, self).__init__()
+        self.comm = comm
+        self._register_comm(comm)
+        self._comms[comm.comm_id]['capabilities'] = list(self.capabilities)
+        self._comms[comm.comm_id]['status'] = 'ready'
+
+    def set_options(self, protocol, compression=None):
+        """Set the pickle protocol and compression used to send data."""
+        comm_dict = self._comms[self.comm.comm_id]
+        comm_dict['pickle_protocol'] = protocol
+        comm_dict['compression'] = compression
+
+    def on_incoming_call(self, call_dict):
+        """Don't negotiate the options, they're set by the benchmark."""
+        pass
+
+    def _wait_reply(self, call_id, call_name, timeout):
+        """Handle the messages received until the reply arrives."""
+        start = timeit.default_timer()
+        while call_id not in self._reply_inbox:
+            if timeout is None:
+                wait_time = MAX_WAIT_TIME
+            else:
+                wait_time = timeout - (timeit.default_timer() - start)
+                if wait_time <= 0:
+                    raise TimeoutError(
+                        "Timeout while waiting for '{}' reply.".format(
+                            call_name))
+            self.comm.receive(min(wait_time, MAX_WAIT_TIME))
+
+
+class Server(object):
+    """Side of the comm that handles the calls, in its own thread."""
+
+    def __init__(self, comm_wrapper, array_size, dataframe_rows):
+        self.comm_wrapper = comm_wrapper
+        self.array_size = array_size
+        self.dataframe_rows = dataframe_rows
+        self._values = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.daemon = True
+
+        comm_wrapper.register_call_handler('echo', self.echo)
+        comm_wrapper.register_call_handler('get_value', self.get_value)
+
+    def start(self):
+        """Start handling the calls."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop handling the calls and wait for the thread to finish."""
+        self._stop.set()
+        self._thread.join()
+        self.comm_wrapper.comm.close()
+
+    def echo(self, value=None):
+        """Return value, to measure small calls."""
+        return value
+
+    def get_value(self, name):
+        """Return the value used for case name."""
+        if name not in self._values:
+            self._values[name] = getattr(self, '_make_' + name)()
+        return self._values[name]
+
+    def set_options(self, protocol, compression=None):
+        """Set the pickle protocol and compression used to send data."""
+        self.comm_wrapper.set_options(protocol, compression)
+
+    def _make_array(self):
+        """Return a float array of array_size MB."""
+        import numpy as np
+        size = int(self.array_size * 2 ** 20 // 8)
+        # Not random, to give compressions something to work with
+        return np.linspace(0, 1, size)
+
+    def _make_dataframe(self):
+        """Return a DataFrame with dataframe_rows and several dtypes."""
+        import numpy as np
+        import pandas as pd
+        rows = self.dataframe_rows
+        return pd.DataFrame({
+            'float': np.linspace(0, 1, rows),
+            'int': np.arange(rows),
+            'bool': np.arange(rows) % 2 == 0,
+            'text': ['row {}'.format(i % 1000) for i in range(rows)],
+            }, index=pd.date_range('2000-01-01', periods=rows, freq='s'))
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                self.comm_wrapper.comm.receive(MAX_WAIT_TIME)
+            except zmq.ZMQError:
+                break
+
+
+def connect(context, transport='tcp'):
+    """Return a pair of connected BenchmarkComm."""
+    session = Session(key=b'')
+    comm_id = uuid.uuid4().hex
+    client_socket = context.socket(zmq.PAIR)
+    server_socket = context.socket(zmq.PAIR)
+    if transport == 'inproc':
+        address = 'inproc://spyder-comm-benchmark-' + comm_id
+        server_socket.bind(address)
+    else:
+        port = server_socket.bind_to_random_port('tcp://127.0.0.1')
+        address = 'tcp://127.0.0.1:{}'.format(port)
+    client_socket.connect(address)
+    return (BenchmarkComm(LoopbackComm(comm_id, client_socket, session)),
+            BenchmarkComm(LoopbackComm(comm_id, server_socket, session)))
+
+
+def measure(client, call, repeat, warmup=1):
+    """
+    Make call repeat times and return the results, with the following
+    structure
+
+    {'calls': 10, 'latency': 0.0012, 'min_latency': 0.001,
+     'calls_per_second': 833.3, 'reply_size': 164,
+     'steps': {'serialize': 0.0001, ...}}
+
+    Here 'latency' is the median time of a call, and 'steps' has the
+    median time of each step of the calls, taken from the call stats.
+    """
+    for __ in range(warmup):
+        call()
+    client.enable_call_stats(size=repeat)
+    times = []
+    start = timeit.default_timer()
+    for __ in range(repeat):
+        call_start = timeit.default_timer()
+        call()
+        times.append(timeit.default_timer() - call_start)
+    elapsed = timeit.default_timer() - start
+    stats = client.get_call_stats()
+    client.enable_call_stats(False)
+
+    steps = {}
+    for step in STEPS:
+        values = [call_stats[step] for call_stats in stats
+                  if call_stats[step] is not None]
+        steps[step] = median(values) if values else None
+    return {
+        'calls': repeat,
+        'latency': median(times),
+        'min_latency': min(times),
+        'calls_per_second': repeat / elapsed,
+        'reply_size': stats[-1]['reply_size'] if stats else None,
+        'steps': steps,
+        }
+
+
+def median(values):
+    """Return the median of values."""
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.
+
+
+def run_benchmark(cases=None, protocols=None, compressions=None,
+                  repeat=20, array_size=8, dataframe_rows=10 ** 5,
+                  transport='tcp'):
+    """
+    Measure the calls of each case for each protocol and compression, and
+    return a list with the results.
+
+    Cases are 'small', for calls without data, and 'array' and
+    'dataframe', for calls that return an array of array_size MB and a
+    DataFrame with dataframe_rows. Compressions are only used with the
+    last two, and None means no compression.
+    """
+    if cases is None:
+        cases = CASES
+    if protocols is None:
+        protocols = get_protocols()
+    if compressions is None:
+        compressions = [None]
+
+    context = zmq.Context()
+    client, server_comm = connect(context, transport)
+    server = Server(server_comm, array_size, dataframe_rows)
+    server.start()
+    results = []
+    try:
+        for case in cases:
+            if case == 'small':
+                case_compressions = [None]
+                call = client.remote_call(blocking=True).echo
+            else:
+                case_compressions = compressions
+                call = lambda case=case: client.remote_call(
+                    blocking=True).get_value(case)
+            for protocol in protocols:
+                for compression in case_compressions:
+                    client.set_options(protocol, compression)
+                    server.set_options(protocol, compression)
+                    result = measure(client, call, repeat)
+                    result.update({
+                        'case': case,
+                        'protocol': protocol,
+                        'compression': compression,
+                        })
+                    results.append(result)
+    finally:
+        server.stop()
+        client.comm.close()
+        context.term()
+    return results
+
+
+def format_results(results):
+    """Return a table with the results, in milliseconds and MB/s."""
+    header = ['case', 'protocol', 'compression', 'size (MB)', 'latency',
+              'calls/s', 'MB/s'] + STEPS
+    rows = [header]
+    for result in results:
+        size = (result['reply_size'] or 0) / 2. ** 20
+        rows.append(
+            [result['case'], str(result['protocol']),
+             result['compression'] or '-',
+             '{:.2f}'.format(size),
+             '{:.3f}'.format(result['latency'] * 1000),
+             '{:.1f}'.format(result['calls_per_second']),
+             '{:.1f}'.format(size * result['calls_per_second'])] +
+            ['-' if result['steps'][step] is None
+             else '{:.3f}'.format(result['steps'][step] * 1000)
+             for step in STEPS])
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return '\n'.join(
+        '  '.join(value.rjust(width) for value, width in zip(row, widths))
+        for row in rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure the latency and throughput of comm calls. "
+                    "Times are in milliseconds.")
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=CASES)
+    parser.add_argument('--protocols', nargs='+', type=int,
+                        default=get_protocols())
+    parser.add_argument('--compressions', nargs='+',
+                        choices=['none'] + COMPRESSIONS, default=['none'],
+                        help="Compressions of the arrays and DataFrames")
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="Number of calls of each measure")
+    parser.add_argument('--array-size', type=float, default=8,
+                        help="Size of the array, in MB")
+    parser.add_argument('--dataframe-rows', type=int, default=10 ** 5)
+    parser.add_argument('--transport', choices=['tcp', 'inproc'],
+                        default='tcp')
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        cases=args.cases,
+        protocols=args.protocols,
+        compressions=[None if compression == 'none' else compression
+                      for compression in args.compressions],
+        repeat=args.repeat,
+        array_size=args.array_size,
+        dataframe_rows=args.dataframe_rows,
+        transport=args.transport)
+    print(format_results(results))
+
+
+if __name__ == '__main__':
+    main()
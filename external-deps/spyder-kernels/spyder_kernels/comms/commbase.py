@@ -8,7 +8,8 @@
 Class that handles communications between Spyder kernel and frontend.
 
 Comms transmit data in a list of buffers, and in a json-able dictionnary.
-Here, we only support a buffer list with a single element.
+Here, the first buffer is the pickled data, and the rest are the out-of-band
+buffers of the pickle, if any.
 
 The messages exchanged have the following msg_dict:
 
@@ -19,7 +20,17 @@
     }
     ```
 
-The buffer is generated by cloudpickle using `PICKLE_PROTOCOL = 2`.
+The buffer is generated by cloudpickle using `PICKLE_PROTOCOL = 2`, or
+the highest protocol supported by both sides after they exchange it with
+`_set_pickle_protocol`. With protocol 5 or higher, and if both sides
+support 'out_of_band_buffers', big contiguous buffers in the data, like the
+ones of NumPy arrays, are not copied into the pickle but sent as the next
+buffers of the message.
+
+Buffers bigger than `COMPRESSION_MIN_SIZE` are compressed if both sides
+agree on a compression with `_set_pickle_protocol`. In that case, the
+msg_dict has the name of the compression in 'compression' and the indexes
+of the compressed buffers in 'compressed_buffers'.
 
 To simplify the usage of messaging, we use a higher level function calling
 mechanism:
@@ -28,6 +39,15 @@
       side of the comm.
     - If the `_wait_reply` is implemented, remote_call can be called with
       `blocking=True`, which will wait for a reply sent by the other side.
+    - With `future=True`, a RemoteCallFuture is returned instead, to get
+      the reply later.
+    - The calls made inside the `batch` context manager are sent together
+      when exiting it, or before waiting for a blocking call, if the other
+      side supports it.
+
+Each side sends the optional features it supports, from `CAPABILITIES`, in
+the 'capabilities' of its calls and when opening the comm, and a feature is
+only used if both sides support it.
 
 The messages exchanged are:
     - Function call (spyder_msg_type = 'remote_call'):
@@ -40,6 +60,11 @@
             'call_args': The function args,
             'call_kwargs': The function kwargs,
             }
+    - Several function calls (spyder_msg_type = 'remote_call_batch'):
+        - The content is a dictionnary {
+            'calls': The content of each call, as above,
+            }
+        - The buffer encodes a list with the buffer of each call.
     - If the 'settings' has `'blocking' =  True`, a reply is sent.
       (spyder_msg_type = 'remote_call_reply'):
         - The buffer contains the return value of the function.
@@ -48,16 +73,26 @@
                             exception to be raised.
                 'call_id': The uuid from above,
                 'call_name': The function name (mostly for debugging)
+                'handler_time': The seconds it took to run the function
                 }
+
+The time spent in each step of the calls and the size of their messages
+can be kept for debugging with `enable_call_stats`, and got with
+`get_call_stats`. See `spyder_kernels.comms.benchmark` to measure them.
 """
 from __future__ import print_function
 
+from collections import deque, OrderedDict
+from contextlib import contextmanager
 import cloudpickle
 import pickle
 import logging
 import sys
+import threading
+import timeit
 import uuid
 import traceback
+import zlib
 
 from spyder_kernels.py3compat import PY2, PY3
 
@@ -70,6 +105,49 @@
 # Max timeout (in secs) for blocking calls
 TIMEOUT = 3
 
+# Minimum size (in bytes) of the buffers sent out of the pickle with pickle
+# protocol 5. Smaller ones are not worth an additional message frame.
+OUT_OF_BAND_MIN_SIZE = 64 * 1024
+
+# Minimum size (in bytes) of the buffers that are compressed
+COMPRESSION_MIN_SIZE = 512 * 1024
+
+# Number of messages whose compression stats are kept
+COMPRESSION_STATS_SIZE = 1000
+
+# Number of calls whose stats are kept by default, when enabled
+CALL_STATS_SIZE = 1000
+
+# Functions to compress and decompress buffers, by compression name
+COMPRESSORS = {
+    'zlib': (lambda data: zlib.compress(data, 1), zlib.decompress),
+}
+
+try:
+    import lz4.frame
+    COMPRESSORS['lz4'] = (lz4.frame.compress, lz4.frame.decompress)
+except ImportError:
+    pass
+
+try:
+    import zstandard
+    COMPRESSORS['zstd'] = (
+        lambda data: zstandard.ZstdCompressor().compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data))
+except ImportError:
+    pass
+
+# Available compressions, in order of preference
+COMPRESSIONS = [name for name in ('zstd', 'lz4', 'zlib')
+                if name in COMPRESSORS]
+
+# Optional features that can be used if the other side supports them:
+# - 'batch_calls': Several calls sent in a 'remote_call_batch' message.
+# - 'out_of_band_buffers': Buffers sent out of the pickle with protocol 5.
+CAPABILITIES = ['batch_calls']
+if pickle.HIGHEST_PROTOCOL >= 5:
+    CAPABILITIES.append('out_of_band_buffers')
+
 
 class CommError(RuntimeError):
     pass
@@ -132,6 +210,61 @@ def comm_excepthook(type, value, tb):
 sys.excepthook = comm_excepthook
 
 
+def pickle_data(data, protocol, out_of_band=False):
+    """
+    Pickle data and return the list of buffers to send.
+
+    With `out_of_band` and pickle protocol 5 or higher, the big contiguous
+    buffers of data are not copied but returned after the pickle. Only use
+    it if the other side can load them.
+    """
+    if protocol < 5 or not out_of_band:
+        return [cloudpickle.dumps(data, protocol=protocol)]
+
+    out_of_band_buffers = []
+
+    def buffer_callback(pickle_buffer):
+        # Returning True keeps the buffer in the pickle
+        try:
+            buffer = pickle_buffer.raw()
+        except BufferError:
+            # Non-contiguous buffer
+            return True
+        if buffer.nbytes < OUT_OF_BAND_MIN_SIZE:
+            return True
+        out_of_band_buffers.append(buffer)
+        return False
+
+    pickled = cloudpickle.dumps(data, protocol=protocol,
+                                buffer_callback=buffer_callback)
+    return [pickled] + out_of_band_buffers
+
+
+def unpickle_data(buffers):
+    """
+    Unpickle the data in the buffers of a message.
+
+    The out-of-band buffers are used as they are if they're writable,
+    otherwise they're copied so that the objects made with them, e.g.
+    arrays, can be changed.
+    """
+    if len(buffers) == 1:
+        if PY3:
+            # https://docs.python.org/3/library/pickle.html#pickle.loads
+            # Using encoding='latin1' is required for unpickling
+            # NumPy arrays and instances of datetime, date and time
+            # pickled by Python 2.
+            return cloudpickle.loads(buffers[0], encoding='latin-1')
+        return cloudpickle.loads(buffers[0])
+
+    out_of_band_buffers = []
+    for buffer in buffers[1:]:
+        if memoryview(buffer).readonly:
+            buffer = bytearray(buffer)
+        out_of_band_buffers.append(buffer)
+    return cloudpickle.loads(buffers[0], buffers=out_of_band_buffers)
+
+
 class CommBase(object):
     """
     Class with the necessary attributes and methods to handle
@@ -149,9 +282,22 @@ def __init__(self):
         # Lists of reply numbers
         self._reply_inbox = {}
         self._reply_waitlist = {}
+        self._reply_futures = {}
+        # Calls to send together, for each thread
+        self._call_batches = threading.local()
+        # Compressions this side can use, in order of preference
+        self.compressions = list(COMPRESSIONS)
+        # Optional features this side supports
+        self.capabilities = list(CAPABILITIES)
+        self._compression_stats = deque(maxlen=COMPRESSION_STATS_SIZE)
+        # Stats of the calls made to the other side, if enabled
+        self._call_stats = None
+        self._pending_call_stats = OrderedDict()
 
         self._register_message_handler(
             'remote_call', self._handle_remote_call)
+        self._register_message_handler(
+            'remote_call_batch', self._handle_remote_call_batch)
         self._register_message_handler(
             'remote_call_reply', self._handle_remote_call_reply)
         self.register_call_handler('_set_pickle_protocol',
@@ -213,6 +359,91 @@ def remote_call(self, comm_id=None, callback=None, **settings):
         """Get a handler for remote calls."""
         return RemoteCallFactory(self, comm_id, callback, **settings)
 
+    @contextmanager
+    def batch(self):
+        """
+        Send the remote calls made in this thread inside the context in a
+        single message, when exiting it.
+
+        Blocking calls send the calls made before them and themselves
+        right away, since they need the reply.
+        """
+        if getattr(self._call_batches, 'calls', None) is not None:
+            # Nested batch
+            yield
+            return
+        self._call_batches.calls = OrderedDict()
+        try:
+            yield
+        finally:
+            try:
+                self._send_call_batches()
+            finally:
+                self._call_batches.calls = None
+
+    def enable_call_stats(self, enabled=True, size=CALL_STATS_SIZE):
+        """
+        Start or stop keeping the stats of the last `size` calls made to
+        the other side, for debugging.
+
+        The stats kept until now are removed. At most `size` calls wait
+        for their reply to complete their stats, and the oldest ones are
+        dropped after that, since some replies never arrive.
+        """
+        self._pending_call_stats = OrderedDict()
+        if enabled:
+            self._call_stats = deque(maxlen=size)
+        else:
+            self._call_stats = None
+
+    def get_call_stats(self):
+        """
+        Get the stats of the last calls made to the other side, if enabled
+        with `enable_call_stats`.
+
+        Each call has a dict with the following structure
+
+        {'call_name': 'get_value', 'request_size': 164,
+         'reply_size': 8000164, 'serialize': 0.0001, 'send': 0.0002,
+         'handler': 0.012, 'reply': 0.025, 'deserialize': 0.004,
+         'callback': 0.0001, 'total': 0.0294}
+
+        Here:
+        * The sizes are the bytes of the buffers of the messages.
+        * 'serialize' and 'send' are the seconds it took to pickle and
+          compress the call, and to give it to the comm to be sent. Calls
+          sent in a batch have the ones of the whole batch.
+        * 'handler' is the time the other side spent running the call.
+        * 'reply' is the time from sending the call until receiving the
+          reply, so it includes 'handler'.
+        * 'deserialize' and 'callback' are the time it took to load the
+          reply and to handle it.
+        * 'total' is the time from the start of 'serialize' until the end
+          of 'callback'.
+
+        The values that are only known with a reply are None for calls
+        without it.
+        """
+        if self._call_stats is None:
+            return []
+        return list(self._call_stats)
+
+    def get_compression_stats(self):
+        """
+        Get the stats of the last compressed messages, to tune
+        `COMPRESSION_MIN_SIZE`.
+
+        Each message has a dict with the following structure
+
+        {'spyder_msg_type': 'remote_call_reply', 'direction': 'sent',
+         'compression': 'zlib', 'raw_size': 1048576,
+         'compressed_size': 4120, 'time': 0.0025}
+
+        where the sizes are in bytes and 'time' is the number of seconds
+        it took to compress or decompress its buffers.
+        """
+        return list(self._compression_stats)
+
     # ---- Private -----
     def _send_message(self, spyder_msg_type, content=None, data=None,
                       comm_id=None):
@@ -227,30 +458,209 @@ def _send_message(self, spyder_msg_type, content=None, data=None,
             The (JSONable) content of the message
         data: any
             Any object that is serializable by cloudpickle (should be most
-            things). Will arrive as cloudpickled bytes in `.buffers[0]`.
+            things). Will arrive as cloudpickled bytes in `.buffers[0]`,
+            followed by its out-of-band buffers with pickle protocol 5.
         comm_id: int
             the comm to send to. If None sends to all comms.
         """
         if not self.is_open(comm_id):
             raise CommError("The comm is not connected.")
+        calls = getattr(self._call_batches, 'calls', None)
+        if spyder_msg_type == 'remote_call' and calls is not None:
+            calls.setdefault(comm_id, []).append((content, data))
+            return
         id_list = self.get_comm_id_list(comm_id)
         for comm_id in id_list:
+            start = timeit.default_timer()
             msg_dict = {
                 'spyder_msg_type': spyder_msg_type,
                 'content': content,
                 'pickle_protocol': self._comms[comm_id]['pickle_protocol'],
                 'python_version': sys.version,
                 }
-            buffers = [cloudpickle.dumps(
-                data, protocol=self._comms[comm_id]['pickle_protocol'])]
+            buffers = pickle_data(
+                data, self._comms[comm_id]['pickle_protocol'],
+                out_of_band=self._comms_support('out_of_band_buffers',
+                                                comm_id))
+            compression = self._comms[comm_id]['compression']
+            if compression is not None:
+                compressed_buffers = self._compress_buffers(
+                    buffers, compression, spyder_msg_type)
+                if compressed_buffers:
+                    msg_dict['compression'] = compression
+                    msg_dict['compressed_buffers'] = compressed_buffers
+            serialized = timeit.default_timer()
             self._comms[comm_id]['comm'].send(msg_dict, buffers=buffers)
+            if self._call_stats is not None:
+                self._start_call_stats(spyder_msg_type, content, buffers,
+                                       start, serialized)
+
+    def _start_call_stats(self, spyder_msg_type, content, buffers, start,
+                          serialized):
+        """Keep the stats of the calls that were just sent."""
+        if spyder_msg_type == 'remote_call':
+            call_dicts = [content]
+        elif spyder_msg_type == 'remote_call_batch':
+            call_dicts = content['calls']
+        else:
+            return
+        sent = timeit.default_timer()
+        for call_dict in call_dicts:
+            stats = {
+                'call_name': call_dict['call_name'],
+                'request_size': sum(len(buffer) for buffer in buffers),
+                'reply_size': None,
+                'serialize': serialized - start,
+                'send': sent - serialized,
+                'handler': None,
+                'reply': None,
+                'deserialize': None,
+                'callback': None,
+                'total': sent - start,
+                }
+            if call_dict['settings'].get('send_reply'):
+                stats['_start'] = start
+                stats['_sent'] = sent
+                self._pending_call_stats[call_dict['call_id']] = stats
+                if len(self._pending_call_stats) > self._call_stats.maxlen:
+                    # The reply of the oldest call was lost or timed out
+                    self._pending_call_stats.popitem(last=False)
+            else:
+                self._call_stats.append(stats)
+
+    def _finish_call_stats(self, content, buffers, received, loaded):
+        """Keep the stats of a call that was just replied."""
+        stats = self._pending_call_stats.pop(content['call_id'], None)
+        if stats is None:
+            return
+        handled = timeit.default_timer()
+        stats['reply_size'] = sum(len(buffer) for buffer in buffers)
+        stats['handler'] = content.get('handler_time')
+        stats['reply'] = received - stats.pop('_sent')
+        stats['deserialize'] = loaded - received
+        stats['callback'] = handled - loaded
+        stats['total'] = handled - stats.pop('_start')
+        self._call_stats.append(stats)
+
+    def _send_call_batches(self):
+        """Send the calls of the current batch, if any."""
+        calls = getattr(self._call_batches, 'calls', None)
+        if not calls:
+            return
+        # Send the calls instead of adding them to the batch again
+        self._call_batches.calls = None
+        try:
+            for comm_id, comm_calls in calls.items():
+                call_dicts = [call_dict for call_dict, _ in comm_calls]
+                call_data = [data for _, data in comm_calls]
+                self._send_call_batch(comm_id, call_dicts, call_data)
+        finally:
+            self._call_batches.calls = OrderedDict()
+
+    def _send_call_batch(self, comm_id, call_dicts, call_data):
+        """
+        Send several calls in a single message, or one by one if the other
+        side can't handle batches.
+        """
+        if (len(call_dicts) == 1 or
+                not self._comms_support('batch_calls', comm_id)):
+            for call_dict, data in zip(call_dicts, call_data):
+                self._send_message('remote_call', content=call_dict,
+                                   data=data, comm_id=comm_id)
+            return
+        self._send_message('remote_call_batch',
+                           content={'calls': call_dicts},
+                           data=call_data, comm_id=comm_id)
+
+    def _compress_buffers(self, buffers, compression, spyder_msg_type):
+        """
+        Compress in place the buffers bigger than COMPRESSION_MIN_SIZE and
+        return their indexes.
+
+        Buffers that don't get smaller are sent as they are.
+        """
+        compress = COMPRESSORS[compression][0]
+        compressed_buffers = []
+        raw_size = compressed_size = 0
+        start = timeit.default_timer()
+        for i, buffer in enumerate(buffers):
+            size = len(buffer)
+            if size < COMPRESSION_MIN_SIZE:
+                continue
+            compressed = compress(buffer)
+            raw_size += size
+            compressed_size += len(compressed)
+            if len(compressed) < size:
+                buffers[i] = compressed
+                compressed_buffers.append(i)
+        if raw_size:
+            self._compression_stats.append({
+                'spyder_msg_type': spyder_msg_type,
+                'direction': 'sent',
+                'compression': compression,
+                'raw_size': raw_size,
+                'compressed_size': compressed_size,
+                'time': timeit.default_timer() - start,
+                })
+        return compressed_buffers
+
+    def _decompress_buffers(self, msg_dict, buffers):
+        """Return the buffers of a message, decompressing them if needed."""
+        compressed_buffers = msg_dict.get('compressed_buffers')
+        if not compressed_buffers:
+            return buffers
+        compression = msg_dict['compression']
+        decompress = COMPRESSORS[compression][1]
+        buffers = list(buffers)
+        raw_size = compressed_size = 0
+        start = timeit.default_timer()
+        for i in compressed_buffers:
+            compressed_size += len(buffers[i])
+            buffers[i] = decompress(buffers[i])
+            raw_size += len(buffers[i])
+        self._compression_stats.append({
+            'spyder_msg_type': msg_dict['spyder_msg_type'],
+            'direction': 'received',
+            'compression': compression,
+            'raw_size': raw_size,
+            'compressed_size': compressed_size,
+            'time': timeit.default_timer() - start,
+            })
+        return buffers
+
+    def _set_pickle_protocol(self, protocol, compressions=None):
+        """
+        Set the pickle protocol used to send data, and the compression
+        used for big buffers.
 
-    def _set_pickle_protocol(self, protocol):
-        """Set the pickle protocol used to send data."""
+        `compressions` are the compressions that the other side can use.
+        The first one of `self.compressions` among them is used, or none
+        if there isn't any.
+        """
         protocol = min(protocol, pickle.HIGHEST_PROTOCOL)
+        compression = None
+        for name in self.compressions:
+            if compressions and name in compressions:
+                compression = name
+                break
         self._comms[self.calling_comm_id]['pickle_protocol'] = protocol
+        self._comms[self.calling_comm_id]['compression'] = compression
         self._comms[self.calling_comm_id]['status'] = 'ready'
 
+    def _set_capabilities(self, capabilities):
+        """
+        Set the optional features that can be used with the calling comm,
+        given the ones that the other side supports.
+        """
+        self._comms[self.calling_comm_id]['capabilities'] = [
+            name for name in self.capabilities
+            if capabilities and name in capabilities]
+
+    def _comms_support(self, capability, comm_id=None):
+        """Check if an optional feature can be used with the comms."""
+        return all(capability in self._comms[comm_id]['capabilities']
+                   for comm_id in self.get_comm_id_list(comm_id))
+
     @property
     def _comm_name(self):
         """
@@ -287,6 +697,8 @@ def _register_comm(self, comm):
         self._comms[comm.comm_id] = {
             'comm': comm,
             'pickle_protocol': DEFAULT_PICKLE_PROTOCOL,
+            'compression': None,
+            'capabilities': [],
             'status': 'opening',
             }
 
@@ -304,20 +716,17 @@ def _comm_message(self, msg):
         # Get message dict
         msg_dict = msg['content']['data']
 
-        # Load the buffer. Only one is supported.
+        # Load the buffers
+        received = timeit.default_timer()
         try:
-            if PY3:
-                # https://docs.python.org/3/library/pickle.html#pickle.loads
-                # Using encoding='latin1' is required for unpickling
-                # NumPy arrays and instances of datetime, date and time
-                # pickled by Python 2.
-                buffer = cloudpickle.loads(msg['buffers'][0],
-                                           encoding='latin-1')
-            else:
-                buffer = cloudpickle.loads(msg['buffers'][0])
+            buffer = unpickle_data(
+                self._decompress_buffers(msg_dict, msg['buffers']))
         except Exception as e:
             logger.debug(
                 "Exception in cloudpickle.loads : %s" % str(e))
+            if msg_dict['spyder_msg_type'] == 'remote_call_batch':
+                # The calls can't be made without their arguments
+                return
             buffer = CommsErrorWrapper(
                 msg_dict['content']['call_name'],
                 msg_dict['content']['call_id'])
@@ -325,6 +734,7 @@ def _comm_message(self, msg):
             msg_dict['content']['is_error'] = True
 
         spyder_msg_type = msg_dict['spyder_msg_type']
+        loaded = timeit.default_timer()
 
         if spyder_msg_type in self._message_handlers:
             self._message_handlers[spyder_msg_type](
@@ -332,21 +742,34 @@ def _comm_message(self, msg):
         else:
             logger.debug("No such spyder message type: %s" % spyder_msg_type)
 
+        if (self._call_stats is not None and
+                spyder_msg_type == 'remote_call_reply'):
+            self._finish_call_stats(msg_dict['content'], msg['buffers'],
+                                    received, loaded)
+
     def _handle_remote_call(self, msg, buffer):
         """Handle a remote call."""
         msg_dict = msg['content']
         self.on_incoming_call(msg_dict)
+        start = timeit.default_timer()
         try:
             return_value = self._remote_callback(
                     msg_dict['call_name'],
                     buffer['call_args'],
                     buffer['call_kwargs'])
+            msg_dict['handler_time'] = timeit.default_timer() - start
             self._set_call_return_value(msg_dict, return_value)
         except Exception:
+            msg_dict['handler_time'] = timeit.default_timer() - start
             exc_infos = CommsErrorWrapper(
                 msg_dict['call_name'], msg_dict['call_id'])
             self._set_call_return_value(msg_dict, exc_infos, is_error=True)
 
+    def _handle_remote_call_batch(self, msg, buffer):
+        """Handle several remote calls, in the order they were made."""
+        for call_dict, call_data in zip(msg['content']['calls'], buffer):
+            self._handle_remote_call({'content': call_dict}, call_data)
+
     def _remote_callback(self, call_name, call_args, call_kwargs):
         """Call the callback function for the remote call."""
         if call_name in self._remote_call_handlers:
@@ -375,31 +798,41 @@ def _set_call_return_value(self, call_dict, data, is_error=False):
         content = {
             'is_error': is_error,
             'call_id': call_dict['call_id'],
-            'call_name': call_dict['call_name']
+            'call_name': call_dict['call_name'],
+            'handler_time': call_dict.get('handler_time')
         }
 
         self._send_message('remote_call_reply', content=content, data=data,
                            comm_id=self.calling_comm_id)
 
-    def _register_call(self, call_dict, callback=None):
+    def _register_call(self, call_dict, callback=None, future=None):
         """
         Register the call so the reply can be properly treated.
         """
         settings = call_dict['settings']
         blocking = 'blocking' in settings and settings['blocking']
         call_id = call_dict['call_id']
-        if blocking or callback is not None:
+        if future is not None:
+            # The reply goes to the inbox, where the future takes it
+            self._reply_futures[call_id] = future
+            self._reply_waitlist[call_id] = True, callback
+        elif blocking or callback is not None:
             self._reply_waitlist[call_id] = blocking, callback
 
     def on_outgoing_call(self, call_dict):
         """A message is about to be sent"""
         call_dict["pickle_highest_protocol"] = pickle.HIGHEST_PROTOCOL
+        call_dict["compressions"] = self.compressions
+        call_dict["capabilities"] = self.capabilities
         return call_dict
 
     def on_incoming_call(self, call_dict):
         """A call was received"""
         if "pickle_highest_protocol" in call_dict:
-            self._set_pickle_protocol(call_dict["pickle_highest_protocol"])
+            self._set_pickle_protocol(call_dict["pickle_highest_protocol"],
+                                      call_dict.get("compressions"))
+        if "capabilities" in call_dict:
+            self._set_capabilities(call_dict["capabilities"])
 
     def _get_call_return_value(self, call_dict, call_data, comm_id):
         """
@@ -420,6 +853,9 @@ def _get_call_return_value(self, call_dict, call_data, comm_id):
         if not blocking:
             return
 
+        # The call can't wait in a batch
+        self._send_call_batches()
+
         call_id = call_dict['call_id']
         call_name = call_dict['call_name']
 
@@ -429,7 +865,12 @@ def _get_call_return_value(self, call_dict, call_data, comm_id):
         else:
             timeout = TIMEOUT
 
-        self._wait_reply(call_id, call_name, timeout)
+        try:
+            self._wait_reply(call_id, call_name, timeout)
+        except Exception:
+            # Its stats won't be completed
+            self._pending_call_stats.pop(call_id, None)
+            raise
 
         reply = self._reply_inbox.pop(call_id)
 
@@ -480,6 +921,10 @@ def _handle_remote_call_reply(self, msg_dict, buffer):
                     'content': content
                     }
 
+        future = self._reply_futures.pop(call_id, None)
+        if future is not None:
+            future._set_done()
+
     def _async_error(self, error_wrapper):
         """
         Handle an error that was raised on the other side asyncronously.
@@ -493,6 +938,98 @@ def _sync_error(self, error_wrapper):
         error_wrapper.raise_error()
 
 
+class RemoteCallFuture(object):
+    """Reply to a remote call made with `future=True`."""
+
+    def __init__(self, comms_wrapper, call_id, call_name, timeout=None):
+        self._comms_wrapper = comms_wrapper
+        self._call_id = call_id
+        self._call_name = call_name
+        self._timeout = timeout
+        self._done = False
+        self._cancelled = False
+        self._waiting = False
+        self._reply = None
+        self._callbacks = []
+
+    def done(self):
+        """Check if the other side replied or the call was cancelled."""
+        return self._done
+
+    def cancelled(self):
+        """Check if the call was cancelled."""
+        return self._cancelled
+
+    def cancel(self):
+        """
+        Stop waiting for the reply, e.g. because it's taking too long, and
+        call the callbacks. Return False if the other side already replied.
+
+        A reply that arrives later is ignored.
+        """
+        if self._done:
+            return self._cancelled
+        comms_wrapper = self._comms_wrapper
+        comms_wrapper._reply_waitlist.pop(self._call_id, None)
+        comms_wrapper._reply_futures.pop(self._call_id, None)
+        comms_wrapper._pending_call_stats.pop(self._call_id, None)
+        self._cancelled = True
+        self._done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+        return True
+
+    def result(self, timeout=None):
+        """
+        Get the value returned by the other side, waiting for it if needed.
+
+        If the call raised an error on the other side, it's raised here.
+        """
+        if self._cancelled:
+            raise CommError("The call {} was cancelled.".format(
+                self._call_name))
+        if self._reply is None:
+            if timeout is None:
+                timeout = self._timeout
+            if timeout is None:
+                timeout = TIMEOUT
+            # The reply is left in the inbox while waiting for it
+            self._waiting = True
+            try:
+                self._comms_wrapper._wait_reply(
+                    self._call_id, self._call_name, timeout)
+            finally:
+                self._waiting = False
+            self._reply = self._comms_wrapper._reply_inbox.pop(
+                self._call_id)
+        if self._reply['is_error']:
+            return self._comms_wrapper._sync_error(self._reply['value'])
+        return self._reply['value']
+
+    def add_done_callback(self, callback):
+        """
+        Call callback with this future when the other side replies, or
+        right away if it already did.
+        """
+        if self._done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def _set_done(self):
+        """The other side replied."""
+        if not self._waiting:
+            # Take the reply so it's not left in the inbox if the result
+            # is never asked
+            self._reply = self._comms_wrapper._reply_inbox.pop(
+                self._call_id)
+        self._done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
 class RemoteCallFactory(object):
     """Class to create `RemoteCall`s."""
 
@@ -531,7 +1068,10 @@ def __call__(self, *args, **kwargs):
         The args and kwargs have to be picklable.
         """
         blocking = 'blocking' in self._settings and self._settings['blocking']
-        self._settings['send_reply'] = blocking or self._callback is not None
+        future = (not blocking and 'future' in self._settings and
+                  self._settings['future'])
+        self._settings['send_reply'] = (
+            blocking or future or self._callback is not None)
 
         call_id = uuid.uuid4().hex
         call_dict = {
@@ -550,6 +1090,15 @@ def __call__(self, *args, **kwargs):
                 raise CommError("The comm is not connected.")
             logger.debug("Call to unconnected comm: %s" % self._name)
             return
-        self._comms_wrapper._register_call(call_dict, self._callback)
-        return self._comms_wrapper._get_call_return_value(
+        if future:
+            future = RemoteCallFuture(
+                self._comms_wrapper, call_id, self._name,
+                self._settings.get('timeout'))
+        else:
+            future = None
+        self._comms_wrapper._register_call(call_dict, self._callback, future)
+        value = self._comms_wrapper._get_call_return_value(
             call_dict, call_data, self._comm_id)
+        if future is not None:
+            return future
+        return value
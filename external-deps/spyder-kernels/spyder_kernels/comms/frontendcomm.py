@@ -23,6 +23,11 @@
 from spyder_kernels.py3compat import TimeoutError, PY2
 
 
+# Max time (in secs) to wait for a message before checking again if a
+# thread was interrupted
+MAX_WAIT_TIME = 0.5
+
+
 def get_free_port():
     """Find a free port on the local machine."""
     sock = socket.socket()
@@ -62,6 +67,8 @@ def __init__(self, kernel):
         self.comm_port = None
         self.register_call_handler('_send_comm_config',
                                    self._send_comm_config)
+        # Notified when a message is handled, to wake up wait_until
+        self._message_handled = threading.Condition()
 
         # self.kernel.parent is IPKernelApp unless we are in tests
         if self.kernel.parent:
@@ -148,31 +155,54 @@ def poll_one(self):
             out_stream.flush(zmq.POLLOUT)
 
     def remote_call(self, comm_id=None, blocking=False, callback=None,
-                    timeout=None):
+                    timeout=None, future=False):
         """Get a handler for remote calls."""
         return super(FrontendComm, self).remote_call(
             blocking=blocking,
             comm_id=comm_id,
             callback=callback,
-            timeout=timeout)
+            timeout=timeout,
+            future=future)
 
     def wait_until(self, condition, timeout=None):
-        """Wait until condition is met. Returns False if timeout."""
+        """
+        Wait until condition is met. Returns False if timeout.
+
+        The condition is checked again every time a message is handled.
+        """
         if condition():
             return True
         t_start = time.time()
-        while not condition():
-            if timeout is not None and time.time() > t_start + timeout:
-                return False
-            if threading.current_thread() is self.comm_socket_thread:
+        if threading.current_thread() is self.comm_socket_thread:
+            while not condition():
+                if timeout is not None and time.time() > t_start + timeout:
+                    return False
                 # Wait for a reply on the comm channel.
                 self.poll_one()
-            else:
-                # Wait 10ms for a reply
-                time.sleep(0.01)
+            return True
+
+        with self._message_handled:
+            while not condition():
+                wait_time = MAX_WAIT_TIME
+                if timeout is not None:
+                    wait_time = min(t_start + timeout - time.time(),
+                                    wait_time)
+                    if wait_time <= 0:
+                        return False
+                # Wait for the next message. The time is limited so that
+                # interruptions can be handled in the main thread.
+                self._message_handled.wait(wait_time)
         return True
 
     # --- Private --------
+    def _comm_message(self, msg):
+        """Handle a message and wake up the threads waiting for it."""
+        try:
+            super(FrontendComm, self)._comm_message(msg)
+        finally:
+            with self._message_handled:
+                self._message_handled.notify_all()
+
     def _wait_reply(self, call_id, call_name, timeout, retry=True):
         """Wait until the frontend replies to a request."""
         def reply_received():
@@ -192,7 +222,10 @@ def _comm_open(self, comm, msg):
         """
         self.calling_comm_id = comm.comm_id
         self._register_comm(comm)
-        self._set_pickle_protocol(msg['content']['data']['pickle_protocol'])
+        data = msg['content']['data']
+        self._set_pickle_protocol(data['pickle_protocol'],
+                                  data.get('compressions'))
+        self._set_capabilities(data.get('capabilities'))
         self._send_comm_config()
 
     def on_outgoing_call(self, call_dict):
@@ -203,7 +236,8 @@ def on_outgoing_call(self, call_dict):
     def _send_comm_config(self):
         """Send the comm config to the frontend."""
         self.remote_call()._set_comm_port(self.comm_port)
-        self.remote_call()._set_pickle_protocol(pickle.HIGHEST_PROTOCOL)
+        self.remote_call()._set_pickle_protocol(pickle.HIGHEST_PROTOCOL,
+                                                self.compressions)
 
     def _comm_close(self, msg):
         """Close comm."""
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for the call stats of comms and benchmark.py
+"""
+
+# Standard library imports
+import time
+
+# Third party imports
+import pytest
+import zmq
+
+# Local imports
+from spyder_kernels.comms.benchmark import (
+    connect, format_results, get_protocols, run_benchmark, Server, STEPS)
+from spyder_kernels.py3compat import TimeoutError
+
+
+@pytest.fixture
+def comms():
+    """Client comm and server of the benchmark."""
+    context = zmq.Context()
+    client, server_comm = connect(context)
+    server = Server(server_comm, array_size=1, dataframe_rows=10)
+    server.start()
+    yield client, server
+    server.stop()
+    client.comm.close()
+    context.term()
+
+
+def test_call_stats(comms):
+    """Test the stats kept of the calls made to the other side."""
+    client, server = comms
+    assert client.get_call_stats() == []
+
+    client.enable_call_stats()
+    assert client.remote_call(blocking=True).echo(1) == 1
+    client.remote_call().echo()
+    array = client.remote_call(blocking=True).get_value('array')
+    stats = client.get_call_stats()
+    assert [call_stats['call_name'] for call_stats in stats] == [
+        'echo', 'echo', 'get_value']
+
+    # Blocking calls have the stats of the reply
+    for call_stats in (stats[0], stats[2]):
+        assert all(call_stats[step] >= 0 for step in STEPS)
+        assert call_stats['reply'] >= call_stats['handler']
+        assert call_stats['total'] >= call_stats['reply']
+    assert stats[2]['reply_size'] >= array.nbytes
+
+    # Other calls don't
+    assert stats[1]['reply'] is None
+    assert stats[1]['reply_size'] is None
+    assert stats[1]['request_size'] > 0
+
+    client.enable_call_stats(False)
+    client.remote_call(blocking=True).echo()
+    assert client.get_call_stats() == []
+
+
+def test_call_stats_batch(comms):
+    """Test the stats of calls sent together."""
+    client, server = comms
+    client.enable_call_stats()
+    with client.batch():
+        client.remote_call().echo()
+        client.remote_call().echo()
+    assert client.remote_call(blocking=True).echo(2) == 2
+    stats = client.get_call_stats()
+    assert len(stats) == 3
+    assert stats[0]['request_size'] == stats[1]['request_size']
+
+
+def test_call_stats_without_reply(comms):
+    """Test that the stats of calls whose reply doesn't arrive are dropped."""
+    client, server = comms
+    server.comm_wrapper.register_call_handler('sleep', time.sleep)
+    client.enable_call_stats(size=2)
+    with pytest.raises(TimeoutError):
+        client.remote_call(blocking=True, timeout=0.1).sleep(0.5)
+    assert len(client._pending_call_stats) == 0
+
+    # Replies that are not waited for are not received here
+    for __ in range(3):
+        client.remote_call(callback=lambda value: None).echo()
+    assert len(client._pending_call_stats) == 2
+    assert client.get_call_stats() == []
+
+
+def test_run_benchmark():
+    """Test that all the cases of the benchmark can be run."""
+    pytest.importorskip('pandas')
+    results = run_benchmark(repeat=2, array_size=0.1, dataframe_rows=100,
+                            compressions=[None, 'zlib'])
+    protocols = get_protocols()
+    assert len(results) == len(protocols) * 5
+    for result in results:
+        assert result['calls'] == 2
+        assert result['latency'] > 0
+        assert result['reply_size'] > 0
+    table = format_results(results).splitlines()
+    assert len(table) == len(results) + 1
+    assert table[0].split()[0] == 'case'
@@ -33,6 +33,10 @@
 # shown at all there)
 EXCLUDED_NAMES = ['In', 'Out', 'exit', 'get_ipython', 'quit']
 
+# Time after which the entries of the Variable Explorer left are sent
+# in a later call, in seconds
+NAMESPACE_SNAPSHOT_TIME_BUDGET = 0.5
+
 
 class SpyderShell(ZMQInteractiveShell):
     """Spyder shell."""
@@ -72,6 +76,13 @@ def __init__(self, *args, **kwargs):
             'set_pdb_execute_events': self.set_pdb_execute_events,
             'set_pdb_use_exclamation_mark': self.set_pdb_use_exclamation_mark,
             'get_value': self.get_value,
+            'open_data_view': self.open_data_view,
+            'get_data_view_page': self.get_data_view_page,
+            'get_data_view_item': self.get_data_view_item,
+            'open_data_subview': self.open_data_subview,
+            'sort_data_view': self.sort_data_view,
+            'filter_data_view': self.filter_data_view,
+            'close_data_view': self.close_data_view,
             'load_data': self.load_data,
             'save_namespace': self.save_namespace,
             'is_defined': self.is_defined,
@@ -87,6 +98,7 @@ def __init__(self, *args, **kwargs):
             'close_all_mpl_figures': self.close_all_mpl_figures,
             'show_mpl_backend_errors': self.show_mpl_backend_errors,
             'get_namespace_view': self.get_namespace_view,
+            'get_namespace_snapshot': self.get_namespace_snapshot,
             'set_namespace_view_settings': self.set_namespace_view_settings,
             'get_var_properties': self.get_var_properties,
             'set_sympy_forecolor': self.set_sympy_forecolor,
@@ -101,6 +113,9 @@ def __init__(self, *args, **kwargs):
                 call_id, handlers[call_id])
 
         self.namespace_view_settings = {}
+        self._namespace_snapshots = None
+        self._data_views = {}
+        self._last_data_view_id = 0
         self._pdb_obj = None
         self._pdb_step = None
         self._do_publish_pdb_state = True
@@ -153,6 +168,47 @@ def get_namespace_view(self):
         else:
             return None
 
+    def get_namespace_snapshot(self, state=None, pending_only=False,
+                               time_budget=NAMESPACE_SNAPSHOT_TIME_BUDGET):
+        """
+        Return the changes of the namespace view and the properties of
+        the variables since the snapshot identified by state, or the whole
+        snapshot if it's not the last one returned.
+
+        This is a dictionary with the following structure
+
+        {'base': state, 'state': new_state,
+         'changed': {'a': {'color': '#800000', ...}},
+         'properties': {'a': {'is_list': False, ...}},
+         'removed': ['b'], 'pending': ['c']}
+
+        Here:
+        * 'changed' has the entries of the variables that were added or
+          changed, as returned by get_namespace_view, and 'properties'
+          their properties, as returned by get_var_properties.
+        * 'removed' has the names of the variables that were removed.
+        * 'pending' has the names of the variables whose entries were not
+          made after time_budget seconds. They are made by calling this
+          again with pending_only.
+        * 'base' is None when the whole snapshot is returned.
+        """
+        from spyder_kernels.utils.nsview import (get_remote_data,
+                                                 RemoteViewChanges)
+
+        settings = self.namespace_view_settings
+        if settings:
+            if self._namespace_snapshots is None:
+                self._namespace_snapshots = RemoteViewChanges(
+                    get_properties=self._get_var_properties)
+            ns = self._get_current_namespace()
+            data = get_remote_data(ns, settings, mode='editable',
+                                   more_excluded_names=EXCLUDED_NAMES)
+            return self._namespace_snapshots.get_changes(
+                data, minmax=settings['minmax'], state=state,
+                time_budget=time_budget, pending_only=pending_only)
+        else:
+            return None
+
     def get_var_properties(self):
         """
         Get some properties of the variables in the current
@@ -168,18 +224,7 @@ def get_var_properties(self):
 
             properties = {}
             for name, value in list(data.items()):
-                properties[name] = {
-                    'is_list':  isinstance(value, (tuple, list)),
-                    'is_dict':  isinstance(value, dict),
-                    'is_set': isinstance(value, set),
-                    'len': self._get_len(value),
-                    'is_array': self._is_array(value),
-                    'is_image': self._is_image(value),
-                    'is_data_frame': self._is_data_frame(value),
-                    'is_series': self._is_series(value),
-                    'array_shape': self._get_array_shape(value),
-                    'array_ndim': self._get_array_ndim(value)
-                }
+                properties[name] = self._get_var_properties(value)
 
             return properties
         else:
@@ -191,6 +236,64 @@ def get_value(self, name):
         self._do_publish_pdb_state = False
         return ns[name]
 
+    def open_data_view(self, name):
+        """
+        Open a paged view of a variable, returning its information
+        together with the id used to get its pages.
+        """
+        ns = self._get_current_namespace()
+        return self._open_data_view(ns[name])
+
+    def open_data_subview(self, view_id, row):
+        """
+        Open a paged view of the item in a row of a view of a collection
+        opened with open_data_view, like open_data_view does.
+        """
+        return self._open_data_view(self._data_views[view_id].get_item(row))
+
+    def get_data_view_page(self, view_id, *args, **kwargs):
+        """Get a page of a view opened with open_data_view."""
+        return self._data_views[view_id].get_page(*args, **kwargs)
+
+    def get_data_view_item(self, view_id, row):
+        """
+        Get the value of the item in a row of a view of a collection opened
+        with open_data_view.
+        """
+        self._do_publish_pdb_state = False
+        return self._data_views[view_id].get_item(row)
+
+    def sort_data_view(self, view_id, column, ascending=True):
+        """
+        Sort a view opened with open_data_view and return its new
+        information.
+        """
+        return self._data_views[view_id].sort(column, ascending)
+
+    def filter_data_view(self, view_id, query=None, column=None,
+                         value=None):
+        """
+        Filter a view opened with open_data_view and return its new
+        information.
+        """
+        return self._data_views[view_id].filter(
+            query, column, value, local_dict=self._get_current_namespace())
+
+    def close_data_view(self, view_id):
+        """Close a view opened with open_data_view."""
+        self._data_views.pop(view_id, None)
+
+    def _open_data_view(self, value):
+        """Open a paged view of value and return its information."""
+        from spyder_kernels.utils.dataviews import make_data_view
+
+        view = make_data_view(value)
+        self._last_data_view_id += 1
+        self._data_views[self._last_data_view_id] = view
+        info = view.get_info()
+        info['id'] = self._last_data_view_id
+        return info
+
     def set_value(self, name, value):
         """Set the value of a variable"""
         ns = self._get_reference_namespace(name)
@@ -283,8 +386,10 @@ def publish_pdb_state(self):
         send_spyder_msg.
         """
         if self._pdb_obj and self._do_publish_pdb_state:
-            state = dict(namespace_view = self.get_namespace_view(),
-                         var_properties = self.get_var_properties(),
+            # The frontend is expected to have the last namespace snapshot
+            snapshot_state = getattr(self._namespace_snapshots, 'state', None)
+            state = dict(namespace_snapshot =
+                             self.get_namespace_snapshot(snapshot_state),
                          step = self._pdb_step)
             self.frontend_call(blocking=False).pdb_state(state)
         self._do_publish_pdb_state = True
@@ -599,6 +704,21 @@ def _mglobals(self):
         else:
             return self.shell.user_ns
 
+    def _get_var_properties(self, var):
+        """Return the properties of a variable"""
+        return {
+            'is_list':  isinstance(var, (tuple, list)),
+            'is_dict':  isinstance(var, dict),
+            'is_set': isinstance(var, set),
+            'len': self._get_len(var),
+            'is_array': self._is_array(var),
+            'is_image': self._is_image(var),
+            'is_data_frame': self._is_data_frame(var),
+            'is_series': self._is_series(var),
+            'array_shape': self._get_array_shape(var),
+            'array_ndim': self._get_array_ndim(var)
+        }
+
     def _get_len(self, var):
         """Return sequence length"""
         try:
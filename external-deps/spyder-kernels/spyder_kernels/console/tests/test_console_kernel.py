@@ -186,6 +186,79 @@ def test_get_namespace_view(kernel):
     assert "'view': '1'" in nsview
 
 
+def test_get_namespace_snapshot(kernel):
+    """
+    Test the snapshots of the namespace view and variable properties.
+    """
+    kernel.do_execute('a = 1; b = [1]', True)
+    snapshot = kernel.get_namespace_snapshot()
+    assert snapshot['base'] is None
+    assert sorted(snapshot['changed']) == ['a', 'b']
+    assert snapshot['properties']['b']['is_list']
+    assert snapshot['properties']['b']['len'] == 1
+
+    kernel.do_execute('b.append(2); c = 3; del a', True)
+    new_snapshot = kernel.get_namespace_snapshot(snapshot['state'])
+    assert new_snapshot['base'] == snapshot['state']
+    assert sorted(new_snapshot['changed']) == ['b', 'c']
+    assert new_snapshot['changed']['b']['view'] == '[1, 2]'
+    assert new_snapshot['properties']['b']['len'] == 2
+    assert new_snapshot['removed'] == ['a']
+    assert new_snapshot['pending'] == []
+
+
+def test_data_views(kernel):
+    """
+    Test getting pages of a DataFrame from the kernel.
+    """
+    kernel.do_execute('import pandas as pd; '
+                      'df = pd.DataFrame({"a": range(10)})', True)
+    info = kernel.open_data_view('df')
+    assert info['shape'] == (10, 1)
+    page = kernel.get_data_view_page(info['id'], (8, 20), (0, 1))
+    assert page['index'] == [8, 9]
+    assert page['values'] == [[8, 9]]
+
+    # Sort and filter the view in the kernel
+    view_id = info['id']
+    kernel.sort_data_view(view_id, 0, ascending=False)
+    page = kernel.get_data_view_page(view_id, (0, 2), (0, 1))
+    assert page['values'] == [[9, 8]]
+    kernel.do_execute('limit = 7', True)
+    info = kernel.filter_data_view(view_id, query='a > @limit')
+    assert info['shape'] == (2, 1)
+
+    kernel.close_data_view(view_id)
+    assert view_id not in kernel._data_views
+
+    kernel.do_execute('b = 1', True)
+    with pytest.raises(TypeError):
+        kernel.open_data_view('b')
+
+    # Items of collections are got one at a time, or by their own pages
+    kernel.do_execute('c = {"x": 1, "y": list(range(20))}', True)
+    info = kernel.open_data_view('c')
+    assert info['length'] == 2
+    page = kernel.get_data_view_page(info['id'], (0, 2), None)
+    assert page['keys'] == ['x', 'y']
+    assert kernel.get_data_view_item(info['id'], 0) == 1
+    subview_info = kernel.open_data_subview(info['id'], 1)
+    assert subview_info['kind'] == 'list'
+    page = kernel.get_data_view_page(subview_info['id'], (10, 12), None)
+    assert [value['view'] for value in page['values']] == ['10', '11']
+    kernel.close_data_view(subview_info['id'])
+    kernel.close_data_view(info['id'])
+
+    # Arrays are shown by slices of their pages
+    kernel.do_execute('import numpy as np; '
+                      'arr = np.arange(24).reshape(2, 3, 4)', True)
+    info = kernel.open_data_view('arr')
+    assert info['shape'] == (2, 3, 4)
+    page = kernel.get_data_view_page(info['id'], (0, 3), (1, 2), 0, 1)
+    assert page.tolist() == [[13], [17], [21]]
+    kernel.close_data_view(info['id'])
+
+
 def test_get_var_properties(kernel):
     """
     Test the properties fo the variables in the namespace.
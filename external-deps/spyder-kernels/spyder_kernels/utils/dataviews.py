@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Paged views of the data in the kernel.
+
+Big objects are not sent to the frontend to be shown in its editors.
+Instead, the frontend opens a view of them and gets only the pages it
+shows. Views are sorted and filtered in the kernel too, without changing
+or copying the objects.
+"""
+
+import datetime
+import re
+
+from spyder_kernels.py3compat import NUMERIC_TYPES, TEXT_TYPES, to_text_string
+
+
+# Types of the values that are sent as they are, the rest are sent as text
+SIMPLE_TYPES = (NUMERIC_TYPES + TEXT_TYPES +
+                (bool, bytes, datetime.date, datetime.time,
+                 datetime.timedelta))
+
+# Number of elements under which the extremes of the values of a
+# DataFrame or array are computed, to color its cells
+MAX_MIN_SIZE = 5e5
+
+
+def to_simple_value(value):
+    """Return value if it has a simple type, or its text otherwise."""
+    if value is None or isinstance(value, SIMPLE_TYPES):
+        return value
+    if isinstance(value, tuple):
+        return tuple(to_simple_value(item) for item in value)
+    try:
+        import numpy
+        if isinstance(value, numpy.generic):
+            return value
+    except ImportError:
+        pass
+    try:
+        return to_text_string(value)
+    except Exception:
+        return u'Display Error!'
+
+
+def natural_sort_key(value):
+    """
+    Return the key to sort value with the numbers in text by their value,
+    e.g. 'a2' before 'a10'.
+    """
+    if not isinstance(value, TEXT_TYPES):
+        return value
+    return [int(part) if part.isdigit() else part.lower()
+            for part in re.split('([0-9]+)', value)]
+
+
+class DataFrameView(object):
+    """
+    Paged view of a DataFrame, Series or Index.
+
+    The rows of the view are the positions in `rows` of the rows of the
+    data, or all of them in order if it's None.
+    """
+
+    def __init__(self, data):
+        from pandas import DataFrame, Series
+
+        self.type_name = type(data).__name__
+        self.is_series = isinstance(data, Series)
+        if self.is_series:
+            data = data.to_frame()
+        elif not isinstance(data, DataFrame):
+            data = DataFrame(data)
+        self.df = data
+        self.rows = None
+        self._filter_rows = None
+        self._sort_key = None
+
+    @property
+    def shape(self):
+        """Return the shape of the view."""
+        if self.rows is None:
+            return self.df.shape
+        return (len(self.rows), self.df.shape[1])
+
+    def _frame(self, start=None, stop=None):
+        """Return the rows of the view between start and stop."""
+        if self.rows is None:
+            return self.df.iloc[start:stop]
+        return self.df.iloc[self.rows[start:stop]]
+
+    def get_info(self):
+        """
+        Return the information needed to show the data, with the following
+        structure
+
+        {'type': 'DataFrame', 'is_series': False, 'shape': (10, 2),
+         'header_shape': (1, 1), 'names': ([None], [None]),
+         'max_min': [[3.0, 1.0], None]}
+
+        Here:
+        * 'header_shape' has the number of levels of the columns and index.
+        * 'names' has the names of those levels.
+        * 'max_min' has the maximum and minimum of each numeric column, or
+          is None if the data is too big to compute them.
+        """
+        df = self.df
+        shape = self.shape
+        small = shape[0] * shape[1] < MAX_MIN_SIZE
+        return {
+            'type': self.type_name,
+            'is_series': self.is_series,
+            'shape': shape,
+            'header_shape': (df.columns.nlevels, df.index.nlevels),
+            'names': ([to_simple_value(name) for name in df.columns.names],
+                      [to_simple_value(name) for name in df.index.names]),
+            'max_min': self.get_max_min() if small else None
+        }
+
+    def get_max_min(self):
+        """
+        Return the maximum and minimum of each column, ignoring NaN.
+
+        They are None for non-numeric columns. For complex columns they
+        are computed with the absolute values.
+        """
+        df = self._frame()
+        max_min = []
+        for column in range(df.shape[1]):
+            col = df.iloc[:, column]
+            kind = col.dtype.kind
+            if kind not in 'iufc' or len(col) == 0:
+                max_min.append(None)
+                continue
+            if kind == 'c':
+                col = col.abs()
+            vmax = col.max(skipna=True)
+            vmin = col.min(skipna=True)
+            if vmax == vmin:
+                vmin = vmin - 1
+            max_min.append([vmax, vmin])
+        return max_min
+
+    def get_page(self, rows, columns):
+        """
+        Return the page with the rows and columns between the given
+        (start, stop) pairs, with the following structure
+
+        {'values': [[1, 2], [3.0, 4.0]], 'index': [0, 1],
+         'columns': ['a', 'b']}
+
+        where 'values' has the values of each column.
+        """
+        page = self._frame(rows[0], rows[1]).iloc[:, columns[0]:columns[1]]
+        values = []
+        for column in range(page.shape[1]):
+            col = page.iloc[:, column]
+            if col.dtype.kind == 'O':
+                values.append([to_simple_value(value) for value in col])
+            else:
+                values.append(col.tolist())
+        return {
+            'values': values,
+            'index': [to_simple_value(label) for label in page.index],
+            'columns': [to_simple_value(label) for label in page.columns]
+        }
+
+    def sort(self, column, ascending=True):
+        """
+        Sort the view by the values of a column, or by the index if
+        column is negative, and return its information.
+
+        The sort is stable and keeps the rows with missing values last.
+        """
+        sort_key = (column, ascending)
+        self.rows = self._sort_rows(self._filter_rows, sort_key)
+        self._sort_key = sort_key
+        return self.get_info()
+
+    def filter(self, query=None, column=None, value=None, local_dict=None):
+        """
+        Show only the rows for which the pandas expression query is true
+        and whose value in column is value, and return the information of
+        the view.
+
+        The names in local_dict can be used in query with @. Calling it
+        without query nor column shows all the rows again.
+        """
+        import numpy as np
+        from pandas import isna
+
+        mask = np.ones(len(self.df), dtype=bool)
+        if query:
+            result = self.df.eval(query, local_dict=local_dict)
+            if (getattr(result, 'shape', None) != mask.shape or
+                    getattr(result, 'dtype', None) != bool):
+                raise ValueError("The query doesn't give a boolean for "
+                                 "each row")
+            mask &= np.asarray(result)
+        if column is not None:
+            col = self.df.iloc[:, column]
+            if isna(value):
+                mask &= np.asarray(col.isna())
+            elif col.dtype.kind == 'O':
+                # The values of these columns are sent as text
+                mask &= np.asarray(col.map(to_simple_value) == value)
+            else:
+                mask &= np.asarray(col == value)
+
+        if query or column is not None:
+            filter_rows = np.flatnonzero(mask)
+        else:
+            filter_rows = None
+        self.rows = self._sort_rows(filter_rows, self._sort_key)
+        self._filter_rows = filter_rows
+        return self.get_info()
+
+    def _sort_rows(self, rows, sort_key):
+        """Return the positions of rows sorted by sort_key."""
+        import numpy as np
+        from pandas import Series
+
+        if sort_key is None:
+            return rows
+        if rows is None:
+            rows = np.arange(len(self.df))
+        column, ascending = sort_key
+        if column < 0:
+            keys = Series(rows, index=self.df.index[rows])
+            keys = keys.sort_index(ascending=ascending, kind='mergesort')
+            return keys.values
+        keys = Series(self.df.iloc[rows, column].values, index=rows)
+        try:
+            keys = keys.sort_values(ascending=ascending, kind='mergesort')
+        except TypeError:
+            if keys.dtype.kind != 'O':
+                raise
+            # Sort the values that can't be compared by their text
+            keys = keys.map(to_text_string).sort_values(
+                ascending=ascending, kind='mergesort')
+        return keys.index.values
+
+
+class ArrayView(object):
+    """
+    Paged view of a NumPy array with up to three dimensions.
+
+    Its pages are two-dimensional: 1D arrays are shown as a column, and
+    3D arrays by the slice at an index of one of their axes. The array is
+    only indexed to get the pages, so memory-mapped arrays are read from
+    disk only where they're shown.
+    """
+
+    def __init__(self, data):
+        import numpy as np
+
+        if data.ndim > 3:
+            raise TypeError("There is no paged view for arrays with more "
+                            "than 3 dimensions")
+        if data.dtype.names is not None or isinstance(data, np.ma.MaskedArray):
+            raise TypeError("There is no paged view for record or masked "
+                            "arrays")
+        self.type_name = type(data).__name__
+        self.data = data
+
+    def get_info(self):
+        """
+        Return the information needed to show the array, with the following
+        structure
+
+        {'type': 'memmap', 'shape': (10, 2), 'dtype': '<f8',
+         'readonly': True, 'min_max': [1.0, 3.0], 'has_inf': False}
+
+        Here 'dtype' gives the data type with numpy.dtype, and 'min_max'
+        has the minimum and maximum of the values used to color them, or is
+        None if they can't be colored or the array is too big to compute
+        them. For complex arrays they are computed with the absolute values.
+        """
+        import numpy as np
+
+        data = self.data
+        min_max = None
+        has_inf = False
+        if data.size < MAX_MIN_SIZE and data.dtype.kind in 'biufc':
+            if data.dtype.kind == 'c':
+                values = np.abs(data)
+            else:
+                values = np.real(data)
+            try:
+                min_max = [np.nanmin(values), np.nanmax(values)]
+            except ValueError:
+                # Arrays without values
+                pass
+            if data.dtype.kind in 'fc':
+                has_inf = bool(np.any(np.isinf(data)))
+        return {
+            'type': self.type_name,
+            'shape': data.shape,
+            'dtype': data.dtype.str,
+            'readonly': not data.flags.writeable,
+            'min_max': min_max,
+            'has_inf': has_inf
+        }
+
+    def get_page(self, rows, columns, axis=None, index=None):
+        """
+        Return a copy of the values of the rows and columns between the
+        given (start, stop) pairs.
+
+        For 3D arrays, the page is taken from the slice of the array at
+        index in axis. Values of object arrays are sent as text if they're
+        not simple.
+        """
+        import numpy as np
+
+        data = self.data
+        if data.ndim == 0:
+            data = data.reshape(1, 1)
+        elif data.ndim == 1:
+            data = data[:, np.newaxis]
+        elif data.ndim == 3:
+            key = [slice(None)] * 3
+            key[axis] = index
+            data = data[tuple(key)]
+        page = np.array(data[rows[0]:rows[1], columns[0]:columns[1]])
+        if page.dtype.kind == 'O':
+            values = np.empty(page.shape, dtype=object)
+            for position, value in np.ndenumerate(page):
+                values[position] = to_simple_value(value)
+            page = values
+        return page
+
+
+class CollectionView(object):
+    """
+    Paged view of a list, tuple, set or dict.
+
+    Each row of the view is an item of the collection, shown by its key
+    and a summary of its value. The rows of the view are the positions in
+    `rows` of the items, or all of them in order if it's None. Items of
+    sets have no key, so their position is used instead.
+    """
+
+    def __init__(self, data):
+        self.type_name = type(data).__name__
+        if isinstance(data, dict):
+            self.kind = 'dict'
+            self.keys = list(data)
+        else:
+            if isinstance(data, (set, frozenset)):
+                self.kind = 'set'
+                data = list(data)
+            elif isinstance(data, tuple):
+                self.kind = 'tuple'
+            else:
+                self.kind = 'list'
+            self.keys = None
+        self.data = data
+        self.rows = None
+
+    def __len__(self):
+        return len(self.data)
+
+    def _key(self, row):
+        """Return the key of the item in a row."""
+        if self.rows is not None:
+            row = self.rows[row]
+        if self.keys is None:
+            return row
+        return self.keys[row]
+
+    def get_info(self):
+        """
+        Return the information needed to show the collection, with the
+        following structure
+
+        {'type': 'OrderedDict', 'kind': 'dict', 'length': 10}
+
+        where 'kind' is 'list', 'tuple', 'set' or 'dict'.
+        """
+        return {
+            'type': self.type_name,
+            'kind': self.kind,
+            'length': len(self)
+        }
+
+    def get_page(self, rows, columns=None, minmax=False):
+        """
+        Return the page with the rows between the given (start, stop) pair,
+        with the following structure
+
+        {'keys': ['a', 'b'], 'values': [{'type': 'int', ...}, ...]}
+
+        where 'values' has the summaries shown by the Variable Explorer
+        for the values. There are no columns, so they're ignored.
+        """
+        from spyder_kernels.utils.nsview import make_remote_view_entry
+
+        keys = [self._key(row)
+                for row in range(*slice(*rows).indices(len(self)))]
+        return {
+            'keys': [to_simple_value(key) for key in keys],
+            'values': [make_remote_view_entry(self.data[key], minmax)
+                       for key in keys]
+        }
+
+    def get_item(self, row):
+        """Return the value of the item in a row."""
+        return self.data[self._key(row)]
+
+    def sort(self, column, ascending=True):
+        """
+        Sort the view by the keys (column 0), types (1), sizes (2) or
+        values (3) of the items, and return its information.
+
+        Text is sorted with its numbers by value, and the values that
+        can't be compared are sorted by their text. The sort is stable.
+        """
+        from spyder_kernels.utils.nsview import (
+            get_human_readable_type, get_size)
+
+        keys = self.keys
+        if keys is None:
+            keys = range(len(self))
+        sort_key = None
+        if column == 0:
+            values = keys
+            sort_key = natural_sort_key
+        elif column == 1:
+            values = [get_human_readable_type(self.data[item_key])
+                      for item_key in keys]
+        elif column == 2:
+            sizes = [get_size(self.data[item_key]) for item_key in keys]
+            values = [size if isinstance(size, tuple) else (size,)
+                      for size in sizes]
+        else:
+            values = [self.data[item_key] for item_key in keys]
+
+        rows = list(range(len(self)))
+        try:
+            if sort_key is None:
+                rows.sort(key=values.__getitem__, reverse=not ascending)
+            else:
+                rows.sort(key=lambda row: sort_key(values[row]),
+                          reverse=not ascending)
+        except TypeError:
+            rows.sort(key=lambda row: to_text_string(values[row]),
+                      reverse=not ascending)
+        self.rows = rows
+        return self.get_info()
+
+
+def make_data_view(data):
+    """Return a paged view of data, or raise TypeError if not supported."""
+    if isinstance(data, (list, tuple, set, frozenset, dict)):
+        return CollectionView(data)
+    try:
+        from pandas import DataFrame, Index, Series
+    except ImportError:
+        DataFrame = Index = Series = None
+    try:
+        from numpy import ndarray
+    except ImportError:
+        ndarray = None
+    if DataFrame is not None and isinstance(data, (DataFrame, Index, Series)):
+        return DataFrameView(data)
+    if ndarray is not None and isinstance(data, ndarray):
+        return ArrayView(data)
+    raise TypeError("There is no paged view for objects of type %s"
+                    % type(data).__name__)
@@ -15,6 +15,9 @@
 from itertools import islice
 import inspect
 import re
+import time
+import uuid
+import zlib
 
 # Local imports
 from spyder_kernels.py3compat import (NUMERIC_TYPES, INT_TYPES, TEXT_TYPES,
@@ -719,7 +722,7 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
     assert mode in list(supported_types.keys())
     excluded_names = settings['excluded_names']
     if more_excluded_names is not None:
-        excluded_names += more_excluded_names
+        excluded_names = excluded_names + more_excluded_names
     return globalsfilter(
         data,
         check_all=settings['check_all'],
@@ -741,13 +744,173 @@ def make_remote_view(data, settings, more_excluded_names=None):
                            more_excluded_names=more_excluded_names)
     remote = {}
     for key, value in list(data.items()):
-        view = value_to_display(value, minmax=settings['minmax'])
-        remote[key] = {
-            'type':  get_human_readable_type(value),
-            'size':  get_size(value),
-            'color': get_color_name(value),
-            'view':  view,
-            'python_type': get_type_string(value)
-        }
+        remote[key] = make_remote_view_entry(value, settings['minmax'])
 
     return remote
+
+
+def make_remote_view_entry(value, minmax=False):
+    """Make the entry of *value* in a remote view"""
+    return {
+        'type':  get_human_readable_type(value),
+        'size':  get_size(value),
+        'color': get_color_name(value),
+        'view':  value_to_display(value, minmax=minmax),
+        'python_type': get_type_string(value)
+    }
+
+
+#==============================================================================
+# Changes of a remote view
+#==============================================================================
+# Types whose values can't change without creating a new object
+SCALAR_TYPES = (NUMERIC_TYPES + (bool, datetime.date, datetime.datetime,
+                                 datetime.timedelta) + NUMERIC_NUMPY_TYPES)
+STRING_TYPES = TEXT_TYPES + (bytes,)
+
+# Larger arrays are not fingerprinted because hashing their contents
+# takes as long as making their view
+FINGERPRINT_MAX_BYTES = 1000000
+
+
+def get_fingerprint(value):
+    """
+    Return a fingerprint of *value* that changes when its remote view
+    changes, or None if that can't be known without making the view.
+
+    Objects are identified by their id, which can be reused after they
+    are deleted, so the fingerprint also includes their type and a cheap
+    summary of the contents shown in the view, without keeping a reference
+    to anything but small scalars.
+    """
+    try:
+        value_type = type(value)
+        if value_type in SCALAR_TYPES:
+            return (value_type, id(value), value)
+        elif value_type in STRING_TYPES:
+            return (value_type, id(value), hash(value))
+        elif isinstance(value, ndarray):
+            if (value.dtype.hasobject or
+                    value.nbytes > FINGERPRINT_MAX_BYTES):
+                return None
+            return (value_type, id(value), value.shape, value.dtype.str,
+                    zlib.crc32(value.tobytes()))
+        elif isinstance(value, DataFrame):
+            return (value_type, id(value), value.shape,
+                    hash(tuple(value.columns)))
+        elif isinstance(value, Series):
+            return (value_type, id(value), value.shape)
+        elif isinstance(value, Image):
+            return (value_type, id(value), value.size, value.mode)
+    except Exception:
+        pass
+    return None
+
+
+class RemoteViewChanges(object):
+    """
+    Keep the last remote view sent to a frontend to send only its changes
+    afterwards.
+
+    Each view is identified by a state, and the changes are only sent if
+    the frontend has the last view, otherwise the whole view is sent.
+    The entries of the variables whose fingerprint didn't change are not
+    made again.
+
+    The properties of the variables, given by *get_properties*, are sent
+    with their entries.
+    """
+
+    def __init__(self, get_properties=None):
+        self.get_properties = get_properties
+        self.state = None
+        self.minmax = None
+        # Name -> (fingerprint, entry, properties)
+        self.entries = {}
+        self.pending = []
+
+    def get_changes(self, data, minmax=False, state=None, time_budget=None,
+                    pending_only=False):
+        """
+        Return the changes of the remote view of the (already filtered)
+        dictionary *data* since the view identified by *state*.
+
+        This is a dictionary with the following structure
+
+        {'base': state, 'state': new_state,
+         'changed': {'a': {'color': '#800000', ...}},
+         'properties': {'a': {'len': None, ...}},
+         'removed': ['b'], 'pending': ['c']}
+
+        where 'changed' has the added and changed entries, and 'base' is
+        None if the whole view is sent.
+
+        Entries are not made after *time_budget* seconds. The variables
+        whose entries were not made are left in 'pending' and keep their
+        last entry, if any, so they can be made later by calling this
+        again with *pending_only*.
+        """
+        start = time.time()
+        if minmax != self.minmax:
+            self.minmax = minmax
+            self.entries = {}
+        full = state is None or state != self.state
+        pending_only = pending_only and not full
+
+        if pending_only:
+            keys = self.pending
+            entries = dict(self.entries)
+        else:
+            # Make first the entries that were left pending, so that they
+            # are not left pending again
+            pending = set(self.pending)
+            keys = sorted(data, key=lambda key: key not in pending)
+            entries = {}
+
+        changed = {}
+        properties = {}
+        removed = []
+        self.pending = []
+        made = 0
+        for key in keys:
+            old = self.entries.get(key)
+            if key not in data:
+                # Only happens for pending entries
+                if old is not None:
+                    del entries[key]
+                    removed.append(key)
+                continue
+            value = data[key]
+            fingerprint = get_fingerprint(value)
+            if (old is not None and fingerprint is not None and
+                    fingerprint == old[0]):
+                entry = old
+            elif (time_budget is not None and made > 0 and
+                    time.time() - start > time_budget):
+                self.pending.append(key)
+                if old is None:
+                    continue
+                entry = old
+            else:
+                made += 1
+                entry = (fingerprint,
+                         make_remote_view_entry(value, minmax),
+                         self._get_properties(value))
+            entries[key] = entry
+            if full or old is None or entry[1:] != old[1:]:
+                changed[key] = entry[1]
+                properties[key] = entry[2]
+
+        if not full and not pending_only:
+            removed = [key for key in self.entries if key not in entries]
+        base = None if full else self.state
+        self.state = uuid.uuid4().hex
+        self.entries = entries
+        return {'base': base, 'state': self.state, 'changed': changed,
+                'properties': properties, 'removed': removed,
+                'pending': list(self.pending)}
+
+    def _get_properties(self, value):
+        if self.get_properties is None:
+            return None
+        return self.get_properties(value)
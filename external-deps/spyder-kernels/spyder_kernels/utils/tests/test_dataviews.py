@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for dataviews.py
+"""
+
+# Third party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local imports
+from spyder_kernels.utils.dataviews import make_data_view, to_simple_value
+
+
+def test_to_simple_value():
+    """Test the conversion of the values sent in pages."""
+    assert to_simple_value(1.5) == 1.5
+    assert to_simple_value(np.int64(3)) == 3
+    assert to_simple_value(None) is None
+    assert to_simple_value(('a', [1])) == ('a', '[1]')
+    assert to_simple_value(np.arange(2)) == '[0 1]'
+
+
+def test_dataframe_view_info():
+    """Test the information of the views of DataFrames."""
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    info = make_data_view(df).get_info()
+    assert info['type'] == 'DataFrame'
+    assert not info['is_series']
+    assert info['shape'] == (3, 2)
+    assert info['header_shape'] == (1, 1)
+    assert info['max_min'] == [[3, 1], None]
+
+    columns = pd.MultiIndex.from_tuples([('a', 1), ('a', 2)],
+                                        names=['x', 'y'])
+    df = pd.DataFrame([[1.0, 1.0]], columns=columns)
+    info = make_data_view(df).get_info()
+    assert info['header_shape'] == (2, 1)
+    assert info['names'] == (['x', 'y'], [None])
+    assert info['max_min'] == [[1.0, 0.0], [1.0, 0.0]]
+
+    info = make_data_view(pd.Series([1, 2], name='s')).get_info()
+    assert info['type'] == 'Series'
+    assert info['is_series']
+    assert info['shape'] == (2, 1)
+
+    info = make_data_view(pd.Index([1, 2, 3])).get_info()
+    assert info['shape'] == (3, 1)
+
+
+def test_dataframe_view_page():
+    """Test getting pages of the views of DataFrames."""
+    df = pd.DataFrame(np.arange(20).reshape(5, 4),
+                      index=list('abcde'), columns=list('ABCD'))
+    df['D'] = [[i] for i in range(5)]
+    view = make_data_view(df)
+
+    page = view.get_page((1, 3), (2, 10))
+    assert page['index'] == ['b', 'c']
+    assert page['columns'] == ['C', 'D']
+    assert page['values'] == [[6, 10], ['[1]', '[2]']]
+
+    index = pd.MultiIndex.from_tuples([(0, 'x'), (1, 'y')])
+    page = make_data_view(pd.DataFrame([1, 2], index=index)).get_page(
+        (0, 500), (0, 40))
+    assert page['index'] == [(0, 'x'), (1, 'y')]
+    assert page['values'] == [[1, 2]]
+
+
+def test_dataframe_view_sort():
+    """Test sorting the views of DataFrames."""
+    df = pd.DataFrame({'a': [2, np.nan, 1, 2], 'b': list('wxyz')},
+                      index=[3, 1, 2, 0])
+    view = make_data_view(df)
+    info = view.sort(0)
+    assert info['shape'] == (4, 2)
+    assert view.get_page((0, 4), (1, 2))['values'] == [list('ywzx')]
+    view.sort(0, ascending=False)
+    assert view.get_page((0, 4), (1, 2))['values'] == [list('wzyx')]
+    view.sort(-1)
+    assert view.get_page((0, 4), (1, 2))['index'] == [0, 1, 2, 3]
+
+    # The data is not changed
+    assert df['b'].tolist() == list('wxyz')
+
+
+def test_dataframe_view_filter():
+    """Test filtering the views of DataFrames."""
+    df = pd.DataFrame({'a': [2, np.nan, 1, 2], 'b': ['w', [1], 'y', 'z']})
+    view = make_data_view(df)
+    info = view.filter('a > @limit', local_dict={'limit': 1})
+    assert info['shape'] == (2, 2)
+    assert info['max_min'][0] == [2, 1]
+    assert view.get_page((0, 4), (1, 2))['values'] == [['w', 'z']]
+
+    # Filters are kept when sorting and the other way around
+    view.sort(1, ascending=False)
+    assert view.get_page((0, 4), (1, 2))['values'] == [['z', 'w']]
+    view.filter(column=1, value='[1]')
+    assert view.get_page((0, 4), (0, 1))['index'] == [1]
+    view.filter(column=0, value=np.nan)
+    assert view.shape == (1, 2)
+    view.filter(column=0, value=2.0)
+    assert view.get_page((0, 4), (1, 2))['values'] == [['z', 'w']]
+    view.filter()
+    assert view.get_page((0, 4), (1, 2))['values'] == [
+        ['z', 'y', 'w', '[1]']]
+
+    with pytest.raises(ValueError):
+        view.filter('a + 1')
+
+
+def test_array_view():
+    """Test getting the information and pages of arrays."""
+    arr = np.arange(12, dtype=float).reshape(3, 4)
+    view = make_data_view(arr)
+    info = view.get_info()
+    assert info['shape'] == (3, 4)
+    assert np.dtype(info['dtype']) == arr.dtype
+    assert info['min_max'] == [0, 11]
+    assert not info['readonly']
+    assert not info['has_inf']
+    page = view.get_page((1, 10), (2, 3))
+    assert page.tolist() == [[6], [10]]
+
+    # The page is a copy
+    page[0, 0] = -1
+    assert arr[1, 2] == 6
+
+    # 1D arrays are shown as a column
+    view = make_data_view(np.array(['a', 'bc', 'd']))
+    assert np.dtype(view.get_info()['dtype']).kind == 'U'
+    assert view.get_info()['min_max'] is None
+    assert view.get_page((0, 2), (0, 1)).tolist() == [['a'], ['bc']]
+
+    # 3D arrays are shown by slices
+    view = make_data_view(np.arange(24).reshape(2, 3, 4))
+    assert view.get_page((0, 2), (0, 2), 1, 2).tolist() == [[8, 9],
+                                                             [20, 21]]
+
+    # The values of object arrays are sent as text
+    view = make_data_view(np.array([1, [2]], dtype=object))
+    assert view.get_page((0, 2), (0, 1)).tolist() == [[1], ['[2]']]
+
+
+def test_memmap_view(tmpdir):
+    """Test that views of memory-mapped arrays don't load them."""
+    filename = str(tmpdir.join('arr.npy'))
+    np.save(filename, np.arange(10.))
+    arr = np.load(filename, mmap_mode='r')
+    view = make_data_view(arr)
+    info = view.get_info()
+    assert info['type'] == 'memmap'
+    assert info['readonly']
+    page = view.get_page((2, 4), (0, 1))
+    assert type(page) is np.ndarray
+    assert page.tolist() == [[2.], [3.]]
+
+
+def test_collection_view_page():
+    """Test getting pages of the items of collections."""
+    view = make_data_view({'b': [1, 2], 'a': 1.5, ('c', 1): 'x'})
+    assert view.get_info() == {'type': 'dict', 'kind': 'dict', 'length': 3}
+    page = view.get_page((1, 5))
+    assert page['keys'] == ['a', ('c', 1)]
+    assert [value['view'] for value in page['values']] == ['1.5', 'x']
+    assert page['values'][0]['type'] == 'float'
+    assert view.get_item(0) == [1, 2]
+
+    view = make_data_view(tuple(range(100)))
+    assert view.get_info()['kind'] == 'tuple'
+    page = view.get_page((98, 100))
+    assert page['keys'] == [98, 99]
+    assert view.get_item(99) == 99
+
+    view = make_data_view({3})
+    assert view.get_info()['kind'] == 'set'
+    assert view.get_page((0, 1))['keys'] == [0]
+
+
+def test_collection_view_sort():
+    """Test sorting the items of collections in the kernel."""
+    view = make_data_view({'a10': [1, 2, 3], 'a2': 'x', 'a1': [4]})
+    view.sort(0)
+    assert view.get_page((0, 3))['keys'] == ['a1', 'a2', 'a10']
+    view.sort(1, ascending=False)
+    assert view.get_page((0, 3))['keys'] == ['a2', 'a10', 'a1']
+    view.sort(2)
+    assert view.get_page((0, 3))['keys'] == ['a2', 'a1', 'a10']
+    assert view.get_item(2) == [1, 2, 3]
+
+    # Values that can't be compared are sorted by their text
+    view = make_data_view([2, 'b', 1])
+    view.sort(3)
+    assert view.get_page((0, 3))['keys'] == [2, 0, 1]
+    view.sort(0, ascending=False)
+    assert view.get_page((0, 3))['keys'] == [2, 1, 0]
+
+
+def test_make_data_view_unsupported():
+    """Test the objects that don't have views."""
+    with pytest.raises(TypeError):
+        make_data_view(1)
+    with pytest.raises(TypeError):
+        make_data_view(np.zeros((1, 1, 1, 1)))
+    with pytest.raises(TypeError):
+        make_data_view(np.ma.array([1, 2], mask=[True, False]))
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -12,6 +12,7 @@
 
 from collections import defaultdict
 import datetime
+import time
 
 # Third party imports
 import numpy as np
@@ -25,7 +26,8 @@
 from spyder_kernels.utils.nsview import (sort_against, is_supported,
                                          value_to_display, get_size,
                                          get_supported_types, get_type_string,
-                                         is_editable_type)
+                                         is_editable_type, get_fingerprint,
+                                         RemoteViewChanges)
 
 def generate_complex_object():
     """Taken from issue #4221."""
@@ -421,5 +423,107 @@ class MyClass:
     assert not is_editable_type(my_instance)
 
 
+def test_get_fingerprint():
+    """Test that fingerprints change when the view of a value changes."""
+    arr = np.zeros(10)
+    fingerprint = get_fingerprint(arr)
+    assert get_fingerprint(arr) == fingerprint
+    arr[0] = 1
+    assert get_fingerprint(arr) != fingerprint
+
+    df = pd.DataFrame({'a': [1, 2]})
+    fingerprint = get_fingerprint(df)
+    df['b'] = [3, 4]
+    assert get_fingerprint(df) != fingerprint
+
+    # Different values have different fingerprints
+    assert get_fingerprint(1.5) != get_fingerprint(2.5)
+    assert get_fingerprint('a' * 10) != get_fingerprint('b' * 10)
+
+    # Equal values with different ids too, because ids are part of them
+    value = 1.5
+    equal_value = value * 1
+    assert equal_value == value and equal_value is not value
+    assert get_fingerprint(equal_value) != get_fingerprint(value)
+
+    # Mutable collections, large arrays and other objects are not
+    # fingerprinted
+    assert get_fingerprint([1, 2]) is None
+    assert get_fingerprint(np.zeros(10 ** 6)) is None
+    assert get_fingerprint(np.array([[]], dtype=object)) is None
+
+
+def test_remote_view_changes():
+    """Test the changes of a remote view."""
+    changes = RemoteViewChanges()
+    data = {'a': 1, 'b': [1, 2], 'c': np.zeros(3)}
+
+    # The whole view is sent first
+    view = changes.get_changes(data)
+    assert view['base'] is None
+    assert sorted(view['changed']) == ['a', 'b', 'c']
+    assert view['changed']['a']['view'] == '1'
+
+    # Then only what changed since the last view
+    data['b'].append(3)
+    data['c'][0] = 1
+    data['d'] = 'text'
+    del data['a']
+    new_view = changes.get_changes(data, state=view['state'])
+    assert new_view['base'] == view['state']
+    assert sorted(new_view['changed']) == ['b', 'c', 'd']
+    assert new_view['changed']['b']['view'] == '[1, 2, 3]'
+    assert new_view['removed'] == ['a']
+
+    newer_view = changes.get_changes(data, state=new_view['state'])
+    assert newer_view['changed'] == {}
+    assert newer_view['removed'] == []
+
+    # The whole view is sent if the frontend doesn't have the last one
+    view = changes.get_changes(data, state=view['state'])
+    assert view['base'] is None
+    assert sorted(view['changed']) == ['b', 'c', 'd']
+
+    # Views are made again if minmax changes
+    view = changes.get_changes(data, minmax=True, state=view['state'])
+    assert view['changed']['c']['view'] == 'Min: 0.0\nMax: 1.0'
+
+
+def test_remote_view_changes_pending():
+    """Test the entries left pending after the time budget."""
+    class Slow(object):
+        def __len__(self):
+            time.sleep(0.1)
+            return 1
+
+    changes = RemoteViewChanges(get_properties=lambda value: len(value))
+    data = {'a': Slow(), 'b': Slow(), 'c': [1]}
+
+    # At least one entry is made every time
+    view = changes.get_changes(data, time_budget=0)
+    assert len(view['changed']) == 1
+    assert len(view['pending']) == 2
+    assert view['properties'] == {key: 1 for key in view['changed']}
+
+    # Only the pending entries are made afterwards, keeping the rest
+    data['d'] = [2]
+    while view['pending']:
+        pending = view['pending']
+        view = changes.get_changes(data, state=view['state'], time_budget=0,
+                                   pending_only=True)
+        assert list(view['changed']) == pending[:1]
+        assert view['removed'] == []
+    assert sorted(changes.entries) == ['a', 'b', 'c']
+
+    # Pending entries that changed keep their last entry
+    del data['d']
+    data['a'] = [1, 2, 3]
+    data['b'] = [4]
+    view = changes.get_changes(data, state=view['state'], time_budget=0)
+    assert list(view['changed']) == ['a']
+    assert sorted(view['pending']) == ['b', 'c']
+    assert changes.entries['b'][1]['python_type'] != 'list'
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -218,7 +218,6 @@ def run(self):
     'paramiko>=2.4.0;platform_system=="Windows"',
     'parso==0.7.0',
     'pexpect>=4.4.0',
-    'pickleshare>=0.4',
     'psutil>=5.3',
     'pygments>=2.0',
     'pylint>=1.0',
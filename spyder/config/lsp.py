@@ -27,6 +27,7 @@
     'port': 2087,
     'external': False,
     'stdio': False,
+    'inprocess_transport': False,
     'configurations': {
         'pyls': {
             'configurationSources': [
@@ -224,6 +224,7 @@
               'automatic_completions_after_chars': 3,
               'automatic_completions_after_ms': 300,
               'completions_wait_for_ms': 200,
+              'completions_streaming': False,
               'completions_hint': True,
               'completions_hint_after_ms': 500,
               'underline_errors': False,
@@ -538,7 +539,10 @@
               'advanced/host': '127.0.0.1',
               'advanced/port': 2087,
               'advanced/external': False,
-              'advanced/stdio': False
+              'advanced/stdio': False,
+              'advanced/inprocess_transport': False,
+              'tracing/enabled': False,
+              'tracing/p95_threshold': 500
              }),
             ('fallback-completions',
              {
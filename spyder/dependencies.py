@@ -46,7 +46,6 @@
 PARAMIKO_REQVER = '>=2.4.0'
 PARSO_REQVER = '=0.7.0'
 PEXPECT_REQVER = '>=4.4.0'
-PICKLESHARE_REQVER = '>=0.4'
 PSUTIL_REQVER = '>=5.3'
 PYGMENTS_REQVER = '>=2.0'
 PYLINT_REQVER = '>=1.0'
@@ -155,10 +154,6 @@
      'package_name': "pexpect",
      'features': _("Stdio support for our language server client"),
      'required_version': PEXPECT_REQVER},
-    {'modname': "pickleshare",
-     'package_name': "pickleshare",
-     'features': _("Cache the list of installed Python modules"),
-     'required_version': PICKLESHARE_REQVER},
     {'modname': "psutil",
      'package_name': "psutil",
      'features': _("CPU and memory usage info in the status bar"),
@@ -27,7 +27,8 @@
 from spyder.plugins.completion.manager.api import CompletionItemKind
 from spyder.plugins.completion.manager.api import LSPRequestTypes
 from spyder.plugins.completion.fallback.utils import (
-    get_keywords, get_words, is_prefix_valid)
+    get_import_prefix, get_keywords, get_words, is_prefix_valid)
+from spyder.utils.introspection.module_completion import get_module_index
 
 
 FALLBACK_COMPLETION = "Fallback"
@@ -101,6 +102,38 @@ def tokenize(self, text, offset, language, current_word):
 
         return keywords
 
+    def get_module_completions(self, text, offset, executable,
+                               current_word):
+        """
+        Return the modules that can be imported by `executable` if
+        `offset` is in a Python import statement, or None otherwise or if
+        those modules are not known yet.
+        """
+        prefix = get_import_prefix(text, offset)
+        if prefix is None:
+            return None
+
+        index = get_module_index(executable)
+        if not index.is_ready():
+            return None
+
+        modules = []
+        for module in index.complete(prefix):
+            name = module.rsplit('.', 1)[-1]
+            modules.append({'kind': CompletionItemKind.MODULE,
+                            'insertText': name,
+                            'label': name,
+                            'sortText': name,
+                            'filterText': name,
+                            'documentation': '',
+                            'provider': FALLBACK_COMPLETION})
+
+        if current_word is not None:
+            current_word = current_word.lower()
+            modules = [m for m in modules
+                       if current_word in m['insertText'].lower()]
+        return modules
+
     def stop(self):
         """Stop actor."""
         with QMutexLocker(self.mutex):
@@ -147,10 +180,22 @@ def handle_msg(self, message):
             tokens = []
             if file in self.file_tokens:
                 text_info = self.file_tokens[file]
-                tokens = self.tokenize(
-                    text_info['text'],
-                    text_info['offset'],
-                    text_info['language'],
-                    msg['current_word'])
+                modules = None
+                if (text_info['language'].lower() == 'python' and
+                        msg.get('executable')):
+                    modules = self.get_module_completions(
+                        text_info['text'],
+                        text_info['offset'],
+                        msg['executable'],
+                        msg['current_word'])
+                if modules is not None:
+                    # Only modules can be written in import statements
+                    tokens = modules
+                else:
+                    tokens = self.tokenize(
+                        text_info['text'],
+                        text_info['offset'],
+                        text_info['language'],
+                        msg['current_word'])
             tokens = {'params': tokens}
             self.sig_set_tokens.emit(_id, tokens)
@@ -14,8 +14,10 @@
 import logging
 
 # Local imports
-from spyder.plugins.completion.manager.api import SpyderCompletionPlugin
+from spyder.plugins.completion.manager.api import (LSPRequestTypes,
+                                                   SpyderCompletionPlugin)
 from spyder.plugins.completion.fallback.actor import FallbackActor
+from spyder.utils.misc import get_python_executable
 
 
 logger = logging.getLogger(__name__)
@@ -61,8 +63,16 @@ def send_request(self, language, req_type, req, req_id=None):
             'msg': req
         }
         req['language'] = language
+        if req_type == LSPRequestTypes.DOCUMENT_COMPLETION:
+            req['executable'] = self.get_python_executable()
         self.fallback_actor.sig_mailbox.emit(request)
 
+    def get_python_executable(self):
+        """Return the interpreter whose modules are completed."""
+        if self.get_option('default', section='main_interpreter'):
+            return get_python_executable()
+        return self.get_option('executable', section='main_interpreter')
+
     def update_configuration(self):
         self.enabled = self.get_option('enable')
         self.start()
@@ -10,7 +10,9 @@
 import pytest
 from diff_match_patch import diff_match_patch
 from spyder.plugins.completion.manager.api import LSPRequestTypes
-from spyder.plugins.completion.fallback.utils import get_words
+from spyder.plugins.completion.fallback.utils import (get_import_prefix,
+                                                      get_words)
+from spyder.utils.introspection.module_completion import get_module_index
 
 
 DATA_PATH = osp.join(osp.dirname(osp.abspath(__file__)), "data")
@@ -91,6 +93,15 @@ def test_get_words():
     assert set(tokens) == {'foo', 'baz', 'car456'}
 
 
+def test_get_import_prefix():
+    for source, prefix in [('import os.pa', 'os.pa'),
+                           ('import sys as s, os', 'os'),
+                           ('a = 1\nfrom ', ''),
+                           ('from os import pa', None),
+                           ('x = os.pa', None)]:
+        assert get_import_prefix(source, len(source)) == prefix
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize('file_fixture', language_list, indirect=True)
 def test_tokenize(qtbot_module, fallback_fixture, file_fixture):
@@ -163,3 +174,31 @@ def test_token_update(qtbot_module, fallback_fixture):
     updated_tokens = blocker.args[0]
     updated_tokens = {token['insertText'] for token in updated_tokens}
     assert 'args' in updated_tokens
+
+
+@pytest.mark.slow
+def test_module_completion(qtbot_module, fallback_fixture):
+    fallback, completions, diff_match = fallback_fixture
+    index = get_module_index(fallback.get_python_executable())
+    qtbot_module.waitUntil(index.is_ready, timeout=30000)
+
+    source = 'import sys\nimport json.de'
+    open_request = {
+        'file': 'test_import.py',
+        'text': source,
+        'offset': len(source),
+    }
+    fallback.send_request(
+        'python', LSPRequestTypes.DOCUMENT_DID_OPEN, open_request)
+    qtbot_module.wait(1000)
+
+    tokens_request = {
+        'file': 'test_import.py',
+        'current_word': 'de'
+    }
+    with qtbot_module.waitSignal(completions.sig_recv_tokens,
+                                 timeout=3000) as blocker:
+        fallback.send_request(
+            'python', LSPRequestTypes.DOCUMENT_COMPLETION, tokens_request)
+    tokens = [token['insertText'] for token in blocker.args[0]]
+    assert tokens == ['decoder']
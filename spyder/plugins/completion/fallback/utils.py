@@ -39,6 +39,12 @@
 # Same as above, but it also considers words separated by "-"
 kebab_regex = re.compile(r'[^\W\d_]\w+[-\w]*')
 
+# Module name being written in an import statement, e.g. `os.pa` in
+# `import sys, os.pa` or `from os.pa`
+import_regex = re.compile(
+    r'^\s*(?:from\s+|import\s+(?:[\w.]+(?:\s+as\s+\w+)?\s*,\s*)*)'
+    r'([^\W\d][\w.]*|)$', re.UNICODE)
+
 LANGUAGE_REGEX = {
     'css': kebab_regex,
     'scss': kebab_regex,
@@ -116,6 +122,22 @@ def get_words(text, exclude_offset=None, language=''):
     return tokens
 
 
+def get_import_prefix(text, offset):
+    """
+    Return the module name written before offset in an import statement,
+    or None if offset is not in one.
+    """
+    # Account for length differences in text when using characters
+    # such as emojis in the editor.
+    utf16_diff = qstring_length(text) - len(text)
+    text = text[:offset - utf16_diff]
+    line = text[text.rfind('\n') + 1:]
+    match = import_regex.match(line)
+    if match is None:
+        return None
+    return match.group(1)
+
+
 def is_prefix_valid(text, offset, language):
     """Check if current offset prefix is valid."""
     # Account for length differences in text when using characters
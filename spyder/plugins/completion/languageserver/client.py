@@ -20,8 +20,8 @@
 import time
 
 # Third-party imports
-from qtpy.QtCore import (QObject, QProcess, QProcessEnvironment,
-                         QSocketNotifier, Signal, Slot)
+from qtpy.QtCore import (QObject, QProcess, QProcessEnvironment, QThread,
+                         Signal, Slot)
 import zmq
 import psutil
 
@@ -34,9 +34,14 @@
     ClientConstants)
 from spyder.plugins.completion.languageserver.decorators import (
     send_request, send_notification, class_register, handles)
-from spyder.plugins.completion.languageserver.transport import MessageKind
+from spyder.plugins.completion.languageserver.transport import (
+    MessageKind, TRACE_KEY)
+from spyder.plugins.completion.languageserver.transport.inprocess import (
+    StdioTransport, TCPTransport)
 from spyder.plugins.completion.languageserver.providers import (
     LSPMethodProviderMixIn)
+from spyder.plugins.completion.languageserver.workers import (
+    MessageReader, preprocess_message)
 from spyder.py3compat import PY2
 from spyder.utils.misc import getcwd_or_home, select_port
 
@@ -87,9 +92,12 @@ def __init__(self, parent,
         self.zmq_in_port = None
         self.zmq_out_port = None
         self.transport = None
+        self.inprocess_transport = None
+        self.tracer = None
         self.server = None
         self.stdio_pid = None
-        self.notifier = None
+        self.reader = None
+        self.reader_thread = None
         self.language = language
 
         self.initialized = False
@@ -117,6 +125,8 @@ def __init__(self, parent,
 
         self.external_server = server_settings.get('external', False)
         self.stdio = server_settings.get('stdio', False)
+        self.use_inprocess_transport = server_settings.get(
+            'inprocess_transport', False)
 
         # Setting stdio on implies that external_server is off
         if self.stdio and self.external_server:
@@ -176,6 +186,22 @@ def transport_log_file(self):
         """
         return self._get_log_filename('transport')
 
+    @property
+    def server_cwd(self):
+        """Working directory for the server process."""
+        if self.language != 'python':
+            # There's no need to define a cwd for other servers.
+            return None
+
+        # Set the PyLS current working to an empty dir inside
+        # our config one. This avoids the server to pick up user
+        # files such as random.py or string.py instead of the
+        # standard library modules named the same.
+        cwd = osp.join(get_conf_path(), 'lsp_paths', 'cwd')
+        if not osp.exists(cwd):
+            os.makedirs(cwd)
+        return cwd
+
     @property
     def server_args(self):
         """Arguments for the server process."""
@@ -267,15 +293,8 @@ def start_server(self):
                 env.insert('PYTHONPATH', os.pathsep.join(sys.path)[:])
 
         # Adjustments for the Python language server.
+        cwd = self.server_cwd
         if self.language == 'python':
-            # Set the PyLS current working to an empty dir inside
-            # our config one. This avoids the server to pick up user
-            # files such as random.py or string.py instead of the
-            # standard library modules named the same.
-            cwd = osp.join(get_conf_path(), 'lsp_paths', 'cwd')
-            if not osp.exists(cwd):
-                os.makedirs(cwd)
-
             # On Windows, some modules (notably Matplotlib)
             # cause exceptions if they cannot get the user home.
             # So, we need to pass the USERPROFILE env variable to
@@ -283,9 +302,6 @@ def start_server(self):
             if os.name == "nt" and "USERPROFILE" in os.environ:
                 env.insert("USERPROFILE", os.environ["USERPROFILE"])
         else:
-            # There's no need to define a cwd for other servers.
-            cwd = None
-
             # Most LSP servers spawn other processes, which may require
             # some environment variables.
             for var in os.environ:
@@ -345,17 +361,55 @@ def start_transport(self):
         # Start transport
         self.transport.start(self.transport_args[0], self.transport_args[1:])
 
+    def start_inprocess_transport(self):
+        """
+        Start a transport that communicates with the server from this
+        process, instead of using a separate transport process.
+        """
+        if self.stdio:
+            env = QProcessEnvironment.systemEnvironment()
+            if DEV or running_under_pytest():
+                env.insert('PYTHONPATH', os.pathsep.join(sys.path)[:])
+            self.inprocess_transport = StdioTransport(
+                self.server_args, env=env, cwd=self.server_cwd,
+                log_file=self.server_log_file, parent=self)
+        else:
+            self.inprocess_transport = TCPTransport(
+                self.server_host, self.server_port, parent=self)
+
+        self.inprocess_transport.sig_ready.connect(
+            self.on_inprocess_transport_ready)
+        self.inprocess_transport.sig_message_received.connect(
+            self.on_inprocess_message)
+        self.inprocess_transport.sig_went_down.connect(
+            lambda: self.sig_went_down.emit(self.language))
+        self.inprocess_transport.start()
+
+    @Slot(object)
+    def on_inprocess_transport_ready(self, pid):
+        """Initialize the server when the in-process transport is ready."""
+        self.initialize({'pid': pid})
+
     def start(self):
         """Start client."""
+        if self.use_inprocess_transport:
+            self.start_server()
+            self.start_inprocess_transport()
+            logger.debug('LSP {} client started!'.format(self.language))
+            return
+
         # NOTE: DO NOT change the order in which these methods are called.
         self.create_transport_sockets()
         self.start_server()
         self.start_transport()
 
-        # Create notifier
-        fid = self.zmq_in_socket.getsockopt(zmq.FD)
-        self.notifier = QSocketNotifier(fid, QSocketNotifier.Read, self)
-        self.notifier.activated.connect(self.on_msg_received)
+        # Read and pre-process messages in a thread
+        self.reader = MessageReader(self.zmq_in_socket, self.req_status)
+        self.reader_thread = QThread(None)
+        self.reader.moveToThread(self.reader_thread)
+        self.reader_thread.started.connect(self.reader.run)
+        self.reader.sig_message_ready.connect(self.process_message)
+        self.reader_thread.start()
 
         # This is necessary for tests to pass locally!
         logger.debug('LSP {} client started!'.format(self.language))
@@ -363,12 +417,16 @@ def start(self):
     def stop(self):
         """Stop transport and server."""
         logger.info('Stopping {} client...'.format(self.language))
-        if self.notifier is not None:
-            self.notifier.activated.disconnect(self.on_msg_received)
-            self.notifier.setEnabled(False)
-            self.notifier = None
+        if self.reader is not None:
+            self.reader.sig_message_ready.disconnect(self.process_message)
+            self.reader.stop()
+            self.reader_thread.quit()
+            self.reader_thread.wait()
+            self.reader = None
         if self.transport is not None:
             self.transport.kill()
+        if self.inprocess_transport is not None:
+            self.inprocess_transport.stop()
         self.context.destroy()
         if self.server is not None:
             self.server.kill()
@@ -403,7 +461,9 @@ def is_down(self):
         users about it.
         """
         is_down = False
-        if self.transport and not self.is_transport_alive():
+        if ((self.transport and not self.is_transport_alive()) or
+                (self.inprocess_transport and
+                 not self.inprocess_transport.is_alive())):
             logger.debug(
                 "Transport layer for {} is down!!".format(self.language))
             if not self.transport_unresponsive:
@@ -459,6 +519,28 @@ def send(self, method, params, kind):
         if running_under_pytest():
             self._requests.append((_id, method))
 
+        start_time = time.time()
+        size = None
+        if self.inprocess_transport is not None:
+            size = self.inprocess_transport.send(msg)
+        elif not self.send_to_transport(msg):
+            return
+
+        if self.tracer is not None and self.tracer.enabled:
+            self.tracer.message_sent(
+                self.language, msg, (time.time() - start_time) * 1000,
+                size=size)
+
+        self.request_seq += 1
+        return int(_id)
+
+    def send_to_transport(self, msg):
+        """
+        Send message to the transport process.
+
+        Returns False if the send queue is full and it was not possible to
+        send the message.
+        """
         # Try sending a message. If the send queue is full, keep trying for a
         # a second before giving up.
         timeout = 1
@@ -467,78 +549,87 @@ def send(self, method, params, kind):
         while True:
             try:
                 self.zmq_out_socket.send_pyobj(msg, flags=zmq.NOBLOCK)
-                self.request_seq += 1
-                return int(_id)
+                return True
             except zmq.error.Again:
                 if time.time() > timeout_time:
                     self.sig_went_down.emit(self.language)
-                    return
+                    return False
                 # The send queue is full! wait 0.1 seconds before retrying.
                 if self.initialized:
                     logger.warning("The send queue is full! Retrying...")
                 time.sleep(.1)
 
-    @Slot()
-    def on_msg_received(self):
-        """Process received messages."""
-        self.notifier.setEnabled(False)
-        while True:
+    @Slot(dict)
+    def on_inprocess_message(self, resp):
+        """Process a message received by the in-process transport."""
+        self.process_message(preprocess_message(resp, self.req_status))
+
+    @Slot(object)
+    def process_message(self, resp):
+        """Process a message received from the server."""
+        trace_info = resp.pop(TRACE_KEY, None)
+        if (self.tracer is None or not self.tracer.enabled
+                or trace_info is None):
+            self.dispatch_message(resp)
+            return
+
+        start_time = time.time()
+        self.dispatch_message(resp)
+        self.tracer.message_received(self.language, resp, trace_info,
+                                     start_time, time.time())
+
+    def dispatch_message(self, resp):
+        """Call the handler registered for a message."""
+        try:
             try:
-                # events = self.zmq_in_socket.poll(1500)
-                resp = self.zmq_in_socket.recv_pyobj(flags=zmq.NOBLOCK)
-
-                try:
-                    method = resp['method']
-                    logger.debug(
-                        '{} response: {}'.format(self.language, method))
-                except KeyError:
-                    pass
-
-                if 'error' in resp:
-                    logger.debug('{} Response error: {}'
-                                 .format(self.language, repr(resp['error'])))
-                    if self.language == 'python':
-                        # Show PyLS errors in our error report dialog only in
-                        # debug or development modes
-                        if get_debug_level() > 0 or DEV:
-                            message = resp['error'].get('message', '')
-                            traceback = (resp['error'].get('data', {}).
-                                         get('traceback'))
-                            if traceback is not None:
-                                traceback = ''.join(traceback)
-                                traceback = traceback + '\n' + message
-                                self.sig_server_error.emit(traceback)
-                        req_id = resp['id']
-                        if req_id in self.req_reply:
-                            self.req_reply[req_id](None, {'params': []})
-                elif 'method' in resp:
-                    if resp['method'][0] != '$':
-                        if 'id' in resp:
-                            self.request_seq = int(resp['id'])
-                        if resp['method'] in self.handler_registry:
-                            handler_name = (
-                                self.handler_registry[resp['method']])
-                            handler = getattr(self, handler_name)
-                            handler(resp['params'])
-                elif 'result' in resp:
-                    if resp['result'] is not None:
-                        req_id = resp['id']
-                        if req_id in self.req_status:
-                            req_type = self.req_status[req_id]
-                            if req_type in self.handler_registry:
-                                handler_name = self.handler_registry[req_type]
-                                handler = getattr(self, handler_name)
-                                handler(resp['result'], req_id)
-                                self.req_status.pop(req_id)
-                                if req_id in self.req_reply:
-                                    self.req_reply.pop(req_id)
-            except RuntimeError:
-                # This is triggered when a codeeditor instance has been
-                # removed before the response can be processed.
+                method = resp['method']
+                logger.debug(
+                    '{} response: {}'.format(self.language, method))
+            except KeyError:
                 pass
-            except zmq.ZMQError:
-                self.notifier.setEnabled(True)
-                return
+
+            if 'error' in resp:
+                logger.debug('{} Response error: {}'
+                             .format(self.language, repr(resp['error'])))
+                if self.language == 'python':
+                    # Show PyLS errors in our error report dialog only in
+                    # debug or development modes
+                    if get_debug_level() > 0 or DEV:
+                        message = resp['error'].get('message', '')
+                        traceback = (resp['error'].get('data', {}).
+                                     get('traceback'))
+                        if traceback is not None:
+                            traceback = ''.join(traceback)
+                            traceback = traceback + '\n' + message
+                            self.sig_server_error.emit(traceback)
+                    req_id = resp['id']
+                    if req_id in self.req_reply:
+                        self.req_reply[req_id](None, {'params': []})
+            elif 'method' in resp:
+                if resp['method'][0] != '$':
+                    if 'id' in resp:
+                        self.request_seq = int(resp['id'])
+                    if resp['method'] in self.handler_registry:
+                        handler_name = (
+                            self.handler_registry[resp['method']])
+                        handler = getattr(self, handler_name)
+                        handler(resp['params'])
+            elif 'result' in resp:
+                if resp['result'] is not None:
+                    req_id = resp['id']
+                    if req_id in self.req_status:
+                        req_type = self.req_status[req_id]
+                        if req_type in self.handler_registry:
+                            handler_name = self.handler_registry[req_type]
+                            handler = getattr(self, handler_name)
+                            handler(resp['result'], req_id)
+                            self.req_status.pop(req_id)
+                            if req_id in self.req_reply:
+                                self.req_reply.pop(req_id)
+        except RuntimeError:
+            # This is triggered when a codeeditor instance has been
+            # removed before the response can be processed.
+            pass
 
     def perform_request(self, method, params):
         if method in self.sender_registry:
@@ -555,7 +646,12 @@ def perform_request(self, method, params):
     @send_request(method=LSPRequestTypes.INITIALIZE)
     def initialize(self, params, *args, **kwargs):
         self.stdio_pid = params['pid']
-        pid = self.transport.processId() if not self.external_server else None
+        if self.external_server:
+            pid = None
+        elif self.inprocess_transport is not None:
+            pid = os.getpid()
+        else:
+            pid = self.transport.processId()
         params = {
             'processId': pid,
             'rootUri': pathlib.Path(osp.abspath(self.folder)).as_uri(),
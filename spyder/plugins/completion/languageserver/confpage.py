@@ -483,11 +483,19 @@ def setup_page(self):
             tip=_("Beyond this timeout, "
                   "the first available provider will be returned"),
             section='editor')
+        self.completions_streaming = newcb(
+            _("Show results as soon as the first provider returns"),
+            'completions_streaming',
+            tip=_("Results from slower providers are merged in the "
+                  "completion widget when they arrive, and the time to "
+                  "wait for them is adjusted automatically"),
+            section='editor')
 
         clients_layout = QVBoxLayout()
         clients_layout.addWidget(self.kite_enabled)
         clients_layout.addWidget(self.fallback_enabled)
         clients_layout.addWidget(self.completions_wait_for_ms)
+        clients_layout.addWidget(self.completions_streaming)
         clients_group.setLayout(clients_layout)
 
         kite_layout = QVBoxLayout()
@@ -501,6 +509,27 @@ def setup_page(self):
             'Kite configuration'))
         kite_group.setLayout(kite_layout)
 
+        # Request timings group
+        tracing_group = QGroupBox(_("Request timings"))
+        self.tracing_enabled = newcb(
+            _("Record the time taken by requests to language servers"),
+            'tracing/enabled',
+            tip=_("Time spent sending each request, waiting for the "
+                  "server and handling its response is measured"))
+        self.tracing_threshold = self.create_spinbox(
+            _("Highlight methods whose p95 latency exceeds (ms):"), None,
+            'tracing/p95_threshold', min_=10, max_=10000, step=10)
+        self.tracing_btn = QPushButton(_("Show request timings"))
+        self.tracing_btn.clicked.connect(
+            lambda: self.main.completions.get_client(
+                'lsp').show_request_timings())
+
+        tracing_layout = QVBoxLayout()
+        tracing_layout.addWidget(self.tracing_enabled)
+        tracing_layout.addWidget(self.tracing_threshold)
+        tracing_layout.addWidget(self.tracing_btn)
+        tracing_group.setLayout(tracing_layout)
+
         # Advanced label
         lsp_advanced_group = QGroupBox(_(
             'Python Language Server configuration'))
@@ -533,6 +562,11 @@ def setup_page(self):
             'advanced/stdio')
         self.use_stdio.stateChanged.connect(self.disable_tcp)
         self.external_server.stateChanged.connect(self.disable_stdio)
+        self.inprocess_transport = self.create_checkbox(
+            _("Communicate with the server from Spyder's process"),
+            'advanced/inprocess_transport',
+            tip=_("Don't use a separate process to relay messages "
+                  "between Spyder and the server"))
 
         # Advanced layout
         advanced_g_layout = QGridLayout()
@@ -550,6 +584,7 @@ def setup_page(self):
         advanced_server_layout = QVBoxLayout()
         advanced_server_layout.addWidget(self.external_server)
         advanced_server_layout.addWidget(self.use_stdio)
+        advanced_server_layout.addWidget(self.inprocess_transport)
 
         advanced_options_layout = QVBoxLayout()
         advanced_options_layout.addLayout(advanced_g_layout)
@@ -637,6 +672,7 @@ def setup_page(self):
         self.tabs.addTab(self.create_tab(snippets_widget), _('Snippets'))
         self.tabs.addTab(self.create_tab(clients_group,
                                          lsp_advanced_group,
+                                         tracing_group,
                                          kite_group),
                          _('Advanced'))
         self.tabs.addTab(self.create_tab(servers_widget), _('Other languages'))
@@ -25,14 +25,19 @@
                                 running_in_mac_app)
 from spyder.config.lsp import PYTHON_CONFIG
 from spyder.config.manager import CONF
-from spyder.utils.misc import check_connection_port
+from spyder.utils.introspection.module_completion import get_module_index
+from spyder.utils.misc import check_connection_port, get_python_executable
 from spyder.plugins.completion.manager.api import (LSP_LANGUAGES,
+                                                   LSPRequestTypes,
                                                    SpyderCompletionPlugin)
 from spyder.plugins.completion.languageserver.client import LSPClient
 from spyder.plugins.completion.languageserver.confpage import (
     LanguageServerConfigPage)
+from spyder.plugins.completion.languageserver.tracing import LSPTracer
 from spyder.plugins.completion.languageserver.widgets.status import (
     ClientStatus, LSPStatusWidget)
+from spyder.plugins.completion.languageserver.widgets.tracing import (
+    LSPTracingDialog)
 from spyder.widgets.helperwidgets import MessageCheckBox
 
 
@@ -87,7 +92,11 @@ def __init__(self, parent):
         self.clients_hearbeat = {}
         self.clients_statusbar = {}
         self.requests = set({})
+        # Language and LSP id of the pending requests, to cancel them
+        self.lsp_requests = {}
         self.register_queue = {}
+        self.tracer = LSPTracer()
+        self.tracing_dialog = None
         self.update_configuration()
         self.show_no_external_server_warning = True
 
@@ -456,6 +465,7 @@ def start_client(self, language):
                     language=language
                 )
 
+                language_client['instance'].tracer = self.tracer
                 self.register_client_instance(language_client['instance'])
 
                 # Register that a client was started.
@@ -527,6 +537,9 @@ def update_configuration(self, python_only=False):
         python_only: bool
             Perform an update only for the Python language server.
         """
+        self.tracer.enabled = self.get_option('tracing/enabled')
+        self.tracer.threshold_ms = self.get_option('tracing/p95_threshold')
+
         for language in self.get_languages():
             if python_only and language != 'python':
                 continue
@@ -541,8 +554,10 @@ def update_configuration(self, python_only=False):
                 current_lang_config = self.clients[language]['config']
                 new_lang_config = client_config['config']
                 restart_diff = ['cmd', 'args', 'host',
-                                'port', 'external', 'stdio']
-                restart = any([current_lang_config[x] != new_lang_config[x]
+                                'port', 'external', 'stdio',
+                                'inprocess_transport']
+                restart = any([current_lang_config.get(x) !=
+                               new_lang_config.get(x)
                                for x in restart_diff])
                 if restart:
                     logger.debug("Restart required for {} client!".format(
@@ -587,9 +602,18 @@ def close_client(self, language):
                 language_client['instance'].stop()
             language_client['status'] = self.STOPPED
 
+    def show_request_timings(self):
+        """Show the timings of the requests sent to all servers."""
+        if self.tracing_dialog is None:
+            self.tracing_dialog = LSPTracingDialog(self.main, self.tracer)
+        self.tracing_dialog.show()
+        self.tracing_dialog.raise_()
+        self.tracing_dialog.activateWindow()
+
     def receive_response(self, response_type, response, language, req_id):
         if req_id in self.requests:
             self.requests.discard(req_id)
+            self.lsp_requests.pop(req_id, None)
             self.sig_response_ready.emit(
                 self.COMPLETION_CLIENT_NAME, req_id, response)
 
@@ -601,11 +625,24 @@ def send_request(self, language, request, params, req_id):
                 client = self.clients[language]['instance']
                 params['response_callback'] = functools.partial(
                     self.receive_response, language=language, req_id=req_id)
-                client.perform_request(request, params)
+                lsp_id = client.perform_request(request, params)
+                self.lsp_requests[req_id] = (language, lsp_id)
                 return
         self.sig_response_ready.emit(self.COMPLETION_CLIENT_NAME,
                                      req_id, {})
 
+    def cancel_request(self, req_id):
+        """Cancel a request that is still being processed by a server."""
+        if req_id not in self.requests:
+            return
+        self.requests.discard(req_id)
+        language, lsp_id = self.lsp_requests.pop(req_id, (None, None))
+        language_client = self.clients.get(language)
+        if (lsp_id is not None and language_client is not None
+                and language_client['status'] == self.RUNNING):
+            language_client['instance'].perform_request(
+                LSPRequestTypes.CANCEL_REQUEST, {'id': lsp_id})
+
     def send_notification(self, language, request, params):
         if language in self.clients:
             language_client = self.clients[language]
@@ -622,6 +659,17 @@ def broadcast_notification(self, request, params):
             for language in self.clients:
                 self.send_notification(language, request, params)
 
+    def get_preload_modules(self, executable=None):
+        """
+        Get the modules to preload in the language server that can be
+        imported by `executable`, or by the interpreter Spyder runs in.
+        """
+        modules = [module.strip() for module
+                   in self.get_option('preload_modules').split(',')]
+        modules = [module for module in modules if module]
+        index = get_module_index(executable or get_python_executable())
+        return index.filter_importable(modules)
+
     def generate_python_config(self):
         """
         Update Python server configuration with the options saved in our
@@ -746,6 +794,7 @@ def generate_python_config(self):
         # Advanced
         external_server = self.get_option('advanced/external')
         stdio = self.get_option('advanced/stdio')
+        inprocess_transport = self.get_option('advanced/inprocess_transport')
 
         # Setup options in json
         python_config['cmd'] = cmd
@@ -756,6 +805,7 @@ def generate_python_config(self):
             python_config['args'] = '--check-parent-process'
         python_config['external'] = external_server
         python_config['stdio'] = stdio
+        python_config['inprocess_transport'] = inprocess_transport
         python_config['host'] = host
         python_config['port'] = port
 
@@ -768,7 +818,7 @@ def generate_python_config(self):
         plugins['jedi_completion'].update(jedi_completion)
         plugins['jedi_signature_help'].update(jedi_signature_help)
         plugins['jedi_definition'].update(jedi_definition)
-        plugins['preload']['modules'] = self.get_option('preload_modules')
+        plugins['preload']['modules'] = self.get_preload_modules(environment)
 
         for formatter in formatters:
             plugins[formatter] = formatter_options[formatter]
@@ -10,7 +10,7 @@
 
 from spyder.plugins.completion.manager.api import LSPRequestTypes
 from spyder.plugins.completion.languageserver.decorators import (
-    handles, send_response)
+    handles, send_notification, send_response)
 
 logger = logging.getLogger(__name__)
 
@@ -22,3 +22,11 @@ def handle_register_capability(self, params):
         """TODO: Handle the glob patterns of the files to watch."""
         logger.debug('Register Capability: {0}'.format(params))
         return {}
+
+    @send_notification(method=LSPRequestTypes.CANCEL_REQUEST)
+    def cancel_request(self, params):
+        """Ask the server to stop working on a request."""
+        req_id = params['id']
+        self.req_status.pop(req_id, None)
+        self.req_reply.pop(req_id, None)
+        return {'id': req_id}
@@ -11,8 +11,7 @@
 
 # Local imports
 from spyder.plugins.completion.manager.api import (
-    LSPRequestTypes, InsertTextFormat, CompletionItemKind,
-    ClientConstants)
+    LSPRequestTypes, ClientConstants)
 from spyder.plugins.completion.languageserver.providers.utils import (
     path_as_uri, process_uri, snake_to_camel)
 from spyder.plugins.completion.languageserver.decorators import (
@@ -90,24 +89,22 @@ def document_completion_request(self, params):
 
     @handles(LSPRequestTypes.DOCUMENT_COMPLETION)
     def process_document_completion(self, response, req_id):
-        if isinstance(response, dict):
-            response = response['items']
-        if response is not None:
-            for item in response:
-                item['kind'] = item.get('kind', CompletionItemKind.TEXT)
-                item['detail'] = item.get('detail', '')
-                item['documentation'] = item.get('documentation', '')
-                item['sortText'] = item.get('sortText', item['label'])
-                item['filterText'] = item.get('filterText', item['label'])
-                item['insertTextFormat'] = item.get(
-                    'insertTextFormat', InsertTextFormat.PLAIN_TEXT)
-                item['insertText'] = item.get('insertText', item['label'])
-                item['provider'] = LSP_COMPLETION
-
+        # Items were already completed and sorted in
+        # workers.preprocess_completion
         if req_id in self.req_reply:
             self.req_reply[req_id](
                 LSPRequestTypes.DOCUMENT_COMPLETION, {'params': response})
 
+    @send_request(method=LSPRequestTypes.COMPLETION_RESOLVE)
+    def completion_resolve_request(self, params):
+        return params['completion_item']
+
+    @handles(LSPRequestTypes.COMPLETION_RESOLVE)
+    def handle_completion_resolve(self, response, req_id):
+        if req_id in self.req_reply:
+            self.req_reply[req_id](
+                LSPRequestTypes.COMPLETION_RESOLVE, {'params': response})
+
     @send_request(method=LSPRequestTypes.DOCUMENT_SIGNATURE)
     def signature_help_request(self, params):
         params = {
@@ -151,22 +148,12 @@ def hover_request(self, params):
 
     @handles(LSPRequestTypes.DOCUMENT_HOVER)
     def process_hover_result(self, result, req_id):
-        contents = result['contents']
-        if isinstance(contents, dict):
-            if 'value' in contents:
-                contents = contents['value']
-        elif isinstance(contents, list):
-            text = []
-            for entry in contents:
-                if isinstance(entry, dict):
-                    text.append(entry['value'])
-                else:
-                    text.append(entry)
-            contents = '\n\n'.join(text)
+        # Contents were already converted to text in
+        # workers.preprocess_hover
         if req_id in self.req_reply:
             self.req_reply[req_id](
                 LSPRequestTypes.DOCUMENT_HOVER,
-                {'params': contents})
+                {'params': result['contents']})
 
     @send_request(method=LSPRequestTypes.DOCUMENT_SYMBOL)
     def document_symbol_request(self, params):
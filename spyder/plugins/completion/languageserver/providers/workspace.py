@@ -107,10 +107,12 @@ def send_symbol_request(self, params):
         params = {
             'query': params['query']
         }
+        if not self.server_capabilites.get('workspaceSymbolProvider'):
+            params[ClientConstants.CANCEL] = True
         return params
 
     @handles(LSPRequestTypes.WORKSPACE_SYMBOL)
-    def handle_symbol_response(self, response):
+    def handle_symbol_response(self, response, *args):
         folders = list(self.watched_folders.keys())
         assigned_symbols = {folder: [] for folder in self.watched_folders}
         for symbol_info in response:
@@ -118,14 +120,16 @@ def handle_symbol_response(self, response):
             path = process_uri(location['uri'])
             location['file'] = path
             workspace = match_path_to_folder(folders, path)
-            assigned_symbols[workspace].append(symbol_info)
+            # Symbols of files outside of the watched folders are ignored
+            if workspace is not None:
+                assigned_symbols[workspace].append(symbol_info)
 
         for workspace in assigned_symbols:
-            workspace_edits = assigned_symbols[workspace]
+            workspace_symbols = assigned_symbols[workspace]
             workspace_instance = self.watched_folders[workspace]['instance']
             workspace_instance.handle_response(
                 LSPRequestTypes.WORKSPACE_SYMBOL,
-                {'params': workspace_edits})
+                {'params': workspace_symbols})
 
     @send_request(method=LSPRequestTypes.WORKSPACE_EXECUTE_COMMAND)
     def send_execute_command(self, params):
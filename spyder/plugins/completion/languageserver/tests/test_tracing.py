@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the tracing of language server messages."""
+
+# Standard library imports
+import json
+
+# Test library imports
+import pytest
+
+# Local imports
+from spyder.plugins.completion.languageserver.tracing import LSPTracer
+from spyder.plugins.completion.languageserver.widgets.tracing import (
+    LSPTracingDialog)
+
+
+@pytest.fixture
+def tracer():
+    tracer = LSPTracer(enabled=True, threshold_ms=100)
+
+    # Completion requests answered in 10 ms
+    for req_id in range(1, 11):
+        request = {'id': req_id, 'method': 'textDocument/completion',
+                   'params': {}}
+        tracer.message_sent('python', request, 1)
+        sent = tracer._pending[('python', req_id)]['sent']
+        info = {'received': sent + 0.01, 'size': 100, 'request_size': 80}
+        tracer.message_received('python', {'id': req_id, 'result': []},
+                                info, sent + 0.012, sent + 0.015)
+
+    # Diagnostics published 200 ms after a change
+    uri = 'file:///test.py'
+    change = {'method': 'textDocument/didChange',
+              'params': {'textDocument': {'uri': uri}}}
+    tracer.message_sent('python', change, 0)
+    changed = tracer._changes[('python', uri)]
+    tracer.message_received(
+        'python',
+        {'method': 'textDocument/publishDiagnostics',
+         'params': {'uri': uri, 'diagnostics': []}},
+        {'received': changed + 0.2, 'size': 50},
+        changed + 0.2, changed + 0.25)
+    return tracer
+
+
+def test_tracer(tracer, tmpdir):
+    """Test the phases and statistics computed by the tracer."""
+    method = 'textDocument/completion'
+    assert len(tracer.records) == 11
+    for phase, expected in [('send', 1), ('server', 10), ('queue', 2),
+                            ('handle', 3), ('total', 16)]:
+        value = tracer.percentile('python', method, phase)
+        assert value == pytest.approx(expected, abs=1e-3)
+    assert not tracer.is_slow('python', method)
+
+    diagnostics = 'textDocument/publishDiagnostics'
+    value = tracer.percentile('python', diagnostics, 'server')
+    assert value == pytest.approx(200, abs=1e-3)
+    assert tracer.is_slow('python', diagnostics)
+
+    summary = tracer.get_summary()
+    assert [row['method'] for row in summary] == [method, diagnostics]
+    assert summary[0]['count'] == 10
+
+    # Export trace
+    filename = str(tmpdir.join('trace.json'))
+    tracer.export(filename)
+    with open(filename) as f:
+        trace = json.load(f)
+    assert len(trace['trace']) == 11
+    assert trace['trace'][0]['request_size'] == 80
+
+    tracer.clear()
+    assert tracer.get_summary() == []
+
+
+def test_tracing_dialog(qtbot, tracer):
+    """Test that the dialog shows the tracer statistics."""
+    dialog = LSPTracingDialog(None, tracer)
+    qtbot.addWidget(dialog)
+
+    assert dialog.table.rowCount() == 2
+    assert dialog.table.item(0, 1).text() == 'textDocument/completion'
+
+    dialog.table.selectRow(0)
+    assert sum(count for __, count in dialog.histogram.histogram) == 10
+
+    dialog.clear()
+    assert dialog.table.rowCount() == 0
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the in-process LSP transport."""
+
+import copy
+import json
+
+import pytest
+
+from spyder.config.lsp import PYTHON_CONFIG
+from spyder.plugins.completion.languageserver.client import LSPClient
+from spyder.plugins.completion.languageserver.tracing import LSPTracer
+from spyder.plugins.completion.languageserver.transport.inprocess import (
+    ContentLengthParser, frame_message)
+
+
+def test_parser_split_messages():
+    """Test parsing messages received in several chunks."""
+    first = frame_message({'id': 1, 'result': u'ñandú'})
+    second = frame_message({'method': 'window/logMessage', 'params': {}})
+    data = first + second
+
+    parser = ContentLengthParser()
+    bodies = []
+    for i in range(0, len(data), 7):
+        bodies += parser.feed(data[i:i + 7])
+
+    messages = [json.loads(body) for body in bodies]
+    assert messages == [
+        {'id': 1, 'result': u'ñandú', 'jsonrpc': '2.0'},
+        {'method': 'window/logMessage', 'params': {}, 'jsonrpc': '2.0'}]
+
+    # Processed messages are removed from the buffer
+    assert len(parser._buffer) == 0
+
+
+def test_parser_headers():
+    """Test parsing several headers and content encodings."""
+    body = u'{"result": "ñ"}'.encode('latin-1')
+    data = (b'Content-Type: application/vscode-jsonrpc; charset=latin-1\r\n'
+            b'content-length: ' + str(len(body)).encode() + b'\r\n\r\n' +
+            body)
+
+    parser = ContentLengthParser()
+    assert parser.feed(data) == [u'{"result": "ñ"}']
+
+    with pytest.raises(ValueError):
+        parser.feed(b'Content-Type: text\r\n\r\n{}')
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('stdio', [True, False])
+def test_inprocess_transport(qtbot, stdio):
+    """Test that the client can initialize a server without a transport
+    process."""
+    config = copy.deepcopy(PYTHON_CONFIG)
+    config['inprocess_transport'] = True
+    config['stdio'] = stdio
+    if stdio:
+        config['args'] = '--check-parent-process'
+
+    client = LSPClient(None, server_settings=config, language='python')
+    client.tracer = LSPTracer(enabled=True)
+    with qtbot.waitSignal(client.sig_initialize, timeout=30000) as blocker:
+        client.start()
+
+    capabilities, language = blocker.args
+    assert language == 'python'
+    assert capabilities['completionProvider']
+    assert client.transport is None
+
+    # Check that the initialize request was traced
+    record = client.tracer.records[0]
+    assert record['method'] == 'initialize'
+    assert record['server_ms'] > 0
+    client.stop()
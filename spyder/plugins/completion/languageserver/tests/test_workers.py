@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the pre-processing of language server messages."""
+
+# Third party imports
+from qtpy.QtCore import QThread
+import pytest
+import zmq
+
+# Local imports
+from spyder.plugins.completion.manager.api import (
+    CompletionItemKind, LSPRequestTypes)
+from spyder.plugins.completion.languageserver.workers import (
+    MessageReader, preprocess_message)
+
+
+def test_preprocess_completion():
+    """Test that completion items are completed and sorted."""
+    message = {'id': 3, 'result': {'items': [
+        {'label': 'b', 'sortText': 'a1'},
+        {'label': 'a', 'sortText': 'a0', 'kind': CompletionItemKind.CLASS},
+        {'label': 'c'},
+    ]}}
+    req_status = {3: LSPRequestTypes.DOCUMENT_COMPLETION}
+
+    items = preprocess_message(message, req_status)['result']
+    assert [item['label'] for item in items] == ['a', 'b', 'c']
+    assert items[0]['kind'] == CompletionItemKind.CLASS
+    assert items[1]['kind'] == CompletionItemKind.TEXT
+    assert items[2]['insertText'] == 'c'
+    assert all(item['provider'] == 'LSP' for item in items)
+
+
+def test_preprocess_completion_resolve():
+    """Test that the documentation of resolved items is converted to text."""
+    message = {'id': 4, 'result': {
+        'label': 'a', 'documentation': {'kind': 'markdown', 'value': 'Doc'}}}
+    req_status = {4: LSPRequestTypes.COMPLETION_RESOLVE}
+
+    item = preprocess_message(message, req_status)['result']
+    assert item['documentation'] == 'Doc'
+
+
+def test_preprocess_hover():
+    """Test that hover contents are converted to text."""
+    message = {'id': 1, 'result': {'contents': ['foo', {'value': 'bar'}]}}
+    req_status = {1: LSPRequestTypes.DOCUMENT_HOVER}
+    result = preprocess_message(message, req_status)['result']
+    assert result['contents'] == 'foo\n\nbar'
+
+
+def test_preprocess_diagnostics():
+    """Test that diagnostics are sorted by line."""
+    def diagnostic(line):
+        return {'range': {'start': {'line': line, 'character': 0},
+                          'end': {'line': line, 'character': 1}},
+                'message': str(line)}
+
+    message = {
+        'method': LSPRequestTypes.DOCUMENT_PUBLISH_DIAGNOSTICS,
+        'params': {'uri': 'file:///test.py',
+                   'diagnostics': [diagnostic(3), diagnostic(1),
+                                   diagnostic(3), diagnostic(0)]}}
+    params = preprocess_message(message, {})['params']
+    lines = [d['range']['start']['line'] for d in params['diagnostics']]
+    assert lines == [0, 1, 3, 3]
+
+
+def test_preprocess_errors():
+    """Test that malformed messages are passed unchanged."""
+    message = {'id': 1, 'result': {'no_contents': None}}
+    req_status = {1: LSPRequestTypes.DOCUMENT_HOVER}
+    assert preprocess_message(message, req_status) == message
+
+
+@pytest.fixture
+def reader(qtbot):
+    context = zmq.Context()
+    in_socket = context.socket(zmq.PAIR)
+    port = in_socket.bind_to_random_port('tcp://127.0.0.1')
+    out_socket = context.socket(zmq.PAIR)
+    out_socket.connect('tcp://127.0.0.1:{}'.format(port))
+
+    req_status = {1: LSPRequestTypes.DOCUMENT_COMPLETION}
+    reader = MessageReader(in_socket, req_status)
+    thread = QThread(None)
+    reader.moveToThread(thread)
+    thread.started.connect(reader.run)
+    thread.start()
+    yield reader, out_socket
+
+    reader.stop()
+    thread.quit()
+    thread.wait()
+    context.destroy()
+
+
+def test_message_reader(qtbot, reader):
+    """Test that messages are read and pre-processed in a thread."""
+    reader, out_socket = reader
+    with qtbot.waitSignal(reader.sig_message_ready) as blocker:
+        out_socket.send_pyobj(
+            {'id': 1, 'result': [{'label': 'b'}, {'label': 'a'}]})
+
+    message = blocker.args[0]
+    assert [item['label'] for item in message['result']] == ['a', 'b']
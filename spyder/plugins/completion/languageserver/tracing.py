@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Tracing of the messages exchanged with language servers.
+
+For every request sent to a server we record how long it took to hand it
+to the transport (send time), how long the server and transport took to
+answer it (server time), how long its response waited in Spyder before
+being handled (queue time) and how long it took to dispatch the response
+to its handlers (handle time). The handle time doesn't include the work
+those handlers postpone, like painting the results in the editor.
+"""
+
+# Standard library imports
+from collections import deque
+import json
+import logging
+import time
+
+# Local imports
+from spyder.plugins.completion.manager.api import LSPRequestTypes
+from spyder.plugins.completion.manager.latency import ProviderLatencyStats
+
+
+logger = logging.getLogger(__name__)
+
+
+# Phases in which the time taken by a request is split
+PHASES = ('send', 'server', 'queue', 'handle', 'total')
+
+# Notifications whose server time is measured from the last change sent
+# for the same document.
+DOCUMENT_CHANGES = (LSPRequestTypes.DOCUMENT_DID_OPEN,
+                    LSPRequestTypes.DOCUMENT_DID_CHANGE,
+                    LSPRequestTypes.DOCUMENT_DID_SAVE)
+
+
+class LSPTracer:
+    """
+    Record the timing of messages exchanged with language servers.
+
+    Only the last `length` messages are kept in the trace, and statistics
+    are computed with the last `window` samples of each method.
+    """
+
+    def __init__(self, enabled=False, threshold_ms=500, length=2000,
+                 window=200):
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms
+        self.records = deque(maxlen=length)
+        self.stats = {phase: ProviderLatencyStats(window, min_samples=1)
+                      for phase in PHASES}
+        self.methods = set()
+        self._pending = {}
+        self._changes = {}
+        self._slow = set()
+
+    def message_sent(self, language, msg, send_ms, size=None):
+        """
+        Register that `msg` was sent to the server of `language` in
+        `send_ms`.
+
+        `size` is the number of bytes written by the transport, if it's
+        known when the message is sent. Otherwise it's taken from the trace
+        info of the response.
+        """
+        method = msg.get('method')
+        now = time.time()
+        if 'id' in msg and method is not None:
+            self._pending[(language, msg['id'])] = {
+                'method': method,
+                'request_size': size,
+                'send_ms': send_ms,
+                'sent': now,
+            }
+        elif method in DOCUMENT_CHANGES:
+            uri = msg['params']['textDocument']['uri']
+            self._changes[(language, uri)] = now
+
+    def message_received(self, language, msg, info, start, end):
+        """
+        Register that `msg`, read from the server of `language` with the
+        trace `info` attached to it by the transport, was handled between
+        `start` and `end`.
+        """
+        received = info['received']
+        record = {
+            'language': language,
+            'method': msg.get('method'),
+            'id': msg.get('id'),
+            'request_size': info.get('request_size'),
+            'response_size': info['size'],
+            'send_ms': None,
+            'server_ms': None,
+            'queue_ms': (start - received) * 1000,
+            'handle_ms': (end - start) * 1000,
+            'total_ms': None,
+            'error': 'error' in msg,
+            'timestamp': received,
+        }
+
+        if 'method' in msg:
+            # Notification or request sent by the server
+            if msg['method'] == LSPRequestTypes.DOCUMENT_PUBLISH_DIAGNOSTICS:
+                uri = msg['params']['uri']
+                changed = self._changes.pop((language, uri), None)
+                if changed is not None:
+                    record['server_ms'] = (received - changed) * 1000
+                    record['total_ms'] = (end - changed) * 1000
+        else:
+            request = self._pending.pop((language, msg.get('id')), None)
+            if request is None:
+                return
+            record['method'] = request['method']
+            if request['request_size'] is not None:
+                record['request_size'] = request['request_size']
+            record['send_ms'] = request['send_ms']
+            record['server_ms'] = (received - request['sent']) * 1000
+            record['total_ms'] = (
+                end - request['sent']) * 1000 + request['send_ms']
+
+        self.add_record(record)
+
+    def add_record(self, record):
+        """Add `record` to the trace and update statistics with it."""
+        self.records.append(record)
+        key = (record['language'], record['method'])
+        self.methods.add(key)
+        for phase in PHASES:
+            value = record[phase + '_ms']
+            if value is not None:
+                self.stats[phase].add(record['language'], record['method'],
+                                      value)
+
+        # Warn once about methods that became slow
+        p95 = self.percentile(record['language'], record['method'], 'total')
+        if p95 is not None and p95 > self.threshold_ms:
+            if key not in self._slow:
+                self._slow.add(key)
+                logger.warning(
+                    "The p95 latency of {0} requests to the {1} server is "
+                    "{2:.0f} ms".format(record['method'], record['language'],
+                                        p95))
+        else:
+            self._slow.discard(key)
+
+    def percentile(self, language, method, phase, percent=95):
+        """Get the `percent` percentile of `phase` for `method`."""
+        return self.stats[phase].percentile(language, method, percent)
+
+    def histogram(self, language, method, phase='total'):
+        """Get the histogram of the time `method` takes in `phase`."""
+        return self.stats[phase].histogram(language, method)
+
+    def is_slow(self, language, method):
+        """Check if the p95 latency of `method` exceeds the threshold."""
+        return (language, method) in self._slow
+
+    def get_summary(self):
+        """
+        Get a list of dicts with the number of samples and the p50 and p95
+        of every phase, per language and method.
+        """
+        summary = []
+        for language, method in sorted(self.methods):
+            row = {
+                'language': language,
+                'method': method,
+                'count': self.stats['handle'].count(language, method),
+                'slow': self.is_slow(language, method),
+            }
+            for phase in PHASES:
+                for percent in (50, 95):
+                    row['{0}_p{1}'.format(phase, percent)] = (
+                        self.percentile(language, method, phase, percent))
+            summary.append(row)
+        return summary
+
+    def export(self, filename):
+        """Save the trace to `filename` as JSON."""
+        with open(filename, 'w') as f:
+            json.dump({'threshold_ms': self.threshold_ms,
+                       'summary': self.get_summary(),
+                       'trace': list(self.records)}, f, indent=1)
+
+    def clear(self):
+        """Remove all recorded messages."""
+        self.records.clear()
+        self.methods.clear()
+        self._pending.clear()
+        self._changes.clear()
+        self._slow.clear()
+        for stats in self.stats.values():
+            stats.clear()
@@ -4,9 +4,24 @@
 # Licensed under the terms of the MIT License
 # (see spyder/__init__.py for details)
 
+# Standard library imports
+import time
+
 
 class MessageKind:
     """JSON-RPC Message types."""
     REQUEST = 1
     RESPONSE = 2
     NOTIFICATION = 3
+
+
+# Key used by transports to attach to messages read from servers the time
+# at which they were read and their size, to trace them in the client.
+# The size of the request answered by a response is also attached to it
+# when the transport runs in its own process.
+TRACE_KEY = '_spyder_trace'
+
+
+def get_trace_info(size):
+    """Get the trace info of a message of `size` bytes read right now."""
+    return {'received': time.time(), 'size': size}
@@ -21,6 +21,9 @@
 import logging
 from threading import Thread, Lock
 
+from spyder.plugins.completion.languageserver.transport import (
+    TRACE_KEY, get_trace_info)
+
 if not os.name == 'nt':
     from pexpect.fdpexpect import fdspawn
 
@@ -42,7 +45,8 @@ def __init__(self):
         self.expect_body = False
         self.mutex = Lock()
 
-    def initialize(self, fd, zmq_sock, req_status, expectable=False):
+    def initialize(self, fd, zmq_sock, req_status, expectable=False,
+                   request_sizes=None):
         self.fd = fd
         self.expect = None
         self.expectable = expectable
@@ -56,6 +60,7 @@ def initialize(self, fd, zmq_sock, req_status, expectable=False):
                 self.expect = fdspawn(self.fd)
         self.zmq_sock = zmq_sock
         self.req_status = req_status
+        self.request_sizes = {} if request_sizes is None else request_sizes
 
     def read_posix(self):
         self.expect.expect('\r\n\r\n', timeout=None)
@@ -107,9 +112,16 @@ def run(self):
                     break
             try:
                 body = self.read_incoming()
+                trace_info = get_trace_info(len(body))
                 err = False
                 try:
                     body = json.loads(body)
+                    if 'id' in body and 'method' not in body:
+                        request_size = self.request_sizes.pop(body['id'],
+                                                              None)
+                        if request_size is not None:
+                            trace_info['request_size'] = request_size
+                    body[TRACE_KEY] = trace_info
                 except (ValueError, TypeError) as e:
                     err = True
                     logger.error(e)
@@ -40,6 +40,8 @@ def __init__(self, zmq_in_port=7000, zmq_out_port=7001):
         self.context = None
         self.zmq_in_socket = None
         self.zmq_out_socket = None
+        # Size of the requests waiting for a response, by id
+        self.request_sizes = {}
 
     def finalize_initialization(self):
         connected, connection_error, pid = self.is_server_alive()
@@ -86,6 +88,7 @@ def __send_request(self, request):
 
         if 'method' in request:
             if 'id' in request:
+                self.request_sizes[request['id']] = content_length
                 logger.debug(
                     'Sending request of type: {0}'.format(request['method']))
             else:
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+
+"""
+Spyder MS Language Server Protocol v3.0 in-process transport implementation.
+
+This module talks to an LSP server directly from Spyder's process, through
+Qt's event loop, instead of relaying messages through the transport
+process of the zmq-based transport. Messages are read from the server
+stdout (stdio servers) or a TCP socket.
+"""
+
+# Standard library imports
+import json
+import logging
+import time
+
+# Third party imports
+from qtpy.QtCore import QObject, QProcess, QTimer, Signal, Slot
+from qtpy.QtNetwork import QAbstractSocket, QTcpSocket
+
+# Local imports
+from spyder.plugins.completion.languageserver.transport import (
+    TRACE_KEY, get_trace_info)
+
+
+logger = logging.getLogger(__name__)
+
+
+class ContentLengthParser(object):
+    """
+    Incremental parser of messages framed with Content-Length headers.
+
+    Data is accumulated in a single buffer and message bodies are decoded
+    straight from it, without making intermediate copies of them.
+    """
+    HEADERS_END = b'\r\n\r\n'
+
+    def __init__(self):
+        self._buffer = bytearray()
+        # Position in the buffer where the current message starts
+        self._start = 0
+        # Position from which to look for the end of the headers
+        self._scan = 0
+        # Start, length and encoding of the current message body
+        self._body_start = None
+        self._body_length = None
+        self._encoding = 'utf-8'
+
+    def feed(self, data):
+        """
+        Add data read from the server and return the list of message bodies
+        completed by it, decoded as text.
+        """
+        self._buffer += data
+        bodies = []
+
+        while True:
+            if self._body_start is None:
+                headers_end = self._buffer.find(self.HEADERS_END, self._scan)
+                if headers_end == -1:
+                    # Don't look again at data that can't contain the
+                    # end of the headers.
+                    self._scan = max(self._start,
+                                     len(self._buffer) - len(self.HEADERS_END))
+                    break
+                self._parse_headers(
+                    bytes(self._buffer[self._start:headers_end]))
+                self._body_start = headers_end + len(self.HEADERS_END)
+
+            body_end = self._body_start + self._body_length
+            if len(self._buffer) < body_end:
+                break
+
+            with memoryview(self._buffer) as view:
+                bodies.append(
+                    str(view[self._body_start:body_end], self._encoding))
+
+            self._start = self._scan = body_end
+            self._body_start = None
+            self._body_length = None
+            self._encoding = 'utf-8'
+
+        self._compact()
+        return bodies
+
+    def _parse_headers(self, headers):
+        """Get the length and encoding of a message body from its headers."""
+        for header in headers.split(b'\r\n'):
+            name, __, value = header.partition(b':')
+            name = name.strip().lower()
+            if name == b'content-length':
+                self._body_length = int(value.strip())
+            elif name == b'content-type' and b'charset=' in value:
+                self._encoding = value.split(b'charset=')[-1].strip().decode()
+
+        if self._body_length is None:
+            raise ValueError('Missing Content-Length header in '
+                             '{}'.format(headers))
+
+    def _compact(self):
+        """Remove processed messages from the buffer."""
+        if self._start == 0:
+            return
+        del self._buffer[:self._start]
+        self._scan -= self._start
+        if self._body_start is not None:
+            self._body_start -= self._start
+        self._start = 0
+
+
+def frame_message(message):
+    """Serialize a JSON-RPC message and add its Content-Length header."""
+    message['jsonrpc'] = '2.0'
+    body = json.dumps(message).encode('utf-8')
+    header = 'Content-Length: {0}\r\n\r\n'.format(len(body))
+    return header.encode('ascii') + body
+
+
+class InProcessTransport(QObject):
+    """Base class of in-process transports."""
+
+    #: Signal emitted when the connection with the server is established
+    #  int: Server pid, if available, or None
+    sig_ready = Signal(object)
+
+    #: Signal emitted for every message received from the server
+    #  dict: Decoded JSON-RPC message
+    sig_message_received = Signal(dict)
+
+    #: Signal emitted when the connection with the server is lost
+    sig_went_down = Signal()
+
+    def __init__(self, parent=None):
+        QObject.__init__(self, parent)
+        self.parser = ContentLengthParser()
+
+    def process_data(self, data):
+        """Decode messages contained in data and emit them."""
+        try:
+            bodies = self.parser.feed(data)
+        except ValueError as e:
+            logger.error(e)
+            self.parser = ContentLengthParser()
+            return
+
+        for body in bodies:
+            trace_info = get_trace_info(len(body))
+            try:
+                message = json.loads(body)
+            except (ValueError, TypeError) as e:
+                logger.error(e)
+                continue
+            message[TRACE_KEY] = trace_info
+            self.sig_message_received.emit(message)
+
+    def send(self, message):
+        """
+        Send a JSON-RPC message to the server and return the number of
+        bytes written.
+        """
+        data = frame_message(message)
+        self.write(data)
+        return len(data)
+
+    # ---- Methods to be implemented by transports
+    def start(self):
+        raise NotImplementedError("Not implemented")
+
+    def stop(self):
+        raise NotImplementedError("Not implemented")
+
+    def write(self, data):
+        raise NotImplementedError("Not implemented")
+
+    def is_alive(self):
+        raise NotImplementedError("Not implemented")
+
+
+class StdioTransport(InProcessTransport):
+    """Transport for servers that communicate through stdio pipes."""
+
+    def __init__(self, server_args, env=None, cwd=None, log_file=None,
+                 parent=None):
+        InProcessTransport.__init__(self, parent)
+        self.server_args = server_args
+        self.process = QProcess(self)
+        if env is not None:
+            self.process.setProcessEnvironment(env)
+        if cwd is not None:
+            self.process.setWorkingDirectory(cwd)
+        self.process.setProcessChannelMode(QProcess.SeparateChannels)
+        if log_file is not None:
+            self.process.setStandardErrorFile(log_file)
+        self.process.readyReadStandardOutput.connect(self._on_ready_read)
+        self.process.started.connect(self._on_started)
+        self.process.errorOccurred.connect(self._on_error)
+
+    def start(self):
+        logger.info('Starting stdio server: {0}'.format(
+            ' '.join(self.server_args)))
+        self.process.start(self.server_args[0], self.server_args[1:])
+
+    def stop(self):
+        self.process.readyReadStandardOutput.disconnect(self._on_ready_read)
+        self.process.kill()
+
+    def write(self, data):
+        self.process.write(data)
+
+    def is_alive(self):
+        return self.process.state() != QProcess.NotRunning
+
+    @Slot()
+    def _on_started(self):
+        self.sig_ready.emit(self.process.processId())
+
+    @Slot()
+    def _on_ready_read(self):
+        self.process_data(self.process.readAllStandardOutput().data())
+
+    @Slot(QProcess.ProcessError)
+    def _on_error(self, error):
+        logger.error('Error in stdio server: {0}'.format(error))
+        self.sig_went_down.emit()
+
+
+class TCPTransport(InProcessTransport):
+    """Transport for servers that communicate through a TCP socket."""
+
+    # Time (in seconds) to keep trying to connect to the server
+    CONNECTION_TIMEOUT = 20
+
+    # Time (in ms) to wait between connection attempts
+    RETRY_INTERVAL = 100
+
+    def __init__(self, host, port, parent=None):
+        InProcessTransport.__init__(self, parent)
+        self.host = host
+        self.port = int(port)
+        self.connected = False
+        self.gave_up = False
+        self._start_time = None
+        self.socket = QTcpSocket(self)
+        self.socket.connected.connect(self._on_connected)
+        self.socket.disconnected.connect(self._on_disconnected)
+        self.socket.readyRead.connect(self._on_ready_read)
+        self.socket.error.connect(self._on_error)
+
+    def start(self):
+        logger.info('Connecting to language server at {0}:{1}'.format(
+            self.host, self.port))
+        self._start_time = time.time()
+        self._connect()
+
+    def stop(self):
+        self.connected = False
+        self.socket.disconnected.disconnect(self._on_disconnected)
+        self.socket.abort()
+
+    def write(self, data):
+        self.socket.write(data)
+
+    def is_alive(self):
+        # The server is not considered down while we try to connect to it
+        return not self.gave_up
+
+    def _connect(self):
+        self.socket.abort()
+        self.socket.connectToHost(self.host, self.port)
+
+    @Slot()
+    def _on_connected(self):
+        self.connected = True
+        self.sig_ready.emit(None)
+
+    @Slot()
+    def _on_disconnected(self):
+        if self.connected:
+            self.connected = False
+            self.gave_up = True
+            self.sig_went_down.emit()
+
+    @Slot()
+    def _on_ready_read(self):
+        self.process_data(self.socket.readAll().data())
+
+    @Slot(QAbstractSocket.SocketError)
+    def _on_error(self, error):
+        if self.connected:
+            return
+
+        # The server could still be starting, so try again
+        if time.time() - self._start_time < self.CONNECTION_TIMEOUT:
+            QTimer.singleShot(self.RETRY_INTERVAL, self._connect)
+        else:
+            logger.error('Unable to connect to language server at '
+                         '{0}:{1}: {2}'.format(self.host, self.port,
+                                               self.socket.errorString()))
+            self.gave_up = True
+            self.sig_went_down.emit()
@@ -60,7 +60,8 @@ def __init__(self, server_args='', log_file=None,
         super(StdioLanguageServerClient, self).finalize_initialization()
         self.reading_thread = StdioIncomingMessageThread()
         self.reading_thread.initialize(self.process, self.zmq_out_socket,
-                                       self.req_status, expectable=True)
+                                       self.req_status, expectable=True,
+                                       request_sizes=self.request_sizes)
 
     def start(self):
         self.reading_thread.start()
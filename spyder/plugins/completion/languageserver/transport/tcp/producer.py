@@ -49,7 +49,8 @@ def __init__(self, host='127.0.0.1', port=2087, zmq_in_port=7000,
         self.socket.setblocking(True)
         self.reading_thread = TCPIncomingMessageThread()
         self.reading_thread.initialize(self.socket, self.zmq_out_socket,
-                                       self.req_status)
+                                       self.req_status,
+                                       request_sizes=self.request_sizes)
 
     def start(self):
         self.reading_thread.start()
@@ -77,7 +77,15 @@ def show_menu(self):
                 text=text,
                 triggered=lambda: self.plugin.restart_lsp(language, force=True),
             )
-            add_actions(menu, [restart_action])
+            actions = [restart_action]
+            if self.plugin.tracer.enabled:
+                timings_action = create_action(
+                    self,
+                    text=_("Show request timings"),
+                    triggered=self.plugin.show_request_timings,
+                )
+                actions.append(timings_action)
+            add_actions(menu, actions)
             rect = self.contentsRect()
             os_height = 7 if os.name == 'nt' else 12
             pos = self.mapToGlobal(
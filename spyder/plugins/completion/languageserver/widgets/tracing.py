@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Dialog to show the timings of requests sent to language servers.
+"""
+
+# Standard library imports
+import os.path as osp
+
+# Third party imports
+from qtpy.compat import getsavefilename
+from qtpy.QtCore import Qt, QTimer, Slot
+from qtpy.QtGui import QColor, QPainter
+from qtpy.QtWidgets import (QAbstractItemView, QDialog, QDialogButtonBox,
+                            QFileDialog, QHBoxLayout, QLabel, QPushButton,
+                            QTableWidget, QTableWidgetItem, QVBoxLayout,
+                            QWidget)
+
+# Local imports
+from spyder.config.base import _
+from spyder.utils import icon_manager as ima
+
+
+# Columns of the timings table: (title, key in the tracer summary)
+COLUMNS = [
+    (_('Language'), 'language'),
+    (_('Method'), 'method'),
+    (_('Count'), 'count'),
+    (_('Send p95'), 'send_p95'),
+    (_('Server p50'), 'server_p50'),
+    (_('Server p95'), 'server_p95'),
+    (_('Queue p95'), 'queue_p95'),
+    (_('Handle p95'), 'handle_p95'),
+    (_('Total p50'), 'total_p50'),
+    (_('Total p95'), 'total_p95'),
+]
+
+
+class LatencyHistogram(QWidget):
+    """Bar chart of the latency histogram of a request method."""
+
+    def __init__(self, parent=None):
+        QWidget.__init__(self, parent)
+        self.histogram = []
+        self.setMinimumHeight(120)
+
+    def set_histogram(self, histogram):
+        """Set the list of (bucket upper edge, count) pairs to show."""
+        self.histogram = histogram
+        self.update()
+
+    def paintEvent(self, event):
+        QWidget.paintEvent(self, event)
+        if not self.histogram:
+            return
+
+        painter = QPainter(self)
+        metrics = painter.fontMetrics()
+        label_height = metrics.height()
+        width = self.width() / len(self.histogram)
+        height = self.height() - 2 * label_height
+        max_count = max(max(count for __, count in self.histogram), 1)
+
+        for i, (edge, count) in enumerate(self.histogram):
+            x = int(i * width)
+            label = ('> {}'.format(self.histogram[i - 1][0])
+                     if edge == float('inf') else '{}'.format(edge))
+            painter.setPen(QColor(ima.MAIN_FG_COLOR))
+            painter.drawText(x, self.height() - label_height,
+                             int(width), label_height, Qt.AlignCenter, label)
+
+            bar_height = int(height * count / max_count)
+            top = label_height + height - bar_height
+            if count:
+                painter.drawText(x, top - label_height, int(width),
+                                 label_height, Qt.AlignCenter, str(count))
+            painter.fillRect(x + 2, top, int(width) - 4, bar_height,
+                             QColor(Qt.darkCyan))
+        painter.end()
+
+
+class LSPTracingDialog(QDialog):
+    """Live view of the timings recorded by an LSPTracer."""
+
+    # Time (in ms) between updates of the dialog contents
+    UPDATE_INTERVAL = 1000
+
+    def __init__(self, parent, tracer):
+        QDialog.__init__(self, parent)
+        self.tracer = tracer
+
+        # Widgets
+        self.label = QLabel(
+            _("Times are in milliseconds. Methods whose p95 total time "
+              "exceeds the threshold set in Preferences are shown in "
+              "red."))
+        self.label.setWordWrap(True)
+        self.table = QTableWidget(0, len(COLUMNS), self)
+        self.table.setHorizontalHeaderLabels([title for title, __ in COLUMNS])
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.histogram_label = QLabel(
+            _("Select a method to see the histogram of its total time"))
+        self.histogram = LatencyHistogram(self)
+        self.export_btn = QPushButton(_("Export trace"))
+        self.clear_btn = QPushButton(_("Clear"))
+        bbox = QDialogButtonBox(QDialogButtonBox.Close)
+
+        # Widget setup
+        self.setWindowTitle(_("Language servers request timings"))
+        self.setWindowIcon(ima.icon('lspserver'))
+        self.setModal(False)
+
+        # Layout
+        hlayout = QHBoxLayout()
+        hlayout.addWidget(self.export_btn)
+        hlayout.addWidget(self.clear_btn)
+        hlayout.addStretch()
+        hlayout.addWidget(bbox)
+
+        vlayout = QVBoxLayout()
+        vlayout.addWidget(self.label)
+        vlayout.addWidget(self.table)
+        vlayout.addWidget(self.histogram_label)
+        vlayout.addWidget(self.histogram)
+        vlayout.addLayout(hlayout)
+        self.setLayout(vlayout)
+        self.resize(860, 560)
+
+        # Timer to update contents
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.UPDATE_INTERVAL)
+
+        # Signals
+        self.timer.timeout.connect(self.refresh)
+        self.table.itemSelectionChanged.connect(self.update_histogram)
+        self.export_btn.clicked.connect(self.export_trace)
+        self.clear_btn.clicked.connect(self.clear)
+        bbox.rejected.connect(self.reject)
+
+        self.refresh()
+
+    def showEvent(self, event):
+        self.timer.start()
+        QDialog.showEvent(self, event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        QDialog.hideEvent(self, event)
+
+    def get_selected_method(self):
+        """Get the language and method of the selected row, if any."""
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        row = rows[0].row()
+        return (self.table.item(row, 0).text(),
+                self.table.item(row, 1).text())
+
+    @Slot()
+    def refresh(self):
+        """Update the table with the current tracer statistics."""
+        selected = self.get_selected_method()
+        summary = self.tracer.get_summary()
+
+        self.table.blockSignals(True)
+        self.table.setRowCount(len(summary))
+        for row, data in enumerate(summary):
+            for column, (__, key) in enumerate(COLUMNS):
+                value = data[key]
+                if value is None:
+                    text = ''
+                elif isinstance(value, float):
+                    text = '{:.1f}'.format(value)
+                else:
+                    text = str(value)
+                item = QTableWidgetItem(text)
+                if data['slow']:
+                    item.setForeground(QColor(Qt.red))
+                self.table.setItem(row, column, item)
+            if selected == (data['language'], data['method']):
+                self.table.selectRow(row)
+        self.table.blockSignals(False)
+        self.table.resizeColumnsToContents()
+        self.update_histogram()
+
+    @Slot()
+    def update_histogram(self):
+        """Show the histogram of the selected method."""
+        selected = self.get_selected_method()
+        if selected is None:
+            self.histogram.set_histogram([])
+        else:
+            self.histogram.set_histogram(self.tracer.histogram(*selected))
+
+    @Slot()
+    def clear(self):
+        """Remove all recorded timings."""
+        self.tracer.clear()
+        self.refresh()
+
+    @Slot()
+    def export_trace(self):
+        """Save the recorded trace to a JSON file."""
+        filename, _selfilter = getsavefilename(
+            self, _("Export trace"),
+            'lsp_trace.json',
+            filters='JSON (*.json)',
+            selectedfilter='',
+            options=QFileDialog.HideNameFilterDetails)
+
+        if filename:
+            self.tracer.export(osp.normpath(filename))
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Decoding and pre-processing of messages received from language servers.
+
+This work is done in a worker thread, before messages reach the LSP
+client, so that large responses (e.g. completion lists with thousands of
+items or diagnostics for big files) don't block the interface. Handlers
+in the client only need to apply the results they receive.
+"""
+
+# Standard library imports
+import logging
+
+# Third party imports
+from qtpy.QtCore import QObject, Signal, Slot
+import zmq
+
+# Local imports
+from spyder.plugins.completion.manager.api import (
+    CompletionItemKind, InsertTextFormat, LSPRequestTypes)
+from spyder.plugins.completion.languageserver.providers.document import (
+    LSP_COMPLETION)
+
+
+logger = logging.getLogger(__name__)
+
+
+def preprocess_completion(result):
+    """
+    Fill default values of completion items and sort them by sortText.
+    """
+    if isinstance(result, dict):
+        result = result['items']
+
+    for item in result:
+        item['kind'] = item.get('kind', CompletionItemKind.TEXT)
+        item['detail'] = item.get('detail', '')
+        item['documentation'] = item.get('documentation', '')
+        item['sortText'] = item.get('sortText', item['label'])
+        item['filterText'] = item.get('filterText', item['label'])
+        item['insertTextFormat'] = item.get(
+            'insertTextFormat', InsertTextFormat.PLAIN_TEXT)
+        item['insertText'] = item.get('insertText', item['label'])
+        item['provider'] = LSP_COMPLETION
+
+    # Editors sort items again after merging the results of all providers.
+    # That's much faster if they come already sorted from each provider.
+    result.sort(key=lambda item: item['sortText'])
+    return result
+
+
+def preprocess_completion_resolve(result):
+    """Convert the documentation of a resolved completion item to text."""
+    documentation = result.get('documentation', '')
+    if isinstance(documentation, dict):
+        documentation = documentation['value']
+    result['documentation'] = documentation
+    return result
+
+
+def preprocess_hover(result):
+    """Convert the contents of a hover response to plain text."""
+    contents = result['contents']
+    if isinstance(contents, dict):
+        if 'value' in contents:
+            contents = contents['value']
+    elif isinstance(contents, list):
+        text = []
+        for entry in contents:
+            if isinstance(entry, dict):
+                text.append(entry['value'])
+            else:
+                text.append(entry)
+        contents = '\n\n'.join(text)
+    result['contents'] = contents
+    return result
+
+
+def preprocess_diagnostics(params):
+    """
+    Sort diagnostics by line so that editors can process the ones that
+    correspond to the same block together.
+    """
+    params['diagnostics'].sort(
+        key=lambda diagnostic: diagnostic['range']['start']['line'])
+    return params
+
+
+# Functions to pre-process the results of requests, per method
+RESULT_PREPROCESSORS = {
+    LSPRequestTypes.DOCUMENT_COMPLETION: preprocess_completion,
+    LSPRequestTypes.COMPLETION_RESOLVE: preprocess_completion_resolve,
+    LSPRequestTypes.DOCUMENT_HOVER: preprocess_hover,
+}
+
+# Functions to pre-process the params of notifications, per method
+NOTIFICATION_PREPROCESSORS = {
+    LSPRequestTypes.DOCUMENT_PUBLISH_DIAGNOSTICS: preprocess_diagnostics,
+}
+
+
+def preprocess_message(message, req_status):
+    """
+    Pre-process a message received from a server.
+
+    `req_status` maps the ids of pending requests to their methods.
+    """
+    try:
+        if 'method' in message:
+            preprocessor = NOTIFICATION_PREPROCESSORS.get(message['method'])
+            if preprocessor is not None:
+                message['params'] = preprocessor(message['params'])
+        elif message.get('result') is not None:
+            method = req_status.get(message.get('id'))
+            preprocessor = RESULT_PREPROCESSORS.get(method)
+            if preprocessor is not None:
+                message['result'] = preprocessor(message['result'])
+    except Exception:
+        logger.error('Error when pre-processing message', exc_info=True)
+    return message
+
+
+class MessageReader(QObject):
+    """
+    Worker that receives and pre-processes the messages relayed by the
+    transport process.
+    """
+
+    # Time (in ms) to wait for new messages before checking if the reader
+    # was stopped.
+    POLL_TIMEOUT = 100
+
+    #: Signal emitted when a message is ready to be handled
+    #  dict: Pre-processed message
+    sig_message_ready = Signal(object)
+
+    def __init__(self, socket, req_status):
+        QObject.__init__(self)
+        self.socket = socket
+        self.req_status = req_status
+        self.stopped = False
+
+    @Slot()
+    def run(self):
+        """Read messages until the reader is stopped."""
+        while not self.stopped:
+            try:
+                if not self.socket.poll(self.POLL_TIMEOUT):
+                    continue
+                message = self.socket.recv_pyobj(flags=zmq.NOBLOCK)
+            except zmq.Again:
+                continue
+            except zmq.ZMQError:
+                # The socket was closed
+                break
+            self.sig_message_ready.emit(
+                preprocess_message(message, self.req_status))
+
+    def stop(self):
+        self.stopped = True
@@ -80,6 +80,18 @@ def send_request(self, language, req_type, req, req_id):
         """
         pass
 
+    def cancel_request(self, req_id):
+        """
+        Cancel a request sent through `send_request` whose response is
+        no longer needed.
+
+        Parameters
+        ----------
+        req_id: int
+            Request identifier
+        """
+        pass
+
     def send_notification(self, language, notification_type, notification):
         """
         Send notification to completion server based on Spyder changes.
@@ -363,7 +375,12 @@ class SymbolKind:
         # the end of the snippet. Placeholders with equal identifiers are
         # linked, that is typing in one will update others too.
         "completionItem": {
-            "snippetSupport": True
+            "snippetSupport": True,
+            # Documentation is requested with completionItem/resolve only
+            # for the item highlighted in the completion widget.
+            "resolveSupport": {
+                "properties": ["documentation"]
+            }
         }
     },
 
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Per-provider latency statistics for completion requests."""
+
+# Standard library imports
+from collections import defaultdict, deque
+import math
+
+
+# Upper edges (in ms) of the buckets used to report latency histograms
+HISTOGRAM_BUCKETS = (5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000,
+                     float('inf'))
+
+
+class ProviderLatencyStats:
+    """
+    Keep track of the time each completion provider takes to answer a
+    request, per request type.
+
+    Only the last `window` samples are kept for each (provider, request
+    type) pair, so that estimates follow changes in the providers load.
+    """
+
+    def __init__(self, window=100, min_samples=10):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+
+    def add(self, source, req_type, elapsed_ms):
+        """Register that `source` took `elapsed_ms` to answer `req_type`."""
+        self._samples[(source, req_type)].append(elapsed_ms)
+
+    def count(self, source, req_type):
+        """Number of samples available for `source` and `req_type`."""
+        return len(self._samples.get((source, req_type), ()))
+
+    def percentile(self, source, req_type, percent):
+        """
+        Return the `percent` percentile of the latency of `source` for
+        `req_type`, or None if there are not enough samples yet.
+        """
+        samples = self._samples.get((source, req_type), ())
+        if len(samples) < self.min_samples:
+            return None
+        samples = sorted(samples)
+        index = int(math.ceil(percent / 100.0 * len(samples))) - 1
+        return samples[max(0, min(index, len(samples) - 1))]
+
+    def histogram(self, source, req_type):
+        """
+        Return a list of (bucket upper edge, count) pairs with the latency
+        distribution of `source` for `req_type`.
+        """
+        counts = [0] * len(HISTOGRAM_BUCKETS)
+        for sample in self._samples.get((source, req_type), ()):
+            for i, edge in enumerate(HISTOGRAM_BUCKETS):
+                if sample <= edge:
+                    counts[i] += 1
+                    break
+        return list(zip(HISTOGRAM_BUCKETS, counts))
+
+    def clear(self):
+        """Remove all samples."""
+        self._samples.clear()
@@ -11,6 +11,7 @@
 # Standard library imports
 from collections import defaultdict
 import logging
+import time
 
 # Third-party imports
 from qtpy.QtCore import QMutex, QMutexLocker, QTimer, Slot
@@ -25,6 +26,7 @@
 from spyder.plugins.completion.fallback.plugin import FallbackPlugin
 from spyder.plugins.completion.manager.api import (LSPRequestTypes,
                                                    SpyderCompletionPlugin)
+from spyder.plugins.completion.manager.latency import ProviderLatencyStats
 from spyder.plugins.completion.snippets.plugin import SnippetsPlugin
 
 logger = logging.getLogger(__name__)
@@ -85,6 +87,28 @@ class CompletionManager(SpyderCompletionPlugin):
         LSPRequestTypes.DOCUMENT_COMPLETION
     }
 
+    # Requests that are cancelled when the same editor sends a new one of
+    # the same type, because their results wouldn't be shown anyway.
+    CANCELLABLE_REQUESTS = {
+        LSPRequestTypes.DOCUMENT_COMPLETION,
+        LSPRequestTypes.COMPLETION_RESOLVE,
+        LSPRequestTypes.DOCUMENT_SIGNATURE,
+        LSPRequestTypes.DOCUMENT_HOVER,
+    }
+
+    # Requests whose partial results can be shown while other providers
+    # are still computing theirs.
+    STREAMING_REQUESTS = {
+        LSPRequestTypes.DOCUMENT_COMPLETION
+    }
+
+    # Bounds (in ms) for the timeout computed from the providers latency
+    MIN_ADAPTIVE_WAIT_MS = 50
+    MAX_STREAMING_WAIT_MS = 2000
+
+    # Latency percentile used to compute adaptive timeouts
+    ADAPTIVE_WAIT_PERCENTILE = 95
+
     def __init__(self, parent, plugins=ALL_COMPLETION_PLUGINS):
         SpyderCompletionPlugin.__init__(self, parent)
         self.clients = {}
@@ -95,6 +119,9 @@ def __init__(self, parent, plugins=ALL_COMPLETION_PLUGINS):
         self.collection_mutex = QMutex(QMutex.Recursive)
         self.wait_for_ms = self.get_option('completions_wait_for_ms',
                                            section='editor')
+        self.streaming = self.get_option('completions_streaming',
+                                         section='editor')
+        self.latency_stats = ProviderLatencyStats()
 
         for plugin in plugins:
             if plugin in self.BASE_PLUGINS:
@@ -127,6 +154,9 @@ def receive_response(self, completion_source, req_id, resp):
         with QMutexLocker(self.collection_mutex):
             request_responses = self.requests[req_id]
             request_responses['sources'][completion_source] = resp
+            elapsed_ms = (time.monotonic() - request_responses['start']) * 1000
+            self.latency_stats.add(
+                completion_source, request_responses['req_type'], elapsed_ms)
             self.howto_send_to_codeeditor(req_id)
 
     @Slot(int)
@@ -140,6 +170,15 @@ def receive_timeout(self, req_id):
         with QMutexLocker(self.collection_mutex):
             request_responses = self.requests[req_id]
             request_responses['timed_out'] = True
+
+            # Providers that didn't answer in time took at least this long,
+            # which is taken into account to compute adaptive timeouts.
+            elapsed_ms = (time.monotonic() - request_responses['start']) * 1000
+            req_type = request_responses['req_type']
+            for source in self.get_wait_for_sources(req_type):
+                if source not in request_responses['sources']:
+                    self.latency_stats.add(source, req_type, elapsed_ms)
+
             self.howto_send_to_codeeditor(req_id)
 
     def howto_send_to_codeeditor(self, req_id):
@@ -169,14 +208,14 @@ def howto_send_to_codeeditor(self, req_id):
 
         # Wait between the LSP and Kite to return responses. This favors
         # Kite when the LSP takes too much time to respond.
-        wait_for = set(source for source
-                       in self.WAIT_FOR_SOURCE[request_responses['req_type']]
-                       if self.is_client_running(source))
+        wait_for = self.get_wait_for_sources(request_responses['req_type'])
         timed_out = request_responses['timed_out']
         all_returned = all(source in request_responses['sources']
                            for source in wait_for)
 
-        if not timed_out:
+        if request_responses['streaming']:
+            self.stream_to_codeeditor(req_id, wait_for, all_returned)
+        elif not timed_out:
             # Before the timeout
             if all_returned:
                 self.skip_and_send_to_codeeditor(req_id)
@@ -187,6 +226,60 @@ def howto_send_to_codeeditor(self, req_id):
             if all_returned or any_nonempty:
                 self.skip_and_send_to_codeeditor(req_id)
 
+    def stream_to_codeeditor(self, req_id, wait_for, all_returned):
+        """
+        Send the responses gathered so far for req_id as soon as a provider
+        returns something useful, and resend them merged with the ones of
+        later providers until all of them return or the request times out.
+        """
+        request_responses = self.requests[req_id]
+        sources = request_responses['sources']
+        final = all_returned or request_responses['timed_out']
+
+        if not self.is_last_request(req_id):
+            # A newer request from the same editor supersedes this one
+            logger.debug("Completion plugin: Request {} removed".format(
+                req_id))
+            del self.requests[req_id]
+            return
+
+        nonempty = set(source for source in sources
+                       if sources[source].get('params'))
+        has_news = bool(nonempty - request_responses['sent_sources'])
+
+        if final:
+            logger.debug("Completion plugin: Request {} removed".format(
+                req_id))
+            del self.requests[req_id]
+
+        if has_news or (final and not request_responses['sent_sources']):
+            is_update = bool(request_responses['sent_sources'])
+            request_responses['sent_sources'] |= nonempty
+            self.gather_and_send_to_codeeditor(
+                request_responses,
+                streaming={'final': final, 'update': is_update})
+        elif final and request_responses['sent_sources']:
+            # Nothing new to show, but let the editor know that no more
+            # updates will come for this request.
+            self.gather_and_send_to_codeeditor(
+                request_responses,
+                streaming={'final': True, 'update': True})
+
+    def is_last_request(self, req_id):
+        """
+        Check if req_id is the most recent request of its type sent by
+        the CodeEditor instance that requested it.
+        """
+        request_responses = self.requests[req_id]
+        req_type = request_responses['req_type']
+        response_instance = id(request_responses['response_instance'])
+        max_req_id = max(
+            [key for key, item in self.requests.items()
+             if item['req_type'] == req_type
+             and id(item['response_instance']) == response_instance]
+            or [-1])
+        return req_id == max_req_id
+
     def skip_and_send_to_codeeditor(self, req_id):
         """
         Skip intermediate responses coming from the same CodeEditor
@@ -195,18 +288,12 @@ def skip_and_send_to_codeeditor(self, req_id):
         """
         request_responses = self.requests[req_id]
         req_type = request_responses['req_type']
-        response_instance = id(request_responses['response_instance'])
         do_send = True
 
         # This is necessary to prevent sending completions for old requests
         # See spyder-ide/spyder#10798
         if req_type in self.SKIP_INTERMEDIATE_REQUESTS:
-            max_req_id = max(
-                [key for key, item in self.requests.items()
-                 if item['req_type'] == req_type
-                 and id(item['response_instance']) == response_instance]
-                or [-1])
-            do_send = (req_id == max_req_id)
+            do_send = self.is_last_request(req_id)
 
         logger.debug("Completion plugin: Request {} removed".format(req_id))
         del self.requests[req_id]
@@ -247,7 +334,10 @@ def gather_completions(self, req_id_responses):
                     continue
                 dedupe_set.add(dedupe_key)
 
-                response['sortText'] = (priority, response['sortText'])
+                # Responses are gathered again for each streamed update,
+                # so the ones sent by the providers must not be changed.
+                response = dict(response,
+                                sortText=(priority, response['sortText']))
                 responses.append(response)
                 merge_stats[source] += 1
 
@@ -265,10 +355,16 @@ def gather_responses(self, req_type, responses):
                     break
         return {'params': response}
 
-    def gather_and_send_to_codeeditor(self, request_responses):
+    def gather_and_send_to_codeeditor(self, request_responses,
+                                      streaming=None):
         """
         Gather request responses from all plugins and send them to the
         CodeEditor instance that requested them.
+
+        If `streaming` is given, it's a dict with the keys `final` (no more
+        responses will be sent for this request) and `update` (responses
+        for this request were already sent), which is passed along to the
+        CodeEditor.
         """
         req_type = request_responses['req_type']
         req_id_responses = request_responses['sources']
@@ -280,6 +376,9 @@ def gather_and_send_to_codeeditor(self, request_responses):
         else:
             responses = self.gather_responses(req_type, req_id_responses)
 
+        if streaming is not None:
+            responses['streaming'] = streaming
+
         try:
             response_instance.handle_response(req_type, responses)
         except RuntimeError:
@@ -287,6 +386,35 @@ def gather_and_send_to_codeeditor(self, request_responses):
             # removed before the response can be processed.
             pass
 
+    def get_wait_for_sources(self, req_type):
+        """Get the running providers to wait for on req_type requests."""
+        return set(source for source in self.WAIT_FOR_SOURCE[req_type]
+                   if self.is_client_running(source))
+
+    def get_wait_for_ms(self, req_type, streaming=False):
+        """
+        Get the time to wait for all providers to answer a req_type request.
+
+        In streaming mode, this is estimated from the latency of the
+        slowest provider we wait for, so that late results can still be
+        merged in the completion widget. Otherwise it's the timeout set
+        by users.
+        """
+        if not streaming or self.wait_for_ms <= 0:
+            return self.wait_for_ms
+
+        estimates = [
+            self.latency_stats.percentile(
+                source, req_type, self.ADAPTIVE_WAIT_PERCENTILE)
+            for source in self.get_wait_for_sources(req_type)]
+        if not estimates or None in estimates:
+            # Not enough samples yet, so use the timeout set by users
+            return self.wait_for_ms
+
+        wait_for_ms = int(max(estimates))
+        return max(self.MIN_ADAPTIVE_WAIT_MS,
+                   min(wait_for_ms, self.MAX_STREAMING_WAIT_MS))
+
     def is_client_running(self, name):
         if name == LanguageServerPlugin.COMPLETION_CLIENT_NAME:
             # The LSP plugin does not emit a plugin ready signal
@@ -296,20 +424,32 @@ def is_client_running(self, name):
         return status == self.RUNNING
 
     def send_request(self, language, req_type, req):
+        if req_type in self.CANCELLABLE_REQUESTS:
+            self.cancel_superseded_requests(req_type,
+                                            req['response_instance'])
+
         req_id = self.req_id
         self.req_id += 1
 
+        streaming = (self.streaming and
+                     req_type in self.STREAMING_REQUESTS and
+                     not self.is_fallback_only(language))
+
         self.requests[req_id] = {
             'language': language,
             'req_type': req_type,
             'response_instance': req['response_instance'],
             'sources': {},
             'timed_out': False,
+            'start': time.monotonic(),
+            'streaming': streaming,
+            'sent_sources': set(),
         }
 
         # Start the timer on this request
-        if self.wait_for_ms > 0:
-            QTimer.singleShot(self.wait_for_ms,
+        wait_for_ms = self.get_wait_for_ms(req_type, streaming)
+        if wait_for_ms > 0:
+            QTimer.singleShot(wait_for_ms,
                               lambda: self.receive_timeout(req_id))
         else:
             self.requests[req_id]['timed_out'] = True
@@ -319,6 +459,26 @@ def send_request(self, language, req_type, req):
             client_info['plugin'].send_request(
                 language, req_type, req, req_id)
 
+    def cancel_superseded_requests(self, req_type, response_instance):
+        """
+        Cancel the pending requests of type req_type sent by
+        response_instance, which are superseded by a new one.
+        """
+        with QMutexLocker(self.collection_mutex):
+            superseded = [
+                req_id for req_id, request in self.requests.items()
+                if request['req_type'] == req_type
+                and request['response_instance'] is response_instance]
+
+            for req_id in superseded:
+                logger.debug("Completion plugin: Request {} cancelled".format(
+                    req_id))
+                del self.requests[req_id]
+                for client_name in self.clients:
+                    client_info = self.clients[client_name]
+                    if client_info['status'] == self.RUNNING:
+                        client_info['plugin'].cancel_request(req_id)
+
     def send_notification(self, language, notification_type, notification):
         for client_name in self.clients:
             client_info = self.clients[client_name]
@@ -352,6 +512,8 @@ def register_file(self, language, filename, codeeditor):
     def update_configuration(self):
         self.wait_for_ms = self.get_option('completions_wait_for_ms',
                                            section='editor')
+        self.streaming = self.get_option('completions_streaming',
+                                         section='editor')
         for client_name in self.clients:
             client_info = self.clients[client_name]
             if client_info['status'] == self.RUNNING:
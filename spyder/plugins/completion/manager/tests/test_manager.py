@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the completion manager."""
+
+# Standard library imports
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock  # Python 2
+
+# Third-party imports
+import pytest
+
+# Local imports
+from spyder.plugins.completion.manager.api import LSPRequestTypes
+from spyder.plugins.completion.manager.latency import ProviderLatencyStats
+from spyder.plugins.completion.manager.plugin import CompletionManager
+
+
+def completion_item(label, sort_text=None):
+    return {'label': label, 'sortText': sort_text or label,
+            'insertText': label, 'filterText': label}
+
+
+@pytest.fixture
+def completion_manager(qtbot):
+    manager = CompletionManager(None, [])
+    for name in ['lsp', 'kite']:
+        manager.clients[name] = {
+            'plugin': Mock(),
+            'status': CompletionManager.RUNNING
+        }
+    manager.wait_for_ms = 5000
+    return manager
+
+
+def test_latency_stats():
+    """Check percentiles and histograms of providers latency."""
+    stats = ProviderLatencyStats(window=10, min_samples=5)
+    req_type = LSPRequestTypes.DOCUMENT_COMPLETION
+
+    for elapsed in [1, 2, 3, 4]:
+        stats.add('lsp', req_type, elapsed)
+    assert stats.percentile('lsp', req_type, 95) is None
+
+    for elapsed in [30, 40, 50, 60, 70, 800]:
+        stats.add('lsp', req_type, elapsed)
+    assert stats.count('lsp', req_type) == 10
+    assert stats.percentile('lsp', req_type, 50) == 30
+    assert stats.percentile('lsp', req_type, 95) == 800
+
+    histogram = dict(stats.histogram('lsp', req_type))
+    assert histogram[5] == 4
+    assert histogram[50] == 3
+    assert histogram[1000] == 1
+
+    # Only the last samples are kept
+    stats.add('lsp', req_type, 900)
+    assert stats.count('lsp', req_type) == 10
+    assert dict(stats.histogram('lsp', req_type))[5] == 3
+
+
+def test_streaming_completions(completion_manager):
+    """Check that results are sent as soon as a provider returns."""
+    manager = completion_manager
+    manager.streaming = True
+    editor = Mock()
+    req_type = LSPRequestTypes.DOCUMENT_COMPLETION
+
+    manager.send_request('python', req_type, {'response_instance': editor})
+
+    # The first provider is shown right away
+    kite_item = completion_item('foo')
+    manager.receive_response('kite', 0, {'params': [kite_item]})
+    method, response = editor.handle_response.call_args[0]
+    assert method == req_type
+    assert [item['label'] for item in response['params']] == ['foo']
+    assert response['streaming'] == {'final': False, 'update': False}
+
+    # Later providers are merged with it
+    manager.receive_response(
+        'lsp', 0, {'params': [completion_item('foo'), completion_item('bar')]})
+    method, response = editor.handle_response.call_args[0]
+    assert [item['label'] for item in response['params']] == ['foo', 'bar']
+    assert response['streaming'] == {'final': True, 'update': True}
+    assert 0 not in manager.requests
+
+    # Items are copied for each update, not changed in place
+    assert kite_item['sortText'] == 'foo'
+    assert all(isinstance(item['sortText'][1], str)
+               for item in response['params'])
+
+    assert manager.latency_stats.count('kite', req_type) == 1
+    assert manager.latency_stats.count('lsp', req_type) == 1
+
+
+def test_streaming_superseded_requests(completion_manager):
+    """Check that results of superseded requests are not streamed."""
+    manager = completion_manager
+    manager.streaming = True
+    editor = Mock()
+    req_type = LSPRequestTypes.DOCUMENT_COMPLETION
+
+    manager.send_request('python', req_type, {'response_instance': editor})
+    manager.send_request('python', req_type, {'response_instance': editor})
+
+    manager.receive_response('kite', 0, {'params': [completion_item('foo')]})
+    assert not editor.handle_response.called
+    assert 0 not in manager.requests
+
+
+def test_adaptive_wait_for_ms(completion_manager):
+    """Check that the timeout follows the providers latency."""
+    manager = completion_manager
+    req_type = LSPRequestTypes.DOCUMENT_COMPLETION
+
+    # Not enough samples
+    assert manager.get_wait_for_ms(req_type, streaming=True) == 5000
+
+    for __ in range(manager.latency_stats.min_samples):
+        manager.latency_stats.add('lsp', req_type, 120)
+        manager.latency_stats.add('kite', req_type, 20)
+    assert manager.get_wait_for_ms(req_type, streaming=True) == 120
+    assert manager.get_wait_for_ms(req_type) == 5000
+
+
+def test_cancel_superseded_requests(completion_manager):
+    """Check that requests superseded by newer ones are cancelled."""
+    manager = completion_manager
+    editor = Mock()
+    other_editor = Mock()
+    hover = LSPRequestTypes.DOCUMENT_HOVER
+
+    manager.send_request('python', hover, {'response_instance': editor})
+    manager.send_request('python', hover, {'response_instance': other_editor})
+    manager.send_request('python', LSPRequestTypes.DOCUMENT_DEFINITION,
+                         {'response_instance': editor})
+    for client in manager.clients.values():
+        client['plugin'].cancel_request.assert_not_called()
+
+    # A new hover request from the same editor cancels the first one
+    manager.send_request('python', hover, {'response_instance': editor})
+    for client in manager.clients.values():
+        client['plugin'].cancel_request.assert_called_once_with(0)
+    assert sorted(manager.requests) == [1, 2, 3]
+
+    # Responses to cancelled requests are ignored
+    manager.receive_response('lsp', 0, {'params': 'foo'})
+    editor.handle_response.assert_not_called()
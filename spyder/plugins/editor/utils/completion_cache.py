@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Cache of completion results, used to refilter them while users keep
+typing the word they were requested for.
+"""
+
+# Local imports
+from spyder.utils.stringmatching import NOT_FOUND_SCORE, get_fuzzy_score
+
+
+class CompletionCache(object):
+    """
+    Last completion results received by an editor.
+
+    Results are stored together with the document version, line and start
+    of the word they were requested for. They can answer later requests
+    made while the same word is being typed, as long as nothing else
+    changed in the document.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Remove cached results."""
+        self.items = None
+        self.version = None
+        self.line = None
+        self.word_start = None
+        self.word = None
+        self.position = None
+        self._line_before = None
+        self._line_after = None
+
+    def set(self, items, version, line, word_start, word, position,
+            line_before, line_after):
+        """
+        Save the completion items requested when the document had version
+        `version` and the cursor was at `position`, after `word`, which
+        starts at `word_start` in line `line`.
+
+        `line_before` and `line_after` are the text of that line before
+        the word and after the cursor.
+        """
+        if not items:
+            # Empty results could be due to providers not being ready yet,
+            # so they can't be used to answer other requests.
+            self.clear()
+            return
+
+        self.items = [dict(item) for item in items]
+        self.version = version
+        self.line = line
+        self.word_start = word_start
+        self.word = word
+        self.position = position
+        self._line_before = line_before
+        self._line_after = line_after
+
+    def get(self, version, line, word_start, word, position, line_before,
+            line_after):
+        """
+        Get the cached items that match `word`, ranked by how well they
+        match it, or None if the cache can't answer this request.
+
+        The arguments have the same meaning as in `set`.
+        """
+        if not self.is_valid(version, line, word_start, word, position,
+                             line_before, line_after):
+            return None
+
+        items = []
+        for item in self.items:
+            score = get_fuzzy_score(word, item['filterText'])
+            if score == NOT_FOUND_SCORE:
+                continue
+
+            item = dict(item)
+            if 'textEdit' in item:
+                # Update the end of textEdit ranges to the current position
+                # or discard them if they can't be applied anymore.
+                text_edit = item['textEdit']
+                edit_range = text_edit['range']
+                if (edit_range['end'] != self.position
+                        or edit_range['start'] > word_start):
+                    continue
+                item['textEdit'] = dict(
+                    text_edit,
+                    range={'start': edit_range['start'], 'end': position})
+
+            item['sortText'] = (score, item['sortText'])
+            items.append(item)
+
+        return items
+
+    def is_valid(self, version, line, word_start, word, position,
+                 line_before, line_after):
+        """Check if the cache can answer a request for `word`."""
+        if self.items is None:
+            return False
+
+        if line != self.line or word_start != self.word_start:
+            # A new word is being completed
+            return False
+
+        if not word.lower().startswith(self.word.lower()):
+            # Results for the cached word don't contain all the results for
+            # the new one.
+            return False
+
+        if version == self.version:
+            return position == self.position
+        elif version < self.version:
+            # Changes were undone
+            return False
+
+        # Check that only the word changed since results were requested.
+        # Other lines can't change while the cursor stays in the same word,
+        # so only the current one is compared.
+        return (line_before == self._line_before
+                and line_after == self._line_after)
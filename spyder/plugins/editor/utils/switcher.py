@@ -11,6 +11,9 @@
 # Standard library imports
 import os.path as osp
 
+# Third party imports
+from qtpy.QtCore import QTimer
+
 # Local imports
 from spyder.config.base import _
 from spyder.config.manager import CONF
@@ -25,14 +28,23 @@ class EditorSwitcherManager(object):
     Switcher instance manager to handle base modes for an Editor.
 
     Symbol mode -> '@'
+    Project symbol mode -> '#'
     Line mode -> ':'
     Files mode -> ''
     """
 
     SYMBOL_MODE = '@'
+    PROJECT_SYMBOL_MODE = '#'
     LINE_MODE = ':'
     FILES_MODE = ''
 
+    # Maximum number of project symbols to show
+    MAX_PROJECT_SYMBOLS = 100
+
+    # Time (in ms) to wait for users to stop typing before asking for
+    # project symbols
+    PROJECT_SYMBOLS_DELAY = 250
+
     def __init__(self, plugin, switcher_instance, get_codeeditor,
                  get_editorstack, section=_("Editor")):
         """
@@ -49,12 +61,21 @@ def __init__(self, plugin, switcher_instance, get_codeeditor,
         self._section = section
         self._current_line = None
 
+        self._project_symbols_text = ''
+        self._project_symbols_timer = QTimer(self._switcher)
+        self._project_symbols_timer.setSingleShot(True)
+        self._project_symbols_timer.setInterval(self.PROJECT_SYMBOLS_DELAY)
+        self._project_symbols_timer.timeout.connect(
+            self.request_project_symbols)
+
         self.setup_switcher()
 
     def setup_switcher(self):
         """Setup switcher modes and signals."""
         self._switcher.add_mode(self.LINE_MODE, _('Go to Line'))
         self._switcher.add_mode(self.SYMBOL_MODE, _('Go to Symbol in File'))
+        self._switcher.add_mode(self.PROJECT_SYMBOL_MODE,
+                                _('Go to Symbol in Project'))
         self._switcher.sig_mode_selected.connect(self.handle_switcher_modes)
         self._switcher.sig_item_selected.connect(
             self.handle_switcher_selection)
@@ -63,10 +84,22 @@ def setup_switcher(self):
         self._switcher.sig_item_changed.connect(
             self.handle_switcher_item_change)
 
+        projects = self._get_projects()
+        if projects is not None:
+            projects.sig_project_symbols_found.connect(
+                self.handle_project_symbols)
+
+    def _get_projects(self):
+        """Get the Projects plugin, if available."""
+        main = getattr(self._plugin, 'main', None)
+        return getattr(main, 'projects', None)
+
     def handle_switcher_modes(self, mode):
         """Handle switcher for registered modes."""
         if mode == self.SYMBOL_MODE:
             self.create_symbol_switcher()
+        elif mode == self.PROJECT_SYMBOL_MODE:
+            self.create_project_symbol_switcher()
         elif mode == self.LINE_MODE:
             self.create_line_switcher()
         elif mode == self.FILES_MODE:
@@ -177,11 +210,69 @@ def create_symbol_switcher(self):
         # Needed to update fold spaces for items titles
         self._switcher.setup()
 
+    def create_project_symbol_switcher(self):
+        """Prepare switcher to show the symbols of the current project."""
+        self._switcher.clear()
+        projects = self._get_projects()
+        if (projects is None or
+                projects.get_active_project_path() is None):
+            self._switcher.set_placeholder_text(
+                _('Open a project to search its symbols'))
+        else:
+            self._switcher.set_placeholder_text(
+                _('Start typing the name of a symbol'))
+
+    def request_project_symbols(self):
+        """Ask for the project symbols that match the search text."""
+        if self._switcher.get_mode() != self.PROJECT_SYMBOL_MODE:
+            return
+
+        projects = self._get_projects()
+        search_text = self._project_symbols_text
+        query = search_text[len(self.PROJECT_SYMBOL_MODE):].strip()
+        if projects is not None and query:
+            projects.request_project_symbols(query)
+
+    def handle_project_symbols(self, symbols):
+        """Populate switcher with the project symbols found."""
+        if self._switcher.get_mode() != self.PROJECT_SYMBOL_MODE:
+            return
+
+        project_path = self._get_projects().get_active_project_path()
+        symbols = symbols[:self.MAX_PROJECT_SYMBOLS]
+        self._switcher.clear()
+        self._switcher.set_placeholder_text(
+            _('Start typing the name of a symbol'))
+        for idx, symbol in enumerate(symbols):
+            path = symbol['location']['file']
+            line_number = symbol['location']['range']['start']['line'] + 1
+            description = u'{path}:{line}'.format(
+                path=osp.relpath(path, project_path) if project_path else path,
+                line=line_number)
+            if symbol.get('containerName'):
+                description = u'{container} - {description}'.format(
+                    container=symbol['containerName'],
+                    description=description)
+            icon = ima.icon(SYMBOL_KIND_ICON.get(symbol['kind'], 'no_match'))
+            data = {'title': symbol['name'],
+                    'filename': path,
+                    'line_number': line_number}
+            self._switcher.add_item(title=symbol['name'],
+                                    description=description,
+                                    icon=icon,
+                                    section=_('Project'),
+                                    data=data,
+                                    last_item=idx + 1 == len(symbols))
+        # Needed to filter and sort the symbols by the current search text
+        self._switcher.setup()
+
     def handle_switcher_selection(self, item, mode, search_text):
         """Handle item selection of the switcher."""
         data = item.get_data()
         if mode == '@':
             self.symbol_switcher_handler(data)
+        elif mode == '#':
+            self.project_symbol_switcher_handler(data)
         elif mode == ':':
             self.line_switcher_handler(data, search_text)
         elif mode == '':
@@ -191,13 +282,18 @@ def handle_switcher_selection(self, item, mode, search_text):
                 self._plugin.switch_to_plugin()
 
     def handle_switcher_text(self, search_text):
-        """Handle switcher search text for line mode."""
+        """Handle switcher search text for line and project symbol modes."""
         editorstack = self._editorstack()
         mode = self._switcher.get_mode()
         if mode == ':':
             item = self._switcher.current_item()
             self.line_switcher_handler(item.get_data(), search_text,
                                        visible=True)
+        elif mode == '#':
+            # Wait for users to stop typing to not send a request for
+            # every key they press
+            self._project_symbols_text = search_text
+            self._project_symbols_timer.start()
         elif self._current_line and mode == '':
             editorstack.go_to_line(self._current_line)
             self._current_line = None
@@ -249,3 +345,10 @@ def symbol_switcher_handler(self, data):
         self._current_line = None
         self._switcher.hide()
         self._switcher.set_search_text('')
+
+    def project_symbol_switcher_handler(self, data):
+        """Handle project symbol switcher selection."""
+        self._plugin.load(data['filename'], goto=data['line_number'])
+        self._current_line = None
+        self._switcher.hide()
+        self._switcher.set_search_text('')
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for completion_cache.py"""
+
+# Local imports
+from spyder.plugins.editor.utils.completion_cache import CompletionCache
+
+
+def completion_item(label):
+    return {'label': label, 'insertText': label, 'filterText': label,
+            'sortText': label}
+
+
+def cache_args(text, version, word):
+    """State of a document with a single line and the cursor at its end."""
+    position = len(text)
+    word_start = position - len(word)
+    return {'version': version, 'line': 0, 'word_start': word_start,
+            'word': word, 'position': position,
+            'line_before': text[:word_start], 'line_after': ''}
+
+
+def test_completion_cache_refilter():
+    """Test that results are refiltered while typing the same word."""
+    cache = CompletionCache()
+    items = [completion_item(label) for label in
+             ['append', 'clear', 'copy', 'count', 'extend']]
+    cache.set(items, **cache_args('x.', 1, ''))
+
+    results = cache.get(**cache_args('x.co', 3, 'co'))
+    assert [item['label'] for item in results] == ['copy', 'count']
+    assert results[0]['sortText'] == (0, 'copy')
+
+    # Items can be fuzzy matched
+    results = cache.get(**cache_args('x.cp', 3, 'cp'))
+    assert [item['label'] for item in results] == ['copy']
+
+    # Cached items are not modified
+    assert cache.items[2] == completion_item('copy')
+
+
+def test_completion_cache_invalidation():
+    """Test the cases where the cache can't answer a request."""
+    cache = CompletionCache()
+    cache.set([completion_item('count')], **cache_args('x.c', 1, 'c'))
+
+    # Same request
+    assert cache.get(**cache_args('x.c', 1, 'c')) is not None
+
+    # A different word
+    assert cache.get(**cache_args('x.c.', 2, '')) is None
+    assert cache.get(**cache_args('x.c + y', 5, 'y')) is None
+
+    # The word doesn't start with the cached one
+    args = cache_args('x.c', 2, 'c')
+    args['word'] = 'o'
+    assert cache.get(**args) is None
+
+    # The document changed before the word
+    assert cache.get(**cache_args('y.co', 3, 'co')) is None
+
+    # Changes were undone
+    cache.set([completion_item('count')], **cache_args('x.c', 3, 'c'))
+    assert cache.get(**cache_args('x.co', 2, 'co')) is None
+
+    # Empty results are not cached
+    cache.set([], **cache_args('x.c', 1, 'c'))
+    assert cache.get(**cache_args('x.c', 1, 'c')) is None
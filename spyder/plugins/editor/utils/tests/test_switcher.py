@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for switcher.py"""
+
+# Standard library imports
+import os.path as osp
+
+# Third party imports
+from qtpy.QtCore import QObject, Signal
+
+# Local imports
+from spyder.plugins.completion.manager.api import SymbolKind
+
+
+class ProjectsMock(QObject):
+    sig_project_symbols_found = Signal(list)
+
+    def __init__(self, project_path):
+        super(ProjectsMock, self).__init__()
+        self.project_path = project_path
+        self.queries = []
+
+    def get_active_project_path(self):
+        return self.project_path
+
+    def request_project_symbols(self, query):
+        self.queries.append(query)
+
+
+def test_project_symbol_switcher(qtbot, mocker, tmpdir):
+    """Test that project symbols are requested and shown in the switcher."""
+    # Local imports need to run tests locally
+    from spyder.plugins.editor.utils.switcher import EditorSwitcherManager
+    from spyder.widgets.switcher import Switcher
+
+    project_path = str(tmpdir)
+    projects = ProjectsMock(project_path)
+    plugin = mocker.Mock()
+    plugin.main.projects = projects
+
+    switcher = Switcher(None, item_styles=None, item_separator_styles=None)
+    qtbot.addWidget(switcher)
+    editorstack = mocker.Mock(data=[])
+    manager = EditorSwitcherManager(  # noqa
+        plugin, switcher, lambda: None, lambda: editorstack)
+
+    switcher.set_search_text('#')
+    assert switcher.get_mode() == '#'
+    assert not projects.queries
+
+    # Symbols are requested when users stop typing
+    switcher.set_search_text('#Test')
+    switcher.set_search_text('#TestCl')
+    assert not projects.queries
+    qtbot.waitUntil(lambda: projects.queries == ['TestCl'])
+
+    path = osp.join(project_path, 'package', 'module.py')
+    symbol_range = {'start': {'line': 8, 'character': 0},
+                    'end': {'line': 10, 'character': 0}}
+    projects.sig_project_symbols_found.emit([
+        {'name': 'TestClass', 'kind': SymbolKind.CLASS, 'containerName': None,
+         'location': {'file': path, 'range': symbol_range}},
+        {'name': 'test_method', 'kind': SymbolKind.METHOD,
+         'containerName': 'TestClass',
+         'location': {'file': path, 'range': symbol_range}},
+    ])
+
+    # Only the symbols that match the search text are shown
+    assert switcher.count() == 1
+    item = switcher.current_item()
+    assert item.get_title() == 'TestClass'
+    assert item.get_description() == osp.join('package', 'module.py') + ':9'
+
+    # Selecting a symbol opens its file at its line
+    switcher.enter()
+    plugin.load.assert_called_once_with(path, goto=9)
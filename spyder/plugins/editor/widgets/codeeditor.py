@@ -20,6 +20,7 @@
 from unicodedata import category
 import logging
 import functools
+import itertools
 import os.path as osp
 import re
 import sre_constants
@@ -65,6 +66,7 @@
                                           ScrollFlagArea)
 from spyder.plugins.editor.utils.editor import (TextHelper, BlockUserData,
                                                 get_file_language)
+from spyder.plugins.editor.utils.completion_cache import CompletionCache
 from spyder.plugins.editor.utils.debugger import DebuggerManager
 from spyder.plugins.editor.utils.kill_ring import QtKillRing
 from spyder.plugins.editor.utils.languages import ALL_LANGUAGES, CELL_LANGUAGES
@@ -297,6 +299,9 @@ def __init__(self, parent=None):
             self._set_completions_hint_idle)
         self.completion_widget.sig_completion_hint.connect(
             self.show_hint_for_completion)
+        self.completion_widget.sig_completion_resolve_requested.connect(
+            self.request_completion_resolve)
+        self._completion_item_to_resolve = None
 
         # Request symbols and folding after a timeout.
         # See: process_diagnostics
@@ -526,6 +531,7 @@ def __init__(self, parent=None):
         self.document_symbols_enabled = False
         self.formatting_characters = []
         self.completion_args = None
+        self.completion_cache = CompletionCache()
         self.folding_supported = False
         self.is_cloned = False
         self.operation_in_progress = False
@@ -1241,45 +1247,59 @@ def _process_code_analysis(self, underline):
             them can't.
         """
         document = self.document()
-        for diagnostic in self._diagnostics:
-            if self.is_ipython() and (
-                    diagnostic["message"] == "undefined name 'get_ipython'"):
-                # get_ipython is defined in IPython files
-                continue
-            source = diagnostic.get('source', '')
-            msg_range = diagnostic['range']
-            start = msg_range['start']
-            end = msg_range['end']
-            code = diagnostic.get('code', 'E')
-            message = diagnostic['message']
-            severity = diagnostic.get(
-                'severity', DiagnosticSeverity.ERROR)
-
-            block = document.findBlockByNumber(start['line'])
+        if underline:
+            first, last = self.get_buffer_block_numbers()
+
+        # Diagnostics are sorted by line by the LSP client, so we can
+        # process the ones for the same block together.
+        diagnostics_per_line = itertools.groupby(
+            self._diagnostics,
+            key=lambda diagnostic: diagnostic['range']['start']['line'])
+
+        for line, diagnostics in diagnostics_per_line:
+            block = document.findBlockByNumber(line)
             data = block.userData()
             if not data:
                 data = BlockUserData(self)
 
-            if underline:
-                block_nb = block.blockNumber()
-                first, last = self.get_buffer_block_numbers()
-
-                if (self.underline_errors_enabled and
-                        first <= block_nb <= last):
-                    error = severity == DiagnosticSeverity.ERROR
-                    color = self.error_color if error else self.warning_color
-                    color = QColor(color)
-                    color.setAlpha(255)
-                    block.color = color
-
-                    data.selection_start = start
-                    data.selection_end = end
+            for diagnostic in diagnostics:
+                if self.is_ipython() and (
+                        diagnostic["message"] ==
+                        "undefined name 'get_ipython'"):
+                    # get_ipython is defined in IPython files
+                    continue
+                source = diagnostic.get('source', '')
+                msg_range = diagnostic['range']
+                start = msg_range['start']
+                end = msg_range['end']
+                code = diagnostic.get('code', 'E')
+                message = diagnostic['message']
+                severity = diagnostic.get(
+                    'severity', DiagnosticSeverity.ERROR)
+
+                if underline:
+                    block_nb = block.blockNumber()
+
+                    if (self.underline_errors_enabled and
+                            first <= block_nb <= last):
+                        error = severity == DiagnosticSeverity.ERROR
+                        color = (self.error_color if error
+                                 else self.warning_color)
+                        color = QColor(color)
+                        color.setAlpha(255)
+                        block.color = color
+
+                        data.selection_start = start
+                        data.selection_end = end
+
+                        self.highlight_selection('code_analysis_underline',
+                                                 data._selection(),
+                                                 underline_color=block.color)
+                else:
+                    data.code_analysis.append(
+                        (source, code, severity, message))
 
-                    self.highlight_selection('code_analysis_underline',
-                                             data._selection(),
-                                             underline_color=block.color)
-            else:
-                data.code_analysis.append((source, code, severity, message))
+            if not underline:
                 block.setUserData(data)
 
     # ------------- LSP: Completion ---------------------------------------
@@ -1301,9 +1321,38 @@ def do_completion(self, automatic=False):
             'selection_end': cursor.selectionEnd(),
             'current_word': current_word
         }
-        self.completion_args = (self.textCursor().position(), automatic)
+
+        # Refilter the last results if they can answer this request
+        cache_args = self.get_completion_cache_args()
+        cached_completions = self.completion_cache.get(**cache_args)
+        if cached_completions is not None:
+            self.completion_args = (cursor.position(), automatic, None)
+            self.process_completion({'params': cached_completions})
+            return
+
+        self.completion_args = (cursor.position(), automatic, cache_args)
         return params
 
+    def get_completion_cache_args(self):
+        """
+        Get the state of the document used to save and look up completions
+        in the cache.
+        """
+        cursor = self.textCursor()
+        line_text = cursor.block().text()
+        column = cursor.positionInBlock()
+        word = re.search(r'\w*$', line_text[:column], re.UNICODE).group()
+        position = cursor.position()
+        return {
+            'version': self.text_version,
+            'line': cursor.blockNumber(),
+            'word_start': position - len(word),
+            'word': word,
+            'position': position,
+            'line_before': line_text[:column - len(word)],
+            'line_after': line_text[column:],
+        }
+
     @handles(LSPRequestTypes.DOCUMENT_COMPLETION)
     def process_completion(self, params):
         """Handle completion response."""
@@ -1311,8 +1360,14 @@ def process_completion(self, params):
         if args is None:
             # This should not happen
             return
-        self.completion_args = None
-        position, automatic = args
+
+        # When streaming, results are sent several times for the same
+        # request as providers return them.
+        streaming = params.get('streaming')
+        if streaming is None or streaming['final']:
+            self.completion_args = None
+        position, automatic, cache_args = args
+        update = streaming is not None and streaming['update']
 
         start_cursor = self.textCursor()
         start_cursor.movePosition(QTextCursor.StartOfBlock)
@@ -1327,6 +1382,15 @@ def process_completion(self, params):
                            [completion for completion in completions
                             if completion.get('insertText')
                             or completion.get('textEdit', {}).get('newText')])
+            if cache_args is not None and self.completion_args is None:
+                # Only save complete results, not the partial ones sent
+                # while streaming.
+                self.completion_cache.set(completions, **cache_args)
+
+            # The completions are changed below, so work on copies to leave
+            # the cached ones untouched.
+            completions = [dict(completion) for completion in completions]
+
             prefix = self.get_current_word(completion=True,
                                            valid_python_variable=False)
             if (len(completions) == 1
@@ -1386,7 +1450,7 @@ def sort_key(completion):
                     completion['insertText'] = reindented_text
 
             self.completion_widget.show_list(
-                completion_list, position, automatic)
+                completion_list, position, automatic, update=update)
 
             self.kite_call_to_action.handle_processed_completions(completions)
         except RuntimeError:
@@ -1397,6 +1461,45 @@ def sort_key(completion):
         except Exception:
             self.log_lsp_handle_errors('Error when processing completions')
 
+    # ------------- LSP: Completion item resolution ------------------------
+    @request(method=LSPRequestTypes.COMPLETION_RESOLVE)
+    def request_completion_resolve(self, item):
+        """Ask for the documentation of a completion item."""
+        if (not self.completions_hint
+                or item is self._completion_item_to_resolve):
+            return
+        self._completion_item_to_resolve = item
+
+        params = {
+            'file': self.filename,
+            'completion_item': {
+                'label': item['label'],
+                'data': item['data']
+            }
+        }
+        return params
+
+    @handles(LSPRequestTypes.COMPLETION_RESOLVE)
+    def handle_completion_resolve(self, params):
+        """Add the documentation of a completion item and show it."""
+        item = self._completion_item_to_resolve
+        self._completion_item_to_resolve = None
+        resolved_item = params['params']
+        if item is None or not resolved_item:
+            return
+
+        try:
+            item['documentation'] = resolved_item.get('documentation') or ''
+            item['resolved'] = True
+            self.completion_widget.refresh_completion_hint(item)
+        except RuntimeError:
+            # This is triggered when a codeeditor instance was removed
+            # before the response can be processed.
+            return
+        except Exception:
+            self.log_lsp_handle_errors(
+                'Error when processing completion item resolution')
+
     # ------------- LSP: Signature Hints ------------------------------------
     @request(method=LSPRequestTypes.DOCUMENT_SIGNATURE)
     def request_signature(self):
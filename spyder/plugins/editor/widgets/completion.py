@@ -60,6 +60,11 @@ class CompletionWidget(QListWidget):
     # QPoint: QPoint where the hint should be shown
     sig_completion_hint = Signal(str, str, QPoint)
 
+    # Signal to request the documentation of the current completion item,
+    # for items whose documentation is computed lazily by their provider.
+    # dict: Completion item
+    sig_completion_resolve_requested = Signal(object)
+
     def __init__(self, parent, ancestor):
         super(CompletionWidget, self).__init__(ancestor)
         self.textedit = parent
@@ -94,8 +99,18 @@ def is_empty(self):
             return True
         return False
 
-    def show_list(self, completion_list, position, automatic):
-        """Show list corresponding to position."""
+    def show_list(self, completion_list, position, automatic, update=False):
+        """
+        Show list corresponding to position.
+
+        If `update` is True, `completion_list` contains more results for
+        the list that is already being displayed, which is refreshed in
+        place instead of being shown again.
+        """
+        if update:
+            self.update_shown_list(completion_list, position)
+            return
+
         if not completion_list:
             self.hide()
             return
@@ -141,14 +156,7 @@ def show_list(self, completion_list, position, automatic):
         self.raise_()
 
         self.textedit.position_widget_at_cursor(self)
-
-        if not self.is_internal_console:
-            tooltip_point = self.rect().topRight()
-            tooltip_point = self.mapToGlobal(tooltip_point)
-
-            if self.completion_list is not None:
-                for completion in self.completion_list:
-                    completion['point'] = tooltip_point
+        self.set_tooltip_point()
 
         # Show hint for first completion element
         self.setCurrentRow(0)
@@ -157,6 +165,52 @@ def show_list(self, completion_list, position, automatic):
         # signal used for testing
         self.sig_show_completions.emit(completion_list)
 
+    def update_shown_list(self, completion_list, position):
+        """
+        Replace the list being displayed with completion_list, keeping the
+        selected item and avoiding to hide and show the widget again.
+        """
+        if (not completion_list or not self.isVisible()
+                or self.is_internal_console
+                or position != self.completion_position):
+            # The widget was closed or moved since the list was shown
+            return
+
+        current_item = self.currentItem()
+        current_label = None
+        if current_item is not None:
+            current_label = current_item.data(Qt.UserRole)['label']
+
+        self.setUpdatesEnabled(False)
+        try:
+            self.completion_list = completion_list
+            self.update_current(new=True)
+            if not self.completion_list:
+                return
+
+            row = 0
+            for i in range(self.count()):
+                if self.item(i).data(Qt.UserRole)['label'] == current_label:
+                    row = i
+                    break
+            self.set_tooltip_point()
+            self.setCurrentRow(row)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # signal used for testing
+        self.sig_show_completions.emit(completion_list)
+
+    def set_tooltip_point(self):
+        """Set the point where completion hints are shown."""
+        if self.is_internal_console or self.completion_list is None:
+            return
+
+        tooltip_point = self.rect().topRight()
+        tooltip_point = self.mapToGlobal(tooltip_point)
+        for completion in self.completion_list:
+            completion['point'] = tooltip_point
+
     def set_language(self, language):
         """Set the completion language."""
         self._language = language.lower()
@@ -457,6 +511,10 @@ def trigger_completion_hint(self, row=None):
         if 'point' not in item:
             return
 
+        if (not item['documentation'] and 'data' in item
+                and not item.get('resolved')):
+            self.sig_completion_resolve_requested.emit(item)
+
         if 'textEdit' in item:
             insert_text = item['textEdit']['newText']
         else:
@@ -479,3 +537,12 @@ def trigger_completion_hint(self, row=None):
     def row_changed(self, row):
         """Set completion hint info and show it."""
         self.trigger_completion_hint(row)
+
+    def refresh_completion_hint(self, item):
+        """Show the hint of item again if it's still the current one."""
+        if not self.isVisible() or not self.completion_list:
+            return
+        row = self.currentRow()
+        if 0 <= row < len(self.completion_list):
+            if self.completion_list[row] is item:
+                self.trigger_completion_hint(row)
@@ -1020,6 +1020,67 @@ def test_text_snippet_completions(snippets_codeeditor, qtbot):
     code_editor.toggle_code_snippets(True)
 
 
+@pytest.mark.slow
+@pytest.mark.first
+@flaky(max_runs=5)
+def test_completion_item_resolve(mock_completions_codeeditor, qtbot):
+    """
+    Test that the documentation of completion items is requested only for
+    the highlighted item when their provider computes it lazily.
+    """
+    code_editor, mock_response = mock_completions_codeeditor
+    completion = code_editor.completion_widget
+    code_editor.toggle_automatic_completions(False)
+    code_editor.toggle_completions_hint(True)
+
+    def response(lang, method, params):
+        if method == LSPRequestTypes.DOCUMENT_COMPLETION:
+            return {'params': [{
+                'kind': CompletionItemKind.FUNCTION,
+                'label': label,
+                'insertText': label,
+                'filterText': label,
+                'sortText': label,
+                'documentation': '',
+                'data': {'doc_uri': 'file:///test.py'},
+                'provider': 'LSP',
+            } for label in ('abs', 'all')]}
+        elif method == LSPRequestTypes.COMPLETION_RESOLVE:
+            label = params['completion_item']['label']
+            return {'params': {'label': label,
+                               'documentation': 'Docs of ' + label}}
+        return None
+
+    mock_response.side_effect = response
+    qtbot.keyClicks(code_editor, 'a')
+    with qtbot.waitSignal(completion.sig_show_completions,
+                          timeout=10000) as sig:
+        qtbot.keyPress(code_editor, Qt.Key_Tab, delay=300)
+
+    # Only the highlighted item is resolved
+    qtbot.waitUntil(lambda: sig.args[0][0]['documentation'] == 'Docs of abs',
+                    timeout=5000)
+    assert sig.args[0][1]['documentation'] == ''
+    resolved = [call[0][2]['completion_item']['label']
+                for call in mock_response.call_args_list
+                if call[0][1] == LSPRequestTypes.COMPLETION_RESOLVE]
+    assert resolved == ['abs']
+
+    # Resolved items are not requested again
+    qtbot.keyPress(completion, Qt.Key_Down)
+    qtbot.keyPress(completion, Qt.Key_Up)
+    qtbot.waitUntil(lambda: sig.args[0][1]['documentation'] == 'Docs of all',
+                    timeout=5000)
+    resolved = [call[0][2]['completion_item']['label']
+                for call in mock_response.call_args_list
+                if call[0][1] == LSPRequestTypes.COMPLETION_RESOLVE]
+    assert resolved == ['abs', 'all']
+
+    mock_response.side_effect = None
+    qtbot.keyPress(completion, Qt.Key_Escape)
+    code_editor.toggle_automatic_completions(True)
+
+
 @pytest.mark.slow
 @pytest.mark.first
 @flaky(max_runs=5)
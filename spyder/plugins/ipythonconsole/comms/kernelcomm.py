@@ -139,14 +139,18 @@ def open_comm(self, kernel_client):
         self._register_comm(
             # Create new comm and send the highest protocol
             kernel_client.comm_manager.new_comm(self._comm_name, data={
-                'pickle_protocol': pickle.HIGHEST_PROTOCOL}))
+                'pickle_protocol': pickle.HIGHEST_PROTOCOL,
+                'compressions': self.compressions,
+                'capabilities': self.capabilities}))
 
     def remote_call(self, interrupt=False, blocking=False, callback=None,
-                    comm_id=None, timeout=None, display_error=False):
+                    comm_id=None, timeout=None, display_error=False,
+                    future=False):
         """Get a handler for remote calls."""
         return super(KernelComm, self).remote_call(
             interrupt=interrupt, blocking=blocking, callback=callback,
-            comm_id=comm_id, timeout=timeout, display_error=display_error)
+            comm_id=comm_id, timeout=timeout, display_error=display_error,
+            future=future)
 
     # ---- Private -----
     def on_incoming_call(self, call_dict):
@@ -205,6 +209,21 @@ def _get_call_return_value(self, call_dict, call_data, comm_id):
                 )
                 return
 
+    def _send_call_batch(self, comm_id, call_dicts, call_data):
+        """
+        Send the batch through the comm channel if any of its calls
+        needs to interrupt the kernel.
+        """
+        interrupt = False
+        for call_dict in call_dicts:
+            settings = call_dict['settings']
+            interrupt = (interrupt or settings.get('interrupt', False) or
+                         settings.get('blocking', False))
+        queue_message = not (interrupt and self.comm_channel_connected())
+        with self.comm_channel_manager(comm_id, queue_message=queue_message):
+            super(KernelComm, self)._send_call_batch(
+                comm_id, call_dicts, call_data)
+
     def _wait_reply(self, call_id, call_name, timeout):
         """Wait for the other side reply."""
 
@@ -11,13 +11,19 @@
 
 # Standard library imports
 import os
+import sys
+import threading
 
 # Test imports
+import numpy as np
 import pytest
 
 
 # Local imports
 from spyder_kernels.utils.test_utils import get_kernel
+from spyder_kernels.comms import commbase
+from spyder_kernels.comms.commbase import (
+    CommError, pickle_data, unpickle_data)
 from spyder_kernels.comms.frontendcomm import FrontendComm
 from spyder.plugins.ipythonconsole.comms.kernelcomm import KernelComm
 
@@ -117,8 +123,9 @@ class DummyKernelClient():
     kernel_comm._register_comm(commA)
 
     # Bypass the target system as this is not what is being tested
-    frontend_comm._comm_open(commB,
-                             {'content': {'data': {'pickle_protocol': 2}}})
+    frontend_comm._comm_open(commB, {'content': {'data': {
+        'pickle_protocol': 2,
+        'capabilities': kernel_comm.capabilities}}})
 
     return (kernel_comm, frontend_comm)
 
@@ -181,5 +188,224 @@ def handler(a, b):
     assert res == 'ab'
 
 
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_request_batch(comms):
+    """Test that the calls made in a batch are sent in one message."""
+    kernel_comm, frontend_comm = comms
+    calls = []
+
+    def handler(value):
+        calls.append(value)
+        return value
+
+    kernel_comm.register_call_handler('test_request', handler)
+
+    # Both sides send the capabilities they support when connecting
+    for comm in (kernel_comm, frontend_comm):
+        assert comm._comms[1]['capabilities'] == commbase.CAPABILITIES
+
+    sent_messages = []
+    comm = frontend_comm._comms[1]['comm']
+    send = comm.send
+
+    def send_logged(msg_dict, buffers=None):
+        sent_messages.append(msg_dict['spyder_msg_type'])
+        send(msg_dict, buffers=buffers)
+
+    comm.send = send_logged
+    with frontend_comm.batch():
+        frontend_comm.remote_call().test_request(1)
+        frontend_comm.remote_call().test_request(2)
+        assert calls == []
+    assert calls == [1, 2]
+    assert sent_messages == ['remote_call_batch']
+
+    # Blocking calls send the batch right away
+    with frontend_comm.batch():
+        frontend_comm.remote_call().test_request(3)
+        res = frontend_comm.remote_call(blocking=True).test_request(4)
+        assert res == 4
+        assert calls == [1, 2, 3, 4]
+        frontend_comm.remote_call().test_request(5)
+    assert calls == [1, 2, 3, 4, 5]
+    assert sent_messages == ['remote_call_batch', 'remote_call_batch',
+                             'remote_call']
+
+    # The calls are sent one by one if the other side can't handle batches
+    frontend_comm._comms[1]['capabilities'] = []
+    del sent_messages[:]
+    with frontend_comm.batch():
+        frontend_comm.remote_call().test_request(6)
+        frontend_comm.remote_call().test_request(7)
+    assert calls == [1, 2, 3, 4, 5, 6, 7]
+    assert sent_messages == ['remote_call', 'remote_call']
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_request_future(comms):
+    """Test getting the replies of calls with futures."""
+    kernel_comm, frontend_comm = comms
+
+    def handler(a, b):
+        if b is None:
+            raise ValueError('No b')
+        return a + b
+
+    kernel_comm.register_call_handler('test_request', handler)
+
+    future = frontend_comm.remote_call(future=True).test_request('a', 'b')
+    assert future.done()
+    assert future.result() == 'ab'
+    done = []
+    future.add_done_callback(done.append)
+    assert done == [future]
+
+    # The replies are not left in the inbox if the result is never asked
+    frontend_comm.remote_call(future=True).test_request('a', 'b')
+    assert frontend_comm._reply_inbox == {}
+
+    # Errors are raised when getting the result
+    future = frontend_comm.remote_call(future=True).test_request('a', None)
+    with pytest.raises(ValueError):
+        future.result()
+
+    # The replies of calls sent in a batch arrive when it's sent
+    with frontend_comm.batch():
+        future = frontend_comm.remote_call(future=True).test_request('c', 'd')
+        assert not future.done()
+    assert future.done()
+    assert future.result() == 'cd'
+
+    # Cancelled calls stop waiting for the reply, which is then ignored
+    with frontend_comm.batch():
+        future = frontend_comm.remote_call(future=True).test_request('e', 'f')
+        future.add_done_callback(done.append)
+        assert future.cancel()
+        assert future.cancelled()
+        assert done[-1] is future
+        assert frontend_comm._reply_waitlist == {}
+        assert frontend_comm._reply_futures == {}
+    assert frontend_comm._reply_inbox == {}
+    with pytest.raises(CommError):
+        future.result()
+    assert not frontend_comm.remote_call(
+        future=True).test_request('a', 'b').cancel()
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_wait_until(comms):
+    """Test that the kernel waits until a message changes a condition."""
+    kernel_comm, frontend_comm = comms
+    frontend_comm.comm_socket_thread = None
+    received = []
+    frontend_comm._register_message_handler(
+        'test_message', lambda msg_dict, buffer: received.append(buffer))
+
+    timer = threading.Timer(
+        0.1, kernel_comm._send_message, args=('test_message',),
+        kwargs={'data': 'data'})
+    timer.start()
+    assert frontend_comm.wait_until(lambda: received, timeout=5)
+    assert received == ['data']
+    assert not frontend_comm.wait_until(lambda: len(received) > 1,
+                                        timeout=0.1)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8),
+                    reason="Pickle protocol 5 requires Python 3.8+")
+def test_pickle_out_of_band_buffers():
+    """Test that big arrays are sent out of the pickle with protocol 5."""
+    data = {'big': np.arange(1e5), 'small': np.arange(10)}
+    buffers = pickle_data(data, 2, out_of_band=True)
+    assert len(buffers) == 1
+
+    # Only if the other side can load them
+    buffers = pickle_data(data, 5)
+    assert len(buffers) == 1
+
+    buffers = pickle_data(data, 5, out_of_band=True)
+    assert len(buffers) == 2
+    assert buffers[1].nbytes == data['big'].nbytes
+
+    # Buffers arrive as bytes through ZMQ
+    value = unpickle_data([bytes(buffer) for buffer in buffers])
+    assert np.array_equal(value['big'], data['big'])
+    assert np.array_equal(value['small'], data['small'])
+    assert value['big'].flags.writeable
+
+    # Non-contiguous arrays are kept in the pickle
+    buffers = pickle_data(data['big'][::2], 5, out_of_band=True)
+    assert len(buffers) == 1
+    assert np.array_equal(unpickle_data(buffers), data['big'][::2])
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+@pytest.mark.skipif(sys.version_info < (3, 8),
+                    reason="Pickle protocol 5 requires Python 3.8+")
+def test_request_out_of_band_buffers(comms):
+    """Test calls with arrays after agreeing on pickle protocol 5."""
+    kernel_comm, frontend_comm = comms
+    for comm in (kernel_comm, frontend_comm):
+        comm._comms[1]['pickle_protocol'] = 5
+
+    def handler(arr):
+        return arr * 2
+
+    kernel_comm.register_call_handler('test_request', handler)
+
+    sent_buffers = []
+    comm = kernel_comm._comms[1]['comm']
+    send = comm.send
+
+    def send_logged(msg_dict, buffers=None):
+        sent_buffers.append(len(buffers))
+        send(msg_dict, buffers=buffers)
+
+    comm.send = send_logged
+    arr = np.arange(1e5).reshape(100, 1000)
+    res = frontend_comm.remote_call(blocking=True).test_request(arr)
+
+    assert np.array_equal(res, arr * 2)
+    assert sent_buffers == [2]
+
+    # Other sides that can't load the buffers get them in the pickle
+    frontend_comm.capabilities = ['batch_calls']
+    res = frontend_comm.remote_call(blocking=True).test_request(arr)
+    assert np.array_equal(res, arr * 2)
+    assert sent_buffers == [2, 1]
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_request_compression(comms):
+    """Test that big buffers are compressed after agreeing on it."""
+    kernel_comm, frontend_comm = comms
+
+    # The compressions of the kernel are sent when the comm is opened
+    assert kernel_comm._comms[1]['compression'] == commbase.COMPRESSIONS[0]
+
+    def handler(value):
+        return value
+
+    kernel_comm.register_call_handler('test_request', handler)
+
+    value = 'a' * commbase.COMPRESSION_MIN_SIZE
+    res = frontend_comm.remote_call(blocking=True).test_request(value)
+    assert res == value
+    stats = kernel_comm.get_compression_stats()
+    assert len(stats) == 1
+    assert stats[0]['direction'] == 'sent'
+    assert stats[0]['spyder_msg_type'] == 'remote_call_reply'
+    assert stats[0]['compressed_size'] < stats[0]['raw_size']
+    stats = frontend_comm.get_compression_stats()
+    assert [stat['direction'] for stat in stats] == ['received']
+
+    # Compression is not used if one side can't use it
+    frontend_comm.compressions = []
+    res = frontend_comm.remote_call(blocking=True).test_request(value)
+    assert res == value
+    assert kernel_comm._comms[1]['compression'] is None
+    assert len(kernel_comm.get_compression_stats()) == 1
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1549,8 +1549,9 @@ def connect_external_kernel(self, shellwidget):
 
         if self.main.variableexplorer is not None:
             self.main.variableexplorer.add_shellwidget(sw)
-            sw.set_namespace_view_settings()
-            sw.refresh_namespacebrowser()
+            with sw.spyder_kernel_comm.batch():
+                sw.set_namespace_view_settings()
+                sw.refresh_namespacebrowser()
             kc.stopped_channels.connect(lambda :
                 self.main.variableexplorer.remove_shellwidget(id(sw)))
 
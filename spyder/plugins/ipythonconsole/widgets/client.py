@@ -335,11 +335,13 @@ def _when_prompt_is_ready(self):
         # To hide the loading page
         self._hide_loading_page()
 
-        # Show possible errors when setting Matplotlib backend
-        self._show_mpl_backend_errors()
+        # Send both checks to the kernel in a single message
+        with self.shellwidget.spyder_kernel_comm.batch():
+            # Show possible errors when setting Matplotlib backend
+            self._show_mpl_backend_errors()
 
-        # To show if special console is valid
-        self._check_special_console_error()
+            # To show if special console is valid
+            self._check_special_console_error()
 
         self.shellwidget.sig_prompt_ready.disconnect(
             self._when_prompt_is_ready)
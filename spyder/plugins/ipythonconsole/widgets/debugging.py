@@ -413,7 +413,9 @@ def refresh_from_pdb(self, pdb_state):
             if (fname, lineno) != last_pdb_loc:
                 self.sig_pdb_step.emit(fname, lineno)
 
-        if 'namespace_view' in pdb_state:
+        if 'namespace_snapshot' in pdb_state:
+            self.set_namespace_snapshot(pdb_state['namespace_snapshot'])
+        elif 'namespace_view' in pdb_state:
             self.set_namespace_view(pdb_state['namespace_view'])
 
         if 'var_properties' in pdb_state:
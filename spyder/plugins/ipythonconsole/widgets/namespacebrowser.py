@@ -61,18 +61,36 @@ def refresh_namespacebrowser(self, interrupt=True):
         if self.namespacebrowser:
             self.call_kernel(
                 interrupt=interrupt,
-                callback=self.set_namespace_view
-            ).get_namespace_view()
-            self.call_kernel(
-                interrupt=interrupt,
-                callback=self.set_var_properties
-            ).get_var_properties()
+                callback=self.set_namespace_snapshot
+            ).get_namespace_snapshot(
+                self.namespacebrowser.namespace_view_state)
 
     def set_namespace_view(self, view):
         """Set the current namespace view."""
         if self.namespacebrowser is not None:
             self.namespacebrowser.process_remote_view(view)
 
+    def set_namespace_snapshot(self, snapshot):
+        """
+        Apply the changes of the namespace view and variable properties
+        since the current snapshot.
+        """
+        if self.namespacebrowser is None or snapshot is None:
+            return
+        if not self.namespacebrowser.process_namespace_snapshot(snapshot):
+            # Get the whole snapshot if the current one is not the last
+            # one sent by the kernel.
+            self.call_kernel(
+                interrupt=True,
+                callback=self.set_namespace_snapshot
+            ).get_namespace_snapshot()
+        elif snapshot['pending']:
+            # Get the variables the kernel didn't have time to send
+            self.call_kernel(
+                interrupt=True,
+                callback=self.set_namespace_snapshot
+            ).get_namespace_snapshot(snapshot['state'], pending_only=True)
+
     def set_var_properties(self, properties):
         """Set var properties."""
         if self.namespacebrowser is not None:
@@ -114,6 +132,78 @@ def get_value(self, name):
         except Exception:
             raise ValueError(msg % reason_other)
 
+    def open_data_view(self, name):
+        """
+        Open a paged view of a variable in the kernel and return its
+        information.
+        """
+        return self.call_kernel(
+            blocking=True,
+            timeout=CALL_KERNEL_TIMEOUT).open_data_view(name)
+
+    def open_data_subview(self, view_id, row):
+        """
+        Open a paged view of the item in a row of a collection opened with
+        open_data_view and return its information.
+        """
+        return self.call_kernel(
+            blocking=True,
+            timeout=CALL_KERNEL_TIMEOUT).open_data_subview(view_id, row)
+
+    def get_data_view_page(self, view_id, *args):
+        """Get a page of a view opened with open_data_view."""
+        return self.call_kernel(
+            blocking=True,
+            timeout=CALL_KERNEL_TIMEOUT).get_data_view_page(view_id, *args)
+
+    def request_data_view_page(self, view_id, *args):
+        """
+        Request a page of a view opened with open_data_view without waiting
+        for it, and return a future to get it.
+
+        The future is None if the kernel is not connected.
+        """
+        return self.call_kernel(
+            interrupt=True,
+            future=True,
+            timeout=CALL_KERNEL_TIMEOUT).get_data_view_page(view_id, *args)
+
+    def get_data_view_item(self, view_id, row):
+        """
+        Get the value of the item in a row of a collection opened with
+        open_data_view.
+        """
+        return self.call_kernel(
+            blocking=True,
+            display_error=True,
+            timeout=CALL_KERNEL_TIMEOUT).get_data_view_item(view_id, row)
+
+    def sort_data_view(self, view_id, column, ascending):
+        """
+        Sort a view opened with open_data_view and return its new
+        information.
+        """
+        return self.call_kernel(
+            blocking=True,
+            timeout=CALL_KERNEL_TIMEOUT).sort_data_view(
+                view_id, column, ascending)
+
+    def filter_data_view(self, view_id, query, column, value):
+        """
+        Filter a view opened with open_data_view and return its new
+        information.
+        """
+        return self.call_kernel(
+            blocking=True,
+            timeout=CALL_KERNEL_TIMEOUT).filter_data_view(
+                view_id, query=query, column=column, value=value)
+
+    def close_data_view(self, view_id):
+        """Close a view opened with open_data_view."""
+        if self.kernel_client is None:
+            return
+        self.call_kernel(blocking=False).close_data_view(view_id)
+
     def set_value(self, name, value):
         """Set value for a variable"""
         self.call_kernel(
@@ -197,8 +287,9 @@ def _handle_execute_reply(self, msg):
         exec_count = msg['content'].get('execution_count', '')
         if exec_count == 0 and self._kernel_is_starting:
             if self.namespacebrowser is not None:
-                self.set_namespace_view_settings()
-                self.refresh_namespacebrowser(interrupt=False)
+                with self.spyder_kernel_comm.batch():
+                    self.set_namespace_view_settings()
+                    self.refresh_namespacebrowser(interrupt=False)
             self._kernel_is_starting = False
             self.ipyclient.t0 = time.monotonic()
 
@@ -230,8 +321,9 @@ def _handle_status(self, msg):
         elif state == 'idle' and msg_type == 'shutdown_request':
             # This handles restarts asked by the user
             if self.namespacebrowser is not None:
-                self.set_namespace_view_settings()
-                self.refresh_namespacebrowser(interrupt=False)
+                with self.spyder_kernel_comm.batch():
+                    self.set_namespace_view_settings()
+                    self.refresh_namespacebrowser(interrupt=False)
             self.ipyclient.t0 = time.monotonic()
         else:
             super(NamepaceBrowserWidget, self)._handle_status(msg)
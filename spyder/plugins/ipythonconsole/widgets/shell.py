@@ -78,6 +78,10 @@ def __init__(self, ipyclient, additional_options, interpreter_versions,
         self.spyder_kernel_comm = KernelComm()
         self.spyder_kernel_comm.sig_exception_occurred.connect(
             self.sig_exception_occurred)
+        if not external_kernel:
+            # Kernels started by Spyder run in this machine, so it's faster
+            # to send their data uncompressed
+            self.spyder_kernel_comm.compressions = []
         super(ShellWidget, self).__init__(*args, **kw)
 
         self.ipyclient = ipyclient
@@ -169,7 +173,7 @@ def will_close(self, externally_managed):
         super(ShellWidget, self).will_close(externally_managed)
 
     def call_kernel(self, interrupt=False, blocking=False, callback=None,
-                    timeout=None, display_error=False):
+                    timeout=None, display_error=False, future=False):
         """
         Send message to Spyder kernel connected to this console.
 
@@ -191,13 +195,17 @@ def call_kernel(self, interrupt=False, blocking=False, callback=None,
             used.
         display_error: bool
             If an error occurs, should it be printed to the console.
+        future: bool
+            Return a future to get the response later, instead of waiting
+            for it.
         """
         return self.spyder_kernel_comm.remote_call(
             interrupt=interrupt,
             blocking=blocking,
             callback=callback,
             timeout=timeout,
-            display_error=display_error
+            display_error=display_error,
+            future=future
         )
 
     def set_kernel_client_and_manager(self, kernel_client, kernel_manager):
@@ -78,6 +78,18 @@ class Projects(SpyderPluginWidget):
         Package to install. Currently not in use.
     """
 
+    sig_project_symbols_found = Signal(list)
+    """
+    This signal is emitted when the symbols of the current project that
+    match a query are received from the completion servers.
+
+    Parameters
+    ----------
+    symbols: list
+        LSP symbol information of each symbol, with the path of the file
+        that defines it in `location['file']`.
+    """
+
     sig_project_loaded = Signal(object)
     sig_project_closed = Signal(object)
     sig_pythonpath_changed = Signal()
@@ -755,6 +767,23 @@ def notify_project_close(self, path):
         }
         return params
 
+    @request(method=LSPRequestTypes.WORKSPACE_SYMBOL,
+             requires_response=True)
+    def request_project_symbols(self, query):
+        """Ask LSP servers for the project symbols that match a query."""
+        if self.current_active_project is None:
+            return
+
+        params = {
+            'query': query
+        }
+        return params
+
+    @handles(LSPRequestTypes.WORKSPACE_SYMBOL)
+    def handle_project_symbols(self, params):
+        """Handle the project symbols found by LSP servers."""
+        self.sig_project_symbols_found.emit(params['params'])
+
     @handles(LSPRequestTypes.WORKSPACE_APPLY_EDIT)
     @request(method=LSPRequestTypes.WORKSPACE_APPLY_EDIT,
              requires_response=False)
@@ -15,6 +15,10 @@
 
 # Standard library imports
 from __future__ import print_function
+from collections import OrderedDict
+from functools import partial
+import logging
+import time
 
 # Third party imports
 import numpy as np
@@ -42,6 +46,9 @@
 from spyder.utils.qthelpers import add_actions, create_action, keybinding
 from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
 
+
+logger = logging.getLogger(__name__)
+
 # Note: string and unicode data types will be formatted with '%s' (see below)
 SUPPORTED_FORMATS = {
                      'single': '%.6g',
@@ -91,6 +98,12 @@
 LARGE_NROWS = 1e5
 LARGE_COLS = 60
 
+# Number of pages of a remote array kept in memory
+MAX_CACHED_PAGES = 32
+
+# Seconds to wait for a page before requesting it again
+PAGE_REQUEST_TIMEOUT = 30
+
 
 #==============================================================================
 # Utility functions
@@ -130,11 +143,13 @@ def __init__(self, data, format="%.6g", xlabels=None, ylabels=None,
         self.xlabels = xlabels
         self.ylabels = ylabels
         self.readonly = readonly
-        self.test_array = np.array([0], dtype=data.dtype)
+        self._data = data
+        self._format = format
+        self.test_array = np.array([0], dtype=self.dtype)
 
         # for complex numbers, shading will be based on absolute value
         # but for all other types it will be the real part
-        if data.dtype in (np.complex64, np.complex128):
+        if self.dtype in (np.complex64, np.complex128):
             self.color_func = np.abs
         else:
             self.color_func = np.real
@@ -145,16 +160,12 @@ def __init__(self, data, format="%.6g", xlabels=None, ylabels=None,
         self.val = 1. # Value
         self.alp = .6 # Alpha-channel
 
-        self._data = data
-        self._format = format
-
-        self.total_rows = self._data.shape[0]
-        self.total_cols = self._data.shape[1]
+        self.total_rows = self.shape[0]
+        self.total_cols = self.shape[1]
         size = self.total_rows * self.total_cols
 
         try:
-            self.vmin = np.nanmin(self.color_func(data))
-            self.vmax = np.nanmax(self.color_func(data))
+            self.vmin, self.vmax = self.get_min_max()
             if self.vmax == self.vmin:
                 self.vmin -= 1
             self.hue0 = huerange[0]
@@ -169,12 +180,10 @@ def __init__(self, data, format="%.6g", xlabels=None, ylabels=None,
 
         # Array with infinite values cannot display background colors and
         # crashes. See: spyder-ide/spyder#8093
-        self.has_inf = False
-        if data.dtype.kind in ['f', 'c']:
-            self.has_inf = np.any(np.isinf(data))
+        self.has_inf = self.get_has_inf()
 
         # Deactivate coloring for object arrays or arrays with inf values
-        if self._data.dtype.name == 'object' or self.has_inf:
+        if self.dtype.name == 'object' or self.has_inf:
             self.bgcolor_enabled = False
 
         # Use paging when the total size, number of rows or number of
@@ -192,6 +201,27 @@ def __init__(self, data, format="%.6g", xlabels=None, ylabels=None,
             else:
                 self.cols_loaded = self.total_cols
 
+    @property
+    def dtype(self):
+        """Return the dtype of the array."""
+        return self._data.dtype
+
+    @property
+    def shape(self):
+        """Return the shape of the array."""
+        return self._data.shape
+
+    def get_min_max(self):
+        """Return the minimum and maximum of the values used to color them."""
+        values = self.color_func(self._data)
+        return np.nanmin(values), np.nanmax(values)
+
+    def get_has_inf(self):
+        """Return whether the array has infinite values."""
+        if self.dtype.kind in ['f', 'c']:
+            return np.any(np.isinf(self._data))
+        return False
+
     def get_format(self):
         """Return current format"""
         # Avoid accessing the private attribute _format from outside
@@ -201,6 +231,13 @@ def get_data(self):
         """Return data"""
         return self._data
 
+    def get_values(self, rows, columns):
+        """
+        Return the values between the (start, stop) pairs of rows and
+        columns.
+        """
+        return self._data[rows[0]:rows[1], columns[0]:columns[1]]
+
     def set_format(self, format):
         """Change display format"""
         self._format = format
@@ -267,7 +304,7 @@ def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return to_qvariant()
         value = self.get_value(index)
-        dtn = self._data.dtype.name
+        dtn = self.dtype.name
 
         # Tranform binary string to unicode so they are displayed
         # correctly
@@ -316,7 +353,7 @@ def setData(self, index, value, role=Qt.EditRole):
         i = index.row()
         j = index.column()
         value = from_qvariant(value, str)
-        dtype = self._data.dtype.name
+        dtype = self.dtype.name
         if dtype == "bool":
             try:
                 val = bool(float(value))
@@ -382,6 +419,144 @@ def reset(self):
         self.endResetModel()
 
 
+class RemoteArrayModel(ArrayModel):
+    """
+    Read-only model of an array that stays in the kernel.
+
+    The values are got from the kernel in pages of ROWS_TO_LOAD rows and
+    COLS_TO_LOAD columns when they're shown, and the last
+    MAX_CACHED_PAGES pages are kept in memory. The pages are requested
+    without waiting for them, and their cells are updated when they
+    arrive.
+
+    `info` is the information returned by the kernel when opening a view
+    of the array, and `view` has the get_page method of the views of
+    spyder_kernels.utils.dataviews and calls it in the kernel, plus
+    request_page to get a future of a page. For 3D arrays, the model shows
+    the slice at `index` in `axis`.
+    """
+
+    def __init__(self, info, view, format="%.6g", axis=None, index=None,
+                 parent=None):
+        self._info = info
+        self._view = view
+        self._axis = axis
+        self._index = index
+        self._pages = OrderedDict()
+        # Futures of the pages requested to the kernel, and when
+        self._requested_pages = {}
+        ArrayModel.__init__(self, None, format=format, readonly=True,
+                            parent=parent)
+
+    @property
+    def dtype(self):
+        """Return the dtype of the array."""
+        return np.dtype(self._info['dtype'])
+
+    @property
+    def shape(self):
+        """Return the shape of the slice of the array that is shown."""
+        shape = tuple(self._info['shape'])
+        if len(shape) == 0:
+            return (1, 1)
+        elif len(shape) == 1:
+            return (shape[0], 1)
+        elif len(shape) == 3:
+            return shape[:self._axis] + shape[self._axis + 1:]
+        return shape
+
+    def get_min_max(self):
+        """Return the minimum and maximum computed by the kernel."""
+        if self._info['min_max'] is None:
+            raise ValueError("The array is too big to color its values")
+        return tuple(self._info['min_max'])
+
+    def get_has_inf(self):
+        """Return whether the kernel found infinite values."""
+        return self._info['has_inf']
+
+    def get_values(self, rows, columns):
+        """
+        Return the values between the (start, stop) pairs of rows and
+        columns.
+        """
+        return self._view.get_page(rows, columns, self._axis, self._index)
+
+    def page(self, row, column):
+        """
+        Return the page with the given cell if it's in memory, or None
+        after requesting it to the kernel if it's not.
+        """
+        key = (row // self.ROWS_TO_LOAD, column // self.COLS_TO_LOAD)
+        if key in self._pages:
+            page = self._pages.pop(key)
+            self._pages[key] = page
+            return page
+        if key in self._requested_pages:
+            future, requested = self._requested_pages[key]
+            if time.monotonic() - requested < PAGE_REQUEST_TIMEOUT:
+                return None
+            # No reply, e.g. because the kernel died, so it's asked again
+            future.cancel()
+        self._request_page(key)
+        return None
+
+    def _request_page(self, key):
+        """Request a page to the kernel without waiting for it."""
+        rows = (key[0] * self.ROWS_TO_LOAD, (key[0] + 1) * self.ROWS_TO_LOAD)
+        columns = (key[1] * self.COLS_TO_LOAD,
+                   (key[1] + 1) * self.COLS_TO_LOAD)
+        try:
+            future = self._view.request_page(rows, columns, self._axis,
+                                             self._index)
+        except Exception:
+            logger.debug("Failed to request page %s of a remote array",
+                         key, exc_info=True)
+            return
+        if future is None:
+            # The comm is closed
+            return
+        # The callback is called right away if the page is already there
+        self._requested_pages[key] = (future, time.monotonic())
+        future.add_done_callback(partial(self._page_received, key))
+
+    def _page_received(self, key, future):
+        """Keep a page got from the kernel and update its cells."""
+        self._requested_pages.pop(key, None)
+        try:
+            page = future.result()
+        except Exception:
+            # Not kept, to request it again the next time it's shown
+            logger.debug("Failed to get page %s of a remote array",
+                         key, exc_info=True)
+            return
+        if len(self._pages) >= MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        self._pages[key] = page
+
+        first_row = key[0] * self.ROWS_TO_LOAD
+        first_column = key[1] * self.COLS_TO_LOAD
+        last_row = min(first_row + self.ROWS_TO_LOAD, self.rowCount()) - 1
+        last_column = min(first_column + self.COLS_TO_LOAD,
+                          self.columnCount()) - 1
+        if last_row < first_row or last_column < first_column:
+            return
+        try:
+            self.dataChanged.emit(self.index(first_row, first_column),
+                                  self.index(last_row, last_column))
+        except RuntimeError:
+            # The editor was closed before the page arrived
+            pass
+
+    def get_value(self, index):
+        i = index.row()
+        j = index.column()
+        page = self.page(i, j)
+        if page is None:
+            return np.ma.masked
+        return page[i % self.ROWS_TO_LOAD, j % self.COLS_TO_LOAD]
+
+
 class ArrayDelegate(QItemDelegate):
     """Array Editor Item Delegate"""
     def __init__(self, dtype, parent=None):
@@ -395,7 +570,7 @@ def createEditor(self, parent, option, index):
         if type(value) == np.ndarray or model.readonly:
             # The editor currently cannot properly handle this case
             return
-        elif model._data.dtype.name == "bool":
+        elif model.dtype.name == "bool":
             value = not value
             model.setData(index, to_qvariant(value))
             return
@@ -555,14 +730,15 @@ def _sel_to_text(self, cell_range):
         if row_min == 0 and row_max == (self.model().rows_loaded-1):
             row_max = self.model().total_rows-1
 
-        _data = self.model().get_data()
         if PY3:
             output = io.BytesIO()
         else:
             output = io.StringIO()
         try:
-            np.savetxt(output, _data[row_min:row_max+1, col_min:col_max+1],
-                       delimiter='\t', fmt=self.model().get_format())
+            _data = self.model().get_values((row_min, row_max + 1),
+                                            (col_min, col_max + 1))
+            np.savetxt(output, _data, delimiter='\t',
+                       fmt=self.model().get_format())
         except:
             QMessageBox.warning(self, _("Warning"),
                                 _("It was not possible to copy values for "
@@ -583,27 +759,30 @@ def copy(self):
 class ArrayEditorWidget(QWidget):
 
     def __init__(self, parent, data, readonly=False,
-                 xlabels=None, ylabels=None):
+                 xlabels=None, ylabels=None, model=None):
         QWidget.__init__(self, parent)
         self.data = data
         self.old_data_shape = None
-        if len(self.data.shape) == 1:
-            self.old_data_shape = self.data.shape
-            self.data.shape = (self.data.shape[0], 1)
-        elif len(self.data.shape) == 0:
-            self.old_data_shape = self.data.shape
-            self.data.shape = (1, 1)
-
-        format = SUPPORTED_FORMATS.get(data.dtype.name, '%s')
-        self.model = ArrayModel(self.data, format=format, xlabels=xlabels,
-                                ylabels=ylabels, readonly=readonly, parent=self)
-        self.view = ArrayView(self, self.model, data.dtype, data.shape)
+        if model is None:
+            if len(self.data.shape) == 1:
+                self.old_data_shape = self.data.shape
+                self.data.shape = (self.data.shape[0], 1)
+            elif len(self.data.shape) == 0:
+                self.old_data_shape = self.data.shape
+                self.data.shape = (1, 1)
+
+            format = SUPPORTED_FORMATS.get(data.dtype.name, '%s')
+            model = ArrayModel(self.data, format=format, xlabels=xlabels,
+                               ylabels=ylabels, readonly=readonly,
+                               parent=self)
+        self.model = model
+        self.view = ArrayView(self, self.model, model.dtype, model.shape)
 
         btn_layout = QHBoxLayout()
         btn_layout.setAlignment(Qt.AlignLeft)
         btn = QPushButton(_( "Format"))
         # disable format button for int type
-        btn.setEnabled(is_float(data.dtype))
+        btn.setEnabled(is_float(model.dtype))
         btn_layout.addWidget(btn)
         btn.clicked.connect(self.change_format)
         btn = QPushButton(_( "Resize"))
@@ -660,6 +839,9 @@ def __init__(self, parent=None):
         self.setAttribute(Qt.WA_DeleteOnClose)
 
         self.data = None
+        self.data_shape = None
+        self.remote_info = None
+        self.remote_view = None
         self.arraywidget = None
         self.stack = None
         self.layout = None
@@ -676,6 +858,7 @@ def setup_and_check(self, data, title='', readonly=False,
         return False if data is not supported, True otherwise
         """
         self.data = data
+        self.data_shape = data.shape
         readonly = readonly or not self.data.flags.writeable
         is_record_array = data.dtype.names is not None
         is_masked_array = isinstance(data, np.ma.MaskedArray)
@@ -709,16 +892,7 @@ def setup_and_check(self, data, title='', readonly=False,
                 self.error(_("%s are currently not supported") % arr)
                 return False
 
-        self.layout = QGridLayout()
-        self.setLayout(self.layout)
-        self.setWindowIcon(ima.icon('arredit'))
-        if title:
-            title = to_text_string(title) + " - " + _("NumPy object array")
-        else:
-            title = _("Array editor")
-        if readonly:
-            title += ' (' + _('read only') + ')'
-        self.setWindowTitle(title)
+        self._setup_window(title, readonly)
 
         # Stack widget
         self.stack = QStackedWidget(self)
@@ -764,27 +938,7 @@ def setup_and_check(self, data, title='', readonly=False,
             else:
                 names = [_('Masked data'), _('Data'), _('Mask')]
             if data.ndim == 3:
-                # QSpinBox
-                self.index_spin = QSpinBox(self, keyboardTracking=False)
-                self.index_spin.valueChanged.connect(self.change_active_widget)
-                # QComboBox
-                names = [str(i) for i in range(3)]
-                ra_combo = QComboBox(self)
-                ra_combo.addItems(names)
-                ra_combo.currentIndexChanged.connect(self.current_dim_changed)
-                # Adding the widgets to layout
-                label = QLabel(_("Axis:"))
-                btn_layout.addWidget(label)
-                btn_layout.addWidget(ra_combo)
-                self.shape_label = QLabel()
-                btn_layout.addWidget(self.shape_label)
-                label = QLabel(_("Index:"))
-                btn_layout.addWidget(label)
-                btn_layout.addWidget(self.index_spin)
-                self.slicing_label = QLabel()
-                btn_layout.addWidget(self.slicing_label)
-                # set the widget to display when launched
-                self.current_dim_changed(self.last_dim)
+                self._add_axis_controls(btn_layout)
             else:
                 ra_combo = QComboBox(self)
                 ra_combo.currentIndexChanged.connect(self.stack.setCurrentIndex)
@@ -798,6 +952,73 @@ def setup_and_check(self, data, title='', readonly=False,
                                    "array's data (and vice-versa)."))
                 btn_layout.addWidget(label)
 
+        self._add_buttons(btn_layout, readonly)
+        return True
+
+    def setup_and_check_remote(self, info, view, title=''):
+        """
+        Setup ArrayEditor to show an array that stays in the kernel,
+        without editing it.
+
+        `info` and `view` are used to create its RemoteArrayModel.
+        """
+        self.remote_info = info
+        self.remote_view = view
+        self.data_shape = tuple(info['shape'])
+        self._setup_window(title, readonly=True)
+
+        self.stack = QStackedWidget(self)
+        if len(self.data_shape) != 3:
+            self.stack.addWidget(self._create_widget())
+        self.arraywidget = self.stack.currentWidget()
+        self.stack.currentChanged.connect(self.current_widget_changed)
+        self.layout.addWidget(self.stack, 1, 0)
+
+        btn_layout = QHBoxLayout()
+        if len(self.data_shape) == 3:
+            self._add_axis_controls(btn_layout)
+        self._add_buttons(btn_layout, readonly=True)
+        return True
+
+    def _setup_window(self, title, readonly):
+        """Create the layout of the dialog and set its title."""
+        self.layout = QGridLayout()
+        self.setLayout(self.layout)
+        self.setWindowIcon(ima.icon('arredit'))
+        if title:
+            title = to_text_string(title) + " - " + _("NumPy object array")
+        else:
+            title = _("Array editor")
+        if readonly:
+            title += ' (' + _('read only') + ')'
+        self.setWindowTitle(title)
+
+    def _add_axis_controls(self, btn_layout):
+        """Add the widgets to choose the slice shown of a 3D array."""
+        # QSpinBox
+        self.index_spin = QSpinBox(self, keyboardTracking=False)
+        self.index_spin.valueChanged.connect(self.change_active_widget)
+        # QComboBox
+        names = [str(i) for i in range(3)]
+        ra_combo = QComboBox(self)
+        ra_combo.addItems(names)
+        ra_combo.currentIndexChanged.connect(self.current_dim_changed)
+        # Adding the widgets to layout
+        label = QLabel(_("Axis:"))
+        btn_layout.addWidget(label)
+        btn_layout.addWidget(ra_combo)
+        self.shape_label = QLabel()
+        btn_layout.addWidget(self.shape_label)
+        label = QLabel(_("Index:"))
+        btn_layout.addWidget(label)
+        btn_layout.addWidget(self.index_spin)
+        self.slicing_label = QLabel()
+        btn_layout.addWidget(self.slicing_label)
+        # set the widget to display when launched
+        self.current_dim_changed(self.last_dim)
+
+    def _add_buttons(self, btn_layout, readonly):
+        """Add the buttons to close the dialog."""
         btn_layout.addStretch()
 
         if not readonly:
@@ -818,7 +1039,26 @@ def setup_and_check(self, data, title='', readonly=False,
         # Make the dialog act as a window
         self.setWindowFlags(Qt.Window)
 
-        return True
+    def _create_widget(self, axis=None, index=None):
+        """
+        Create the widget to show the array, or the slice of a 3D array at
+        index in axis.
+        """
+        if self.remote_view is not None:
+            format = SUPPORTED_FORMATS.get(
+                np.dtype(self.remote_info['dtype']).name, '%s')
+            model = RemoteArrayModel(self.remote_info, self.remote_view,
+                                     format=format, axis=axis, index=index,
+                                     parent=self)
+            return ArrayEditorWidget(self, None, readonly=True, model=model)
+        if axis is None:
+            return ArrayEditorWidget(self, self.data)
+        slice_index = [slice(None)]*3
+        slice_index[axis] = index
+        try:
+            return ArrayEditorWidget(self, self.data[tuple(slice_index)])
+        except IndexError:  # Handle arrays of size 0 in one axis
+            return ArrayEditorWidget(self, self.data)
 
     @Slot(QModelIndex, QModelIndex)
     def save_and_close_enable(self, left_top, bottom_right):
@@ -842,20 +1082,15 @@ def change_active_widget(self, index):
         self.slicing_label.setText((r"Slicing: [" + ", ".join(string_index) +
                                 "]") % index)
         if index < 0:
-            data_index = self.data.shape[self.last_dim] + index
+            data_index = self.data_shape[self.last_dim] + index
         else:
             data_index = index
-        slice_index = [slice(None)]*3
-        slice_index[self.last_dim] = data_index
 
         stack_index = self.dim_indexes[self.last_dim].get(data_index)
         if stack_index is None:
             stack_index = self.stack.count()
-            try:
-                self.stack.addWidget(ArrayEditorWidget(
-                    self, self.data[tuple(slice_index)]))
-            except IndexError:  # Handle arrays of size 0 in one axis
-                self.stack.addWidget(ArrayEditorWidget(self, self.data))
+            self.stack.addWidget(self._create_widget(self.last_dim,
+                                                     data_index))
             self.dim_indexes[self.last_dim][data_index] = stack_index
             self.stack.update()
         self.stack.setCurrentIndex(stack_index)
@@ -869,15 +1104,15 @@ def current_dim_changed(self, index):
         string_size = ['%i']*3
         string_size[index] = '<font color=red>%i</font>'
         self.shape_label.setText(('Shape: (' + ', '.join(string_size) +
-                                 ')    ') % self.data.shape)
+                                 ')    ') % self.data_shape)
         if self.index_spin.value() != 0:
             self.index_spin.setValue(0)
         else:
             # this is done since if the value is currently 0 it does not emit
             # currentIndexChanged(int)
             self.change_active_widget(0)
-        self.index_spin.setRange(-self.data.shape[index],
-                                 self.data.shape[index]-1)
+        self.index_spin.setRange(-self.data_shape[index],
+                                 self.data_shape[index]-1)
 
     @Slot()
     def accept(self):
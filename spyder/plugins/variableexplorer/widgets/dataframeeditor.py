@@ -33,6 +33,10 @@
 """
 
 # Standard library imports
+from collections import OrderedDict
+from functools import partial
+import logging
+import time
 
 # Third party imports
 from qtpy.compat import from_qvariant, to_qvariant
@@ -64,6 +68,9 @@
 from spyder.plugins.variableexplorer.widgets.arrayeditor import get_idx_rect
 from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
 
+
+logger = logging.getLogger(__name__)
+
 # Supported Numbers and complex numbers
 REAL_NUMBER_TYPES = (float, int, np.int64, np.int32)
 COMPLEX_NUMBER_TYPES = (complex, np.complex64, np.complex128)
@@ -80,6 +87,12 @@
 ROWS_TO_LOAD = 500
 COLS_TO_LOAD = 40
 
+# Number of pages of a remote dataframe kept in memory
+MAX_CACHED_PAGES = 32
+
+# Seconds to wait for a page before requesting it again
+PAGE_REQUEST_TIMEOUT = 30
+
 # Background colours
 BACKGROUND_NUMBER_MINHUE = 0.66 # hue for largest number
 BACKGROUND_NUMBER_HUERANGE = 0.33 # (hue for smallest) minus (hue for largest)
@@ -130,8 +143,8 @@ def __init__(self, dataFrame, format=DEFAULT_FORMAT, parent=None):
         self.complex_intran = None
         self.display_error_idxs = []
 
-        self.total_rows = self.df.shape[0]
-        self.total_cols = self.df.shape[1]
+        self.total_rows = self.shape[0]
+        self.total_cols = self.shape[1]
         size = self.total_rows * self.total_cols
 
         self.max_min_col = None
@@ -461,6 +474,13 @@ def get_data(self):
         """Return data"""
         return self.df
 
+    def get_frame(self, rows, columns):
+        """
+        Return the part of the data between the (start, stop) pairs of
+        rows and columns.
+        """
+        return self.df.iloc[rows[0]:rows[1], columns[0]:columns[1]]
+
     def rowCount(self, index=QModelIndex()):
         """DataFrame row number"""
         # Avoid a "Qt exception in virtual methods" generated in our
@@ -498,7 +518,7 @@ def columnCount(self, index=QModelIndex()):
         # See spyder-ide/spyder#8910.
         try:
             # This is done to implement series
-            if len(self.df.shape) == 1:
+            if len(self.shape) == 1:
                 return 2
             elif self.total_cols <= self.cols_loaded:
                 return self.total_cols
@@ -512,6 +532,216 @@ def reset(self):
         self.endResetModel()
 
 
+class RemoteDataFrameModel(DataFrameModel):
+    """
+    Read-only model of a DataFrame that stays in the kernel.
+
+    The data is got from the kernel in pages of ROWS_TO_LOAD rows and
+    COLS_TO_LOAD columns when it's shown, and the last MAX_CACHED_PAGES
+    pages are kept in memory. The pages are requested without waiting for
+    them, and their cells are updated when they arrive.
+
+    The data is sorted and filtered in the kernel too.
+
+    `info` is the information returned by the kernel when opening a view
+    of the DataFrame, and `view` has the methods of the views of
+    spyder_kernels.utils.dataviews (get_page, sort and filter) and calls
+    them in the kernel, plus request_page to get a future of a page.
+    """
+
+    def __init__(self, info, view, format=DEFAULT_FORMAT, parent=None):
+        self._info = info
+        self._view = view
+        self._pages = OrderedDict()
+        # Futures of the pages requested to the kernel, and when
+        self._requested_pages = {}
+        self._pages_generation = 0
+        self.filter_query = None
+        DataFrameModel.__init__(self, None, format=format, parent=parent)
+
+    def _axis_levels(self, axis):
+        """Return the number of levels of the columns (0) or rows (1)."""
+        return self._info['header_shape'][axis]
+
+    @property
+    def shape(self):
+        """Return the shape of the dataframe."""
+        return tuple(self._info['shape'])
+
+    def page(self, row, column):
+        """
+        Return the page with the given cell if it's in memory, or None
+        after requesting it to the kernel if it's not.
+        """
+        key = (row // ROWS_TO_LOAD, column // COLS_TO_LOAD)
+        if key in self._pages:
+            page = self._pages.pop(key)
+            self._pages[key] = page
+            return page
+        if key in self._requested_pages:
+            future, requested = self._requested_pages[key]
+            if time.monotonic() - requested < PAGE_REQUEST_TIMEOUT:
+                return None
+            # No reply, e.g. because the kernel died, so it's asked again
+            future.cancel()
+        self._request_page(key)
+        return None
+
+    def _request_page(self, key):
+        """Request a page to the kernel without waiting for it."""
+        rows = (key[0] * ROWS_TO_LOAD, (key[0] + 1) * ROWS_TO_LOAD)
+        columns = (key[1] * COLS_TO_LOAD, (key[1] + 1) * COLS_TO_LOAD)
+        try:
+            future = self._view.request_page(rows, columns)
+        except Exception:
+            logger.debug("Failed to request page %s of a remote dataframe",
+                         key, exc_info=True)
+            return
+        if future is None:
+            # The comm is closed
+            return
+        # The callback is called right away if the page is already there
+        self._requested_pages[key] = (future, time.monotonic())
+        future.add_done_callback(
+            partial(self._page_received, key, self._pages_generation))
+
+    def _page_received(self, key, generation, future):
+        """Keep a page got from the kernel and update its cells."""
+        if generation != self._pages_generation:
+            # The view was sorted or filtered after requesting the page
+            return
+        self._requested_pages.pop(key, None)
+        try:
+            page = future.result()
+        except Exception:
+            # Not kept, to request it again the next time it's shown
+            logger.debug("Failed to get page %s of a remote dataframe",
+                         key, exc_info=True)
+            return
+        if len(self._pages) >= MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        self._pages[key] = page
+
+        first_row = key[0] * ROWS_TO_LOAD
+        first_column = key[1] * COLS_TO_LOAD
+        last_row = min(first_row + ROWS_TO_LOAD, self.rowCount()) - 1
+        last_column = min(first_column + COLS_TO_LOAD,
+                          self.columnCount()) - 1
+        if last_row < first_row or last_column < first_column:
+            return
+        try:
+            self.dataChanged.emit(self.index(first_row, first_column),
+                                  self.index(last_row, last_column))
+            self.headerDataChanged.emit(Qt.Horizontal, first_column,
+                                        last_column)
+            self.headerDataChanged.emit(Qt.Vertical, first_row, last_row)
+        except RuntimeError:
+            # The editor was closed before the page arrived
+            pass
+
+    def header(self, axis, x, level=0):
+        """
+        Return the values of the labels for the header of columns or rows.
+
+        The value corresponds to the header of column or row x in the
+        given level.
+        """
+        if axis == 0:
+            page = self.page(0, x)
+            labels, position = 'columns', x % COLS_TO_LOAD
+        else:
+            page = self.page(x, 0)
+            labels, position = 'index', x % ROWS_TO_LOAD
+        if page is None:
+            return ''
+        label = page[labels][position]
+        if self._axis_levels(axis) > 1:
+            return label[level]
+        return label
+
+    def name(self, axis, level):
+        """Return the labels of the levels if any."""
+        names = self._info['names'][axis]
+        if self._axis_levels(axis) > 1:
+            return names[level]
+        if names[0]:
+            return names[0]
+
+    def max_min_col_update(self):
+        """Use the maximum and minimum of each column sent by the kernel."""
+        self.max_min_col = self._info['max_min']
+
+    def get_value(self, row, column):
+        """Return the value of the DataFrame."""
+        page = self.page(row, column)
+        if page is None:
+            return ''
+        return page['values'][column % COLS_TO_LOAD][row % ROWS_TO_LOAD]
+
+    def recalculate_index(self):
+        """Nothing to do, the index is in the kernel."""
+        pass
+
+    def set_info(self, info):
+        """Show the view again after it was sorted or filtered."""
+        self._info = info
+        self._pages.clear()
+        self._requested_pages.clear()
+        self._pages_generation += 1
+        self.display_error_idxs = []
+        self.total_rows = self.shape[0]
+        self.max_min_col_update()
+        self.reset()
+
+    def _update_view(self, method, *args, **kwargs):
+        """Sort or filter the view in the kernel and show it again."""
+        try:
+            info = getattr(self._view, method)(*args, **kwargs)
+        except Exception as e:
+            QMessageBox.critical(self.dialog, _("Error"),
+                                 "%s: %s" % (type(e).__name__,
+                                             to_text_string(e)))
+            return False
+        self.set_info(info)
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the data in the kernel by a column, or by the index."""
+        ascending = order == Qt.AscendingOrder
+        return self._update_view('sort', column, ascending)
+
+    def filter(self, query=None, column=None, value=None):
+        """
+        Show only the rows for which the pandas expression query is true
+        and whose value in column is value, or all of them if neither
+        query nor column are given.
+        """
+        if not self._update_view('filter', query=query, column=column,
+                                 value=value):
+            return False
+        self.filter_query = query
+        return True
+
+    def flags(self, index):
+        """Set flags"""
+        return QAbstractTableModel.flags(self, index)
+
+    def setData(self, index, value, role=Qt.EditRole, change_type=None):
+        """Remote dataframes can't be edited."""
+        return False
+
+    def get_frame(self, rows, columns):
+        """
+        Return the part of the data between the (start, stop) pairs of
+        rows and columns.
+        """
+        page = self._view.get_page(rows, columns)
+        df = DataFrame(OrderedDict(enumerate(page['values'])))
+        df.columns = Index(page['columns'])
+        df.index = Index(page['index'])
+        return df
+
+
 class DataFrameView(QTableView):
     """
     Data Frame view class.
@@ -521,10 +751,13 @@ class DataFrameView(QTableView):
     sig_option_changed(): Raised after a sort by column.
     sig_sort_by_column(): Raised after more columns are fetched.
     sig_fetch_more_rows(): Raised after more rows are fetched.
+    sig_filter_changed(): Raised after the rows of a remote model are
+       filtered.
     """
     sig_sort_by_column = Signal()
     sig_fetch_more_columns = Signal()
     sig_fetch_more_rows = Signal()
+    sig_filter_changed = Signal()
 
     def __init__(self, parent, model, header, hscroll, vscroll):
         """Constructor."""
@@ -608,6 +841,19 @@ def setup_menu(self):
                                     icon=ima.icon('editcopy'),
                                     triggered=self.copy,
                                     context=Qt.WidgetShortcut)
+        if isinstance(self.model(), RemoteDataFrameModel):
+            # Remote models can't be edited, but they can be filtered
+            filter_action = create_action(self, _('Filter by this value'),
+                                          icon=ima.icon('filter'),
+                                          triggered=self.filter_by_value,
+                                          context=Qt.WidgetShortcut)
+            clear_action = create_action(self, _('Clear filter'),
+                                         triggered=self.clear_filter,
+                                         context=Qt.WidgetShortcut)
+            menu = QMenu(self)
+            add_actions(menu, [copy_action, None, filter_action,
+                               clear_action])
+            return menu
         functions = ((_("To bool"), bool), (_("To complex"), complex),
                      (_("To int"), int), (_("To float"), float),
                      (_("To str"), to_text_string))
@@ -622,6 +868,22 @@ def slot():
         add_actions(menu, types_in_menu)
         return menu
 
+    def filter_by_value(self):
+        """Show only the rows with the value of the current cell."""
+        index = self.currentIndex()
+        if not index.isValid():
+            return
+        model = self.model()
+        value = model.get_value(index.row(), index.column())
+        if model.filter(query=model.filter_query, column=index.column(),
+                        value=value):
+            self.sig_filter_changed.emit()
+
+    def clear_filter(self):
+        """Show all the rows again."""
+        if self.model().filter():
+            self.sig_filter_changed.emit()
+
     def change_type(self, func):
         """A function that changes types of cells."""
         model = self.model()
@@ -638,9 +900,8 @@ def copy(self):
         # Copy index and header too (equal True).
         # See spyder-ide/spyder#11096
         index = header = True
-        df = self.model().df
-        obj = df.iloc[slice(row_min, row_max + 1),
-                      slice(col_min, col_max + 1)]
+        obj = self.model().get_frame((row_min, row_max + 1),
+                                     (col_min, col_max + 1))
         output = io.StringIO()
         try:
             obj.to_csv(output, sep='\t', index=index, header=header)
@@ -708,6 +969,27 @@ def __init__(self, model, axis, palette):
         else:
             self.total_rows = self.model.shape[0]
             self._shape = (self.model.shape[0], self.model.header_shape[1])
+        self.model.headerDataChanged.connect(self._model_header_changed)
+
+    def _model_header_changed(self, orientation, first, last):
+        """
+        Update the labels that changed in the model, e.g. when a page of a
+        remote dataframe arrives.
+        """
+        if (orientation == Qt.Horizontal) != (self.axis == 0):
+            return
+        if self.axis == 0:
+            last = min(last, self.columnCount() - 1)
+            top_left = self.index(0, first)
+            bottom_right = self.index(self.rowCount() - 1, last)
+        else:
+            last = min(last, self.rowCount() - 1)
+            top_left = self.index(first, 0)
+            bottom_right = self.index(last, self.columnCount() - 1)
+        if last < first:
+            return
+        self.headerDataChanged.emit(orientation, first, last)
+        self.dataChanged.emit(top_left, bottom_right)
 
     def rowCount(self, index=None):
         """Get number of rows in the header."""
@@ -916,6 +1198,30 @@ def setup_and_check(self, data, title=''):
         return False if data is not supported, True otherwise.
         Supported types for data are DataFrame, Series and Index.
         """
+        type_name = data.__class__.__name__
+        if isinstance(data, Series):
+            self.is_series = True
+            data = data.to_frame()
+        elif isinstance(data, Index):
+            data = DataFrame(data)
+        self.dataModel = DataFrameModel(data, parent=self)
+        self._setup(type_name, title)
+        return True
+
+    def setup_and_check_remote(self, info, view, title=''):
+        """
+        Setup DataFrameEditor to show a DataFrame, Series or Index that
+        stays in the kernel, without editing it.
+
+        `info` and `view` are used to create its RemoteDataFrameModel.
+        """
+        self.is_series = info['is_series']
+        self.dataModel = RemoteDataFrameModel(info, view, parent=self)
+        self._setup(info['type'], title, readonly=True)
+        return True
+
+    def _setup(self, type_name, title, readonly=False):
+        """Create the widgets of the editor to show self.dataModel."""
         self._selection_rec = False
         self._model = None
 
@@ -925,14 +1231,11 @@ def setup_and_check(self, data, title=''):
         self.setLayout(self.layout)
         self.setWindowIcon(ima.icon('arredit'))
         if title:
-            title = to_text_string(title) + " - %s" % data.__class__.__name__
+            title = to_text_string(title) + " - %s" % type_name
         else:
-            title = _("%s editor") % data.__class__.__name__
-        if isinstance(data, Series):
-            self.is_series = True
-            data = data.to_frame()
-        elif isinstance(data, Index):
-            data = DataFrame(data)
+            title = _("%s editor") % type_name
+        if readonly:
+            title += ' (' + _('read only') + ')'
 
         self.setWindowTitle(title)
 
@@ -948,9 +1251,13 @@ def setup_and_check(self, data, title=''):
         # Create the view for the vertical index
         self.create_table_index()
 
-        # Create the model and view of the data
-        self.dataModel = DataFrameModel(data, parent=self)
-        self.dataModel.dataChanged.connect(self.save_and_close_enable)
+        # Create the view of the data
+        if readonly:
+            # The pages of remote dataframes change the data when they
+            # arrive
+            self.dataModel.dataChanged.connect(self._remote_data_changed)
+        else:
+            self.dataModel.dataChanged.connect(self.save_and_close_enable)
         self.create_data_table()
 
         self.layout.addWidget(self.hscroll, 2, 0, 1, 2)
@@ -993,11 +1300,20 @@ def setup_and_check(self, data, title=''):
         self.bgcolor_global.stateChanged.connect(self.dataModel.colum_avg)
         btn_layout.addWidget(self.bgcolor_global)
 
-        btn_layout.addStretch()
+        if readonly:
+            # Remote dataframes are filtered in the kernel instead
+            self.query_edit = QLineEdit()
+            self.query_edit.setPlaceholderText(
+                _("Filter with a query, e.g. a > 0 and b == 'x'"))
+            self.query_edit.returnPressed.connect(self.filter_rows)
+            btn_layout.addWidget(self.query_edit, 1)
+        else:
+            btn_layout.addStretch()
 
         self.btn_save_and_close = QPushButton(_('Save and Close'))
         self.btn_save_and_close.setDisabled(True)
         self.btn_save_and_close.clicked.connect(self.accept)
+        self.btn_save_and_close.setVisible(not readonly)
         btn_layout.addWidget(self.btn_save_and_close)
 
         self.btn_close = QPushButton(_('Close'))
@@ -1011,8 +1327,6 @@ def setup_and_check(self, data, title=''):
         self.setModel(self.dataModel)
         self.resizeColumnsToContents()
 
-        return True
-
     @Slot(QModelIndex, QModelIndex)
     def save_and_close_enable(self, top_left, bottom_right):
         """Handle the data change event to enable the save and close button."""
@@ -1020,6 +1334,12 @@ def save_and_close_enable(self, top_left, bottom_right):
         self.btn_save_and_close.setAutoDefault(True)
         self.btn_save_and_close.setDefault(True)
 
+    def _remote_data_changed(self, top_left, bottom_right):
+        """Resize the columns of a page of a remote model that arrived."""
+        self._autosized_cols.difference_update(
+            range(top_left.column(), bottom_right.column() + 1))
+        self._resizeVisibleColumnsToContents()
+
     def create_table_level(self):
         """Create the QTableView that will hold the level model."""
         self.table_level = QTableView()
@@ -1086,6 +1406,7 @@ def create_data_table(self):
         self.dataTable.sig_sort_by_column.connect(self._sort_update)
         self.dataTable.sig_fetch_more_columns.connect(self._fetch_more_columns)
         self.dataTable.sig_fetch_more_rows.connect(self._fetch_more_rows)
+        self.dataTable.sig_filter_changed.connect(self._filter_update)
 
     def sortByIndex(self, index):
         """Implement a Index sort."""
@@ -1348,6 +1669,17 @@ def _sort_update(self):
         self.dataModel.recalculate_index()
         self.setModel(self.dataTable.model())
 
+    def filter_rows(self):
+        """Show only the rows for which the query in the filter is true."""
+        query = to_text_string(self.query_edit.text()).strip() or None
+        if self.dataModel.filter(query=query):
+            self._filter_update()
+
+    def _filter_update(self):
+        """Update the views after filtering the rows of a remote model."""
+        self.query_edit.setText(self.dataModel.filter_query or '')
+        self._sort_update()
+
     def _fetch_more_columns(self):
         """Fetch more data for the header (columns)."""
         self.table_header.model().fetch_more()
@@ -90,6 +90,9 @@ def __init__(self, parent, options_button=None, plugin_actions=[]):
 
         self.filename = None
 
+        # State of the namespace view shown, to get only its changes
+        self.namespace_view_state = None
+
     def setup(self, check_all=None, exclude_private=None,
               exclude_uppercase=None, exclude_capitalized=None,
               exclude_unsupported=None, excluded_names=None,
@@ -396,6 +399,34 @@ def process_remote_view(self, remote_view):
 
         if remote_view is not None:
             self.set_data(remote_view)
+            self.namespace_view_state = None
+
+    def process_namespace_snapshot(self, snapshot):
+        """
+        Process the changes of the remote view and the properties of the
+        variables since the ones shown.
+
+        Return False if they are not based on the ones shown, e.g. because
+        the previous changes were lost.
+        """
+        self.finder.text_finder.load_all = False
+
+        if snapshot['base'] is None:
+            self.editor.var_properties = snapshot['properties']
+            self.set_data(snapshot['changed'])
+        elif snapshot['base'] == self.namespace_view_state:
+            var_properties = self.editor.var_properties
+            var_properties.update(snapshot['properties'])
+            for name in snapshot['removed']:
+                var_properties.pop(name, None)
+            if snapshot['changed'] or snapshot['removed']:
+                self.editor.source_model.apply_changes(snapshot['changed'],
+                                                       snapshot['removed'])
+                self.editor.adjust_columns()
+        else:
+            return False
+        self.namespace_view_state = snapshot['state']
+        return True
 
     def set_var_properties(self, properties):
         """Set properties of variables"""
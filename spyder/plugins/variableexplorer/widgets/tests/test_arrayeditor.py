@@ -26,7 +26,11 @@
 from flaky import flaky
 
 # Local imports
-from spyder.plugins.variableexplorer.widgets.arrayeditor import ArrayEditor, ArrayModel
+from spyder.plugins.variableexplorer.widgets import arrayeditor
+from spyder.plugins.variableexplorer.widgets.arrayeditor import (
+    ArrayEditor, ArrayModel, RemoteArrayModel)
+from spyder.plugins.variableexplorer.widgets.tests.test_dataframeeditor import (
+    LocalDataView)
 
 
 # =============================================================================
@@ -341,5 +345,93 @@ def test_arrayeditor_edit_overflow(qtbot, monkeypatch):
                       dialog.get_value()) == len(expected_array)
 
 
+def test_remote_arraymodel(qtbot, monkeypatch):
+    """
+    Test that the remote model gets only the pages it shows and keeps
+    them in memory.
+    """
+    arr = np.arange(1000 * 100, dtype=float).reshape(1000, 100)
+    view = LocalDataView(arr)
+    model = RemoteArrayModel(view.get_info(), view, format='%.1f')
+    assert (model.rowCount(), model.columnCount()) == (1000, 40)
+
+    # Pages are shown empty until they arrive, and requested only once
+    assert model.data(model.index(1, 2)) == ''
+    assert model.data(model.index(2, 2)) == ''
+    assert [args for __, args in view.requests] == [
+        ((0, 500), (0, 40), None, None)]
+    with qtbot.waitSignal(model.dataChanged) as blocker:
+        view.reply()
+    top_left, bottom_right = blocker.args[:2]
+    assert (top_left.row(), top_left.column()) == (0, 0)
+    assert (bottom_right.row(), bottom_right.column()) == (499, 39)
+    assert model.data(model.index(1, 2)) == '102.0'
+    assert model.data(model.index(2, 2)) == '202.0'
+    assert view.pages == [(0, 500)]
+    assert model.get_values((998, 1000), (99, 100)).tolist() == [
+        [99899.], [99999.]]
+    assert model.readonly
+
+    # Failed pages are shown empty and requested again
+    get_page = view.get_page
+    view.get_page = Mock(side_effect=KeyError)
+    model = RemoteArrayModel(view.get_info(), view)
+    assert model.data(model.index(0, 0)) == ''
+    view.reply()
+    assert model.data(model.index(0, 0)) == ''
+    view.get_page = get_page
+    view.reply()
+    assert model.data(model.index(0, 0)) == '0'
+
+    # Pages without a reply are cancelled and requested again after a while
+    model = RemoteArrayModel(view.get_info(), view)
+    assert model.data(model.index(0, 0)) == ''
+    assert model.data(model.index(0, 0)) == ''
+    assert len(view.requests) == 1
+    future = view.requests[0][0]
+    monkeypatch.setattr(arrayeditor, 'PAGE_REQUEST_TIMEOUT', 0)
+    assert model.data(model.index(0, 0)) == ''
+    assert future.cancelled()
+    assert len(view.requests) == 2
+    view.reply()
+    assert model.data(model.index(0, 0)) == '0'
+
+
+def test_remote_arrayeditor(qtbot):
+    """Test showing 1D and 3D arrays with the remote model."""
+    view = LocalDataView(np.array([1.5, 2.5]))
+    dlg = ArrayEditor()
+    assert dlg.setup_and_check_remote(view.get_info(), view, title='x')
+    qtbot.addWidget(dlg)
+    assert dlg.windowTitle().endswith('(read only)')
+    assert dlg.btn_save_and_close is None
+    model = dlg.arraywidget.model
+    assert (model.rowCount(), model.columnCount()) == (2, 1)
+    model.data(model.index(1, 0))
+    view.reply()
+    assert model.data(model.index(1, 0)) == '2.5'
+
+    view = LocalDataView(np.arange(24).reshape(2, 3, 4))
+    dlg = ArrayEditor()
+    assert dlg.setup_and_check_remote(view.get_info(), view)
+    qtbot.addWidget(dlg)
+    model = dlg.arraywidget.model
+    assert (model.rowCount(), model.columnCount()) == (3, 4)
+    model.data(model.index(1, 2))
+    view.reply()
+    assert model.data(model.index(1, 2)) == '6'
+    dlg.index_spin.setValue(1)
+    model = dlg.arraywidget.model
+    model.data(model.index(1, 2))
+    view.reply()
+    assert model.data(model.index(1, 2)) == '18'
+    dlg.current_dim_changed(2)
+    model = dlg.arraywidget.model
+    assert (model.rowCount(), model.columnCount()) == (2, 3)
+    model.data(model.index(1, 1))
+    view.reply()
+    assert model.data(model.index(1, 1)) == '16'
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -13,6 +13,7 @@
 from __future__ import division
 
 # Standard library imports
+from concurrent.futures import Future
 import os
 import sys
 from datetime import datetime
@@ -35,7 +36,8 @@
 from spyder.utils.test import close_message_box
 from spyder.plugins.variableexplorer.widgets import dataframeeditor
 from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
-    DataFrameEditor, DataFrameModel)
+    DataFrameEditor, DataFrameModel, RemoteDataFrameModel)
+from spyder_kernels.utils.dataviews import make_data_view
 
 
 # =============================================================================
@@ -66,6 +68,58 @@ def data_header(dfh, i, j, role=Qt.DisplayRole):
 def data_index(dfi, i, j, role=Qt.DisplayRole):
     return dfi.data(dfi.createIndex(i, j), role)
 
+class LocalDataView(object):
+    """
+    View with the methods of RemoteDataView that doesn't need a kernel.
+
+    The pages requested are only got when calling reply, like the replies
+    of the kernel that arrive later.
+    """
+
+    def __init__(self, value):
+        self.view = make_data_view(value)
+        self.pages = []
+        self.requests = []
+
+    def get_info(self):
+        return self.view.get_info()
+
+    def get_page(self, rows, *args):
+        self.pages.append(rows)
+        return self.view.get_page(rows, *args)
+
+    def request_page(self, *args):
+        future = Future()
+        self.requests.append((future, args))
+        return future
+
+    def reply(self):
+        """Get the pages requested since the last reply."""
+        requests, self.requests = self.requests, []
+        for future, args in requests:
+            if future.cancelled():
+                continue
+            try:
+                future.set_result(self.get_page(*args))
+            except Exception as error:
+                future.set_exception(error)
+
+    def get_item(self, row):
+        return self.view.get_item(row)
+
+    def sort(self, column, ascending=True):
+        return self.view.sort(column, ascending)
+
+    def filter(self, query=None, column=None, value=None):
+        return self.view.filter(query=query, column=column, value=value)
+
+    def open_item_view(self, row):
+        view = LocalDataView(self.view.get_item(row))
+        return view.get_info(), view
+
+    def close(self):
+        pass
+
 def generate_pandas_indexes():
     """ Creates a dictionary of many possible pandas indexes """
     return {
@@ -750,5 +804,127 @@ def test_no_convert_strings_to_unicode():
     assert data(dfm, 0, 0) != u'файла'
 
 
+def test_remote_dataframemodel(qtbot):
+    """
+    Test that the remote model gets only the pages it shows and keeps
+    them in memory.
+    """
+    df = DataFrame(numpy.arange(2000).reshape(1000, 2),
+                   columns=['a', 'b'])
+    view = LocalDataView(df)
+    dfm = RemoteDataFrameModel(view.get_info(), view)
+    assert dfm.shape == (1000, 2)
+    assert dfm.header_shape == (1, 1)
+
+    # Pages are shown empty until they arrive, and requested only once
+    assert data(dfm, 0, 0) == ''
+    assert dfm.header(0, 1) == ''
+    assert len(view.requests) == 1
+    with qtbot.waitSignal(dfm.dataChanged):
+        with qtbot.waitSignal(dfm.headerDataChanged):
+            view.reply()
+    assert data(dfm, 0, 0) == '0'
+    assert data(dfm, 1, 1) == '3'
+    assert dfm.header(0, 1) == 'b'
+    assert dfm.header(1, 1) == 1
+    assert view.pages == [(0, 500)]
+    data(dfm, 999, 1)
+    view.reply()
+    assert data(dfm, 999, 1) == '1999'
+    assert dfm.header(1, 999) == 999
+    assert view.pages == [(0, 500), (500, 1000)]
+    assert bgcolor(dfm, 0, 0) is not None
+
+    index = dfm.createIndex(0, 0)
+    assert not dfm.flags(index) & Qt.ItemIsEditable
+    assert not dfm.setData(index, '1')
+
+    frame = dfm.get_frame((1, 3), (0, 2))
+    assert frame.equals(df.iloc[1:3, 0:2])
+
+
+def test_remote_dataframemodel_sort_and_filter(qtbot, monkeypatch):
+    """Test sorting and filtering remote dataframes in the kernel."""
+    df = DataFrame({'a': [3, 1, 2, 1], 'b': list('wxyz')})
+    view = LocalDataView(df)
+    dfm = RemoteDataFrameModel(view.get_info(), view)
+
+    def column(rows):
+        data(dfm, 0, 1)
+        view.reply()
+        return [data(dfm, i, 1) for i in range(rows)]
+
+    assert column(1) == ['w']
+    assert dfm.sort(0)
+    assert column(4) == list('xzyw')
+
+    # Pages requested before sorting are not kept
+    data(dfm, 0, 1)
+    assert dfm.sort(-1, Qt.DescendingOrder)
+    view.reply()
+    assert data(dfm, 0, 1) == ''
+    assert column(4) == list('zyxw')
+
+    assert dfm.filter(query='a < 3')
+    assert dfm.rowCount() == 3
+    assert dfm.filter(query='a < 3', column=0, value=1)
+    assert column(2) == list('zx')
+    assert dfm.filter_query == 'a < 3'
+    assert dfm.filter()
+    assert dfm.rowCount() == 4
+
+    # The data in the kernel is not changed
+    assert df['b'].tolist() == list('wxyz')
+
+    critical = []
+    monkeypatch.setattr(dataframeeditor.QMessageBox, 'critical',
+                        lambda *args: critical.append(args))
+    assert not dfm.filter(query='a +')
+    assert len(critical) == 1
+    assert dfm.rowCount() == 4
+
+
+def test_remote_dataframeeditor(qtbot):
+    """Test showing a Series and a MultiIndex with the remote model."""
+    series = Series([1.5, 2.5], name='s')
+    view = LocalDataView(series)
+    editor = DataFrameEditor(None)
+    editor.setup_and_check_remote(view.get_info(), view, title='x')
+    assert editor.is_series
+    assert editor.windowTitle() == 'x - Series (read only)'
+    assert editor.btn_save_and_close.isHidden()
+    dfm = editor.model()
+    header = editor.table_header.model()
+    data(dfm, 1, 0)
+    with qtbot.waitSignal(header.headerDataChanged):
+        view.reply()
+    assert data(dfm, 1, 0) == '2.5'
+    assert header.headerData(0, Qt.Horizontal, Qt.DisplayRole) == 's'
+    assert not editor.btn_save_and_close.isEnabled()
+
+    index = MultiIndex.from_tuples([('a', 1), ('b', 2)],
+                                   names=['first', 'second'])
+    view = LocalDataView(DataFrame([[1], [2]], index=index))
+    editor = DataFrameEditor(None)
+    editor.setup_and_check_remote(view.get_info(), view)
+    dfm = editor.model()
+    assert dfm.header_shape == (1, 2)
+    assert dfm.name(1, 1) == 'second'
+    index = editor.table_index.model()
+    data_index(index, 1, 0)
+    with qtbot.waitSignal(index.dataChanged):
+        view.reply()
+    assert data_index(index, 1, 0) == 'b'
+    assert data_index(index, 1, 1) == '2'
+
+    editor.query_edit.setText('second > 1')
+    editor.filter_rows()
+    index = editor.table_index.model()
+    data_index(index, 0, 0)
+    view.reply()
+    assert index.rowCount() == 1
+    assert data_index(index, 0, 0) == 'b'
+
+
 if __name__ == "__main__":
     pytest.main()
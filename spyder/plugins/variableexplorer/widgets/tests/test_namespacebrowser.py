@@ -221,5 +221,39 @@ def test_filtering_with_large_rows(qtbot):
     assert model.rowCount() == 1
 
 
+def test_process_namespace_snapshot(qtbot):
+    """Test applying the snapshots of the namespace sent by the kernel."""
+    browser = NamespaceBrowser(None)
+    qtbot.addWidget(browser)
+    browser.set_shellwidget(Mock())
+    browser.setup(exclude_private=True, exclude_uppercase=True,
+                  exclude_capitalized=True, exclude_unsupported=False,
+                  exclude_callables_and_modules=True,
+                  minmax=False)
+    entry = {'type': 'int', 'size': 1, 'color': '#0000ff', 'view': '1'}
+    model = browser.editor.model
+
+    # Whole snapshot
+    assert browser.process_namespace_snapshot(
+        {'base': None, 'state': 's1', 'changed': {'a': entry, 'b': entry},
+         'properties': {'a': {'len': None}, 'b': {'len': None}},
+         'removed': [], 'pending': []})
+    assert data_table(model, 2, 1) == [['a', 'b']]
+
+    # Changes since the last snapshot
+    assert browser.process_namespace_snapshot(
+        {'base': 's1', 'state': 's2', 'changed': {'c': entry},
+         'properties': {'c': {'len': 3}}, 'removed': ['a'], 'pending': []})
+    assert data_table(model, 2, 1) == [['b', 'c']]
+    assert sorted(browser.editor.var_properties) == ['b', 'c']
+
+    # Changes since another snapshot are not applied
+    assert not browser.process_namespace_snapshot(
+        {'base': 's1', 'state': 's3', 'changed': {}, 'properties': {},
+         'removed': ['b'], 'pending': []})
+    assert model.rowCount() == 2
+    assert browser.namespace_view_state == 's2'
+
+
 if __name__ == "__main__":
     pytest.main()
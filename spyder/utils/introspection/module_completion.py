@@ -9,15 +9,28 @@
 
 """
 Module completion auxiliary functions.
-"""
 
-import pkgutil
+The modules that can be imported by an interpreter are kept in an index
+that is saved to disk and updated in a separate process, which only
+lists again the folders that changed since the last update.
+
+This module is imported when loading the configuration, so it must be
+fast to import.
+"""
 
-from pickleshare import PickleShareDB
+import bisect
+import hashlib
+import json
+import logging
+import os.path as osp
+import threading
+import time
 
 from spyder.config.base import get_conf_path
 
 
+logger = logging.getLogger(__name__)
+
 # List of preferred modules
 PREFERRED_MODULES = ['numpy', 'scipy', 'sympy', 'pandas', 'networkx',
                      'statsmodels', 'matplotlib', 'sklearn', 'skimage',
@@ -30,46 +43,130 @@
                      'zlib', 'pytest', 'PyQt4', 'PyQt5', 'PySide',
                      'PySide2', 'os.path']
 
+# Minimum time between updates of an index, in seconds
+UPDATE_INTERVAL = 60
 
-def get_submodules(mod):
-    """Get all submodules of a given module"""
-    def catch_exceptions(module):
-        pass
-    try:
-        m = __import__(mod)
-        submodules = [mod]
-        submods = pkgutil.walk_packages(m.__path__, m.__name__ + '.',
-                                        catch_exceptions)
-        for sm in submods:
-            sm_name = sm[1]
-            submodules.append(sm_name)
-    except ImportError:
-        return []
-    except:
-        return [mod]
-
-    return submodules
+# Script that finds the modules of an interpreter
+SCAN_SCRIPT = osp.join(osp.dirname(osp.abspath(__file__)), 'module_scan.py')
 
 
-def get_preferred_submodules():
-    """
-    Get all submodules of the main scientific modules and others of our
-    interest
+class ModuleIndex(object):
     """
-    # Path to the modules database
-    modules_path = get_conf_path('db')
+    Index of the modules that can be imported by a Python interpreter.
 
-    # Modules database
-    modules_db = PickleShareDB(modules_path)
-
-    if 'submodules' in modules_db:
-        return modules_db['submodules']
-
-    submodules = []
-
-    for m in PREFERRED_MODULES:
-        submods = get_submodules(m)
-        submodules += submods
+    The saved index is loaded when created, and `update` refreshes it in
+    the background.
+    """
 
-    modules_db['submodules'] = submodules
-    return submodules
+    def __init__(self, executable, index_path=None):
+        self.executable = executable
+        if index_path is None:
+            key = hashlib.sha1(executable.encode('utf-8')).hexdigest()
+            index_path = osp.join(get_conf_path('module_index'),
+                                  key + '.json')
+        self.index_path = index_path
+        self.modules = []
+        self._lock = threading.Lock()
+        self._process = None
+        self._last_update = None
+        self._load()
+
+    def is_ready(self):
+        """Return whether the modules of the interpreter are known."""
+        return bool(self.modules)
+
+    def is_importable(self, name):
+        """Return whether module `name` can be imported."""
+        modules = self.modules
+        i = bisect.bisect_left(modules, name)
+        return i < len(modules) and modules[i] == name
+
+    def complete(self, prefix):
+        """
+        Return the modules whose names start with `prefix`.
+
+        Only the modules in the package given by the dotted part of
+        `prefix` are returned, e.g. `numpy.li` gives `numpy.linalg` but
+        not `numpy.linalg.linalg`.
+        """
+        modules = self.modules
+        package_length = prefix.rfind('.') + 1
+        completions = []
+        i = bisect.bisect_left(modules, prefix)
+        while i < len(modules) and modules[i].startswith(prefix):
+            if '.' not in modules[i][package_length:]:
+                completions.append(modules[i])
+            i += 1
+        return completions
+
+    def filter_importable(self, names):
+        """
+        Return the names of `names` whose top-level module can be
+        imported, or all of them if the index is not ready yet.
+        """
+        if not self.is_ready():
+            return list(names)
+        return [name for name in names
+                if self.is_importable(name.split('.')[0])]
+
+    def update(self, callback=None):
+        """
+        Update the index in a separate process, calling `callback` with
+        this index when done.
+        """
+        with self._lock:
+            if self._process is not None:
+                return
+            self._last_update = time.time()
+            from spyder.utils.programs import run_program
+            try:
+                self._process = run_program(
+                    self.executable, [SCAN_SCRIPT, self.index_path])
+            except Exception:
+                logger.debug("Failed to start module index update",
+                             exc_info=True)
+                return
+
+        thread = threading.Thread(target=self._wait_for_update,
+                                  args=(callback,))
+        thread.daemon = True
+        thread.start()
+
+    def needs_update(self):
+        """Return whether the index wasn't updated recently."""
+        return (self._last_update is None or
+                time.time() - self._last_update > UPDATE_INTERVAL)
+
+    def _wait_for_update(self, callback):
+        _, stderr = self._process.communicate()
+        if self._process.returncode != 0:
+            logger.debug("Module index update failed: {}".format(stderr))
+        self._load()
+        with self._lock:
+            self._process = None
+        if callback is not None:
+            callback(self)
+
+    def _load(self):
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+            self.modules = index['modules']
+        except (IOError, OSError, ValueError, KeyError):
+            pass
+
+
+_indexes = {}
+
+
+def get_module_index(executable):
+    """
+    Return the module index of `executable`, updating it in the background
+    if it wasn't updated recently.
+    """
+    if executable not in _indexes:
+        _indexes[executable] = ModuleIndex(executable)
+    index = _indexes[executable]
+    if index.needs_update():
+        index.update()
+    return index
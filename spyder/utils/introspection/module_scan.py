@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Find the modules that can be imported by a Python interpreter.
+
+This script is run in a separate process by the interpreter whose modules
+are indexed, so it must not import Spyder and has to work with all the
+Python versions Spyder can run code with.
+
+Modules are found by listing the folders in sys.path and the packages in
+them, without importing anything. The folders listed by a previous run
+are read from the index file given as argument, and only the ones that
+were modified since then are listed again. The result is saved to the
+same file.
+"""
+
+import json
+import os
+import sys
+
+try:
+    from importlib.machinery import all_suffixes
+except ImportError:
+    # Python 2
+    import imp
+
+    def all_suffixes():
+        return [suffix for suffix, _, _ in imp.get_suffixes()]
+
+
+INDEX_VERSION = 1
+# Avoid walking very deep folder hierarchies or symlink loops
+MAX_DEPTH = 6
+SUFFIXES = all_suffixes()
+
+
+def is_identifier(name):
+    """Check if name can be part of a module name."""
+    return (name.replace('_', 'a').isalnum() and not name[0].isdigit() and
+            not name.startswith('__'))
+
+
+def module_name(filename):
+    """Return the name of the module in filename, or None."""
+    for suffix in SUFFIXES:
+        if filename.endswith(suffix):
+            name = filename[:-len(suffix)]
+            if is_identifier(name):
+                return name
+    return None
+
+
+def is_package(path):
+    """Check if the folder at path has an __init__ module."""
+    return any(os.path.isfile(os.path.join(path, '__init__' + suffix))
+               for suffix in SUFFIXES)
+
+
+def list_folder(path, namespace):
+    """
+    Return the modules, packages and namespace packages in the folder at
+    path.
+
+    Folders without an __init__ module are namespace packages only at the
+    top level or inside other namespace packages, otherwise they are just
+    data folders.
+    """
+    modules = set()
+    packages = []
+    namespaces = []
+    for filename in os.listdir(path):
+        filepath = os.path.join(path, filename)
+        if os.path.isdir(filepath):
+            if not is_identifier(filename):
+                continue
+            if is_package(filepath):
+                packages.append(filename)
+            elif namespace:
+                namespaces.append(filename)
+        else:
+            name = module_name(filename)
+            if name is not None:
+                modules.add(name)
+    return {'modules': sorted(modules), 'packages': sorted(packages),
+            'namespaces': sorted(namespaces)}
+
+
+def scan_folder(path, old_folders, folders, namespace=True, depth=0):
+    """Add the entries for the folder at path and its packages to folders."""
+    if path in folders or depth > MAX_DEPTH:
+        return
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return
+    entry = old_folders.get(path)
+    if entry is None or entry['mtime'] != mtime:
+        try:
+            entry = list_folder(path, namespace)
+        except OSError:
+            return
+        entry['mtime'] = mtime
+    folders[path] = entry
+    for package in entry['packages']:
+        scan_folder(os.path.join(path, package), old_folders, folders,
+                    namespace=False, depth=depth + 1)
+    for package in entry['namespaces']:
+        scan_folder(os.path.join(path, package), old_folders, folders,
+                    namespace=True, depth=depth + 1)
+
+
+def module_names(sys_path, folders):
+    """Return the names of the modules found in folders."""
+    names = set(sys.builtin_module_names)
+
+    def add_names(path, prefix):
+        entry = folders.get(path)
+        if entry is None:
+            return False
+        names.update(prefix + name for name in entry['modules'])
+        found = bool(entry['modules'])
+        for package in entry['packages']:
+            names.add(prefix + package)
+            add_names(os.path.join(path, package), prefix + package + '.')
+            found = True
+        # Namespace packages can be imported only if they contain modules
+        for package in entry['namespaces']:
+            if add_names(os.path.join(path, package), prefix + package + '.'):
+                names.add(prefix + package)
+                found = True
+        return found
+
+    for path in sys_path:
+        add_names(path, '')
+    return sorted(names)
+
+
+def get_sys_path():
+    """Return the folders in sys.path, without the one of this script."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    sys_path = []
+    for path in sys.path:
+        path = os.path.abspath(path or os.curdir)
+        if (path != script_dir and path not in sys_path and
+                os.path.isdir(path)):
+            sys_path.append(path)
+    return sys_path
+
+
+def load_index(index_path):
+    """Load the index saved by a previous run."""
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    if index.get('version') != INDEX_VERSION:
+        return {}
+    return index
+
+
+def save_index(index_path, index):
+    """Save index, replacing the file at index_path only when done."""
+    index_dir = os.path.dirname(index_path)
+    if not os.path.isdir(index_dir):
+        os.makedirs(index_dir)
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f)
+    if os.name == 'nt' and os.path.isfile(index_path):
+        # os.rename doesn't replace files on Windows in Python 2
+        os.remove(index_path)
+    os.rename(tmp_path, index_path)
+
+
+def main(index_path):
+    old_folders = load_index(index_path).get('folders', {})
+    sys_path = get_sys_path()
+    folders = {}
+    for path in sys_path:
+        scan_folder(path, old_folders, folders)
+    index = {
+        'version': INDEX_VERSION,
+        'executable': sys.executable,
+        'sys_path': sys_path,
+        'folders': folders,
+        'modules': module_names(sys_path, folders),
+    }
+    save_index(index_path, index)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1])
@@ -10,20 +10,56 @@
 
 # Stdlib imports
 import sys
+import threading
 
 # Test library imports
 import pytest
 
 # Local imports
-from spyder.py3compat import PY3
-from spyder.utils.introspection.module_completion import get_preferred_submodules
+from spyder.utils.introspection.module_completion import ModuleIndex
 
 
-@pytest.mark.skipif(sys.platform == 'darwin' and PY3,
-                    reason="It's very slow in this combo")
-def test_module_completion():
-    """Test module_completion."""
-    assert 'numpy.linalg' in get_preferred_submodules()
+def update_index(index):
+    """Update index and wait until it's done."""
+    done = threading.Event()
+    index.update(callback=lambda index: done.set())
+    assert done.wait(60)
+
+
+def test_module_index(tmpdir, monkeypatch):
+    """Test that the modules of an interpreter are found and updated."""
+    lib = tmpdir.mkdir('lib')
+    package = lib.mkdir('spyder_test_package')
+    package.join('__init__.py').write('')
+    package.join('module.py').write('')
+    package.mkdir('data').join('data.py').write('')
+    monkeypatch.setenv('PYTHONPATH', str(lib))
+
+    index_path = str(tmpdir.join('index', 'index.json'))
+    index = ModuleIndex(sys.executable, index_path=index_path)
+    assert not index.is_ready()
+    assert index.filter_importable(['os', 'not_a_module']) == [
+        'os', 'not_a_module']
+
+    update_index(index)
+    assert index.is_ready()
+    assert index.is_importable('sys')
+    assert index.is_importable('os')
+    assert index.complete('json.de') == ['json.decoder']
+    assert index.complete('spyder_test_pa') == ['spyder_test_package']
+    assert index.complete('spyder_test_package.') == [
+        'spyder_test_package.module']
+    assert index.filter_importable(['os', 'os.path', 'not_a_module']) == [
+        'os', 'os.path']
+
+    # Changes in packages are found by the next update
+    package.join('new_module.py').write('')
+    update_index(index)
+    assert index.complete('spyder_test_package.') == [
+        'spyder_test_package.module', 'spyder_test_package.new_module']
+
+    # The saved index is loaded by new instances
+    assert ModuleIndex(sys.executable, index_path=index_path).is_ready()
 
 
 if __name__ == "__main__":
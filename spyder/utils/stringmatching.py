@@ -235,6 +235,51 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
     return results
 
 
+def get_fuzzy_score(query, choice):
+    """Returns a score for query letters appearing in order in choice.
+
+    This is a fast alternative to `get_search_score` that doesn't use
+    regular expressions nor enriches the text, meant to filter and sort
+    long lists of choices (e.g. code completions) on each key press.
+
+    Parameters
+    ----------
+    query : str
+        String with letters to search in choice (in order of appearance).
+    choice : str
+        Word in which to search for the 'query' letters.
+
+    Returns
+    -------
+    score : int
+        Lower scores imply a better match. Choices that start with query
+        get the lowest scores (case sensitive matches first), followed by
+        the ones where query letters are found closest to each other.
+        NOT_FOUND_SCORE is returned if query letters are not in choice.
+    """
+    if not query:
+        return NO_SCORE
+
+    if choice.startswith(query):
+        return 0
+
+    lower_query = query.lower()
+    lower_choice = choice.lower()
+    if lower_choice.startswith(lower_query):
+        return 1
+
+    score = 2
+    pos = -1
+    for char in lower_query:
+        new_pos = lower_choice.find(char, pos + 1)
+        if new_pos == -1:
+            return NOT_FOUND_SCORE
+        score += new_pos - pos - 1
+        pos = new_pos
+
+    return score
+
+
 def test():
     template = '<b>{0}</b>'
     names = ['close pane', 'debug continue', 'debug exit', 'debug step into',
@@ -15,7 +15,8 @@
 import pytest
 
 # Local imports
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import (
+    NOT_FOUND_SCORE, get_fuzzy_score, get_search_scores)
 
 TEST_FILE = os.path.join(os.path.dirname(__file__), 'data/example.py')
 
@@ -216,5 +217,18 @@ def test_stringmatching_order_filter():
                                      'use previous <b>lay</b>out', 400113)]
 
 
+def test_fuzzy_score():
+    """Test the scores given to completion-like choices."""
+    choices = ['isinstance', 'IsADirectoryError', 'print', 'issubclass',
+               'ZeroDivisionError']
+    scores = [get_fuzzy_score('is', choice) for choice in choices]
+    assert scores == [0, 1, NOT_FOUND_SCORE, 0, 9]
+
+    # Letters closer to each other give better scores
+    assert get_fuzzy_score('ie', 'ImportError') < get_fuzzy_score(
+        'ie', 'isinstance')
+    assert get_fuzzy_score('', 'print') == 0
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -20,9 +20,13 @@
 
 # Standard library imports
 from __future__ import print_function
+from collections import OrderedDict
 import datetime
+from functools import partial
+import logging
 import re
 import sys
+import time
 import warnings
 
 # Third party imports
@@ -66,6 +70,16 @@
 LARGE_NROWS = 100
 ROWS_TO_LOAD = 50
 
+# Rows of the pages of remote collections got from the kernel, and number
+# of those pages kept in memory
+ROWS_PER_PAGE = 500
+MAX_CACHED_PAGES = 32
+
+# Seconds to wait for a page before requesting it again
+PAGE_REQUEST_TIMEOUT = 30
+
+logger = logging.getLogger(__name__)
+
 
 def natsort(s):
     """
@@ -217,6 +231,83 @@ def set_data(self, data, coll_filter=None):
             self.update_search_letters()
         self.reset()
 
+    def apply_changes(self, changed, removed):
+        """
+        Add or replace the items of `changed` and remove the keys in
+        `removed` from the dictionary of this model, without resetting it.
+
+        This keeps the current selection, sorting and scroll position,
+        unlike set_data.
+        """
+        data = self._data
+        self.scores = list(self.scores)
+
+        for key in removed:
+            if key not in data:
+                continue
+            row = self.keys.index(key)
+            loaded = row < self.rows_loaded
+            if loaded:
+                self.beginRemoveRows(QModelIndex(), row, row)
+            del data[key]
+            del self.keys[row]
+            del self.scores[row:row + 1]
+            if loaded:
+                del self.sizes[row]
+                del self.types[row]
+                self.rows_loaded -= 1
+            self.total_rows -= 1
+            if loaded:
+                self.endRemoveRows()
+
+        rows = {key: row for row, key in enumerate(self.keys)}
+        added = []
+        for key, value in changed.items():
+            row = rows.get(key)
+            if row is None:
+                added.append(key)
+                continue
+            data[key] = value
+            if row < self.rows_loaded:
+                self.sizes[row], self.types[row] = self._size_and_type(value)
+                self.dataChanged.emit(self.index(row, 0),
+                                      self.index(row, 3))
+
+        if added:
+            # New rows are only shown if all the others were already loaded
+            loaded = self.rows_loaded == self.total_rows
+            start = self.total_rows
+            if loaded:
+                self.beginInsertRows(QModelIndex(), start,
+                                     start + len(added) - 1)
+            for key in added:
+                data[key] = changed[key]
+                self.keys.append(key)
+                self.scores.append(0)
+                if loaded:
+                    size, type_ = self._size_and_type(changed[key])
+                    self.sizes.append(size)
+                    self.types.append(type_)
+            self.total_rows += len(added)
+            if loaded:
+                self.rows_loaded = self.total_rows
+                self.endInsertRows()
+
+        # Update search scores without resetting the model
+        names = [str(key) for key in self.keys]
+        results = get_search_scores(getattr(self, 'letters', ''), names,
+                                    template='<b>{0}</b>')
+        if results:
+            self.normal_text, _, self.scores = zip(*results)
+            self.dataChanged.emit(self.index(0, 4),
+                                  self.index(self.rowCount() - 1, 4))
+
+    def _size_and_type(self, value):
+        """Return the size and type shown for value."""
+        if self.remote:
+            return value['size'], value['type']
+        return get_size(value), get_human_readable_type(value)
+
     def set_size_and_type(self, start=None, stop=None):
         data = self._data
 
@@ -501,6 +592,198 @@ def setData(self, index, value, role=Qt.EditRole):
         return True
 
 
+class RemoteCollectionsModel(ReadOnlyCollectionsModel):
+    """
+    Read-only model of a list, tuple, set or dict that stays in the kernel.
+
+    The keys of the items and the summaries of their values are got from
+    the kernel in pages of ROWS_PER_PAGE rows when they're shown, and the
+    last MAX_CACHED_PAGES pages are kept in memory. The pages are requested
+    without waiting for them, and their rows are updated when they arrive.
+    The items are sorted in the kernel too, and their values are only got
+    when they're opened.
+
+    `info` is the information returned by the kernel when opening a view
+    of the collection, and `view` is its RemoteDataView.
+    """
+
+    def __init__(self, parent, info, view, title="", minmax=False,
+                 dataframe_format=None):
+        self._info = info
+        self._view = view
+        self._pages = OrderedDict()
+        # Futures of the pages requested to the kernel, and when
+        self._requested_pages = {}
+        self._pages_generation = 0
+        self._sorted = False
+        ReadOnlyCollectionsModel.__init__(self, parent, None, title=title,
+                                          minmax=minmax,
+                                          dataframe_format=dataframe_format,
+                                          remote=True)
+
+    def set_data(self, data, coll_filter=None):
+        """Show the collection described by the information of the view."""
+        kind = self._info['kind']
+        self._data = self.showndata = self._view
+        self.header0 = _("Key") if kind == 'dict' else _("Index")
+        self.title += {'tuple': _("Tuple"), 'list': _("List"),
+                       'set': _("Set"), 'dict': _("Dictionary")}[kind]
+        self.total_rows = self._info['length']
+        if self.total_rows > 1:
+            elements = _("elements")
+        else:
+            elements = _("element")
+        self.title += ' (' + str(self.total_rows) + ' ' + elements + ')'
+        if self.total_rows > LARGE_NROWS:
+            self.rows_loaded = ROWS_TO_LOAD
+        else:
+            self.rows_loaded = self.total_rows
+        self._clear_pages()
+        self.sig_setting_data.emit()
+        self.reset()
+
+    def set_size_and_type(self, start=None, stop=None):
+        """Nothing to do, sizes and types are in the pages."""
+        pass
+
+    def page(self, row):
+        """
+        Return the page with the given row if it's in memory, or None after
+        requesting it to the kernel if it's not.
+        """
+        key = (row // ROWS_PER_PAGE, self.minmax)
+        if key in self._pages:
+            page = self._pages.pop(key)
+            self._pages[key] = page
+            return page
+        if key in self._requested_pages:
+            future, requested = self._requested_pages[key]
+            if time.monotonic() - requested < PAGE_REQUEST_TIMEOUT:
+                return None
+            # No reply, e.g. because the kernel died, so it's asked again
+            future.cancel()
+        self._request_page(key)
+        return None
+
+    def _request_page(self, key):
+        """Request a page to the kernel without waiting for it"""
+        rows = (key[0] * ROWS_PER_PAGE, (key[0] + 1) * ROWS_PER_PAGE)
+        try:
+            future = self._view.request_page(rows, None, key[1])
+        except Exception:
+            logger.debug("Failed to request page %s of a remote collection",
+                         key, exc_info=True)
+            return
+        if future is None:
+            # The comm is closed
+            return
+        # The callback is called right away if the page is already there
+        self._requested_pages[key] = (future, time.monotonic())
+        future.add_done_callback(
+            partial(self._page_received, key, self._pages_generation))
+
+    def _page_received(self, key, generation, future):
+        """Keep a page got from the kernel and update its rows"""
+        if generation != self._pages_generation:
+            # The collection was sorted after requesting the page
+            return
+        self._requested_pages.pop(key, None)
+        try:
+            page = future.result()
+        except Exception:
+            # Not kept, to request it again the next time it's shown
+            logger.debug("Failed to get page %s of a remote collection",
+                         key, exc_info=True)
+            return
+        if len(self._pages) >= MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        self._pages[key] = page
+
+        first_row = key[0] * ROWS_PER_PAGE
+        last_row = min(first_row + ROWS_PER_PAGE, self.rowCount()) - 1
+        if last_row < first_row:
+            return
+        try:
+            self.dataChanged.emit(self.index(first_row, 0),
+                                  self.index(last_row,
+                                             self.columnCount() - 1))
+        except RuntimeError:
+            # The editor was closed before the page arrived
+            pass
+
+    def _clear_pages(self):
+        """Forget the pages got or requested to the kernel"""
+        self._pages.clear()
+        self._requested_pages.clear()
+        self._pages_generation += 1
+
+    def get_entry(self, row):
+        """
+        Return the key of the item in row and the summary of its value
+        made by the kernel.
+        """
+        page = self.page(row)
+        if page is None:
+            return '', {'type': '', 'size': '', 'view': '',
+                        'color': '#ffffff'}
+        position = row % ROWS_PER_PAGE
+        return page['keys'][position], page['values'][position]
+
+    def get_key(self, index):
+        """Return current key"""
+        return self.get_entry(index.row())[0]
+
+    def get_value(self, index):
+        """Return current key, type, size or value summary"""
+        key, value = self.get_entry(index.row())
+        if index.column() == 0:
+            return key
+        elif index.column() == 1:
+            return value['type']
+        elif index.column() == 2:
+            return value['size']
+        return value
+
+    def get_item(self, index):
+        """Get the value of the item at index from the kernel"""
+        return self._view.get_item(index.row())
+
+    def open_item_view(self, index):
+        """
+        Open a paged view of the value of the item at index in the kernel
+        and return its information and RemoteDataView.
+        """
+        return self._view.open_item_view(index.row())
+
+    def get_bgcolor(self, index):
+        """Background color depending on value"""
+        if index.column() < 3:
+            return ReadOnlyCollectionsModel.get_bgcolor(self, index)
+        color = QColor(self.get_value(index)['color'])
+        color.setAlphaF(.2)
+        return color
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the items in the kernel"""
+        ascending = order == Qt.AscendingOrder
+        if column > 3:
+            return
+        if (column == 0 and ascending and not self._sorted and
+                self._info['kind'] != 'dict'):
+            # Sequences and sets are already in this order
+            return
+        try:
+            self._info = self._view.sort(column, ascending)
+        except Exception as e:
+            QMessageBox.critical(self._parent, _("Error"),
+                                 "%s: %s" % (type(e).__name__,
+                                             to_text_string(e)))
+            return
+        self._sorted = True
+        self._clear_pages()
+        self.reset()
+
+
 class BaseHeaderView(QHeaderView):
     """
     A header view for the BaseTableView that emits a signal when the width of
@@ -1297,9 +1580,12 @@ def set_filter(self, dictfilter=None):
 
 class CollectionsEditorWidget(QWidget):
     """Dictionary Editor Widget"""
-    def __init__(self, parent, data, readonly=False, title="", remote=False):
+    def __init__(self, parent, data, readonly=False, title="", remote=False,
+                 editor=None):
         QWidget.__init__(self, parent)
-        if remote:
+        if editor is not None:
+            self.editor = editor
+        elif remote:
             self.editor = RemoteCollectionsEditorTableView(self, data, readonly)
         else:
             self.editor = CollectionsEditorTableView(self, data, readonly,
@@ -1364,6 +1650,24 @@ def setup(self, data, title='', readonly=False, remote=False,
         self.widget = CollectionsEditorWidget(self, self.data_copy,
                                               title=title, readonly=readonly,
                                               remote=remote)
+        self._setup(readonly, icon)
+
+    def setup_remote(self, info, view, title='', minmax=False,
+                     dataframe_format=None, icon=None):
+        """
+        Setup editor to show a collection that stays in the kernel, without
+        editing it.
+
+        `info` and `view` are used to create its RemoteCollectionsModel.
+        """
+        editor = RemoteCollectionItemsTableView(
+            self, info, view, title=title, minmax=minmax,
+            dataframe_format=dataframe_format)
+        self.widget = CollectionsEditorWidget(self, None, editor=editor)
+        self._setup(True, icon)
+
+    def _setup(self, readonly, icon):
+        """Create the layout and buttons of the editor for self.widget."""
         self.widget.editor.source_model.sig_setting_data.connect(
                                                     self.save_and_close_enable)
         layout = QVBoxLayout()
@@ -1417,6 +1721,56 @@ def get_value(self):
 #==============================================================================
 # Remote versions of CollectionsDelegate and CollectionsEditorTableView
 #==============================================================================
+class RemoteDataView(object):
+    """
+    View of a variable opened in the kernel by a
+    RemoteCollectionsEditorTableView, with the methods of the views of
+    spyder_kernels.utils.dataviews.
+    """
+
+    def __init__(self, table, view_id):
+        self.table = table
+        self.view_id = view_id
+
+    def get_page(self, rows, columns, *args):
+        """Get a page of the view"""
+        return self.table.get_data_view_page(self.view_id, rows, columns,
+                                             *args)
+
+    def request_page(self, rows, columns, *args):
+        """
+        Request a page of the view without waiting for it and return a
+        future to get it
+        """
+        return self.table.request_data_view_page(self.view_id, rows,
+                                                 columns, *args)
+
+    def get_item(self, row):
+        """Get the value of the item in a row of a collection"""
+        return self.table.get_data_view_item(self.view_id, row)
+
+    def open_item_view(self, row):
+        """
+        Open a view of the item in a row of a collection and return its
+        information and RemoteDataView
+        """
+        info = self.table.open_data_subview(self.view_id, row)
+        return info, RemoteDataView(self.table, info['id'])
+
+    def sort(self, column, ascending=True):
+        """Sort the view and return its new information"""
+        return self.table.sort_data_view(self.view_id, column, ascending)
+
+    def filter(self, query=None, column=None, value=None):
+        """Filter the view and return its new information"""
+        return self.table.filter_data_view(self.view_id, query, column,
+                                           value)
+
+    def close(self):
+        """Close the view in the kernel"""
+        self.table.close_data_view(self.view_id)
+
+
 class RemoteCollectionsDelegate(CollectionsDelegate):
     """CollectionsEditor Item Delegate"""
     def __init__(self, parent=None):
@@ -1434,6 +1788,171 @@ def set_value(self, index, value):
             name = source_index.model().keys[source_index.row()]
             self.parent().new_value(name, value)
 
+    def use_remote_editor(self, index):
+        """
+        Return whether to show the value at index in an editor that gets
+        its pages from the kernel, if it has one.
+        """
+        return self.show_warning(index)
+
+    def open_data_view(self, index):
+        """
+        Open a paged view of the value at index in the kernel and return
+        its name, information and RemoteDataView.
+        """
+        source_index = index.model().mapToSource(index)
+        name = source_index.model().keys[source_index.row()]
+        table = self.parent()
+        info = table.open_data_view(name)
+        return name, info, RemoteDataView(table, info['id'])
+
+    def createEditor(self, parent, option, index, object_explorer=False):
+        """Overriding method createEditor"""
+        # Big collections, DataFrames, Series, Indexes and arrays are shown
+        # in pages got from the kernel instead of getting their whole value.
+        if (index.column() == 3 and not object_explorer and
+                self.use_remote_editor(index)):
+            val_type = index.sibling(index.row(), 1).data()
+            if val_type in ['list', 'set', 'tuple', 'dict']:
+                if self.create_remote_collections_editor(parent, index):
+                    return None
+            elif ((val_type in ['DataFrame', 'Series'] or
+                    'Index' in val_type) and DataFrame is not FakeObject):
+                if self.create_remote_dataframe_editor(parent, index):
+                    return None
+            elif 'Array' in val_type and ndarray is not FakeObject:
+                if self.create_remote_array_editor(parent, index):
+                    return None
+        return CollectionsDelegate.createEditor(self, parent, option, index,
+                                                object_explorer)
+
+    def create_remote_collections_editor(self, parent, index):
+        """
+        Show a read-only editor of the list, tuple, set or dict at index
+        that gets its pages from the kernel.
+
+        Return False if the kernel can't open a paged view of it.
+        """
+        try:
+            name, info, view = self.open_data_view(index)
+        except Exception:
+            return False
+        self.sig_open_editor.emit()
+
+        source_model = self.parent().source_model
+        editor = CollectionsEditor(parent=parent)
+        editor.setup_remote(info, view, title=name,
+                            minmax=source_model.minmax,
+                            dataframe_format=source_model.dataframe_format,
+                            icon=self.parent().windowIcon())
+        editor.finished.connect(lambda result: view.close())
+        self.create_dialog(editor, dict(model=index.model(), editor=editor,
+                                        key=name, readonly=True))
+        return True
+
+    def create_remote_dataframe_editor(self, parent, index):
+        """
+        Show a read-only editor of the DataFrame, Series or Index at index
+        that gets its pages from the kernel.
+
+        Return False if the kernel can't open a paged view of it.
+        """
+        try:
+            name, info, view = self.open_data_view(index)
+        except Exception:
+            return False
+        self.sig_open_editor.emit()
+
+        from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
+            DataFrameEditor)
+        editor = DataFrameEditor(parent=parent)
+        editor.setup_and_check_remote(info, view, title=name)
+        editor.dataModel.set_format(index.model().dataframe_format)
+        editor.sig_option_changed.connect(self.change_option)
+        editor.finished.connect(lambda result: view.close())
+        self.create_dialog(editor, dict(model=index.model(), editor=editor,
+                                        key=name, readonly=True))
+        return True
+
+    def create_remote_array_editor(self, parent, index):
+        """
+        Show a read-only editor of the array at index that gets its pages
+        from the kernel.
+
+        Return False if the kernel can't open a paged view of it.
+        """
+        try:
+            name, info, view = self.open_data_view(index)
+        except Exception:
+            return False
+        self.sig_open_editor.emit()
+
+        from spyder.plugins.variableexplorer.widgets.arrayeditor import (
+            ArrayEditor)
+        editor = ArrayEditor(parent=parent)
+        editor.setup_and_check_remote(info, view, title=name)
+        editor.finished.connect(lambda result: view.close())
+        self.create_dialog(editor, dict(model=index.model(), editor=editor,
+                                        key=name, readonly=True))
+        return True
+
+
+class RemoteCollectionItemsDelegate(RemoteCollectionsDelegate):
+    """
+    Delegate of the items of a collection that stays in the kernel.
+
+    Collections, DataFrames and arrays are always shown in editors that get
+    their pages from the kernel, and the values of the rest of items are
+    got from the kernel when they're opened, without editing them.
+    """
+
+    def get_value(self, index):
+        if index.isValid():
+            return index.model().get_item(index)
+
+    def set_value(self, index, value):
+        """The items can't be changed"""
+        pass
+
+    def use_remote_editor(self, index):
+        return True
+
+    def open_data_view(self, index):
+        info, view = index.model().open_item_view(index)
+        return index.model().get_key(index), info, view
+
+
+class RemoteCollectionItemsTableView(BaseTableView):
+    """Read-only table of the items of a collection that stays in the kernel"""
+    def __init__(self, parent, info, view, title="", minmax=False,
+                 dataframe_format=None):
+        BaseTableView.__init__(self, parent)
+        self.dictfilter = None
+        self.readonly = True
+        self.source_model = RemoteCollectionsModel(
+            self, info, view, title, minmax=minmax,
+            dataframe_format=dataframe_format)
+        self.model = self.source_model
+        self.setModel(self.source_model)
+        self.delegate = RemoteCollectionItemsDelegate(self)
+        self.setItemDelegate(self.delegate)
+
+        self.setup_table()
+        self.menu = self.setup_menu(minmax)
+
+        if info['kind'] == 'set':
+            self.horizontalHeader().hideSection(0)
+
+    def refresh_menu(self):
+        """Refresh context menu"""
+        self.edit_action.setEnabled(self.currentIndex().isValid())
+        for action in [self.remove_action, self.insert_action,
+                       self.insert_action_above, self.insert_action_below,
+                       self.paste_action, self.view_action,
+                       self.rename_action, self.duplicate_action]:
+            action.setEnabled(False)
+        self.refresh_plot_entries(QModelIndex())
+
 
 class RemoteCollectionsEditorTableView(BaseTableView):
     """DictEditor table view"""
@@ -1487,6 +2006,47 @@ def get_value(self, name):
         value = self.shellwidget.get_value(name)
         return value
 
+    def open_data_view(self, name):
+        """Open a paged view of a variable and return its information"""
+        return self.shellwidget.open_data_view(name)
+
+    def open_data_subview(self, view_id, row):
+        """
+        Open a paged view of an item of a collection opened with
+        open_data_view and return its information
+        """
+        return self.shellwidget.open_data_subview(view_id, row)
+
+    def get_data_view_page(self, view_id, rows, columns, *args):
+        """Get a page of a view opened with open_data_view"""
+        return self.shellwidget.get_data_view_page(view_id, rows, columns,
+                                                   *args)
+
+    def request_data_view_page(self, view_id, rows, columns, *args):
+        """
+        Request a page of a view opened with open_data_view and return a
+        future to get it
+        """
+        return self.shellwidget.request_data_view_page(view_id, rows,
+                                                       columns, *args)
+
+    def get_data_view_item(self, view_id, row):
+        """Get an item of a collection opened with open_data_view"""
+        return self.shellwidget.get_data_view_item(view_id, row)
+
+    def sort_data_view(self, view_id, column, ascending):
+        """Sort a view opened with open_data_view"""
+        return self.shellwidget.sort_data_view(view_id, column, ascending)
+
+    def filter_data_view(self, view_id, query, column, value):
+        """Filter a view opened with open_data_view"""
+        return self.shellwidget.filter_data_view(view_id, query, column,
+                                                 value)
+
+    def close_data_view(self, view_id):
+        """Close a view opened with open_data_view"""
+        self.shellwidget.close_data_view(view_id)
+
     def new_value(self, name, value):
         """Create new value in data"""
         try:
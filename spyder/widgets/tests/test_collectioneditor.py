@@ -35,8 +35,8 @@
     CollectionsModel, CollectionsEditor, LARGE_NROWS, ROWS_TO_LOAD, natsort)
 from spyder.plugins.variableexplorer.widgets.namespacebrowser import (
     NamespacesBrowserFinder)
-from spyder.plugins.variableexplorer.widgets.tests.test_dataframeeditor import \
-    generate_pandas_indexes
+from spyder.plugins.variableexplorer.widgets.tests.test_dataframeeditor import (
+    LocalDataView, generate_pandas_indexes)
 from spyder.py3compat import PY2, to_text_string
 from spyder_kernels.utils.nsview import get_size
 
@@ -219,6 +219,29 @@ def remove_values(ins, names):
     assert data(editor.model, 3, 0) == 'e'
 
 
+def test_apply_remote_changes(qtbot):
+    """Test applying the changes of a remote view in place."""
+    def entry(view, type_='int'):
+        return {'type': type_, 'size': 1, 'color': '#0000ff', 'view': view}
+
+    variables = {'a': entry('1'), 'b': entry('2'), 'c': entry('3')}
+    editor = RemoteCollectionsEditorTableView(None, variables)
+    qtbot.addWidget(editor)
+    editor.setCurrentIndex(editor.model.index(2, 0))
+    resets = []
+    editor.source_model.modelReset.connect(lambda: resets.append(True))
+
+    editor.source_model.apply_changes(
+        {'a': entry('10'), 'd': entry("'text'", 'str')}, ['b'])
+    assert not resets
+    assert editor.model.rowCount() == 3
+    assert data_table(editor.model, 3, 4) == [
+        ['a', 'c', 'd'], ['int', 'int', 'str'], [1, 1, 1],
+        ['10', '3', "'text'"]]
+    # The selected variable is still selected
+    assert data(editor.model, editor.currentIndex().row(), 0) == 'c'
+
+
 def test_filter_rows(qtbot):
     """Test rows filtering."""
     data = (
@@ -920,5 +943,99 @@ def test_dicts_natural_sorting_mixed_types():
                                     ['(0,)', 2, 3, str_size]]
 
 
+def test_remote_collections_model(qtbot):
+    """
+    Test that remote collections get only the pages they show and are
+    sorted in the kernel.
+    """
+    view = LocalDataView({'k{}'.format(i): i for i in range(2000)})
+    editor = CollectionsEditor()
+    editor.setup_remote(view.get_info(), view, title='d')
+    qtbot.addWidget(editor)
+    assert editor.btn_save_and_close is None
+    assert editor.windowTitle() == 'd - Dictionary (2000 elements)'
+
+    model = editor.widget.editor.source_model
+    assert model.rowCount() == ROWS_TO_LOAD
+
+    # Pages are shown empty until they arrive, and requested only once
+    data(model, 0, 0)
+    requests = len(view.requests)
+    assert data(model, 0, 0) == ''
+    assert data(model, 1, 0) == ''
+    assert len(view.requests) == requests
+    with qtbot.waitSignal(model.dataChanged):
+        view.reply()
+    assert data_table(model, 3, 4) == [['k0', 'k1', 'k2'],
+                                       ['int', 'int', 'int'],
+                                       [1, 1, 1],
+                                       ['0', '1', '2']]
+    assert set(view.pages) == {(0, 500)}
+
+    model.sort(0, Qt.DescendingOrder)
+    data(model, 0, 0)
+    view.reply()
+    assert data(model, 0, 0) == 'k1999'
+    model.sort(3)
+    data(model, 1, 3)
+    view.reply()
+    assert data(model, 1, 3) == '1'
+    model.load_all()
+    data(model, 1999, 0)
+    view.reply()
+    assert data(model, 1999, 0) == 'k1999'
+    assert set(view.pages) == {(0, 500), (1500, 2000)}
+
+    # Pages requested before sorting are not kept
+    model.sort(0)
+    data(model, 0, 0)
+    model.sort(0, Qt.DescendingOrder)
+    view.reply()
+    assert data(model, 0, 0) == ''
+    view.reply()
+    assert data(model, 0, 0) == 'k1999'
+
+    # Failed pages are shown empty and requested again
+    get_page = view.get_page
+    view.get_page = Mock(side_effect=KeyError)
+    model.sort(2)
+    assert data(model, 0, 0) == ''
+    view.reply()
+    assert data(model, 0, 0) == ''
+    view.get_page = get_page
+    view.reply()
+    assert data(model, 0, 0) != ''
+
+
+def test_remote_collections_nested(qtbot):
+    """Test opening the items of remote collections."""
+    view = LocalDataView([list(range(3)), 1.5])
+    editor = CollectionsEditor()
+    editor.setup_remote(view.get_info(), view)
+    qtbot.addWidget(editor)
+    table = editor.widget.editor
+    model = table.source_model
+    assert editor.windowTitle() == 'List (2 elements)'
+    data(model, 0, 3)
+    view.reply()
+
+    # Nested collections are shown by their own pages
+    table.delegate.createEditor(None, None, model.index(0, 3))
+    [dialog] = table.delegate._editors.values()
+    nested_editor = dialog['editor']
+    qtbot.addWidget(nested_editor)
+    assert dialog['readonly']
+    assert nested_editor.windowTitle() == '0 - List (3 elements)'
+    nested_model = nested_editor.widget.editor.source_model
+    data(nested_model, 2, 3)
+    nested_model._view.reply()
+    assert data(nested_model, 2, 3) == '2'
+
+    # The rest of values are got from the kernel
+    assert table.delegate.get_value(model.index(1, 3)) == 1.5
+    assert table.delegate.createEditor(None, None, model.index(1, 3)) is None
+    assert len(table.delegate._editors) == 1
+
+
 if __name__ == "__main__":
     pytest.main()